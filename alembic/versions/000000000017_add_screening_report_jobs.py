@@ -0,0 +1,90 @@
+"""add screening_report_jobs
+
+Revision ID: 000000000017
+Revises: 000000000016
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "000000000017"
+down_revision: str | Sequence[str] | None = "000000000016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+REPORT_JOB_STATUS_VALUES = ("PENDING", "RUNNING", "COMPLETED", "FAILED")
+
+
+def upgrade() -> None:
+    report_job_status_enum = postgresql.ENUM(
+        *REPORT_JOB_STATUS_VALUES,
+        name="report_job_status",
+        create_type=False,
+    )
+    report_job_status_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "screening_report_jobs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("created_by", sa.Uuid(), nullable=True),
+        sa.Column("updated_by", sa.Uuid(), nullable=True),
+        sa.Column("organization_id", sa.Uuid(), nullable=False),
+        sa.Column("process_id", sa.Uuid(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                *REPORT_JOB_STATUS_VALUES,
+                name="report_job_status",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("report_url", sa.String(length=2048), nullable=True),
+        sa.Column("error", sa.String(length=2000), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["organization_id"],
+            ["organizations.id"],
+            name=op.f("fk_screening_report_jobs_organization_id_organizations"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["process_id"],
+            ["screening_processes.id"],
+            name=op.f("fk_screening_report_jobs_process_id_screening_processes"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_screening_report_jobs")),
+        sa.UniqueConstraint(
+            "process_id",
+            "version",
+            name="uq_screening_report_jobs_process_version",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("screening_report_jobs")
+    op.execute("DROP TYPE IF EXISTS report_job_status")
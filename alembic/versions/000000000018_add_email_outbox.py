@@ -0,0 +1,96 @@
+"""add email_outbox
+
+Revision ID: 000000000018
+Revises: 000000000017
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "000000000018"
+down_revision: str | Sequence[str] | None = "000000000017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+EMAIL_OUTBOX_STATUS_VALUES = ("PENDING", "SENDING", "SENT", "FAILED")
+
+
+def upgrade() -> None:
+    email_outbox_status_enum = postgresql.ENUM(
+        *EMAIL_OUTBOX_STATUS_VALUES,
+        name="email_outbox_status",
+        create_type=False,
+    )
+    email_outbox_status_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column(
+            "recipients",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column("subject", sa.String(length=255), nullable=False),
+        sa.Column("html", sa.Text(), nullable=False),
+        sa.Column(
+            "tags",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                *EMAIL_OUTBOX_STATUS_VALUES,
+                name="email_outbox_status",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("error", sa.String(length=2000), nullable=True),
+        sa.Column("provider_message_id", sa.String(length=255), nullable=True),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_email_outbox")),
+    )
+    op.create_index(
+        "ix_email_outbox_due",
+        "email_outbox",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where="status IN ('PENDING', 'SENDING')",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_outbox_due", table_name="email_outbox")
+    op.drop_table("email_outbox")
+    op.execute("DROP TYPE IF EXISTS email_outbox_status")
@@ -0,0 +1,42 @@
+"""add organization_professionals cpf prefix index
+
+Revision ID: 000000000019
+Revises: 000000000018
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "000000000019"
+down_revision: str | Sequence[str] | None = "000000000018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CPF prefix search (cpf LIKE '123%') within an organization. The unique
+    # (organization_id, cpf) index uses the database collation, which cannot
+    # serve LIKE prefixes; text_pattern_ops compares byte-wise and can.
+    op.create_index(
+        "idx_organization_professionals_org_cpf_prefix",
+        "organization_professionals",
+        ["organization_id", "cpf"],
+        unique=False,
+        postgresql_ops={"cpf": "text_pattern_ops"},
+        postgresql_where=sa.text("cpf IS NOT NULL AND deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_organization_professionals_org_cpf_prefix",
+        table_name="organization_professionals",
+        postgresql_ops={"cpf": "text_pattern_ops"},
+        postgresql_where=sa.text("cpf IS NOT NULL AND deleted_at IS NULL"),
+    )
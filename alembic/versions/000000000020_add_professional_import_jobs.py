@@ -0,0 +1,115 @@
+"""add professional_import_jobs
+
+Revision ID: 000000000020
+Revises: 000000000019
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "000000000020"
+down_revision: str | Sequence[str] | None = "000000000019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+IMPORT_STATUS_VALUES = ("PENDING", "RUNNING", "COMPLETED", "FAILED")
+IMPORT_FILE_FORMAT_VALUES = ("CSV", "XLSX")
+
+
+def upgrade() -> None:
+    import_status_enum = postgresql.ENUM(
+        *IMPORT_STATUS_VALUES,
+        name="professional_import_status",
+        create_type=False,
+    )
+    import_status_enum.create(op.get_bind(), checkfirst=True)
+    import_file_format_enum = postgresql.ENUM(
+        *IMPORT_FILE_FORMAT_VALUES,
+        name="professional_import_file_format",
+        create_type=False,
+    )
+    import_file_format_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "professional_import_jobs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("created_by", sa.Uuid(), nullable=True),
+        sa.Column("updated_by", sa.Uuid(), nullable=True),
+        sa.Column("organization_id", sa.Uuid(), nullable=False),
+        sa.Column("file_name", sa.String(length=255), nullable=False),
+        sa.Column("file_path", sa.String(length=1024), nullable=False),
+        sa.Column(
+            "file_format",
+            postgresql.ENUM(
+                *IMPORT_FILE_FORMAT_VALUES,
+                name="professional_import_file_format",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                *IMPORT_STATUS_VALUES,
+                name="professional_import_status",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("processed_rows", sa.Integer(), nullable=False),
+        sa.Column("imported_rows", sa.Integer(), nullable=False),
+        sa.Column("error_rows", sa.Integer(), nullable=False),
+        sa.Column("total_rows", sa.Integer(), nullable=True),
+        sa.Column(
+            "errors",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("error", sa.String(length=2000), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["organization_id"],
+            ["organizations.id"],
+            name=op.f("fk_professional_import_jobs_organization_id_organizations"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_professional_import_jobs")),
+    )
+    op.create_index(
+        "idx_professional_import_jobs_org_created",
+        "professional_import_jobs",
+        ["organization_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_professional_import_jobs_org_created",
+        table_name="professional_import_jobs",
+    )
+    op.drop_table("professional_import_jobs")
+    op.execute("DROP TYPE IF EXISTS professional_import_file_format")
+    op.execute("DROP TYPE IF EXISTS professional_import_status")
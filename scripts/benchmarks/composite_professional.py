@@ -0,0 +1,257 @@
+"""
+Count database round trips of the composite professional create/update.
+
+For professionals with an increasing number of specialties (and as many
+educations), runs:
+- per-item validation (previous behavior): one exists query for CPF and
+  one for email, plus one global specialty lookup and one "already
+  assigned" check per new specialty
+- CreateOrganizationProfessionalCompositeUseCase
+- UpdateOrganizationProfessionalCompositeUseCase keeping half of the
+  specialties/educations (updated), dropping the rest and adding new ones
+
+and reports statements issued and latency. Each size runs inside an outer
+transaction that is rolled back (use case commits become savepoints), so
+the database is left unchanged. The run fails (exit code 1) if the
+statements of either use case grow with the number of specialties.
+
+Needs a database seeded with scripts/seed_organizations.py and at least
+1.5 x the largest size global specialties.
+
+Usage:
+    uv run python scripts/benchmarks/composite_professional.py [max_specialties]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+from uuid import UUID
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.app.dependencies.settings import get_settings
+from src.app.logging import configure_logging
+from src.modules.organizations.domain.models import Organization
+from src.modules.professionals.domain.models import OrganizationProfessional
+from src.modules.professionals.domain.models.enums import (
+    CouncilType,
+    EducationLevel,
+    ProfessionalType,
+)
+from src.modules.professionals.domain.schemas.organization_professional_composite import (
+    EducationNestedCreate,
+    EducationNestedUpdate,
+    OrganizationProfessionalCompositeCreate,
+    OrganizationProfessionalCompositeUpdate,
+    QualificationNestedCreate,
+    QualificationNestedUpdate,
+    SpecialtyNestedCreate,
+    SpecialtyNestedUpdate,
+)
+from src.modules.professionals.infrastructure.repositories import (
+    OrganizationProfessionalRepository,
+    ProfessionalSpecialtyRepository,
+    SpecialtyRepository,
+)
+from src.modules.professionals.use_cases import (
+    CreateOrganizationProfessionalCompositeUseCase,
+    UpdateOrganizationProfessionalCompositeUseCase,
+)
+from src.shared.domain.models.specialty import Specialty
+from src.shared.infrastructure.database.connection import _connection_args
+
+
+# Extra statements tolerated between the smallest and the largest payload
+SLACK = 2
+
+
+def generate_cpf() -> str:
+    digits = [random.randint(0, 9) for _ in range(9)]
+    for length in (9, 10):
+        total = sum((length + 1 - i) * digits[i] for i in range(length))
+        digits.append(0 if total % 11 < 2 else 11 - total % 11)
+    return "".join(map(str, digits))
+
+
+def build_create(specialty_ids: list[UUID]) -> OrganizationProfessionalCompositeCreate:
+    suffix = random.randint(0, 10**9)
+    return OrganizationProfessionalCompositeCreate(
+        full_name="Benchmark Professional",
+        email=f"benchmark-{suffix}@example.com",
+        cpf=generate_cpf(),
+        city="São Paulo",
+        state_code="SP",
+        postal_code="01452000",
+        qualification=QualificationNestedCreate(
+            professional_type=ProfessionalType.DOCTOR,
+            council_type=CouncilType.CRM,
+            council_number=str(suffix),
+            council_state="SP",
+            specialties=[
+                SpecialtyNestedCreate(specialty_id=specialty_id)
+                for specialty_id in specialty_ids
+            ],
+            educations=[
+                EducationNestedCreate(
+                    level=EducationLevel.SPECIALIZATION,
+                    course_name=f"Benchmark course {i}",
+                    institution="Benchmark institution",
+                )
+                for i in range(len(specialty_ids))
+            ],
+        ),
+    )
+
+
+def build_update(
+    professional: OrganizationProfessional, new_specialty_ids: list[UUID]
+) -> OrganizationProfessionalCompositeUpdate:
+    qualification = professional.qualifications[0]
+    kept_specialties = qualification.specialties[: len(qualification.specialties) // 2]
+    kept_educations = qualification.educations[: len(qualification.educations) // 2]
+    return OrganizationProfessionalCompositeUpdate(
+        full_name="Benchmark Professional (updated)",
+        email=f"updated-{professional.email}",
+        qualification=QualificationNestedUpdate(
+            id=qualification.id,
+            specialties=[
+                SpecialtyNestedUpdate(id=spec.id, rqe_number="12345")
+                for spec in kept_specialties
+            ]
+            + [
+                SpecialtyNestedUpdate(specialty_id=specialty_id)
+                for specialty_id in new_specialty_ids
+            ],
+            educations=[
+                EducationNestedUpdate(id=edu.id, notes="updated")
+                for edu in kept_educations
+            ]
+            + [
+                EducationNestedUpdate(
+                    level=EducationLevel.SPECIALIZATION,
+                    course_name=f"New course {i}",
+                    institution="Benchmark institution",
+                )
+                for i in range(len(new_specialty_ids))
+            ],
+        ),
+    )
+
+
+async def validate_per_item(
+    session: AsyncSession,
+    professional: OrganizationProfessional,
+    data: OrganizationProfessionalCompositeUpdate,
+    family_org_ids: list[UUID],
+) -> None:
+    """Previous validation: one query per check and per new specialty."""
+    professionals = OrganizationProfessionalRepository(session)
+    await professionals.exists_by_cpf_in_family(
+        cpf=professional.cpf, family_org_ids=family_org_ids, exclude_id=professional.id
+    )
+    await professionals.exists_by_email_in_family(
+        email=data.email, family_org_ids=family_org_ids, exclude_id=professional.id
+    )
+    specialties = ProfessionalSpecialtyRepository(session)
+    global_specialties = SpecialtyRepository(session)
+    for spec in data.qualification.specialties:
+        if spec.id is None:
+            await global_specialties.get_by_id(spec.specialty_id)
+            await specialties.specialty_exists_for_qualification(
+                data.qualification.id, spec.specialty_id
+            )
+
+
+async def main(max_specialties: int) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    settings = get_settings()
+    engine = create_async_engine(settings.database_url_async, **_connection_args(settings))
+
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sizes = sorted({min(5, max_specialties), min(20, max_specialties), max_specialties})
+
+    async with AsyncSession(engine) as session:
+        organization_id = (
+            await session.execute(select(Organization.id).limit(1))
+        ).scalar_one_or_none()
+        specialty_ids = list(
+            (
+                await session.execute(
+                    select(Specialty.id).limit(max_specialties + max_specialties // 2)
+                )
+            ).scalars()
+        )
+    if organization_id is None:
+        raise SystemExit("No organization found (run scripts/seed_organizations.py)")
+    if len(specialty_ids) < max_specialties + max_specialties // 2:
+        raise SystemExit(f"Need {max_specialties * 3 // 2} global specialties")
+
+    family_org_ids = [organization_id]
+    results: dict[str, list[int]] = {"create": [], "update": []}
+
+    print("\nComposite professional create/update (rolled back)")
+    for size in sizes:
+        async with engine.connect() as conn:
+            await conn.begin()
+            async with AsyncSession(
+                bind=conn,
+                join_transaction_mode="create_savepoint",
+                expire_on_commit=False,
+                autoflush=False,
+            ) as session:
+                statements.clear()
+                start = time.perf_counter()
+                professional = await CreateOrganizationProfessionalCompositeUseCase(
+                    session
+                ).execute(organization_id, build_create(specialty_ids[:size]), family_org_ids)
+                create_ms = (time.perf_counter() - start) * 1000
+                results["create"].append(len(statements))
+
+                data = build_update(
+                    professional, specialty_ids[size : size + size // 2]
+                )
+
+                statements.clear()
+                await validate_per_item(session, professional, data, family_org_ids)
+                before = len(statements)
+
+                statements.clear()
+                start = time.perf_counter()
+                await UpdateOrganizationProfessionalCompositeUseCase(session).execute(
+                    organization_id, professional.id, data, family_org_ids
+                )
+                update_ms = (time.perf_counter() - start) * 1000
+                results["update"].append(len(statements))
+            await conn.rollback()
+
+        print(
+            f"  {size:>4} specialties  create: statements={results['create'][-1]:<3} "
+            f"{create_ms:8.2f}ms  update: statements={results['update'][-1]:<3} "
+            f"{update_ms:8.2f}ms  (per-item validation alone: {before})"
+        )
+
+    await engine.dispose()
+
+    failed = [
+        name for name, counts in results.items() if counts[-1] - counts[0] > SLACK
+    ]
+    if failed:
+        print(f"\nREGRESSION: statements grow with payload size in {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
@@ -0,0 +1,193 @@
+"""
+Benchmark invitation emails: inline send vs. transactional outbox.
+
+1. Request path, for REQUESTS concurrent invitations:
+   - inline (previous behavior): the provider call happens while the
+     request's transaction is open
+   - outbox: the email row is inserted in the transaction; nothing waits
+     on the provider
+   Reports request latency and how long each transaction stays open.
+
+2. Worker delivery of EMAILS outbox rows with EmailOutboxDispatcher and a
+   FakeEmailTransport (simulated provider latency, first request fails).
+   Reports provider requests, emails sent and the achieved request rate.
+
+The provider is always the fake transport, so no email is sent. Each
+scenario runs inside a transaction that is rolled back (dispatcher
+commits become savepoints), so the database is left unchanged. The run
+fails (exit code 1) if the dispatcher exceeds the rate limit, does not
+batch, or loses emails. Run it against a database whose outbox has no
+due emails, or they are counted in the delivery run.
+
+Usage:
+    uv run python scripts/benchmarks/email_outbox.py [emails]
+"""
+
+import asyncio
+import math
+import os
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.dependencies.settings import get_settings
+from src.app.logging import configure_logging
+from src.shared.domain.models import EmailOutbox, EmailOutboxStatus
+from src.shared.infrastructure.database.connection import _connection_args
+from src.shared.infrastructure.email import FakeEmailTransport, get_email_service
+from src.shared.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+from src.shared.infrastructure.repositories import EmailOutboxRepository
+
+
+REQUESTS = 20
+PROVIDER_LATENCY = 0.25
+BATCH_SIZE = 50
+RATE_LIMIT = 5.0
+
+
+def build_email(i: int):
+    return get_email_service().build_invitation_email(
+        to=f"benchmark-{i}@example.com",
+        invitee_name=f"Convidado {i}",
+        organization_name="Organização Benchmark",
+        inviter_name="Administrador",
+        role_name="Gestor",
+        invitation_link=f"https://app.example/convite/{i}",
+    )
+
+
+async def invite_request(engine, transport: FakeEmailTransport | None, i: int):
+    """One invitation request; returns (latency, transaction open) in ms."""
+    start = time.perf_counter()
+    async with AsyncSession(engine, autoflush=False) as session:
+        await session.connection()
+        tx_start = time.perf_counter()
+        email = build_email(i)
+        if transport is not None:
+            await transport.send_batch([email])
+        else:
+            await EmailOutboxRepository(session).enqueue("invitation", email)
+            await session.flush()
+        tx_ms = (time.perf_counter() - tx_start) * 1000
+        await session.rollback()
+    return (time.perf_counter() - start) * 1000, tx_ms
+
+
+def report(label: str, results: list[tuple[float, float]]) -> None:
+    latencies = [latency for latency, _ in results]
+    tx = [tx_ms for _, tx_ms in results]
+    print(
+        f"  {label:<18} latency p50={statistics.median(latencies):8.2f}ms "
+        f"max={max(latencies):8.2f}ms  transaction open p50={statistics.median(tx):8.2f}ms"
+    )
+
+
+async def main(emails: int) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    settings = get_settings()
+    engine = create_async_engine(
+        settings.database_url_async,
+        **{**_connection_args(settings), "pool_size": REQUESTS},
+    )
+
+    print(f"\nInvitation requests ({REQUESTS} concurrent, provider {PROVIDER_LATENCY}s)")
+    transport = FakeEmailTransport(latency=PROVIDER_LATENCY)
+    report(
+        "inline (before)",
+        await asyncio.gather(
+            *(invite_request(engine, transport, i) for i in range(REQUESTS))
+        ),
+    )
+    report(
+        "outbox",
+        await asyncio.gather(
+            *(invite_request(engine, None, i) for i in range(REQUESTS))
+        ),
+    )
+
+    print(
+        f"\nOutbox delivery ({emails} emails, batch {BATCH_SIZE}, "
+        f"{RATE_LIMIT:g} requests/s, first request fails)"
+    )
+    failed = False
+    async with engine.connect() as conn:
+        await conn.begin()
+        session_factory = async_sessionmaker(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        async with session_factory() as session:
+            repository = EmailOutboxRepository(session)
+            for i in range(emails):
+                await repository.enqueue("benchmark", build_email(i))
+            await session.commit()
+
+        transport = FakeEmailTransport(latency=0.05, fail_times=1)
+        dispatcher = EmailOutboxDispatcher(
+            session_factory,
+            transport,
+            settings.model_copy(
+                update={
+                    "EMAIL_OUTBOX_BATCH_SIZE": BATCH_SIZE,
+                    "EMAIL_OUTBOX_RATE_LIMIT": RATE_LIMIT,
+                }
+            ),
+        )
+
+        start = time.perf_counter()
+        # The first drain stops at the failed request; the second sends the rest
+        sent = await dispatcher.drain()
+        sent += await dispatcher.drain()
+        elapsed = time.perf_counter() - start
+
+        async with session_factory() as session:
+            counts = dict(
+                (
+                    await session.execute(
+                        select(EmailOutbox.status, func.count())
+                        .where(EmailOutbox.kind == "benchmark")
+                        .group_by(EmailOutbox.status)
+                    )
+                ).all()
+            )
+        await conn.rollback()
+
+    await engine.dispose()
+
+    rate = (transport.requests - 1) / elapsed if elapsed else 0.0
+    print(
+        f"  provider requests={transport.requests}  sent={sent}  "
+        f"rescheduled={counts.get(EmailOutboxStatus.PENDING, 0)}  "
+        f"{elapsed:6.2f}s  ({rate:5.2f} requests/s)"
+    )
+
+    expected_requests = math.ceil(emails / BATCH_SIZE) + 1
+    if transport.requests > expected_requests:
+        print(f"\nREGRESSION: {transport.requests} requests (expected {expected_requests})")
+        failed = True
+    if rate > RATE_LIMIT * 1.1:
+        print(f"\nREGRESSION: {rate:.2f} requests/s exceeds the {RATE_LIMIT:g}/s limit")
+        failed = True
+    delivered_or_pending = counts.get(EmailOutboxStatus.SENT, 0) + counts.get(
+        EmailOutboxStatus.PENDING, 0
+    )
+    if delivered_or_pending != emails:
+        print(f"\nREGRESSION: emails lost ({counts})")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
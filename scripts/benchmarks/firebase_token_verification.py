@@ -0,0 +1,186 @@
+"""
+Benchmark Firebase ID token verification throughput and event-loop blocking.
+
+Compares:
+- verifying synchronously on the event loop (the previous behavior, where
+  every cache miss called the SDK's blocking verify_token inline)
+- FirebaseService.verify_token_async with a cold claims cache (local RS256
+  check in a worker thread)
+- FirebaseService.verify_token_async with a warm claims cache
+
+Tokens are signed with a throwaway RSA key whose certificate is injected
+as the public key set, so no network or Firebase project is needed.
+
+Event-loop blocking is measured by a ticker that sleeps 1ms in a loop and
+records how late it wakes up while verifications run.
+
+Usage:
+    uv run python scripts/benchmarks/firebase_token_verification.py [tokens]
+"""
+
+import asyncio
+import datetime
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from jose import jwt
+
+from src.shared.infrastructure.firebase.firebase_service import (
+    FIREBASE_ISSUER_PREFIX,
+    FirebaseService,
+)
+
+
+PROJECT_ID = "benchmark-project"
+KEY_ID = "benchmark-kid"
+CONCURRENCY = 50
+TICK_SECONDS = 0.001
+
+
+def build_signing_material() -> tuple[str, str]:
+    """Create an RSA private key and a self-signed certificate (both PEM)."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "benchmark")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    cert_pem = cert.public_bytes(serialization.Encoding.PEM).decode()
+    return private_pem, cert_pem
+
+
+def build_tokens(private_pem: str, count: int) -> list[str]:
+    """Sign `count` distinct Firebase-shaped ID tokens."""
+    now = int(time.time())
+    return [
+        jwt.encode(
+            {
+                "iss": f"{FIREBASE_ISSUER_PREFIX}{PROJECT_ID}",
+                "aud": PROJECT_ID,
+                "sub": f"user-{i}",
+                "auth_time": now - 60,
+                "iat": now - 60,
+                "exp": now + 3600,
+                "email": f"user{i}@queroplantao.com.br",
+                "email_verified": True,
+            },
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": KEY_ID},
+        )
+        for i in range(count)
+    ]
+
+
+def build_service(cert_pem: str) -> FirebaseService:
+    """Create a FirebaseService with the benchmark key set preloaded."""
+    settings = SimpleNamespace(
+        FIREBASE_PROJECT_ID=PROJECT_ID,
+        FIREBASE_CREDENTIALS_BASE64="",
+        FIREBASE_LOCAL_TOKEN_VERIFICATION=True,
+        FIREBASE_TOKEN_CACHE_MAX_SIZE=100_000,
+    )
+    service = FirebaseService(settings)
+    service._public_keys = {KEY_ID: cert_pem}
+    service._public_keys_expire_at = time.time() + 86_400
+    return service
+
+
+async def run_with_lag_monitor(workload) -> tuple[float, list[float]]:
+    """Run a workload while sampling event-loop wake-up lag (ms)."""
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append((time.perf_counter() - start - TICK_SECONDS) * 1000)
+
+    monitor = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await workload()
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    await monitor
+    return elapsed, lags
+
+
+async def verify_inline(service: FirebaseService, tokens: list[str]) -> None:
+    """Previous behavior: blocking verification on the event loop."""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(token: str) -> None:
+        async with semaphore:
+            service.verify_token_local(token)
+
+    await asyncio.gather(*(one(token) for token in tokens))
+
+
+async def verify_async(service: FirebaseService, tokens: list[str]) -> None:
+    """New behavior: claims cache, then verification in a worker thread."""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one(token: str) -> None:
+        async with semaphore:
+            await service.verify_token_async(token)
+
+    await asyncio.gather(*(one(token) for token in tokens))
+
+
+def report(label: str, count: int, elapsed: float, lags: list[float]) -> None:
+    max_lag = max(lags) if lags else 0.0
+    p99_lag = statistics.quantiles(lags, n=100)[98] if len(lags) >= 100 else max_lag
+    print(
+        f"  {label:<32} {count / elapsed:>10,.0f} verif/s  "
+        f"loop lag p99={p99_lag:7.2f}ms max={max_lag:7.2f}ms"
+    )
+
+
+async def main(count: int) -> None:
+    private_pem, cert_pem = build_signing_material()
+    tokens = build_tokens(private_pem, count)
+
+    print(f"\nFirebase token verification ({count} distinct tokens, concurrency={CONCURRENCY})")
+
+    service = build_service(cert_pem)
+    elapsed, lags = await run_with_lag_monitor(lambda: verify_inline(service, tokens))
+    report("sync on event loop (before)", count, elapsed, lags)
+
+    service = build_service(cert_pem)
+    elapsed, lags = await run_with_lag_monitor(lambda: verify_async(service, tokens))
+    report("worker thread, cold cache", count, elapsed, lags)
+
+    elapsed, lags = await run_with_lag_monitor(lambda: verify_async(service, tokens))
+    report("claims cache hit", count, elapsed, lags)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,211 @@
+"""
+Benchmark per-request overhead of the identity middleware stack.
+
+Compares the legacy shape (three BaseHTTPMiddleware layers: logging,
+auth, organization identity) with the pure ASGI pipeline
+(LoggingMiddleware + IdentityMiddleware).
+
+Both stacks resolve identity from in-memory stages so the numbers isolate
+middleware dispatch cost from Redis/database latency.
+
+Usage:
+    uv run python scripts/benchmarks/identity_middleware.py [requests]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from dataclasses import replace
+from uuid import uuid7
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from src.app.context import (
+    RequestContext,
+    clear_request_context,
+    get_request_context,
+    set_request_context,
+)
+from src.app.middlewares import (
+    FirebaseAuthenticator,
+    IdentityMiddleware,
+    LoggingMiddleware,
+    OrganizationIdentityResolver,
+)
+
+
+USER_CONTEXT = RequestContext(
+    user_id=uuid7(),
+    firebase_uid="benchmark-uid",
+    email="bench@queroplantao.com.br",
+    full_name="Benchmark User",
+)
+ORG_ID = uuid7()
+
+
+class InMemoryAuthenticator(FirebaseAuthenticator):
+    """Authenticator that skips Firebase/Redis and returns a fixed user."""
+
+    async def authenticate(self, headers: Headers) -> RequestContext:
+        return USER_CONTEXT
+
+
+class InMemoryOrganizationResolver(OrganizationIdentityResolver):
+    """Resolver that skips Redis/database and returns a fixed organization."""
+
+    async def resolve(
+        self, headers: Headers, current_context: RequestContext
+    ) -> RequestContext:
+        return replace(
+            current_context,
+            organization_id=ORG_ID,
+            organization_role="ORG_ADMIN",
+            family_org_ids=(ORG_ID,),
+        )
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = "bench"
+        return response
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        try:
+            set_request_context(await InMemoryAuthenticator().authenticate(request.headers))
+            return await call_next(request)
+        finally:
+            clear_request_context()
+
+
+class LegacyOrganizationMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        resolver = InMemoryOrganizationResolver()
+        set_request_context(
+            await resolver.resolve(request.headers, get_request_context())
+        )
+        return await call_next(request)
+
+
+async def endpoint(request):
+    assert get_request_context() is not None
+    return PlainTextResponse("ok")
+
+
+async def stream(request):
+    async def body():
+        for _ in range(16):
+            yield b"x" * 1024
+
+    return StreamingResponse(body())
+
+
+ROUTES = [Route("/bench", endpoint), Route("/stream", stream)]
+
+
+def build_legacy_app() -> Starlette:
+    return Starlette(
+        routes=ROUTES,
+        middleware=[
+            Middleware(LegacyLoggingMiddleware),
+            Middleware(LegacyAuthMiddleware),
+            Middleware(LegacyOrganizationMiddleware),
+        ],
+    )
+
+
+def build_asgi_app() -> Starlette:
+    return Starlette(
+        routes=ROUTES,
+        middleware=[
+            Middleware(LoggingMiddleware),
+            Middleware(
+                IdentityMiddleware,
+                authenticator=InMemoryAuthenticator(),
+                organization_resolver=InMemoryOrganizationResolver(),
+            ),
+        ],
+    )
+
+
+async def call(app: Starlette, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"authorization", b"Bearer benchmark"),
+            (b"x-organization-id", str(ORG_ID).encode()),
+        ],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def measure(app: Starlette, path: str, requests: int) -> list[float]:
+    # Warm-up (router, middleware stack build)
+    for _ in range(200):
+        await call(app, path)
+
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await call(app, path)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> None:
+    p50 = statistics.median(samples)
+    p99 = statistics.quantiles(samples, n=100)[98]
+    print(f"  {label:<28} p50={p50:8.1f}µs  p99={p99:8.1f}µs  mean={statistics.fmean(samples):8.1f}µs")
+
+
+async def main(requests: int) -> None:
+    legacy = build_legacy_app()
+    asgi = build_asgi_app()
+
+    for path in ("/bench", "/stream"):
+        print(f"\n{path} ({requests} requests)")
+        before = await measure(legacy, path, requests)
+        after = await measure(asgi, path, requests)
+        report("BaseHTTPMiddleware x3", before)
+        report("pure ASGI pipeline", after)
+        saved = statistics.median(before) - statistics.median(after)
+        print(f"  p50 overhead saved: {saved:.1f}µs per request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
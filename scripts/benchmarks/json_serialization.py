@@ -0,0 +1,147 @@
+"""
+Microbenchmark JSON serialization: stdlib json vs. src.app.serialization.
+
+For the largest response payloads (professional detail and screening
+detail), built with every list holding ITEMS entries:
+- response body: what FastAPI hands the response class (the response
+  model dumped in JSON mode) rendered by Starlette's JSONResponse vs.
+  ORJSONResponse
+- cache round trip: the payload as Python objects (UUID, datetime,
+  Decimal, enums) through json.dumps(default=str) + json.loads vs.
+  serialization.dumps + loads, as RedisCache does
+
+The run fails (exit code 1) if the bodies decode to different values or
+the new serializer is slower than the stdlib for any payload. No
+database is needed.
+
+Usage:
+    uv run python scripts/benchmarks/json_serialization.py [items]
+"""
+
+import json
+import os
+import sys
+import timeit
+import types
+import typing
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID, uuid4
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from src.app import serialization
+from src.modules.professionals.domain.schemas import (
+    OrganizationProfessionalDetailResponse,
+)
+from src.modules.screening.domain.schemas import ScreeningProcessDetailResponse
+
+
+NUMBER = 200
+# Nesting below this depth gets empty lists (guards recursive schemas)
+MAX_DEPTH = 4
+
+
+def sample(annotation, items: int, depth: int = 0):
+    """Build a sample value for a type annotation (models recursively)."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Annotated:
+        return sample(args[0], items, depth)
+    if origin in (typing.Union, types.UnionType):
+        arg = next(arg for arg in args if arg is not type(None))
+        return sample(arg, items, depth)
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (list, set, tuple, frozenset):
+        if depth >= MAX_DEPTH:
+            return []
+        return [sample(args[0] if args else str, items, depth + 1) for _ in range(items)]
+    if origin is dict:
+        return {}
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            # model_construct: sample strings need not pass field validators
+            return annotation.model_construct(
+                **{
+                    name: sample(field.annotation, items, depth)
+                    for name, field in annotation.model_fields.items()
+                }
+            )
+        if issubclass(annotation, Enum):
+            return next(iter(annotation))
+        if issubclass(annotation, bool):
+            return True
+        if issubclass(annotation, int):
+            return 42
+        if issubclass(annotation, float):
+            return 4.2
+        if issubclass(annotation, Decimal):
+            return Decimal("1234.56")
+        if issubclass(annotation, UUID):
+            return uuid4()
+        if issubclass(annotation, datetime):
+            return datetime.now(timezone.utc)
+        if issubclass(annotation, date):
+            return date.today()
+        if issubclass(annotation, time):
+            return time(8, 30)
+    # str and anything unannotated: CPF, phone, names, URLs...
+    return "Conceição 123.456.789-09 +5511999990000"
+
+
+def per_call_us(statement) -> float:
+    return min(timeit.repeat(statement, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main(items: int) -> None:
+    payloads = {
+        "professional detail": sample(OrganizationProfessionalDetailResponse, items),
+        "screening detail": sample(ScreeningProcessDetailResponse, items),
+    }
+
+    failed = False
+    print(f"\nJSON serialization (lists of {items} items, best of 5 x {NUMBER} calls)")
+    for name, model in payloads.items():
+        content = model.model_dump(mode="json")
+        stdlib_body = JSONResponse(content).body
+        orjson_body = serialization.ORJSONResponse(content).body
+        if json.loads(stdlib_body) != json.loads(orjson_body):
+            print(f"\nREGRESSION: {name} bodies differ")
+            failed = True
+
+        response_before = per_call_us(lambda: JSONResponse(content))
+        response_after = per_call_us(lambda: serialization.ORJSONResponse(content))
+
+        cached = model.model_dump()
+        cache_before = per_call_us(lambda: json.loads(json.dumps(cached, default=str)))
+        cache_after = per_call_us(lambda: serialization.loads(serialization.dumps(cached)))
+
+        print(f"  {name} ({len(orjson_body) / 1024:.0f} KiB)")
+        print(
+            f"    response body     stdlib={response_before:9.1f}us  "
+            f"orjson={response_after:9.1f}us  ({response_before / response_after:4.1f}x)"
+        )
+        print(
+            f"    cache round trip  stdlib={cache_before:9.1f}us  "
+            f"orjson={cache_after:9.1f}us  ({cache_before / cache_after:4.1f}x)"
+        )
+        if response_after > response_before or cache_after > cache_before:
+            print(f"\nREGRESSION: {name} serializes slower than the stdlib")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,136 @@
+"""
+Benchmark paginated list queries: separate COUNT vs count(*) OVER ().
+
+Compares, against a real database seeded with
+scripts/seed_professionals.py:
+- two-query mode (CountStrategy.EXACT): COUNT(*) then the page query
+- one-query mode (CountStrategy.WINDOW): page query with count(*) OVER ()
+
+Both run through OrganizationProfessionalRepository.list_for_organization
+(the professionals list endpoint) for the first page and a deeper page,
+and report latency percentiles plus database round trips per call.
+Round-trip cost dominates on Neon, so run it against the same region as
+the API for representative numbers.
+
+Usage:
+    uv run python scripts/seed_professionals.py
+    uv run python scripts/benchmarks/list_count_modes.py [iterations]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from uuid import UUID
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from scripts.seed_professionals import ORGANIZATIONS
+from src.app.config import Settings
+from src.modules.professionals.infrastructure.repositories import (
+    OrganizationProfessionalRepository,
+)
+from src.shared.domain.schemas import CountStrategy, CursorPaginationParams
+
+
+PAGE_SIZE = 10
+PAGES = (1, 3)
+STRATEGIES = (CountStrategy.EXACT, CountStrategy.WINDOW)
+
+
+async def run_case(
+    async_session: sessionmaker,
+    statements: list[str],
+    strategy: CountStrategy,
+    page: int,
+    iterations: int,
+) -> tuple[list[float], float, int | None]:
+    """Run one (strategy, page) case and collect latencies in ms."""
+    organization_id = UUID(ORGANIZATIONS[0])
+    family_org_ids = [UUID(org_id) for org_id in ORGANIZATIONS]
+    pagination = CursorPaginationParams(page=page, page_size=PAGE_SIZE)
+
+    latencies: list[float] = []
+    round_trips = 0
+    total = None
+
+    async with async_session() as session:
+        repo = OrganizationProfessionalRepository(session)
+
+        for _ in range(iterations):
+            statements.clear()
+            start = time.perf_counter()
+            result = await repo.list_for_organization(
+                organization_id=organization_id,
+                pagination=pagination,
+                family_org_ids=family_org_ids,
+                count_strategy=strategy,
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+            round_trips += len(statements)
+            total = result.total
+            session.expunge_all()
+
+    return latencies, round_trips / iterations, total
+
+
+def report(
+    strategy: CountStrategy,
+    page: int,
+    latencies: list[float],
+    round_trips: float,
+    total: int | None,
+) -> None:
+    p50 = statistics.median(latencies)
+    p95 = (
+        statistics.quantiles(latencies, n=20)[18]
+        if len(latencies) >= 20
+        else max(latencies)
+    )
+    print(
+        f"  {strategy.value:<8} page={page:<3} p50={p50:7.2f}ms  p95={p95:7.2f}ms  "
+        f"round trips/call={round_trips:.1f}  total={total}"
+    )
+
+
+async def main(iterations: int) -> None:
+    settings = Settings()
+    db_url = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    engine = create_async_engine(db_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    print(
+        f"\nProfessionals list: separate COUNT vs count(*) OVER () "
+        f"({iterations} iterations, page_size={PAGE_SIZE})"
+    )
+
+    # Warm up connections and the plan cache
+    for strategy in STRATEGIES:
+        await run_case(async_session, statements, strategy, 1, 3)
+
+    for page in PAGES:
+        for strategy in STRATEGIES:
+            latencies, round_trips, total = await run_case(
+                async_session, statements, strategy, page, iterations
+            )
+            report(strategy, page, latencies, round_trips, total)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
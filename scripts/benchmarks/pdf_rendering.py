@@ -0,0 +1,244 @@
+"""
+Benchmark compliance report rendering vs. latency of unrelated requests.
+
+Compares, for the screening_report.html template with a synthetic but
+realistic context (qualification, specialty, educations, documents and
+step history):
+- inline: Jinja render + WeasyPrint write_pdf inside the coroutine (the
+  previous PDFGeneratorService.generate_pdf behavior)
+- thread: PDF_RENDER_WORKERS=0, rendering in a thread (loop is free, but
+  rendering still holds the GIL)
+- process pool: PDF_RENDER_WORKERS=N, rendering in processes with the
+  templates preloaded
+
+While reports render, a probe issues a lightweight "unrelated request"
+every PROBE_INTERVAL seconds and records how long it takes to be served,
+which is what other API requests on the same worker experience.
+
+It also prints the per-stage breakdown (render_html, layout, write) of a
+cold render (fresh service) vs. warm renders (compiled template, parsed
+stylesheet, font configuration and image cache reused).
+
+Needs WeasyPrint's system libraries (Pango); no database or Firebase.
+
+Usage:
+    uv run python scripts/benchmarks/pdf_rendering.py [reports]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.app.dependencies.settings import get_settings
+from src.app.logging import configure_logging
+from src.modules.screening.domain.schemas.screening_report import (
+    DocumentData,
+    EducationData,
+    QualificationData,
+    ScreeningReportContext,
+    SpecialtyData,
+    StepHistoryData,
+)
+from src.modules.screening.use_cases.screening_report.generate_screening_report_use_case import (
+    TEMPLATES_DIR,
+)
+from src.shared.infrastructure.pdf import PDFGeneratorService, shutdown_render_pools
+
+
+TEMPLATE_NAME = "screening_report.html"
+PROBE_INTERVAL = 0.005
+POOL_SIZES = (1, 2, 4)
+
+
+def build_context(service: PDFGeneratorService) -> dict:
+    """Build a report context similar to a fully completed screening."""
+    now = datetime.now(timezone.utc)
+    context = ScreeningReportContext(
+        screening_id=uuid4(),
+        generated_at=now,
+        logo_base64=service.get_logo_base64(),
+        placeholder_base64=service.get_placeholder_base64(),
+        professional_name="Maria Aparecida dos Santos",
+        professional_cpf="52998224725",
+        professional_email="maria.santos@example.com",
+        professional_phone="+5511999998888",
+        professional_birth_date=date(1988, 4, 12),
+        professional_gender="FEMALE",
+        professional_gender_label="Feminino",
+        professional_nationality="Brasileira",
+        professional_address="Rua das Flores, 123 - Apto 45, Jardim Paulista",
+        professional_city="São Paulo",
+        professional_state="SP",
+        professional_postal_code="01452000",
+        qualification=QualificationData(
+            professional_type="DOCTOR",
+            professional_type_label="Médico",
+            council_type="CRM",
+            council_number="123456",
+            council_state="SP",
+            graduation_year=2012,
+        ),
+        specialty=SpecialtyData(
+            name="Cardiologia",
+            rqe_number="54321",
+            rqe_state="SP",
+            residency_status="COMPLETED",
+            residency_status_label="Concluída",
+            residency_institution="Hospital das Clínicas",
+        ),
+        educations=[
+            EducationData(
+                level="SPECIALIZATION",
+                level_label="Especialização",
+                course_name=f"Curso {i}",
+                institution="Universidade de São Paulo",
+                start_year=2012 + i,
+                end_year=2013 + i,
+                is_completed=True,
+            )
+            for i in range(4)
+        ],
+        documents=[
+            DocumentData(
+                document_type_name=f"Documento {i}",
+                status="APPROVED",
+                status_label="Aprovado",
+                uploaded_at=now,
+                uploaded_by_name="Maria Aparecida dos Santos",
+                reviewed_at=now,
+                reviewed_by_name="João Revisor",
+                download_url=f"https://storage.example/doc-{i}.pdf",
+            )
+            for i in range(12)
+        ],
+        created_at=now,
+        owner_name="Gestor da Triagem",
+        steps_history=[
+            StepHistoryData(
+                step_type=f"STEP_{i}",
+                step_label=f"Etapa {i}",
+                status="COMPLETED",
+                status_label="Concluído",
+                completed_at=now,
+                completed_by_name="Gestor da Triagem",
+            )
+            for i in range(5)
+        ],
+        completed_at=now,
+        completed_by_name="Gestor da Triagem",
+    )
+    return context.model_dump()
+
+
+async def run_with_probe(workload) -> tuple[float, list[float]]:
+    """Run a workload while timing unrelated requests (ms)."""
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def unrelated_request(started: float) -> None:
+        await asyncio.sleep(0)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    async def probe() -> None:
+        pending = []
+        while not done.is_set():
+            pending.append(asyncio.create_task(unrelated_request(time.perf_counter())))
+            await asyncio.sleep(PROBE_INTERVAL)
+        await asyncio.gather(*pending)
+
+    monitor = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await workload()
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    await monitor
+    return elapsed, latencies
+
+
+def report(label: str, reports: int, elapsed: float, latencies: list[float]) -> None:
+    p50 = statistics.median(latencies) if latencies else 0.0
+    p99 = (
+        statistics.quantiles(latencies, n=100)[98]
+        if len(latencies) >= 100
+        else max(latencies, default=0.0)
+    )
+    print(
+        f"  {label:<22} {reports / elapsed:>6.2f} reports/s  "
+        f"unrelated p50={p50:8.2f}ms p99={p99:8.2f}ms  (n={len(latencies)})"
+    )
+
+
+def report_stages(label: str, timings: list[dict[str, float]]) -> None:
+    stages = "  ".join(
+        f"{stage}={statistics.mean(t[stage] for t in timings):7.2f}ms"
+        for stage in timings[0]
+    )
+    print(f"  {label:<22} {stages}")
+
+
+async def main(reports: int) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    settings = get_settings()
+
+    inline_service = PDFGeneratorService(TEMPLATES_DIR, settings)
+    context = build_context(inline_service)
+
+    print("\nStage timings")
+    report_stages("cold", [inline_service.render_pdf(TEMPLATE_NAME, context).timings])
+    report_stages(
+        "warm",
+        [inline_service.render_pdf(TEMPLATE_NAME, context).timings for _ in range(5)],
+    )
+
+    print(f"\nCompliance report rendering ({reports} concurrent reports)")
+
+    async def render_inline() -> bytes:
+        return inline_service.render_pdf(TEMPLATE_NAME, context).content
+
+    elapsed, latencies = await run_with_probe(
+        lambda: asyncio.gather(*(render_inline() for _ in range(reports)))
+    )
+    report("inline (before)", reports, elapsed, latencies)
+
+    thread_service = PDFGeneratorService(
+        TEMPLATES_DIR, settings.model_copy(update={"PDF_RENDER_WORKERS": 0})
+    )
+    elapsed, latencies = await run_with_probe(
+        lambda: asyncio.gather(
+            *(thread_service.generate_pdf(TEMPLATE_NAME, context) for _ in range(reports))
+        )
+    )
+    report("thread", reports, elapsed, latencies)
+
+    for workers in POOL_SIZES:
+        pool_service = PDFGeneratorService(
+            TEMPLATES_DIR, settings.model_copy(update={"PDF_RENDER_WORKERS": workers})
+        )
+        # Start the processes (and preload templates) outside the measurement
+        await asyncio.gather(
+            *(pool_service.generate_pdf(TEMPLATE_NAME, context) for _ in range(workers))
+        )
+
+        elapsed, latencies = await run_with_probe(
+            lambda: asyncio.gather(
+                *(pool_service.generate_pdf(TEMPLATE_NAME, context) for _ in range(reports))
+            )
+        )
+        report(f"process pool ({workers})", reports, elapsed, latencies)
+        shutdown_render_pools()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
@@ -0,0 +1,206 @@
+"""
+Benchmark planner time and latency per database statement mode.
+
+For the identity, list and detail hot paths:
+- OrganizationRepository.get_identity_data (identity resolver cache miss)
+- OrganizationProfessionalRepository.list_for_organization (first page)
+- OrganizationProfessionalRepository.get_by_id_with_relations (detail)
+
+it reports:
+- planner time per call: "Planning Time" from EXPLAIN (ANALYZE) of every
+  statement the call issues, i.e. what each unprepared execution pays and
+  a cached prepared statement (generic plan) avoids
+- end-to-end latency p50/p95 per DATABASE_STATEMENT_MODE, reusing one
+  connection so the per-connection prepared statement cache is warm
+
+Modes: unprepared and pooler always; direct when DATABASE_DIRECT_URL is
+set. Needs a database seeded with scripts/seed_organizations.py and
+scripts/seed_professionals.py.
+
+Usage:
+    uv run python scripts/benchmarks/prepared_statements.py [iterations]
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from scripts.seed_professionals import ORGANIZATIONS
+from src.app.dependencies.settings import get_settings
+from src.modules.organizations.domain.models import OrganizationMembership
+from src.modules.organizations.infrastructure.repositories import (
+    OrganizationRepository,
+)
+from src.modules.professionals.domain.models import OrganizationProfessional
+from src.modules.professionals.infrastructure.repositories import (
+    OrganizationProfessionalRepository,
+)
+from src.shared.domain.schemas import CursorPaginationParams
+from src.shared.infrastructure.database.connection import _connection_args
+
+
+Workload = Callable[[AsyncSession], Awaitable[object]]
+
+
+async def build_workloads(session: AsyncSession) -> dict[str, Workload]:
+    """Pick seeded ids and build the identity/list/detail workloads."""
+    organization_id = UUID(ORGANIZATIONS[0])
+    family_org_ids = [UUID(org_id) for org_id in ORGANIZATIONS]
+
+    user_id = (
+        await session.execute(
+            select(OrganizationMembership.user_id)
+            .where(OrganizationMembership.organization_id == organization_id)
+            .limit(1)
+        )
+    ).scalar_one()
+    professional_id = (
+        await session.execute(
+            select(OrganizationProfessional.id)
+            .where(OrganizationProfessional.organization_id.in_(family_org_ids))
+            .limit(1)
+        )
+    ).scalar_one()
+    pagination = CursorPaginationParams(page=1, page_size=25)
+
+    async def identity(s: AsyncSession) -> object:
+        return await OrganizationRepository(s).get_identity_data(
+            organization_id, user_id
+        )
+
+    async def listing(s: AsyncSession) -> object:
+        return await OrganizationProfessionalRepository(s).list_for_organization(
+            organization_id=organization_id,
+            pagination=pagination,
+            family_org_ids=family_org_ids,
+        )
+
+    async def detail(s: AsyncSession) -> object:
+        return await OrganizationProfessionalRepository(s).get_by_id_with_relations(
+            id=professional_id,
+            organization_id=organization_id,
+            family_org_ids=family_org_ids,
+        )
+
+    return {"identity": identity, "list": listing, "detail": detail}
+
+
+async def measure_planning(engine, workloads: dict[str, Workload]) -> None:
+    """Print total planning time of the statements each workload issues."""
+    captured: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    print("\nPlanner time per call (EXPLAIN ANALYZE, unprepared)")
+
+    async with AsyncSession(engine) as session:
+        for name, workload in workloads.items():
+            captured.clear()
+            await workload(session)
+            session.expunge_all()
+            statements = list(captured)
+
+            planning = 0.0
+            execution = 0.0
+            for statement, parameters in statements:
+                connection = await session.connection()
+                raw = (
+                    await connection.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}",
+                        parameters,
+                    )
+                ).scalar_one()
+                plan = json.loads(raw) if isinstance(raw, str) else raw
+                planning += plan[0]["Planning Time"]
+                execution += plan[0]["Execution Time"]
+
+            print(
+                f"  {name:<9} statements={len(statements):<2} "
+                f"planning={planning:7.3f}ms  execution={execution:7.3f}ms"
+            )
+
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+async def measure_latency(
+    mode: str,
+    engine,
+    workloads: dict[str, Workload],
+    iterations: int,
+) -> None:
+    """Print per-call latency of each workload for one statement mode."""
+    async with AsyncSession(engine) as session:
+        for name, workload in workloads.items():
+            # Warm up: prepare statements (5+ runs lets PostgreSQL pick a generic plan)
+            for _ in range(6):
+                await workload(session)
+                session.expunge_all()
+
+            latencies = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                await workload(session)
+                latencies.append((time.perf_counter() - start) * 1000)
+                session.expunge_all()
+
+            p50 = statistics.median(latencies)
+            p95 = (
+                statistics.quantiles(latencies, n=20)[18]
+                if len(latencies) >= 20
+                else max(latencies)
+            )
+            print(f"  {mode:<10} {name:<9} p50={p50:7.2f}ms  p95={p95:7.2f}ms")
+
+
+def build_engine(mode: str):
+    """Create an engine configured for a statement mode."""
+    settings = get_settings().model_copy(update={"DATABASE_STATEMENT_MODE": mode})
+
+    if mode == "direct":
+        # Same settings as the read engine in connection.create_read_engine
+        args = settings.neon_connection_args_async
+        args["connect_args"]["prepared_statement_cache_size"] = (
+            settings.DATABASE_STATEMENT_CACHE_SIZE
+        )
+        return create_async_engine(settings.database_direct_url_async, **args)
+
+    return create_async_engine(settings.database_url_async, **_connection_args(settings))
+
+
+async def main(iterations: int) -> None:
+    settings = get_settings()
+    modes = ["unprepared", "pooler"]
+    if settings.DATABASE_DIRECT_URL:
+        modes.append("direct")
+
+    engine = build_engine("unprepared")
+    async with AsyncSession(engine) as session:
+        workloads = await build_workloads(session)
+
+    await measure_planning(engine, workloads)
+    await engine.dispose()
+
+    print(f"\nLatency per call ({iterations} iterations, warm connection)")
+    for mode in modes:
+        engine = build_engine(mode)
+        await measure_latency(mode, engine, workloads, iterations)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
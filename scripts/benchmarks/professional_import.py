@@ -0,0 +1,255 @@
+"""
+Compare the chunked spreadsheet import with per-row composite creates.
+
+Generates a CSV of N valid professionals (one specialty each) and imports
+it with:
+- per-row creates (previous way to load a spreadsheet): each row parsed
+  and sent to CreateOrganizationProfessionalCompositeUseCase, which
+  validates and commits one professional at a time
+- ProcessProfessionalImportJobUseCase, reading the CSV from memory instead
+  of Firebase Storage
+
+and reports rows/s and statements issued. Each run happens inside an
+outer transaction that is rolled back (use case commits become
+savepoints), so the database is left unchanged. The run fails (exit code
+1) if the chunked import is not faster than per-row creates or does not
+import every row.
+
+Needs a database seeded with scripts/seed_organizations.py and at least
+one global specialty.
+
+Usage:
+    uv run python scripts/benchmarks/professional_import.py [rows]
+"""
+
+import asyncio
+import csv
+import io
+import os
+import random
+import sys
+import time
+from typing import BinaryIO
+from uuid import UUID
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from src.app.dependencies.settings import get_settings
+from src.app.logging import configure_logging
+from src.modules.organizations.domain.models import Organization
+from src.modules.professionals.domain.models import (
+    ProfessionalImportFileFormat,
+    ProfessionalImportJob,
+    ProfessionalImportStatus,
+)
+from src.modules.professionals.domain.schemas.organization_professional_composite import (
+    SpecialtyNestedCreate,
+)
+from src.modules.professionals.domain.services import (
+    ParsedProfessionalRow,
+    parse_professional_row,
+)
+from src.modules.professionals.use_cases import (
+    CreateOrganizationProfessionalCompositeUseCase,
+    ProcessProfessionalImportJobUseCase,
+)
+from src.shared.domain.models.specialty import Specialty
+from src.shared.infrastructure.database.connection import _connection_args
+from src.shared.infrastructure.spreadsheets import read_csv
+
+
+# Rows imported one by one (per-row creates are slow; rows/s is compared)
+PER_ROW_LIMIT = 300
+
+COLUMNS = [
+    "full_name",
+    "cpf",
+    "email",
+    "city",
+    "state_code",
+    "postal_code",
+    "professional_type",
+    "council_type",
+    "council_number",
+    "council_state",
+    "specialty_codes",
+]
+
+
+class MemoryStorage:
+    """Serves the generated CSV in place of Firebase Storage."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    async def download_to_file(self, path: str, file: BinaryIO) -> None:
+        file.write(self.content)
+        file.seek(0)
+
+
+def generate_cpf() -> str:
+    digits = [random.randint(0, 9) for _ in range(9)]
+    for length in (9, 10):
+        total = sum((length + 1 - i) * digits[i] for i in range(length))
+        digits.append(0 if total % 11 < 2 else 11 - total % 11)
+    return "".join(map(str, digits))
+
+
+def build_csv(rows: int, specialty_code: str) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";")
+    writer.writerow(COLUMNS)
+    suffix = random.randint(0, 10**6)
+    for i in range(rows):
+        writer.writerow(
+            [
+                f"Benchmark Professional {i}",
+                generate_cpf(),
+                f"import-{suffix}-{i}@example.com",
+                "São Paulo",
+                "sp",
+                "01452000",
+                "doctor",
+                "crm",
+                f"{suffix}{i:06d}",
+                "SP",
+                specialty_code,
+            ]
+        )
+    return buffer.getvalue().encode("utf-8")
+
+
+async def import_per_row(
+    conn: AsyncConnection,
+    content: bytes,
+    organization_id: UUID,
+    specialty_ids: dict[str, UUID],
+) -> int:
+    """Parse each row and create it with the composite use case."""
+    async with AsyncSession(
+        bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False
+    ) as session:
+        use_case = CreateOrganizationProfessionalCompositeUseCase(session)
+        imported = 0
+        for line, values in read_csv(io.BytesIO(content)).rows:
+            row = parse_professional_row(line, values)
+            assert isinstance(row, ParsedProfessionalRow), row
+            row.data.qualification.specialties = [
+                SpecialtyNestedCreate(specialty_id=specialty_ids[code])
+                for code in row.specialty_codes
+            ]
+            await use_case.execute(organization_id, row.data, [organization_id])
+            imported += 1
+    return imported
+
+
+async def import_chunked(
+    conn: AsyncConnection,
+    content: bytes,
+    organization_id: UUID,
+) -> ProfessionalImportJob:
+    """Run an import job over the CSV."""
+    async with AsyncSession(
+        bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False
+    ) as session:
+        job = ProfessionalImportJob(
+            organization_id=organization_id,
+            file_name="benchmark.csv",
+            file_path="benchmark/benchmark.csv",
+            file_format=ProfessionalImportFileFormat.CSV,
+        )
+        session.add(job)
+        await session.commit()
+
+        use_case = ProcessProfessionalImportJobUseCase(session)
+        use_case.storage_service = MemoryStorage(content)  # type: ignore[assignment]
+        delay = await use_case.execute(job.id)
+        if delay is not None:
+            raise SystemExit(f"Import job asked for a retry: {job.error}")
+
+        await session.refresh(job)
+        return job
+
+
+async def main(rows: int) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    settings = get_settings()
+    engine = create_async_engine(settings.database_url_async, **_connection_args(settings))
+
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async with AsyncSession(engine) as session:
+        organization_id = (
+            await session.execute(select(Organization.id).limit(1))
+        ).scalar_one_or_none()
+        specialty = (
+            await session.execute(select(Specialty).limit(1))
+        ).scalar_one_or_none()
+    if organization_id is None:
+        raise SystemExit("No organization found (run scripts/seed_organizations.py)")
+    if specialty is None:
+        raise SystemExit("No global specialty found")
+
+    per_row_rows = min(rows, PER_ROW_LIMIT)
+    content = build_csv(rows, specialty.code)
+    per_row_content = build_csv(per_row_rows, specialty.code)
+
+    print(f"\nProfessional spreadsheet import (rolled back, chunk size "
+          f"{settings.PROFESSIONAL_IMPORT_CHUNK_SIZE})")
+
+    async with engine.connect() as conn:
+        await conn.begin()
+        statements.clear()
+        start = time.perf_counter()
+        imported = await import_per_row(
+            conn, per_row_content, organization_id, {specialty.code: specialty.id}
+        )
+        per_row_seconds = time.perf_counter() - start
+        per_row_statements = len(statements)
+        await conn.rollback()
+    per_row_rate = imported / per_row_seconds
+    print(
+        f"  per-row creates  rows={imported:<7} statements={per_row_statements:<7} "
+        f"{per_row_seconds:8.2f}s  {per_row_rate:10.1f} rows/s"
+    )
+
+    async with engine.connect() as conn:
+        await conn.begin()
+        statements.clear()
+        start = time.perf_counter()
+        job = await import_chunked(conn, content, organization_id)
+        chunked_seconds = time.perf_counter() - start
+        chunked_statements = len(statements)
+        await conn.rollback()
+    chunked_rate = job.imported_rows / chunked_seconds
+    print(
+        f"  chunked import   rows={job.imported_rows:<7} statements={chunked_statements:<7} "
+        f"{chunked_seconds:8.2f}s  {chunked_rate:10.1f} rows/s  "
+        f"({chunked_rate / per_row_rate:.1f}x)"
+    )
+
+    await engine.dispose()
+
+    if job.status != ProfessionalImportStatus.COMPLETED or job.imported_rows != rows:
+        print(
+            f"\nREGRESSION: job {job.status.value} imported {job.imported_rows}/{rows} rows "
+            f"({job.error_rows} rejected: {job.errors[:3]})"
+        )
+        sys.exit(1)
+    if chunked_rate <= per_row_rate:
+        print("\nREGRESSION: chunked import is not faster than per-row creates")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
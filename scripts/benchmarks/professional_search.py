@@ -0,0 +1,272 @@
+"""
+Benchmark the organization professional search on a large organization.
+
+Seeds professionals (100k by default) into one organization and, for a
+few search terms, compares:
+- SearchFilter (previous behavior): unaccent(column) ILIKE '%term%' on
+  full_name, email and cpf, which no index can serve
+- OrganizationProfessionalRepository.list_for_organization: the trigram
+  indexed expression, ranked by similarity, and CPF prefix matching
+
+and reports latency (p50/p95 of a first page with its exact total), the
+total found and whether the plan scans the table. Everything runs inside
+a transaction that is rolled back, so the database is left unchanged.
+The run fails (exit code 1) if the plan of a selective search scans
+organization_professionals sequentially, or the indexed search finds a
+different number of rows than the previous one.
+
+Needs a database seeded with scripts/seed_organizations.py and migrated
+to head (the trigram and CPF prefix indexes).
+
+Usage:
+    uv run python scripts/benchmarks/professional_search.py [professionals]
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from fastapi_restkit.filters import SearchFilter
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.app.dependencies.settings import get_settings
+from src.app.logging import configure_logging
+from src.modules.organizations.domain.models import Organization
+from src.modules.professionals.domain.models import OrganizationProfessional
+from src.modules.professionals.infrastructure.filters import (
+    OrganizationProfessionalFilter,
+    OrganizationProfessionalSorting,
+)
+from src.modules.professionals.infrastructure.repositories import (
+    OrganizationProfessionalRepository,
+)
+from src.shared.domain.schemas import CursorPaginationParams
+from src.shared.infrastructure.database.connection import _connection_args
+
+
+REPEAT = 20
+
+# Names repeat across rows (as in a real roster), with accents
+SEED_SQL = """
+INSERT INTO organization_professionals (id, organization_id, full_name, email, cpf)
+SELECT
+    gen_random_uuid(),
+    :organization_id,
+    (ARRAY['João', 'Maria', 'José', 'Ana', 'Antônio', 'Francisca', 'Luís', 'Márcia'])
+        [1 + i % 8]
+    || ' ' || (ARRAY['Silva', 'Santos', 'Oliveira', 'Souza', 'Conceição', 'Araújo'])
+        [1 + (i / 8) % 6]
+    || ' ' || (ARRAY['Gonçalves', 'Pereira', 'Lima', 'Ferreira', 'Rodrigues'])
+        [1 + (i / 48) % 5]
+    || ' ' || i,
+    'profissional' || i || '@example.com',
+    lpad(((i::bigint * 104729) % 99999999999)::text, 11, '0')
+FROM generate_series(1, :professionals) AS i
+"""
+
+
+class PreviousFilter(OrganizationProfessionalFilter):
+    """The filter as it was: search mapped to the columns by SearchFilter."""
+
+    class Config:
+        """FilterSet configuration."""
+
+        field_columns = {"search": ["full_name", "email", "cpf"]}
+
+
+def search_terms(sample: int, sample_cpf: str) -> list[tuple[str, bool, bool]]:
+    """
+    Search terms, with whether the previous search should find the same
+    rows and whether the term is selective enough to require an index.
+
+    "silva" matches a sixth of the roster, where a sequential scan may be
+    the right plan. CPF terms are punctuated or prefixes, which the
+    previous search did not normalize.
+    """
+    return [
+        ("silva", True, False),
+        ("joao conceicao", True, True),
+        ("Márcia Araújo Lima", True, True),
+        (f"profissional{sample}@", True, True),
+        (sample_cpf[:6], False, True),
+        (f"{sample_cpf[:3]}.{sample_cpf[3:6]}.{sample_cpf[6:9]}", False, True),
+    ]
+
+
+def seq_scans(plan: dict) -> list[str]:
+    """Relations scanned sequentially anywhere in an EXPLAIN JSON plan."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def run_search(
+    session: AsyncSession,
+    organization_id,
+    filters: OrganizationProfessionalFilter,
+    *,
+    previous: bool,
+) -> int:
+    """List the first page of a search and return the total found."""
+    repository = OrganizationProfessionalRepository(session)
+    pagination = CursorPaginationParams(page=1, page_size=25)
+    if previous:
+        query = repository._apply_org_scope(  # type: ignore[misc]
+            repository.get_query(), [organization_id]
+        )
+        page = await repository.list(
+            filters=filters,
+            sorting=OrganizationProfessionalSorting(),
+            limit=pagination.limit,
+            offset=pagination.offset,
+            base_query=query,
+        )
+    else:
+        page = await repository.list_for_organization(
+            organization_id,
+            pagination,
+            filters=filters,
+            sorting=OrganizationProfessionalSorting(),
+        )
+    session.expunge_all()
+    return page.total or 0
+
+
+async def measure(
+    session: AsyncSession,
+    statements: list[tuple[str, object]],
+    organization_id,
+    filters: OrganizationProfessionalFilter,
+    *,
+    previous: bool,
+) -> tuple[list[float], int, list[str]]:
+    """Latencies, total found and sequentially scanned relations of a search."""
+    latencies = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        total = await run_search(session, organization_id, filters, previous=previous)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    statements.clear()
+    await run_search(session, organization_id, filters, previous=previous)
+    captured = list(statements)
+
+    scanned: list[str] = []
+    connection = await session.connection()
+    for statement, parameters in captured:
+        raw = (
+            await connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+        ).scalar_one()
+        plan = json.loads(raw) if isinstance(raw, str) else raw
+        scanned.extend(seq_scans(plan[0]["Plan"]))
+    return latencies, total, scanned
+
+
+def p95(values: list[float]) -> float:
+    return sorted(values)[max(0, int(len(values) * 0.95) - 1)]
+
+
+async def main(professionals: int) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    settings = get_settings()
+    engine = create_async_engine(settings.database_url_async, **_connection_args(settings))
+
+    statements: list[tuple[str, object]] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("EXPLAIN"):
+            statements.append((statement, parameters))
+
+    failed = False
+    async with engine.connect() as conn:
+        await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+            autoflush=False,
+        ) as session:
+            organization_id = (
+                await session.execute(select(Organization.id).limit(1))
+            ).scalar_one_or_none()
+            if organization_id is None:
+                raise SystemExit(
+                    "No organization found (run scripts/seed_organizations.py)"
+                )
+
+            start = time.perf_counter()
+            await session.execute(
+                text(SEED_SQL),
+                {"organization_id": organization_id, "professionals": professionals},
+            )
+            await session.execute(text("ANALYZE organization_professionals"))
+            print(
+                f"\nSeeded {professionals} professionals in "
+                f"{time.perf_counter() - start:.1f}s (rolled back at the end)"
+            )
+            sample = min(4242, professionals)
+            sample_cpf = (
+                await session.execute(
+                    select(OrganizationProfessional.cpf).where(
+                        OrganizationProfessional.email
+                        == f"profissional{sample}@example.com"
+                    )
+                )
+            ).scalar_one()
+
+            print(f"\nSearch, first page + exact total (p50/p95 of {REPEAT} runs)")
+            for term, comparable, selective in search_terms(sample, sample_cpf):
+                results = {}
+                for previous in (True, False):
+                    filter_class = (
+                        PreviousFilter if previous else OrganizationProfessionalFilter
+                    )
+                    filters = filter_class(search=SearchFilter(value=term))
+                    results[previous] = await measure(
+                        session, statements, organization_id, filters, previous=previous
+                    )
+
+                print(f"  {term!r}")
+                for previous, label in ((True, "SearchFilter"), (False, "indexed")):
+                    latencies, total, scanned = results[previous]
+                    print(
+                        f"    {label:<13} p50={statistics.median(latencies):8.2f}ms "
+                        f"p95={p95(latencies):8.2f}ms  total={total:<6} "
+                        f"seq scans={', '.join(sorted(set(scanned))) or '-'}"
+                    )
+
+                _, total, scanned = results[False]
+                if selective and "organization_professionals" in scanned:
+                    print(f"\nREGRESSION: {term!r} scans organization_professionals")
+                    failed = True
+                if comparable and total != results[True][1]:
+                    print(
+                        f"\nREGRESSION: {term!r} found {total} rows "
+                        f"(previous search: {results[True][1]})"
+                    )
+                    failed = True
+        await conn.rollback()
+
+    await engine.dispose()
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,209 @@
+"""
+Benchmark the professional summary list: ORM + Pydantic vs. JSON from SQL.
+
+Seeds professionals, each with a primary qualification and specialties,
+into one organization and, for page sizes 25 to 500, renders the first
+page with:
+- execute() (current path): load_only + selectinload into ORM objects,
+  OrganizationProfessionalListItem models, then the response validation
+  and JSON serialization FastAPI does for a response_model
+- execute_json(): summary columns and json_agg in SQL, items copied into
+  the body as JSON text
+
+and reports rows/sec of each (request to JSON bytes). Everything runs
+inside a transaction that is rolled back, so the database is left
+unchanged. The run fails (exit code 1) if the two bodies differ or the
+JSON path is slower than the current one at any page size.
+
+Needs a database seeded with scripts/seed_organizations.py and global
+specialties.
+
+Usage:
+    uv run python scripts/benchmarks/professional_summary_list.py [professionals]
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from pydantic import TypeAdapter
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.app.dependencies.settings import get_settings
+from src.app.logging import configure_logging
+from src.modules.organizations.domain.models import Organization
+from src.modules.professionals.domain.schemas import OrganizationProfessionalListItem
+from src.modules.professionals.infrastructure.filters import (
+    OrganizationProfessionalSorting,
+)
+from src.modules.professionals.use_cases import (
+    ListOrganizationProfessionalsSummaryUseCase,
+)
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+)
+from src.shared.infrastructure.database.connection import _connection_args
+
+
+PAGE_SIZES = [25, 100, 250, 500]
+REPEAT = 10
+SPECIALTIES_PER_PROFESSIONAL = 3
+
+SEED_SQL = """
+WITH professionals AS (
+    INSERT INTO organization_professionals (
+        id, organization_id, full_name, email, cpf, phone, city, state_code
+    )
+    SELECT
+        gen_random_uuid(), :organization_id, 'Profissional Resumo ' || i,
+        'resumo' || i || '@example.com', lpad(i::text, 11, '0'), '11999990000',
+        'São Paulo', 'SP'
+    FROM generate_series(1, :professionals) AS i
+    RETURNING id, organization_id
+),
+qualifications AS (
+    INSERT INTO professional_qualifications (
+        id, organization_id, organization_professional_id, professional_type,
+        is_primary, council_type, council_number, council_state
+    )
+    SELECT
+        gen_random_uuid(), organization_id, id, 'DOCTOR', true, 'CRM',
+        substr(replace(id::text, '-', ''), 1, 20), 'SP'
+    FROM professionals
+    RETURNING id
+)
+INSERT INTO professional_specialties (
+    id, qualification_id, specialty_id, is_primary, residency_status
+)
+SELECT gen_random_uuid(), q.id, s.id, false, 'COMPLETED'
+FROM qualifications AS q
+CROSS JOIN (SELECT id FROM specialties LIMIT :per_professional) AS s
+"""
+
+# What FastAPI does with the response_model of the current path
+response_adapter = TypeAdapter(CursorPaginatedResponse[OrganizationProfessionalListItem])
+
+
+async def current_path(use_case, session, organization_id, page_size: int) -> bytes:
+    response = await use_case.execute(
+        organization_id,
+        CursorPaginationParams(page=1, page_size=page_size),
+        [organization_id],
+        sorting=OrganizationProfessionalSorting(),
+        count_strategy=CountStrategy.EXACT,
+    )
+    validated = response_adapter.validate_python(response, from_attributes=True)
+    body = json.dumps(response_adapter.dump_python(validated, mode="json")).encode()
+    session.expunge_all()
+    return body
+
+
+async def json_path(use_case, session, organization_id, page_size: int) -> bytes:
+    body = await use_case.execute_json(
+        organization_id,
+        CursorPaginationParams(page=1, page_size=page_size),
+        [organization_id],
+        sorting=OrganizationProfessionalSorting(),
+        count_strategy=CountStrategy.EXACT,
+    )
+    session.expunge_all()
+    return body
+
+
+def normalized(body: bytes) -> dict:
+    """Decoded body with specialties in a stable order (unordered before)."""
+    data = json.loads(body)
+    for item in data["items"]:
+        item["specialties"].sort(key=lambda specialty: specialty["id"])
+    return data
+
+
+async def rows_per_second(path, use_case, session, organization_id, page_size: int):
+    durations = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        await path(use_case, session, organization_id, page_size)
+        durations.append(time.perf_counter() - start)
+    return page_size / statistics.median(durations)
+
+
+async def main(professionals: int) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    settings = get_settings()
+    engine = create_async_engine(settings.database_url_async, **_connection_args(settings))
+
+    failed = False
+    async with engine.connect() as conn:
+        await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+            autoflush=False,
+        ) as session:
+            organization_id = (
+                await session.execute(select(Organization.id).limit(1))
+            ).scalar_one_or_none()
+            if organization_id is None:
+                raise SystemExit(
+                    "No organization found (run scripts/seed_organizations.py)"
+                )
+
+            await session.execute(
+                text(SEED_SQL),
+                {
+                    "organization_id": organization_id,
+                    "professionals": professionals,
+                    "per_professional": SPECIALTIES_PER_PROFESSIONAL,
+                },
+            )
+            await session.execute(text("ANALYZE organization_professionals"))
+            use_case = ListOrganizationProfessionalsSummaryUseCase(session)
+
+            print(
+                f"\nProfessional summary list ({professionals} seeded, "
+                f"median of {REPEAT} runs, first page to JSON bytes)"
+            )
+            for page_size in PAGE_SIZES:
+                current_body = await current_path(
+                    use_case, session, organization_id, page_size
+                )
+                json_body = await json_path(use_case, session, organization_id, page_size)
+                if normalized(current_body) != normalized(json_body):
+                    print(f"\nREGRESSION: bodies differ at page size {page_size}")
+                    failed = True
+
+                current = await rows_per_second(
+                    current_path, use_case, session, organization_id, page_size
+                )
+                fast = await rows_per_second(
+                    json_path, use_case, session, organization_id, page_size
+                )
+                print(
+                    f"  page_size={page_size:<4} current={current:9.0f} rows/s  "
+                    f"json={fast:9.0f} rows/s  ({fast / current:4.1f}x)"
+                )
+                if fast < current:
+                    print(f"\nREGRESSION: JSON path slower at page size {page_size}")
+                    failed = True
+        await conn.rollback()
+
+    await engine.dispose()
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
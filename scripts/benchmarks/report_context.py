@@ -0,0 +1,210 @@
+"""
+Regression benchmark for building the compliance report context.
+
+Compares, on the screening with the most documents in the database (or
+the screening id passed as second argument):
+- per-reference resolution (previous behavior): one UserRepository.get_by_id
+  per document uploader, document reviewer, step completer, owner and
+  finalizer, plus one SpecialtyRepository.get_by_id
+- ScreeningReportContextBuilder: references collected first and resolved
+  with one bulk query per table
+
+Both start from ScreeningProcessRepository.get_by_id_for_report and report
+statements per build and latency. The run fails (exit code 1) if the
+builder issues more than MAX_BUILDER_STATEMENTS statements, i.e. if the
+number of round trips starts growing with the number of documents again.
+
+Usage:
+    uv run python scripts/benchmarks/report_context.py [iterations] [screening_id]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from uuid import UUID
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.app.config import Settings
+from src.app.logging import configure_logging
+from src.modules.screening.domain.models import (
+    DocumentUploadStep,
+    ScreeningDocument,
+    ScreeningProcess,
+)
+from src.modules.screening.infrastructure.repositories import ScreeningProcessRepository
+from src.modules.screening.use_cases.screening_report.generate_screening_report_use_case import (
+    TEMPLATES_DIR,
+)
+from src.modules.screening.use_cases.screening_report.report_context_builder import (
+    ScreeningReportContextBuilder,
+)
+from src.modules.users.infrastructure.repositories import UserRepository
+from src.shared.infrastructure.pdf import PDFGeneratorService
+from src.shared.infrastructure.repositories.specialty_repository import (
+    SpecialtyRepository,
+)
+
+
+# get_by_id_for_report (process + selectin loads) + users + specialties
+MAX_BUILDER_STATEMENTS = 16
+
+
+async def pick_screening(session: AsyncSession) -> ScreeningProcess:
+    """Pick the screening with the most documents."""
+    result = await session.execute(
+        select(ScreeningProcess)
+        .join(DocumentUploadStep, DocumentUploadStep.process_id == ScreeningProcess.id)
+        .join(ScreeningDocument, ScreeningDocument.upload_step_id == DocumentUploadStep.id)
+        .group_by(ScreeningProcess.id)
+        .order_by(func.count(ScreeningDocument.id).desc())
+        .limit(1)
+    )
+    process = result.scalar_one_or_none()
+    if process is None:
+        raise SystemExit("No screening with documents found")
+    return process
+
+
+async def load(session: AsyncSession, screening: ScreeningProcess) -> ScreeningProcess:
+    """Load the report graph for a screening."""
+    return await ScreeningProcessRepository(session).get_by_id_for_report(
+        id=screening.id,
+        organization_id=screening.organization_id,
+        family_org_ids=None,
+    )
+
+
+async def resolve_per_reference(session: AsyncSession, process: ScreeningProcess) -> int:
+    """Previous behavior: one query per referenced user occurrence."""
+    users = UserRepository(session)
+    names = 0
+
+    async def name(user_id) -> None:
+        nonlocal names
+        if user_id:
+            user = await users.get_by_id(UUID(str(user_id)))
+            names += user is not None
+
+    if process.expected_specialty_id:
+        await SpecialtyRepository(session).get_by_id(process.expected_specialty_id)
+
+    if process.document_upload_step:
+        for doc in process.document_upload_step.documents:
+            if doc.review_history:
+                await name(doc.review_history[-1].get("user_id"))
+            await name(doc.created_by)
+
+    for step in ScreeningReportContextBuilder._steps_by_type(process).values():
+        if step is not None:
+            await name(step.completed_by)
+
+    await name(process.owner_id)
+    await name(process.updated_by)
+    return names
+
+
+async def measure(async_session, statements: list[str], screening, iterations, build):
+    """Run a build function and collect latencies (ms) and statement counts."""
+    latencies: list[float] = []
+    counts: list[int] = []
+
+    for _ in range(iterations):
+        async with async_session() as session:
+            statements.clear()
+            start = time.perf_counter()
+            process = await load(session, screening)
+            await build(session, process)
+            latencies.append((time.perf_counter() - start) * 1000)
+            counts.append(len(statements))
+
+    return latencies, counts
+
+
+def report(label: str, latencies: list[float], counts: list[int]) -> None:
+    p50 = statistics.median(latencies)
+    p95 = (
+        statistics.quantiles(latencies, n=20)[18]
+        if len(latencies) >= 20
+        else max(latencies)
+    )
+    print(
+        f"  {label:<22} p50={p50:8.2f}ms  p95={p95:8.2f}ms  "
+        f"statements/build={max(counts)}"
+    )
+
+
+async def main(iterations: int, screening_id: UUID | None) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    settings = Settings()
+    db_url = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    engine = create_async_engine(db_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async with async_session() as session:
+        if screening_id:
+            screening = await session.get(ScreeningProcess, screening_id)
+        else:
+            screening = await pick_screening(session)
+        process = await load(session, screening)
+        documents = (
+            len(process.document_upload_step.documents)
+            if process.document_upload_step
+            else 0
+        )
+
+    print(
+        f"\nReport context for screening {screening.id} "
+        f"({documents} documents, {iterations} iterations)"
+    )
+
+    pdf_service = PDFGeneratorService(TEMPLATES_DIR, settings)
+
+    async def per_reference(session, process):
+        await resolve_per_reference(session, process)
+
+    async def builder(session, process):
+        await ScreeningReportContextBuilder(session, pdf_service).build(process)
+
+    latencies, counts = await measure(
+        async_session, statements, screening, iterations, per_reference
+    )
+    report("per-reference (before)", latencies, counts)
+
+    latencies, counts = await measure(
+        async_session, statements, screening, iterations, builder
+    )
+    report("bulk builder", latencies, counts)
+
+    await engine.dispose()
+
+    if max(counts) > MAX_BUILDER_STATEMENTS:
+        print(
+            f"\nREGRESSION: builder issued {max(counts)} statements "
+            f"(max {MAX_BUILDER_STATEMENTS})"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+            UUID(sys.argv[2]) if len(sys.argv) > 2 else None,
+        )
+    )
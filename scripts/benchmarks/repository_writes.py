@@ -0,0 +1,160 @@
+"""
+Count database round trips of BaseRepository writes.
+
+For ROWS educations added to a seeded qualification, compares:
+- flush + refresh (previous BaseRepository.create/update behavior)
+- create/update with eager server defaults (RETURNING, no refresh)
+- create(flush=False) + one flush at the unit-of-work boundary
+- create_many (creates only: one INSERT ... RETURNING per table)
+
+and reports statements issued and latency. Everything runs inside a
+transaction that is rolled back, so the database is left unchanged. The
+run fails (exit code 1) if a flushed create or update still needs more
+than one statement per entity.
+
+Needs a database seeded with scripts/seed_professionals.py.
+
+Usage:
+    uv run python scripts/benchmarks/repository_writes.py [rows]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.app.dependencies.settings import get_settings
+from src.app.logging import configure_logging
+from src.modules.professionals.domain.models import (
+    ProfessionalEducation,
+    ProfessionalQualification,
+)
+from src.modules.professionals.domain.models.enums import EducationLevel
+from src.modules.professionals.infrastructure.repositories import (
+    ProfessionalEducationRepository,
+)
+from src.shared.infrastructure.database.connection import _connection_args
+
+
+Scenario = Callable[[AsyncSession, list[ProfessionalEducation]], Awaitable[None]]
+
+
+def build_educations(
+    qualification: ProfessionalQualification, rows: int
+) -> list[ProfessionalEducation]:
+    return [
+        ProfessionalEducation(
+            organization_id=qualification.organization_id,
+            qualification_id=qualification.id,
+            level=EducationLevel.SPECIALIZATION,
+            course_name=f"Benchmark course {i}",
+            institution="Benchmark institution",
+            is_completed=True,
+        )
+        for i in range(rows)
+    ]
+
+
+async def flush_and_refresh(session: AsyncSession, entities) -> None:
+    """Previous behavior: flush + refresh per create and per update."""
+    for entity in entities:
+        session.add(entity)
+        await session.flush()
+        await session.refresh(entity)
+    for entity in entities:
+        entity.notes = "updated"
+        entity.updated_at = datetime.now(timezone.utc)
+        session.add(entity)
+        await session.flush()
+        await session.refresh(entity)
+
+
+async def eager_defaults(session: AsyncSession, entities) -> None:
+    repository = ProfessionalEducationRepository(session)
+    for entity in entities:
+        await repository.create(entity)
+    for entity in entities:
+        entity.notes = "updated"
+        entity.updated_at = datetime.now(timezone.utc)
+        await repository.update(entity)
+
+
+async def deferred_flush(session: AsyncSession, entities) -> None:
+    repository = ProfessionalEducationRepository(session)
+    for entity in entities:
+        await repository.create(entity, flush=False)
+    for entity in entities:
+        entity.notes = "updated"
+        await repository.update(entity, flush=False)
+    await session.flush()
+
+
+async def create_many(session: AsyncSession, entities) -> None:
+    await ProfessionalEducationRepository(session).create_many(entities)
+
+
+async def main(rows: int) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    settings = get_settings()
+    engine = create_async_engine(settings.database_url_async, **_connection_args(settings))
+
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        qualification = (
+            await session.execute(select(ProfessionalQualification).limit(1))
+        ).scalar_one_or_none()
+        if qualification is None:
+            raise SystemExit("No qualification found (run scripts/seed_professionals.py)")
+
+    scenarios: dict[str, Scenario] = {
+        "flush + refresh (before)": flush_and_refresh,
+        "eager defaults": eager_defaults,
+        "deferred flush": deferred_flush,
+        "create_many": create_many,
+    }
+
+    print(f"\nRepository writes ({rows} creates + updates, rolled back)")
+    failed = False
+
+    for label, scenario in scenarios.items():
+        async with AsyncSession(engine, autoflush=False) as session:
+            await session.connection()
+            entities = build_educations(qualification, rows)
+            statements.clear()
+            start = time.perf_counter()
+            await scenario(session, entities)
+            elapsed = (time.perf_counter() - start) * 1000
+            count = len(statements)
+            await session.rollback()
+
+        print(
+            f"  {label:<26} statements={count:<5} "
+            f"per entity={count / rows:5.2f}  {elapsed:8.2f}ms"
+        )
+        if scenario is eager_defaults and count > 2 * rows:
+            failed = True
+
+    await engine.dispose()
+
+    if failed:
+        print("\nREGRESSION: flushed create/update needs more than one statement")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
@@ -0,0 +1,187 @@
+"""
+Benchmark concurrent document uploads vs. latency of unrelated requests.
+
+Compares:
+- the previous upload path: file.read() + blob.upload_from_string +
+  generate_signed_url called directly inside the coroutine
+- FirebaseStorageService.upload_file: resumable chunked upload and URL
+  signing in the storage thread pool (bounded concurrency)
+
+Uploads go to an in-memory fake bucket that simulates network transfer
+time (blocking sleeps per chunk, like the real SDK's socket writes), so
+no Firebase project or emulator is needed. To run against a GCS emulator
+instead, set STORAGE_EMULATOR_HOST and pass a real bucket.
+
+While uploads run, a probe issues a lightweight "unrelated request" every
+PROBE_INTERVAL seconds and records how long it takes to be served.
+
+Usage:
+    uv run python scripts/benchmarks/storage_uploads.py [uploads]
+"""
+
+import asyncio
+import io
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+# Add project root to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.app.logging import configure_logging
+from src.shared.infrastructure.firebase.storage_service import FirebaseStorageService
+
+
+FILE_SIZE = 10 * 1024 * 1024
+BANDWIDTH_BYTES_PER_SECOND = 200 * 1024 * 1024
+SIGN_SECONDS = 0.002
+PROBE_INTERVAL = 0.002
+
+
+class FakeBlob:
+    """Blob that simulates transfer time instead of talking to GCS."""
+
+    def __init__(self, bucket: "FakeBucket", path: str) -> None:
+        self._bucket = bucket
+        self.path = path
+        self.chunk_size: int | None = None
+
+    def upload_from_string(self, data: bytes, content_type: str) -> None:
+        time.sleep(len(data) / BANDWIDTH_BYTES_PER_SECOND)
+        self._bucket.objects[self.path] = len(data)
+
+    def upload_from_file(
+        self,
+        file_obj,
+        rewind: bool = False,
+        size: int | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        if rewind:
+            file_obj.seek(0)
+        chunk_size = self.chunk_size or size or FILE_SIZE
+        total = 0
+        while chunk := file_obj.read(chunk_size):
+            time.sleep(len(chunk) / BANDWIDTH_BYTES_PER_SECOND)
+            total += len(chunk)
+        self._bucket.objects[self.path] = total
+
+    def generate_signed_url(self, version: str, expiration: timedelta, method: str) -> str:
+        time.sleep(SIGN_SECONDS)
+        return f"https://storage.example/{self.path}?signature=fake"
+
+    def delete(self) -> None:
+        self._bucket.objects.pop(self.path, None)
+
+
+class FakeBucket:
+    """In-memory bucket keeping uploaded object sizes."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, int] = {}
+
+    def blob(self, path: str) -> FakeBlob:
+        return FakeBlob(self, path)
+
+
+def build_service(bucket: FakeBucket) -> FirebaseStorageService:
+    settings = SimpleNamespace(
+        FIREBASE_STORAGE_BUCKET="benchmark-bucket",
+        FIREBASE_STORAGE_UPLOAD_CONCURRENCY=4,
+        FIREBASE_STORAGE_CHUNK_SIZE=1024 * 1024,
+    )
+    return FirebaseStorageService(settings, bucket=bucket)
+
+
+async def upload_inline(bucket: FakeBucket, payload: bytes) -> None:
+    """Previous behavior: blocking SDK calls inside the coroutine."""
+    file = io.BytesIO(payload)
+    blob = bucket.blob(f"inline/{uuid4()}.pdf")
+    content = file.read()
+    blob.upload_from_string(content, content_type="application/pdf")
+    blob.generate_signed_url(version="v4", expiration=timedelta(days=365), method="GET")
+
+
+async def upload_async(service: FirebaseStorageService, payload: bytes) -> None:
+    """New behavior: streamed upload in the storage thread pool."""
+    await service.upload_file(
+        file=io.BytesIO(payload),
+        file_name="document.pdf",
+        file_size=len(payload),
+        content_type="application/pdf",
+        organization_id=uuid4(),
+        professional_id=uuid4(),
+        screening_id=uuid4(),
+        document_type_id=uuid4(),
+    )
+
+
+async def run_with_probe(workload) -> tuple[float, list[float]]:
+    """Run a workload while timing unrelated requests (ms)."""
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def unrelated_request(started: float) -> None:
+        await asyncio.sleep(0)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    async def probe() -> None:
+        pending = []
+        while not done.is_set():
+            pending.append(asyncio.create_task(unrelated_request(time.perf_counter())))
+            await asyncio.sleep(PROBE_INTERVAL)
+        await asyncio.gather(*pending)
+
+    monitor = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await workload()
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    await monitor
+    return elapsed, latencies
+
+
+def report(label: str, uploads: int, elapsed: float, latencies: list[float]) -> None:
+    p50 = statistics.median(latencies) if latencies else 0.0
+    p99 = (
+        statistics.quantiles(latencies, n=100)[98]
+        if len(latencies) >= 100
+        else max(latencies, default=0.0)
+    )
+    print(
+        f"  {label:<30} {uploads / elapsed:>7.1f} uploads/s  "
+        f"unrelated p50={p50:7.2f}ms p99={p99:8.2f}ms  (n={len(latencies)})"
+    )
+
+
+async def main(uploads: int) -> None:
+    configure_logging(log_level="WARNING", log_format="text")
+    payload = os.urandom(FILE_SIZE)
+    print(f"\nConcurrent uploads ({uploads} x {FILE_SIZE // (1024 * 1024)} MB)")
+
+    bucket = FakeBucket()
+    elapsed, latencies = await run_with_probe(
+        lambda: asyncio.gather(*(upload_inline(bucket, payload) for _ in range(uploads)))
+    )
+    report("inline SDK calls (before)", uploads, elapsed, latencies)
+
+    bucket = FakeBucket()
+    service = build_service(bucket)
+    elapsed, latencies = await run_with_probe(
+        lambda: asyncio.gather(*(upload_async(service, payload) for _ in range(uploads)))
+    )
+    report("streamed, thread pool", uploads, elapsed, latencies)
+    assert all(size == FILE_SIZE for size in bucket.objects.values())
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
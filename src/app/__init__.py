@@ -6,6 +6,7 @@ Contains:
 - context.py: Request context management
 - exceptions.py: Application exceptions
 - security.py: Authentication and authorization
+- serialization.py: JSON serialization (responses and cache)
 - dependencies/: Dependency injection
 - logging/: Logging configuration
 - middlewares/: HTTP middlewares
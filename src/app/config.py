@@ -59,6 +59,25 @@ class Settings(BaseSettings):
     NEON_WARM_CONNECTIONS: bool = Field(
         default=True, description="Manter conexões aquecidas"
     )
+    DATABASE_STATEMENT_MODE: Literal["unprepared", "pooler", "direct"] = Field(
+        default="unprepared",
+        description=(
+            "Prepared statements: unprepared (sem cache), pooler (nomes únicos, "
+            "compatível com o pooler do Neon) ou direct (pool direto para leituras)"
+        ),
+    )
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(
+        default=256,
+        description="Tamanho do cache LRU de prepared statements por conexão",
+    )
+    DATABASE_DIRECT_URL: str | None = Field(
+        default=None,
+        description="URL sem pooler (endpoint direto do Neon) para o modo direct",
+    )
+    DATABASE_DIRECT_POOL_SIZE: int = Field(
+        default=3,
+        description="Tamanho do pool de conexões diretas (modo direct)",
+    )
 
     # LavinMQ
     LAVINMQ_URL: str = Field(
@@ -107,6 +126,30 @@ class Settings(BaseSettings):
         default="",
         description="Firebase Storage bucket name (e.g., project-id.appspot.com)",
     )
+    FIREBASE_STORAGE_UPLOAD_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="Uploads simultâneos para o Storage por worker (threads dedicadas)",
+    )
+    FIREBASE_STORAGE_CHUNK_SIZE: int = Field(
+        default=1024 * 1024,
+        description="Tamanho do chunk do upload resumable em bytes (múltiplo de 256 KB)",
+    )
+    FIREBASE_STORAGE_UPLOAD_URL_TTL: int = Field(
+        default=900,
+        ge=60,
+        le=7 * 24 * 3600,
+        description="Validade em segundos das URLs assinadas de upload direto",
+    )
+    FIREBASE_LOCAL_TOKEN_VERIFICATION: bool = Field(
+        default=True,
+        description="Verifica tokens localmente com as chaves públicas do Google "
+        "(sem checagem de revogação) em vez do Admin SDK",
+    )
+    FIREBASE_TOKEN_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description="Número máximo de tokens verificados em cache por worker",
+    )
 
     # Redis Cache
     REDIS_URL: str = Field(
@@ -125,6 +168,118 @@ class Settings(BaseSettings):
         default=900,
         description="TTL do cache de membership em segundos (15 min)",
     )
+    REDIS_LOCAL_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Habilita cache L1 em memória na frente do Redis",
+    )
+    REDIS_LOCAL_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description="Número máximo de entradas no cache L1 por worker",
+    )
+    REDIS_LOCAL_CACHE_TTL: int = Field(
+        default=30,
+        description="TTL máximo do cache L1 em segundos",
+    )
+    REDIS_CACHE_TTL_JITTER: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=0.5,
+        description="Fração aleatória aplicada aos TTLs (±) para evitar expirações simultâneas",
+    )
+    REDIS_STAMPEDE_LOCK_ENABLED: bool = Field(
+        default=True,
+        description="Usa lock no Redis para que apenas um worker recarregue uma chave expirada",
+    )
+    REDIS_STAMPEDE_LOCK_TIMEOUT: float = Field(
+        default=5.0,
+        description="Tempo máximo (segundos) do lock de recarga de cache",
+    )
+
+    # Pagination
+    PAGINATION_COUNT_CAP: int = Field(
+        default=1000,
+        description="Limite da contagem na estratégia capped (acima disso retorna '1000+')",
+    )
+    PAGINATION_ESTIMATE_MIN_ROWS: int = Field(
+        default=1000,
+        description="Abaixo desta estimativa do EXPLAIN a contagem exata é usada",
+    )
+    PAGINATION_COUNT_CACHE_TTL: int = Field(
+        default=30,
+        description="TTL (segundos) das contagens em cache por hash de filtros",
+    )
+
+    # PDF rendering
+    PDF_RENDER_WORKERS: int = Field(
+        default=2,
+        ge=0,
+        description="Processos de renderização de PDF por worker (0 = thread, sem processos)",
+    )
+    PDF_RENDER_MAX_TASKS_PER_CHILD: int = Field(
+        default=50,
+        ge=1,
+        description="PDFs renderizados por processo antes de reciclá-lo (limita uso de memória)",
+    )
+
+    # Screening report jobs (worker)
+    SCREENING_REPORT_JOB_CONCURRENCY: int = Field(
+        default=2,
+        ge=1,
+        description="Relatórios de compliance gerados em paralelo por worker (prefetch da fila)",
+    )
+    SCREENING_REPORT_JOB_MAX_ATTEMPTS: int = Field(
+        default=3,
+        ge=1,
+        description="Tentativas de geração de um relatório antes de marcá-lo como FAILED",
+    )
+    SCREENING_REPORT_JOB_RETRY_BACKOFF: int = Field(
+        default=30,
+        ge=1,
+        description="Espera base (segundos) antes de uma nova tentativa (dobra a cada tentativa)",
+    )
+    SCREENING_REPORT_JOB_TIMEOUT: int = Field(
+        default=300,
+        ge=1,
+        description="Tempo (segundos) após o qual uma geração em andamento é considerada travada",
+    )
+
+    # Professional import jobs (worker)
+    PROFESSIONAL_IMPORT_MAX_FILE_SIZE: int = Field(
+        default=20 * 1024 * 1024,
+        ge=1,
+        description="Tamanho máximo (bytes) de uma planilha de importação de profissionais",
+    )
+    PROFESSIONAL_IMPORT_CHUNK_SIZE: int = Field(
+        default=500,
+        ge=1,
+        le=5000,
+        description="Linhas validadas e inseridas por transação na importação de profissionais",
+    )
+    PROFESSIONAL_IMPORT_MAX_ROW_ERRORS: int = Field(
+        default=1000,
+        ge=0,
+        description="Erros por linha guardados no job de importação (os demais são apenas contados)",
+    )
+    PROFESSIONAL_IMPORT_JOB_CONCURRENCY: int = Field(
+        default=1,
+        ge=1,
+        description="Importações de profissionais processadas em paralelo por worker (prefetch da fila)",
+    )
+    PROFESSIONAL_IMPORT_JOB_MAX_ATTEMPTS: int = Field(
+        default=3,
+        ge=1,
+        description="Tentativas de uma importação antes de marcá-la como FAILED",
+    )
+    PROFESSIONAL_IMPORT_JOB_RETRY_BACKOFF: int = Field(
+        default=30,
+        ge=1,
+        description="Espera base (segundos) antes de retomar uma importação (dobra a cada tentativa)",
+    )
+    PROFESSIONAL_IMPORT_JOB_TIMEOUT: int = Field(
+        default=600,
+        ge=1,
+        description="Tempo (segundos) sem progresso após o qual uma importação é considerada travada",
+    )
 
     # Logging
     LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -148,6 +303,39 @@ class Settings(BaseSettings):
         description="Default from name",
     )
 
+    # Email outbox (worker)
+    EMAIL_OUTBOX_BATCH_SIZE: int = Field(
+        default=50,
+        ge=1,
+        le=100,
+        description="Emails enviados por requisição ao provedor (máximo 100 no Resend)",
+    )
+    EMAIL_OUTBOX_RATE_LIMIT: float = Field(
+        default=2.0,
+        gt=0,
+        description="Requisições por segundo ao provedor de email, por worker",
+    )
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = Field(
+        default=5,
+        ge=1,
+        description="Tentativas de envio de um email antes de marcá-lo como FAILED",
+    )
+    EMAIL_OUTBOX_RETRY_BACKOFF: int = Field(
+        default=30,
+        ge=1,
+        description="Espera base (segundos) antes de um novo envio (dobra a cada tentativa)",
+    )
+    EMAIL_OUTBOX_POLL_INTERVAL: int = Field(
+        default=15,
+        ge=1,
+        description="Intervalo (segundos) da varredura periódica do outbox no worker",
+    )
+    EMAIL_OUTBOX_LOCK_TIMEOUT: int = Field(
+        default=300,
+        ge=1,
+        description="Tempo (segundos) após o qual um envio em andamento é considerado travado",
+    )
+
     # Invitation
     INVITATION_TOKEN_EXPIRE_DAYS: int = Field(
         default=7,
@@ -209,6 +397,14 @@ class Settings(BaseSettings):
             },
         }
 
+    @property
+    def database_direct_url_async(self) -> str | None:
+        """URL assíncrona da conexão direta (sem pooler), se configurada."""
+        if not self.DATABASE_DIRECT_URL:
+            return None
+        base_url = str(self.DATABASE_DIRECT_URL).split("?")[0]
+        return base_url.replace("postgresql://", "postgresql+asyncpg://")
+
     @property
     def neon_connection_args_async(self) -> dict:
         """Argumentos de conexão assíncronos otimizados para Neon (asyncpg)"""
@@ -103,6 +103,10 @@ class ProfessionalErrorCodes(StrEnum):
     VERSION_NOT_PENDING = "PROF_VERSION_NOT_PENDING"
     VERSION_FEATURE_NOT_SUPPORTED = "PROF_VERSION_FEATURE_NOT_SUPPORTED"
 
+    # Import errors
+    IMPORT_JOB_NOT_FOUND = "PROF_IMPORT_JOB_NOT_FOUND"
+    INVALID_IMPORT_FILE = "PROF_INVALID_IMPORT_FILE"
+
 
 class ScreeningErrorCodes(StrEnum):
     """Error codes for Screening module."""
@@ -160,6 +164,7 @@ class ScreeningErrorCodes(StrEnum):
     # Report errors
     SCREENING_NOT_APPROVED = "SCREENING_NOT_APPROVED"
     SCREENING_REPORT_GENERATION_FAILED = "SCREENING_REPORT_GENERATION_FAILED"
+    SCREENING_REPORT_JOB_NOT_FOUND = "SCREENING_REPORT_JOB_NOT_FOUND"
 
 
 class UserErrorCodes(StrEnum):
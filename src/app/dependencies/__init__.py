@@ -7,7 +7,12 @@ from src.app.dependencies.context import (
     get_organization_context,
     get_validated_context,
 )
-from src.app.dependencies.database import SessionDep, get_session
+from src.app.dependencies.database import (
+    ReadSessionDep,
+    SessionDep,
+    get_read_session,
+    get_session,
+)
 from src.app.dependencies.settings import SettingsDep, get_settings
 
 
@@ -15,6 +20,8 @@ __all__ = [
     # Database
     "SessionDep",
     "get_session",
+    "ReadSessionDep",
+    "get_read_session",
     # Settings
     "SettingsDep",
     "get_settings",
@@ -6,7 +6,10 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.shared.infrastructure.database.connection import async_session_factory
+from src.shared.infrastructure.database.connection import (
+    async_session_factory,
+    read_session_factory,
+)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
@@ -27,4 +30,25 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
             raise
 
 
+async def get_read_session() -> AsyncGenerator[AsyncSession]:
+    """
+    Dependency to get a read-only async database session.
+
+    Uses the read engine (direct connections with prepared statements when
+    DATABASE_STATEMENT_MODE=direct, the default engine otherwise). Nothing
+    is committed.
+
+    Usage:
+        @router.get("/items")
+        async def get_items(session: ReadSessionDep):
+            ...
+    """
+    async with read_session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
@@ -34,10 +34,12 @@ from src.app.exceptions.professional_exceptions import (
     GlobalSpecialtyNotFoundError,
     InstitutionRequiredError,
     InvalidCouncilTypeError,
+    InvalidImportFileError,
     LevelRequiredError,
     ProfessionalCpfExistsError,
     ProfessionalEmailExistsError,
     ProfessionalException,
+    ProfessionalImportJobNotFoundError,
     ProfessionalNotFoundError,
     QualificationIdRequiredError,
     QualificationNotBelongsError,
@@ -75,6 +77,7 @@ from src.app.exceptions.screening_exceptions import (
     ScreeningProfessionalNotLinkedError,
     ScreeningProfessionalTypeMismatchError,
     ScreeningReportGenerationError,
+    ScreeningReportJobNotFoundError,
     ScreeningSpecialtyMismatchError,
     ScreeningStepAlreadyCompletedError,
     ScreeningStepAlreadyConfiguredError,
@@ -141,10 +144,12 @@ __all__ = [
     "GlobalSpecialtyNotFoundError",
     "InstitutionRequiredError",
     "InvalidCouncilTypeError",
+    "InvalidImportFileError",
     "LevelRequiredError",
     "ProfessionalCpfExistsError",
     "ProfessionalEmailExistsError",
     "ProfessionalException",
+    "ProfessionalImportJobNotFoundError",
     "ProfessionalNotFoundError",
     "QualificationIdRequiredError",
     "QualificationNotBelongsError",
@@ -181,6 +186,7 @@ __all__ = [
     "ScreeningProfessionalTypeMismatchError",
     "ScreeningNotApprovedError",
     "ScreeningReportGenerationError",
+    "ScreeningReportJobNotFoundError",
     "ScreeningSpecialtyMismatchError",
     "ScreeningStepAlreadyCompletedError",
     "ScreeningStepAlreadyConfiguredError",
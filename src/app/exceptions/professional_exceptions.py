@@ -510,3 +510,41 @@ class VersionFeatureNotSupportedError(ProfessionalException):
             status_code=501,
             details=details,
         )
+
+
+# =============================================================================
+# Import Exceptions
+# =============================================================================
+
+
+class ProfessionalImportJobNotFoundError(ProfessionalException):
+    """Professional import job not found."""
+
+    def __init__(
+        self,
+        message: str | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            message=message or get_message(ProfessionalMessages.IMPORT_JOB_NOT_FOUND),
+            code=ProfessionalErrorCodes.IMPORT_JOB_NOT_FOUND,
+            status_code=404,
+            details=details,
+        )
+
+
+class InvalidImportFileError(ProfessionalException):
+    """Uploaded import spreadsheet is not acceptable (type, size or content)."""
+
+    def __init__(
+        self,
+        message: str | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            message=message
+            or get_message(ProfessionalMessages.IMPORT_UNSUPPORTED_FILE),
+            code=ProfessionalErrorCodes.INVALID_IMPORT_FILE,
+            status_code=422,
+            details=details,
+        )
@@ -505,6 +505,18 @@ class ScreeningReportGenerationError(AppException):
         )
 
 
+class ScreeningReportJobNotFoundError(AppException):
+    """Raised when a compliance report job is not found."""
+
+    def __init__(self, job_id: str) -> None:
+        super().__init__(
+            message=get_message(ScreeningMessages.REPORT_JOB_NOT_FOUND),
+            code=ScreeningErrorCodes.SCREENING_REPORT_JOB_NOT_FOUND,
+            status_code=status.HTTP_404_NOT_FOUND,
+            details={"job_id": job_id},
+        )
+
+
 # =============================================================================
 # CLIENT VALIDATION EXCEPTIONS
 # =============================================================================
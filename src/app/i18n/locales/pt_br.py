@@ -53,6 +53,7 @@ MESSAGES: dict[str, str] = {
     ResourceMessages.NOT_FOUND_WITH_ID: "{resource} com id '{identifier}' não encontrado(a)",
     ResourceMessages.CONFLICT: "Conflito de recurso",
     ResourceMessages.VALIDATION_ERROR: "Erro de validação",
+    ResourceMessages.INVALID_CURSOR: "Cursor de paginação inválido ou incompatível com a ordenação",
     # ==========================================================================
     # Professional messages
     # ==========================================================================
@@ -87,6 +88,16 @@ MESSAGES: dict[str, str] = {
     ProfessionalMessages.VERSION_ALREADY_REJECTED: "Esta versão já foi rejeitada",
     ProfessionalMessages.VERSION_NOT_PENDING: "Esta versão não está pendente de aprovação",
     ProfessionalMessages.VERSION_FEATURE_NOT_SUPPORTED: "Funcionalidade do snapshot ainda não suportada: {feature}",
+    # Import errors
+    ProfessionalMessages.IMPORT_JOB_NOT_FOUND: "Importação de profissionais não encontrada",
+    ProfessionalMessages.IMPORT_UNSUPPORTED_FILE: "Formato de arquivo não suportado. Envie uma planilha CSV ou XLSX",
+    ProfessionalMessages.IMPORT_FILE_TOO_LARGE: "Arquivo muito grande. Tamanho máximo: {max_size_mb} MB",
+    ProfessionalMessages.IMPORT_EMPTY_FILE: "Arquivo vazio não é permitido",
+    ProfessionalMessages.IMPORT_MISSING_COLUMNS: "Colunas obrigatórias ausentes na planilha: {columns}",
+    ProfessionalMessages.IMPORT_UNREADABLE_FILE: "Não foi possível ler a planilha: {error}",
+    ProfessionalMessages.IMPORT_DUPLICATED_IN_FILE: "Valor repetido na planilha (linha {row})",
+    ProfessionalMessages.IMPORT_SPECIALTY_CODE_NOT_FOUND: "Especialidade não encontrada: {code}",
+    ProfessionalMessages.IMPORT_COMPANY_CNPJ_NOT_FOUND: "Nenhuma empresa cadastrada com o CNPJ {cnpj}",
     # ==========================================================================
     # User messages
     # ==========================================================================
@@ -181,6 +192,7 @@ MESSAGES: dict[str, str] = {
     # Report
     ScreeningMessages.NOT_APPROVED: "O relatório de compliance só pode ser gerado para triagens aprovadas",
     ScreeningMessages.REPORT_GENERATION_FAILED: "Falha ao gerar o relatório de compliance: {error}",
+    ScreeningMessages.REPORT_JOB_NOT_FOUND: "Geração de relatório não encontrada",
     # ==========================================================================
     # Document Type messages
     # ==========================================================================
@@ -62,6 +62,7 @@ class ResourceMessages(StrEnum):
     NOT_FOUND_WITH_ID = "resource.not_found_with_id"
     CONFLICT = "resource.conflict"
     VALIDATION_ERROR = "resource.validation_error"
+    INVALID_CURSOR = "resource.invalid_cursor"
 
 
 class ProfessionalMessages(StrEnum):
@@ -104,6 +105,17 @@ class ProfessionalMessages(StrEnum):
     VERSION_NOT_PENDING = "professional.version_not_pending"
     VERSION_FEATURE_NOT_SUPPORTED = "professional.version_feature_not_supported"
 
+    # Import errors
+    IMPORT_JOB_NOT_FOUND = "professional.import.job_not_found"
+    IMPORT_UNSUPPORTED_FILE = "professional.import.unsupported_file"
+    IMPORT_FILE_TOO_LARGE = "professional.import.file_too_large"
+    IMPORT_EMPTY_FILE = "professional.import.empty_file"
+    IMPORT_MISSING_COLUMNS = "professional.import.missing_columns"
+    IMPORT_UNREADABLE_FILE = "professional.import.unreadable_file"
+    IMPORT_DUPLICATED_IN_FILE = "professional.import.duplicated_in_file"
+    IMPORT_SPECIALTY_CODE_NOT_FOUND = "professional.import.specialty_code_not_found"
+    IMPORT_COMPANY_CNPJ_NOT_FOUND = "professional.import.company_cnpj_not_found"
+
 
 class ScreeningMessages(StrEnum):
     """Message keys for Screening module."""
@@ -158,6 +170,7 @@ class ScreeningMessages(StrEnum):
     # Report messages
     NOT_APPROVED = "screening.report.not_approved"
     REPORT_GENERATION_FAILED = "screening.report.generation_failed"
+    REPORT_JOB_NOT_FOUND = "screening.report.job_not_found"
 
 
 class UserMessages(StrEnum):
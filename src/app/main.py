@@ -5,20 +5,25 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from src.app.dependencies import get_settings
 from src.app.exceptions import AppException
 from src.app.logging import configure_logging, get_logger
-from src.app.middlewares import (
-    FirebaseAuthMiddleware,
-    LoggingMiddleware,
-    OrganizationIdentityMiddleware,
-)
+from src.app.middlewares import IdentityMiddleware, LoggingMiddleware
 from src.app.presentation.api.health import router as health_router
 from src.app.presentation.api.v1.router import router as v1_router
-from src.shared.infrastructure.cache import RedisCache, set_redis_cache
-from src.shared.infrastructure.firebase import FirebaseService, set_firebase_service
+from src.app.serialization import ORJSONResponse
+from src.modules.professionals.infrastructure.messaging import declare_import_queues
+from src.modules.screening.infrastructure.messaging import declare_report_queues
+from src.shared.infrastructure.cache import LocalCache, RedisCache, set_redis_cache
+from src.shared.infrastructure.firebase import (
+    FirebaseService,
+    get_firebase_service,
+    set_firebase_service,
+)
+from src.shared.infrastructure.messaging.broker import broker
+from src.shared.infrastructure.messaging.email_outbox import declare_email_queues
+from src.shared.infrastructure.pdf import shutdown_render_pools
 
 
 @asynccontextmanager
@@ -46,8 +51,25 @@ async def lifespan(app: FastAPI):
         log_level=settings.LOG_LEVEL,
     )
 
-    # Initialize Redis cache
-    redis_cache = RedisCache(settings.REDIS_URL)
+    # Initialize Redis cache (with optional in-process L1 tier)
+    local_cache = (
+        LocalCache(
+            max_size=settings.REDIS_LOCAL_CACHE_MAX_SIZE,
+            default_ttl=settings.REDIS_LOCAL_CACHE_TTL,
+        )
+        if settings.REDIS_LOCAL_CACHE_ENABLED
+        else None
+    )
+    redis_cache = RedisCache(
+        settings.REDIS_URL,
+        local_cache=local_cache,
+        ttl_jitter=settings.REDIS_CACHE_TTL_JITTER,
+        lock_timeout=(
+            settings.REDIS_STAMPEDE_LOCK_TIMEOUT
+            if settings.REDIS_STAMPEDE_LOCK_ENABLED
+            else None
+        ),
+    )
     try:
         await redis_cache.connect()
         set_redis_cache(redis_cache)
@@ -61,14 +83,26 @@ async def lifespan(app: FastAPI):
         firebase_service = FirebaseService(settings)
         firebase_service.initialize()
         set_firebase_service(firebase_service)
+        await firebase_service.start_public_key_refresh()
         logger.info("firebase_service_initialized")
     except Exception as e:
         logger.error("firebase_service_init_failed", error=str(e))
         # Firebase is required - but we log and continue
         # Authentication will fail if Firebase is not configured
 
+    # Connect message broker (publishing only; consumers run in the worker)
+    try:
+        await broker.connect()
+        await declare_report_queues()
+        await declare_import_queues()
+        await declare_email_queues()
+        logger.info("message_broker_connected")
+    except Exception as e:
+        logger.warning("message_broker_connect_failed", error=str(e))
+        # Continue without broker - report requests fail until it is back;
+        # outbox emails are still sent by the worker's periodic poll
+
     # TODO: Initialize database connection pool
-    # TODO: Initialize message broker connection
 
     yield
 
@@ -82,8 +116,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("redis_cache_disconnect_failed", error=str(e))
 
+    # Stop Firebase public key refresh
+    firebase_service = get_firebase_service()
+    if firebase_service:
+        await firebase_service.stop_public_key_refresh()
+
+    # Stop PDF render processes
+    shutdown_render_pools()
+
+    # Close message broker connection
+    try:
+        await broker.stop()
+        logger.info("message_broker_disconnected")
+    except Exception as e:
+        logger.warning("message_broker_disconnect_failed", error=str(e))
+
     # TODO: Close database connections
-    # TODO: Close message broker connections
 
 
 def create_app() -> FastAPI:
@@ -98,6 +146,7 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if settings.is_development else None,
         openapi_url="/openapi.json" if settings.is_development else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS
@@ -110,34 +159,24 @@ def create_app() -> FastAPI:
     )
 
     # NOTE: Middleware order is REVERSED in Starlette/FastAPI
-    # Last added middleware runs FIRST in the request chain
-    # So we add them in reverse order of desired execution:
-    #   1. OrganizationIdentityMiddleware (added last, runs first in middleware chain
-    #      but needs FirebaseAuthMiddleware to have set context)
-    #   2. FirebaseAuthMiddleware (runs second, sets user context)
-    #   3. LoggingMiddleware (runs third, logs request/response)
-    #
-    # Actually, since OrganizationIdentityMiddleware depends on FirebaseAuthMiddleware,
-    # we need to add OrganizationIdentityMiddleware FIRST so it runs LAST
-    # (after FirebaseAuthMiddleware has set the context)
-
-    # Add organization identity middleware FIRST
-    # (runs LAST - after FirebaseAuthMiddleware has set user context)
+    # Last added middleware runs FIRST in the request chain:
+    #   1. LoggingMiddleware (runs first, logs request/response)
+    #   2. IdentityMiddleware (runs second, resolves token → user →
+    #      organization → membership → family and sets RequestContext)
+    # Both are pure ASGI middlewares, so neither adds a task/stream hop.
+
+    # Add identity middleware FIRST (runs after logging)
+    # Note: No exclude_prefixes needed - /auth/me requires authentication
+    # Future public endpoints (login, register) should use exclude_prefixes
     app.add_middleware(
-        OrganizationIdentityMiddleware,
-        exclude_prefixes=(
+        IdentityMiddleware,
+        organization_exclude_prefixes=(
             f"{settings.API_V1_PREFIX}/auth",  # Auth routes don't require org
             f"{settings.API_V1_PREFIX}/users/me",  # User profile doesn't require org
         ),
         require_organization=False,  # Organization header is optional by default
     )
 
-    # Add Firebase authentication middleware SECOND
-    # (runs SECOND - after logging, before organization identity)
-    # Note: No exclude_prefixes needed - /auth/me requires authentication
-    # Future public endpoints (login, register) should use exclude_paths
-    app.add_middleware(FirebaseAuthMiddleware)
-
     # Add logging middleware LAST
     # (runs FIRST - logs all requests/responses)
     app.add_middleware(LoggingMiddleware)
@@ -146,9 +185,9 @@ def create_app() -> FastAPI:
     @app.exception_handler(AppException)
     async def app_exception_handler(
         request: Request, exc: AppException
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle custom application exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "code": exc.code,
@@ -5,9 +5,10 @@ from src.app.middlewares.constants import (
     DEFAULT_EXCLUDE_PATHS,
     ORGANIZATION_ID_HEADER,
 )
-from src.app.middlewares.firebase_auth import FirebaseAuthMiddleware
+from src.app.middlewares.firebase_auth import FirebaseAuthenticator
+from src.app.middlewares.identity import IdentityMiddleware
 from src.app.middlewares.logging import LoggingMiddleware
-from src.app.middlewares.organization_identity import OrganizationIdentityMiddleware
+from src.app.middlewares.organization_identity import OrganizationIdentityResolver
 
 __all__ = [
     # Constants
@@ -16,6 +17,8 @@ __all__ = [
     "CHILD_ORGANIZATION_ID_HEADER",
     # Middlewares
     "LoggingMiddleware",
-    "FirebaseAuthMiddleware",
-    "OrganizationIdentityMiddleware",
+    "IdentityMiddleware",
+    # Identity pipeline stages
+    "FirebaseAuthenticator",
+    "OrganizationIdentityResolver",
 ]
@@ -0,0 +1,226 @@
+"""Identity middleware - single-pass authentication and organization pipeline."""
+
+from enum import StrEnum
+
+import structlog
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.app.context import (
+    RequestContext,
+    clear_request_context,
+    set_request_context,
+)
+from src.app.exceptions import AuthException
+from src.app.exceptions.organization_exceptions import OrganizationException
+from src.app.i18n import AuthMessages, OrganizationMessages, get_message
+from src.app.logging import get_logger
+from src.app.middlewares.constants import DEFAULT_EXCLUDE_PATHS
+from src.app.middlewares.firebase_auth import FirebaseAuthenticator
+from src.app.middlewares.organization_identity import OrganizationIdentityResolver
+from src.app.serialization import ORJSONResponse
+
+
+logger = get_logger(__name__)
+
+
+class IdentityStageError(Exception):
+    """Unexpected failure inside an identity stage (wraps the original error)."""
+
+    def __init__(self, event: str, message_key: StrEnum) -> None:
+        super().__init__(event)
+        self.event = event
+        self.message_key = message_key
+
+
+class IdentityMiddleware:
+    """
+    Pure ASGI identity middleware.
+
+    Resolves the full request identity in a single pass and sets
+    RequestContext before the route runs:
+
+        token → user → organization → membership → family
+
+    Unlike BaseHTTPMiddleware, this middleware does not wrap the downstream
+    app in a separate task or buffer the response body, so it adds no extra
+    task/stream hops and streaming responses pass through untouched.
+
+    Stages:
+    1. FirebaseAuthenticator - verifies the Bearer token and loads the user
+    2. OrganizationIdentityResolver - validates X-Organization-Id /
+       X-Child-Organization-Id headers, membership and family scope
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        exclude_paths: set[str] | None = None,
+        exclude_prefixes: tuple[str, ...] | None = None,
+        organization_exclude_prefixes: tuple[str, ...] | None = None,
+        require_organization: bool = True,
+        authenticator: FirebaseAuthenticator | None = None,
+        organization_resolver: OrganizationIdentityResolver | None = None,
+    ) -> None:
+        """
+        Initialize identity middleware.
+
+        Args:
+            app: ASGI application.
+            exclude_paths: Exact paths to exclude from the whole pipeline.
+            exclude_prefixes: Path prefixes to exclude from the whole pipeline
+                              (e.g., future public endpoints).
+            organization_exclude_prefixes: Path prefixes that are authenticated
+                                           but skip organization identification.
+            require_organization: If True, organization header is required
+                                  for non-excluded paths. If False, organization
+                                  is optional but validated if provided.
+            authenticator: Authentication stage (defaults to Firebase).
+            organization_resolver: Organization stage.
+        """
+        self.app = app
+        self.exclude_paths = exclude_paths or DEFAULT_EXCLUDE_PATHS
+        self.exclude_prefixes = exclude_prefixes or ()
+        self.organization_exclude_prefixes = organization_exclude_prefixes or ()
+        self.authenticator = authenticator or FirebaseAuthenticator()
+        self.organization_resolver = organization_resolver or (
+            OrganizationIdentityResolver(require_organization=require_organization)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with authentication and organization identification."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+
+        # Skip for excluded paths and OPTIONS requests (CORS preflight)
+        if self._should_skip(path) or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+
+        try:
+            context = await self._resolve_identity(path, headers)
+        except AuthException as e:
+            logger.warning(
+                "auth_failed",
+                error_code=e.code,
+                error_message=e.message,
+            )
+            response = self._error_response(
+                status_code=e.status_code,
+                code=e.code,
+                message=e.message,
+                details=e.details,
+            )
+            await response(scope, receive, send)
+            return
+        except OrganizationException as e:
+            logger.warning(
+                "organization_identity_failed",
+                error_code=e.code,
+                error_message=e.message,
+            )
+            response = self._error_response(
+                status_code=e.status_code,
+                code=e.code,
+                message=e.message,
+                details=e.details,
+            )
+            await response(scope, receive, send)
+            return
+        except IdentityStageError as e:
+            logger.exception(e.event, error=str(e.__cause__))
+            response = self._error_response(
+                status_code=500,
+                code="INTERNAL_ERROR",
+                message=get_message(e.message_key),
+            )
+            await response(scope, receive, send)
+            return
+
+        set_request_context(context)
+        self._bind_log_context(context)
+
+        try:
+            # Process request
+            await self.app(scope, receive, send)
+        finally:
+            # Always clear context after request
+            clear_request_context()
+
+    async def _resolve_identity(self, path: str, headers: Headers) -> RequestContext:
+        """
+        Run the authentication and organization stages.
+
+        Raises:
+            AuthException: If authentication fails.
+            OrganizationException: If organization identification fails.
+            IdentityStageError: On unexpected errors, tagged with the stage.
+        """
+        try:
+            context = await self.authenticator.authenticate(headers)
+        except AuthException:
+            raise
+        except Exception as e:
+            raise IdentityStageError(
+                "auth_unexpected_error", AuthMessages.FIREBASE_INTERNAL_ERROR
+            ) from e
+
+        if path.startswith(self.organization_exclude_prefixes):
+            return context
+
+        try:
+            return await self.organization_resolver.resolve(headers, context)
+        except OrganizationException:
+            raise
+        except Exception as e:
+            raise IdentityStageError(
+                "organization_identity_unexpected_error",
+                OrganizationMessages.INTERNAL_ERROR,
+            ) from e
+
+    def _should_skip(self, path: str) -> bool:
+        """Check if path should skip the identity pipeline."""
+        if path in self.exclude_paths:
+            return True
+
+        return path.startswith(self.exclude_prefixes)
+
+    @staticmethod
+    def _bind_log_context(context: RequestContext) -> None:
+        """Bind identity fields to all downstream logs of this request."""
+        structlog.contextvars.bind_contextvars(
+            user_id=str(context.user_id),
+            firebase_uid=context.firebase_uid,
+        )
+        if context.organization_id is not None:
+            structlog.contextvars.bind_contextvars(
+                organization_id=str(context.organization_id),
+                organization_role=context.organization_role,
+            )
+        if context.child_organization_id is not None:
+            structlog.contextvars.bind_contextvars(
+                child_organization_id=str(context.child_organization_id),
+            )
+
+    @staticmethod
+    def _error_response(
+        status_code: int,
+        code: str,
+        message: str,
+        details: dict | None = None,
+    ) -> ORJSONResponse:
+        """Create JSON error response."""
+        return ORJSONResponse(
+            status_code=status_code,
+            content={
+                "code": code,
+                "message": message,
+                "details": details or {},
+            },
+        )
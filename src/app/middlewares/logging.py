@@ -2,13 +2,10 @@
 
 import time
 import uuid
-from collections.abc import Callable
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.app.middlewares.constants import DEFAULT_EXCLUDE_PATHS
 
@@ -16,9 +13,9 @@ from src.app.middlewares.constants import DEFAULT_EXCLUDE_PATHS
 logger = structlog.get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
-    Middleware for structured request logging.
+    Pure ASGI middleware for structured request logging.
 
     Binds request context (request_id, method, path) to all logs within the request.
     Logs request completion with status code and duration.
@@ -43,71 +40,51 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             app: ASGI application
             exclude_paths: Paths to exclude from logging (e.g., health checks)
         """
-        super().__init__(app)
+        self.app = app
         self.exclude_paths = exclude_paths or DEFAULT_EXCLUDE_PATHS
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Response],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with logging context."""
-        # Skip logging for excluded paths
-        if request.url.path in self.exclude_paths:
-            return await call_next(request)
+        # Skip logging for non-HTTP scopes and excluded paths
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
 
         # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        request_id = headers.get("X-Request-ID") or str(uuid.uuid4())
 
         # Clear previous context and bind new values
+        client = scope.get("client")
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client_ip=request.client.host if request.client else None,
+            method=scope["method"],
+            path=scope["path"],
+            client_ip=client[0] if client else None,
         )
 
         # Add query params if present (for debugging)
-        if request.query_params:
+        query_string: bytes = scope.get("query_string", b"")
+        if query_string:
             structlog.contextvars.bind_contextvars(
-                query=str(request.query_params),
+                query=query_string.decode("latin-1"),
             )
 
         start_time = time.perf_counter()
+        status_code = 500
 
-        try:
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
-
-            # Log based on status code
-            status_code = response.status_code
-            if status_code >= 500:
-                logger.error(
-                    "request_completed",
-                    status_code=status_code,
-                    duration_ms=duration_ms,
-                )
-            elif status_code >= 400:
-                logger.warning(
-                    "request_completed",
-                    status_code=status_code,
-                    duration_ms=duration_ms,
-                )
-            else:
-                logger.info(
-                    "request_completed",
-                    status_code=status_code,
-                    duration_ms=duration_ms,
-                )
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-
-            return response
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
 
@@ -118,3 +95,26 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 duration_ms=duration_ms,
             )
             raise
+
+        # Calculate duration
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+
+        # Log based on status code
+        if status_code >= 500:
+            logger.error(
+                "request_completed",
+                status_code=status_code,
+                duration_ms=duration_ms,
+            )
+        elif status_code >= 400:
+            logger.warning(
+                "request_completed",
+                status_code=status_code,
+                duration_ms=duration_ms,
+            )
+        else:
+            logger.info(
+                "request_completed",
+                status_code=status_code,
+                duration_ms=duration_ms,
+            )
@@ -1,18 +1,12 @@
-"""Organization identity middleware."""
+"""Organization identity stage of the identity pipeline."""
 
 from dataclasses import replace
+from typing import Any
 from uuid import UUID
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers
 
-from src.app.config import Settings
-from src.app.context import (
-    get_request_context,
-    set_request_context,
-)
+from src.app.context import RequestContext
 from src.app.dependencies import get_settings
 from src.app.exceptions.organization_exceptions import (
     ChildNotAllowedError,
@@ -22,33 +16,31 @@ from src.app.exceptions.organization_exceptions import (
     InvalidOrganizationIdError,
     MissingOrganizationIdError,
     NotChildOfParentError,
-    OrganizationException,
     OrganizationInactiveError,
     OrganizationNotFoundError,
     UserNotMemberError,
 )
-from src.app.i18n import OrganizationMessages, get_message
 from src.app.logging import get_logger
 from src.app.middlewares.constants import (
     CHILD_ORGANIZATION_ID_HEADER,
-    DEFAULT_EXCLUDE_PATHS,
     ORGANIZATION_ID_HEADER,
 )
 from src.modules.organizations.infrastructure.repositories import OrganizationRepository
 from src.shared.infrastructure.cache import RedisCache, get_redis_cache
-from src.shared.infrastructure.database.connection import async_session_factory
+from src.shared.infrastructure.database.connection import read_session_factory
 
 
 logger = get_logger(__name__)
 
 
-class OrganizationIdentityMiddleware(BaseHTTPMiddleware):
+class OrganizationIdentityResolver:
     """
-    Organization identity middleware.
+    Organization identity resolver.
 
     Identifies the active organization from request headers,
     validates user membership, caches results in Redis,
-    and updates RequestContext with organization data.
+    and enriches the RequestContext with organization data.
+    Used by IdentityMiddleware as the second stage of the identity pipeline.
 
     Headers:
     - X-Organization-Id: Required organization UUID
@@ -56,480 +48,268 @@ class OrganizationIdentityMiddleware(BaseHTTPMiddleware):
       (only valid if parent org can have children)
 
     Flow:
-    1. Check if path requires organization context
-    2. Extract organization ID from header
-    3. Check organization cache (Redis) - if hit, use cached data
-    4. Look up organization in database
-    5. Cache organization data with configured TTL
-    6. Check membership cache (Redis) - if hit, use cached data
-    7. Validate user is active member of organization
-    8. Cache membership data with configured TTL
-    9. If child org header present, validate child relationship
-    10. Update RequestContext with organization data
+    1. Extract organization (and optional child) ID from headers
+    2. Fetch organization, membership, family and child org keys from
+       cache in a single MGET
+    3. Load all misses from the database in a single SQL round trip
+    4. Cache loaded data with one pipelined SETEX batch
+    5. Validate organization, membership and child relationship
+    6. Return RequestContext updated with organization data
     """
 
-    def __init__(
-        self,
-        app: ASGIApp,
-        *,
-        exclude_paths: set[str] | None = None,
-        exclude_prefixes: tuple[str, ...] | None = None,
-        require_organization: bool = True,
-    ) -> None:
+    def __init__(self, *, require_organization: bool = True) -> None:
         """
-        Initialize organization identity middleware.
+        Initialize organization identity resolver.
 
         Args:
-            app: ASGI application.
-            exclude_paths: Exact paths to exclude from organization check.
-            exclude_prefixes: Path prefixes to exclude.
-            require_organization: If True, organization header is required
-                                  for non-excluded paths. If False, organization
-                                  is optional but validated if provided.
+            require_organization: If True, organization header is required.
+                                  If False, organization is optional but
+                                  validated if provided.
         """
-        super().__init__(app)
-        self.exclude_paths = exclude_paths or DEFAULT_EXCLUDE_PATHS
-        self.exclude_prefixes = exclude_prefixes or ()
         self.require_organization = require_organization
 
-    async def dispatch(
+    async def resolve(
         self,
-        request: Request,
-        call_next,
-    ) -> Response:
-        """Process request with organization identification."""
-        # Skip for excluded paths
-        if self._should_skip(request.url.path):
-            return await call_next(request)
-
-        # Skip OPTIONS requests (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-
-        try:
-            # Get current context (set by FirebaseAuthMiddleware)
-            current_context = get_request_context()
-            if not current_context:
-                # No auth context means FirebaseAuthMiddleware didn't run
-                # or user is not authenticated - just pass through
-                return await call_next(request)
-
-            # Extract organization ID from header
-            org_id_str = request.headers.get(ORGANIZATION_ID_HEADER)
-
-            # If organization not provided
-            if not org_id_str:
-                if self.require_organization:
-                    raise MissingOrganizationIdError()
-                # Organization is optional and not provided - pass through
-                return await call_next(request)
+        headers: Headers,
+        current_context: RequestContext,
+    ) -> RequestContext:
+        """
+        Resolve the organization context for an authenticated request.
 
-            # Validate UUID format
-            try:
-                organization_id = UUID(org_id_str)
-            except ValueError:
-                raise InvalidOrganizationIdError(
-                    details={"organization_id": org_id_str}
-                )
+        Args:
+            headers: Request headers.
+            current_context: Context produced by the authentication stage.
 
-            # Get services
-            settings = get_settings()
-            cache = get_redis_cache()
+        Returns:
+            RequestContext with organization data, or the unchanged context
+            when the organization header is optional and not provided.
 
-            # Get organization data (with cache)
-            org_data = await self._get_organization_with_cache(
-                organization_id=organization_id,
-                cache=cache,
-                settings=settings,
-            )
+        Raises:
+            OrganizationException: If organization identification fails.
+        """
+        # Extract organization ID from header
+        org_id_str = headers.get(ORGANIZATION_ID_HEADER)
 
-            # Validate membership (with cache)
-            membership_data = await self._get_membership_with_cache(
-                user_id=current_context.user_id,
-                organization_id=organization_id,
-                cache=cache,
-                settings=settings,
-            )
+        # If organization not provided
+        if not org_id_str:
+            if self.require_organization:
+                raise MissingOrganizationIdError()
+            # Organization is optional and not provided - pass through
+            return current_context
 
-            # Get family organization IDs (with cache)
-            family_org_ids = await self._get_family_org_ids_with_cache(
-                organization_id=organization_id,
-                cache=cache,
-                settings=settings,
+        # Validate UUID format
+        try:
+            organization_id = UUID(org_id_str)
+        except ValueError:
+            raise InvalidOrganizationIdError(
+                details={"organization_id": org_id_str}
             )
 
-            # Initialize child organization data
-            child_org_data: dict | None = None
-
-            # Check for child organization header
-            child_org_id_str = request.headers.get(CHILD_ORGANIZATION_ID_HEADER)
-            if child_org_id_str:
-                # Validate parent can have children
-                if not org_data["can_have_children"]:
-                    raise ChildNotAllowedError(
-                        details={"organization_id": str(organization_id)}
-                    )
-
-                # Validate UUID format
-                try:
-                    child_organization_id = UUID(child_org_id_str)
-                except ValueError:
-                    raise InvalidChildOrganizationIdError(
-                        details={"child_organization_id": child_org_id_str}
-                    )
-
-                # Get child organization data (with cache)
-                child_org_data = await self._get_organization_with_cache(
-                    organization_id=child_organization_id,
-                    cache=cache,
-                    settings=settings,
-                    is_child=True,
-                )
-
-                # Validate child relationship
-                await self._validate_child_relationship(
-                    child_id=child_organization_id,
-                    parent_id=organization_id,
-                )
+        # Parse child header up front so its cache key joins the batch.
+        # Invalid values are reported only after the parent org is validated.
+        child_org_id_str = headers.get(CHILD_ORGANIZATION_ID_HEADER)
+        child_organization_id: UUID | None = None
+        if child_org_id_str:
+            try:
+                child_organization_id = UUID(child_org_id_str)
+            except ValueError:
+                child_organization_id = None
 
-            # Update context with organization data
-            # Determine parent_organization_id:
-            # - If org has a parent_id, use that (org is a child)
-            # - If org has no parent_id, use the org's own ID (org is the parent)
-            parent_org_id = (
-                UUID(org_data["parent_id"])
-                if org_data.get("parent_id")
-                else organization_id
-            )
+        # Resolve organization, membership, family and child org in one batch
+        identity = await self._load_identity(
+            user_id=current_context.user_id,
+            organization_id=organization_id,
+            child_organization_id=child_organization_id,
+        )
 
-            updated_context = replace(
-                current_context,
-                organization_id=organization_id,
-                organization_name=org_data["name"],
-                organization_role=membership_data["role_code"],
-                organization_role_name=membership_data["role_name"],
-                child_organization_id=(
-                    UUID(child_org_data["id"]) if child_org_data else None
-                ),
-                child_organization_name=(
-                    child_org_data["name"] if child_org_data else None
-                ),
-                parent_organization_id=parent_org_id,
-                family_org_ids=tuple(family_org_ids),
-            )
-            set_request_context(updated_context)
+        org_id_str = str(organization_id)
 
-            # Bind organization context to logs
-            logger.bind(
-                organization_id=str(organization_id),
-                organization_role=membership_data["role_code"],
-            )
-            if child_org_data:
-                logger.bind(child_organization_id=child_org_data["id"])
-
-            # Process request
-            response = await call_next(request)
-            return response
-
-        except OrganizationException as e:
-            logger.warning(
-                "organization_identity_failed",
-                error_code=e.code,
-                error_message=e.message,
-            )
-            return self._error_response(
-                status_code=e.status_code,
-                code=e.code,
-                message=e.message,
-                details=e.details,
-            )
-        except Exception as e:
-            logger.exception("organization_identity_unexpected_error", error=str(e))
-            return self._error_response(
-                status_code=500,
-                code="INTERNAL_ERROR",
-                message=get_message(OrganizationMessages.INTERNAL_ERROR),
+        # Validate organization
+        org_data = identity.get("organization")
+        if org_data is None:
+            raise OrganizationNotFoundError(details={"organization_id": org_id_str})
+        if not org_data.get("is_active", False):
+            raise OrganizationInactiveError(details={"organization_id": org_id_str})
+
+        # Validate membership
+        membership_data = identity.get("membership")
+        if membership_data is None:
+            raise UserNotMemberError(
+                details={
+                    "user_id": str(current_context.user_id),
+                    "organization_id": org_id_str,
+                }
             )
 
-    def _should_skip(self, path: str) -> bool:
-        """Check if path should skip organization check."""
-        if path in self.exclude_paths:
-            return True
+        family_org_ids = [UUID(id_str) for id_str in identity["family"]]
 
-        for prefix in self.exclude_prefixes:
-            if path.startswith(prefix):
-                return True
+        # Initialize child organization data
+        child_org_data: dict | None = None
 
-        return False
+        # Validate child organization header
+        if child_org_id_str:
+            # Validate parent can have children
+            if not org_data["can_have_children"]:
+                raise ChildNotAllowedError(details={"organization_id": org_id_str})
 
-    async def _get_organization_with_cache(
-        self,
-        organization_id: UUID,
-        cache: RedisCache | None,
-        settings: Settings,
-        is_child: bool = False,
-    ) -> dict:
-        """
-        Get organization data with caching.
-
-        Args:
-            organization_id: Organization UUID.
-            cache: Redis cache instance (optional).
-            settings: Application settings.
-            is_child: Whether this is a child organization lookup.
-
-        Returns:
-            Dict with organization data.
-
-        Raises:
-            OrganizationNotFoundError: If organization not found.
-            OrganizationInactiveError: If organization is inactive.
-            ChildOrganizationNotFoundError: If child org not found.
-            ChildOrganizationInactiveError: If child org is inactive.
-        """
-        org_id_str = str(organization_id)
+            # Validate UUID format
+            if child_organization_id is None:
+                raise InvalidChildOrganizationIdError(
+                    details={"child_organization_id": child_org_id_str}
+                )
 
-        # Try cache first
-        if cache:
-            cache_key = cache.organization_cache_key(org_id_str)
-            cached = await cache.get(cache_key)
+            child_org_data = identity.get("child_organization")
+            if child_org_data is None:
+                raise ChildOrganizationNotFoundError(
+                    details={"child_organization_id": child_org_id_str}
+                )
+            if not child_org_data.get("is_active", False):
+                raise ChildOrganizationInactiveError(
+                    details={"child_organization_id": child_org_id_str}
+                )
 
-            if cached:
-                logger.debug(
-                    "organization_cache_hit",
-                    organization_id=org_id_str,
-                    is_child=is_child,
+            # Validate child relationship
+            if child_org_data.get("parent_id") != org_id_str:
+                raise NotChildOfParentError(
+                    details={
+                        "child_organization_id": str(child_organization_id),
+                        "parent_organization_id": org_id_str,
+                    }
                 )
-                # Validate cached org is still active
-                if not cached.get("is_active", False):
-                    if is_child:
-                        raise ChildOrganizationInactiveError(
-                            details={"child_organization_id": org_id_str}
-                        )
-                    raise OrganizationInactiveError(
-                        details={"organization_id": org_id_str}
-                    )
-                return cached
-
-        # Query database
-        async with async_session_factory() as session:
-            repo = OrganizationRepository(session)
-            org = await repo.get_active_by_id(organization_id)
-
-            if not org:
-                # Check if org exists but is inactive
-                inactive_org = await repo.get_by_id(organization_id)
-                if inactive_org and inactive_org.deleted_at is None:
-                    if is_child:
-                        raise ChildOrganizationInactiveError(
-                            details={"child_organization_id": org_id_str}
-                        )
-                    raise OrganizationInactiveError(
-                        details={"organization_id": org_id_str}
-                    )
-
-                if is_child:
-                    raise ChildOrganizationNotFoundError(
-                        details={"child_organization_id": org_id_str}
-                    )
-                raise OrganizationNotFoundError(details={"organization_id": org_id_str})
-
-            org_data = {
-                "id": str(org.id),
-                "name": org.name,
-                "is_active": org.is_active,
-                "parent_id": str(org.parent_id) if org.parent_id else None,
-                "can_have_children": org.can_have_children(),
-            }
-
-        # Cache the result
-        if cache:
-            await cache.set(
-                key=cache.organization_cache_key(org_id_str),
-                value=org_data,
-                ttl=settings.REDIS_ORG_CACHE_TTL,
-            )
-            logger.debug(
-                "organization_cached",
-                organization_id=org_id_str,
-                ttl=settings.REDIS_ORG_CACHE_TTL,
-            )
 
-        return org_data
+        # Determine parent_organization_id:
+        # - If org has a parent_id, use that (org is a child)
+        # - If org has no parent_id, use the org's own ID (org is the parent)
+        parent_org_id = (
+            UUID(org_data["parent_id"])
+            if org_data.get("parent_id")
+            else organization_id
+        )
+
+        return replace(
+            current_context,
+            organization_id=organization_id,
+            organization_name=org_data["name"],
+            organization_role=membership_data["role_code"],
+            organization_role_name=membership_data["role_name"],
+            child_organization_id=(
+                UUID(child_org_data["id"]) if child_org_data else None
+            ),
+            child_organization_name=(
+                child_org_data["name"] if child_org_data else None
+            ),
+            parent_organization_id=parent_org_id,
+            family_org_ids=tuple(family_org_ids),
+        )
 
-    async def _get_membership_with_cache(
+    async def _load_identity(
         self,
         user_id: UUID,
         organization_id: UUID,
-        cache: RedisCache | None,
-        settings: Settings,
-    ) -> dict:
+        child_organization_id: UUID | None,
+    ) -> dict[str, Any]:
         """
-        Get user's organization membership with caching.
+        Load organization identity data with one cache round trip.
+
+        All cache keys are fetched with a single MGET. Misses are loaded
+        from the database with a single statement and written back with one
+        pipelined SETEX batch. Only active organizations are cached.
+        Concurrent misses for the same keys are coalesced into one load.
 
         Args:
             user_id: User UUID.
             organization_id: Organization UUID.
-            cache: Redis cache instance (optional).
-            settings: Application settings.
+            child_organization_id: Child organization UUID (optional).
 
         Returns:
-            Dict with membership data including role_code.
-
-        Raises:
-            UserNotMemberError: If user is not a member.
-            MembershipInactiveError: If membership is inactive.
-            MembershipPendingError: If membership is pending.
-            MembershipExpiredError: If membership has expired.
+            Dict with "organization", "membership", "family" and, when a
+            child was requested, "child_organization" entries. Missing
+            records are None; inactive organizations have is_active False.
         """
+        settings = get_settings()
+        cache = get_redis_cache()
+
         user_id_str = str(user_id)
         org_id_str = str(organization_id)
 
-        # Try cache first
-        if cache:
-            cache_key = cache.membership_cache_key(user_id_str, org_id_str)
-            cached = await cache.get(cache_key)
+        # Map logical identity parts to cache keys
+        keys = {
+            "organization": RedisCache.organization_cache_key(org_id_str),
+            "membership": RedisCache.membership_cache_key(user_id_str, org_id_str),
+            "family": RedisCache.family_org_ids_cache_key(org_id_str),
+        }
+        if child_organization_id is not None:
+            keys["child_organization"] = RedisCache.organization_cache_key(
+                str(child_organization_id)
+            )
 
-            if cached:
-                logger.debug(
-                    "membership_cache_hit",
-                    user_id=user_id_str,
-                    organization_id=org_id_str,
+        # Try cache first (single round trip)
+        cached = await cache.get_many(list(keys.values())) if cache else {}
+        identity: dict[str, Any] = {
+            part: cached[key] for part, key in keys.items() if key in cached
+        }
+
+        missing = [part for part in keys if part not in identity]
+        if not missing:
+            logger.debug("organization_identity_cache_hit", organization_id=org_id_str)
+            return identity
+
+        ttls = {
+            "organization": settings.REDIS_ORG_CACHE_TTL,
+            "membership": settings.REDIS_MEMBERSHIP_CACHE_TTL,
+            "family": settings.REDIS_ORG_CACHE_TTL,
+            "child_organization": settings.REDIS_ORG_CACHE_TTL,
+        }
+
+        async def load() -> dict[str, Any]:
+            # Load all misses in a single SQL round trip
+            async with read_session_factory() as session:
+                repo = OrganizationRepository(session)
+                loaded = await repo.get_identity_data(
+                    organization_id=organization_id,
+                    user_id=user_id,
+                    child_organization_id=child_organization_id,
                 )
-                return cached
 
-        # Query database
-        async with async_session_factory() as session:
-            repo = OrganizationRepository(session)
-            membership = await repo.get_user_membership(user_id, organization_id)
+            values = {keys[part]: loaded[part] for part in missing}
 
-            if not membership:
-                raise UserNotMemberError(
-                    details={
-                        "user_id": user_id_str,
-                        "organization_id": org_id_str,
+            org_data = loaded["organization"]
+            if cache and org_data is not None and org_data["is_active"]:
+                # Cache the results (single pipelined round trip)
+                await cache.set_many(
+                    {
+                        keys[part]: (loaded[part], ttls[part])
+                        for part in missing
+                        if self._is_cacheable(loaded[part])
                     }
                 )
-
-            membership_data = {
-                "membership_id": str(membership.id),
-                "role_id": str(membership.role_id),
-                "role_code": membership.role.code if membership.role else None,
-                "role_name": membership.role.name if membership.role else None,
-                "is_active": membership.is_active,
-            }
-
-        # Cache the result
-        if cache:
-            await cache.set(
-                key=cache.membership_cache_key(user_id_str, org_id_str),
-                value=membership_data,
-                ttl=settings.REDIS_MEMBERSHIP_CACHE_TTL,
-            )
-            logger.debug(
-                "membership_cached",
-                user_id=user_id_str,
-                organization_id=org_id_str,
-                ttl=settings.REDIS_MEMBERSHIP_CACHE_TTL,
-            )
-
-        return membership_data
-
-    async def _get_family_org_ids_with_cache(
-        self,
-        organization_id: UUID,
-        cache: RedisCache | None,
-        settings: Settings,
-    ) -> list[UUID]:
-        """
-        Get family organization IDs with caching.
-
-        Returns all organization IDs in the family (parent + children/siblings).
-        This is used for hierarchical data scope queries.
-
-        Args:
-            organization_id: Organization UUID.
-            cache: Redis cache instance (optional).
-            settings: Application settings.
-
-        Returns:
-            List of UUIDs for all organizations in the family.
-        """
-        org_id_str = str(organization_id)
-        cache_key = f"org:family:{org_id_str}"
-
-        # Try cache first
-        if cache:
-            cached = await cache.get(cache_key)
-            if cached:
                 logger.debug(
-                    "family_org_ids_cache_hit",
+                    "organization_identity_cached",
                     organization_id=org_id_str,
+                    parts=missing,
                 )
-                # Convert cached strings back to UUIDs
-                return [UUID(id_str) for id_str in cached]
 
-        # Query database
-        async with async_session_factory() as session:
-            repo = OrganizationRepository(session)
-            family_ids = await repo.get_family_ids(organization_id)
+            return values
 
-        # Cache the result (store as strings for JSON serialization)
+        # Only one loader per missing key set hits the database; concurrent
+        # requests (in this and other workers) await its result
         if cache:
-            await cache.set(
-                key=cache_key,
-                value=[str(id) for id in family_ids],
-                ttl=settings.REDIS_ORG_CACHE_TTL,
+            values = await cache.coalesce_load(
+                [keys[part] for part in missing], load
             )
-            logger.debug(
-                "family_org_ids_cached",
-                organization_id=org_id_str,
-                family_size=len(family_ids),
-                ttl=settings.REDIS_ORG_CACHE_TTL,
-            )
-
-        return family_ids
-
-    async def _validate_child_relationship(
-        self,
-        child_id: UUID,
-        parent_id: UUID,
-    ) -> None:
-        """
-        Validate that child organization is a child of parent.
-
-        Args:
-            child_id: Child organization UUID.
-            parent_id: Parent organization UUID.
-
-        Raises:
-            NotChildOfParentError: If child is not a child of parent.
-        """
-        async with async_session_factory() as session:
-            repo = OrganizationRepository(session)
-            is_child = await repo.is_child_of_parent(child_id, parent_id)
-
-            if not is_child:
-                raise NotChildOfParentError(
-                    details={
-                        "child_organization_id": str(child_id),
-                        "parent_organization_id": str(parent_id),
-                    }
-                )
-
-    def _error_response(
-        self,
-        status_code: int,
-        code: str,
-        message: str,
-        details: dict | None = None,
-    ) -> JSONResponse:
-        """Create JSON error response."""
-        return JSONResponse(
-            status_code=status_code,
-            content={
-                "code": code,
-                "message": message,
-                "details": details or {},
-            },
-        )
+        else:
+            values = await load()
+
+        for part in missing:
+            identity[part] = values.get(keys[part])
+
+        return identity
+
+    @staticmethod
+    def _is_cacheable(value: Any) -> bool:
+        """Only cache found records, skipping inactive organizations."""
+        if value is None:
+            return False
+        if isinstance(value, dict):
+            return value.get("is_active", True)
+        return True
@@ -4,6 +4,7 @@ from fastapi import APIRouter
 
 from src.app.dependencies import get_settings
 from src.shared.domain.schemas import HealthResponse
+from src.shared.infrastructure.cache import get_redis_cache
 
 
 router = APIRouter(tags=["Health"])
@@ -23,3 +24,14 @@ async def health_check() -> HealthResponse:
         version="0.1.0",
         environment=settings.APP_ENV,
     )
+
+
+@router.get(
+    "/health/cache",
+    summary="Cache Statistics",
+    description="Hit/miss counters per cache key family for this worker",
+)
+async def cache_stats() -> dict[str, dict[str, int]]:
+    """Return cache hit/miss counters of the current worker."""
+    cache = get_redis_cache()
+    return cache.stats() if cache else {}
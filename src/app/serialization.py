@@ -0,0 +1,68 @@
+"""
+Fast JSON serialization (orjson) for responses and the cache.
+
+Used by RedisCache, the app's default response class and the error
+responses of middlewares, so every JSON body and cache entry is encoded
+the same way. UUID, datetime/date/time (timezone-aware datetimes as
+RFC 3339, UTC as "Z", like Pydantic), enums and dataclasses are encoded
+natively; Decimal as a string and Pydantic models as their JSON dump,
+also like Pydantic. CPF and phone fields are plain strings. Anything else
+raises TypeError instead of being silently turned into str().
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+# Raised by loads() (a subclass of json.JSONDecodeError and ValueError)
+JSONDecodeError = orjson.JSONDecodeError
+
+_DUMPS_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson does not support natively."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a value to JSON bytes.
+
+    Args:
+        value: Value to serialize.
+
+    Returns:
+        Compact UTF-8 JSON.
+
+    Raises:
+        TypeError: If the value (or a nested value) cannot be serialized.
+    """
+    return orjson.dumps(value, default=_default, option=_DUMPS_OPTIONS)
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON bytes or text.
+
+    Raises:
+        JSONDecodeError: If the data is not valid JSON.
+    """
+    return orjson.loads(data)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with dumps(), the app's default response class."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
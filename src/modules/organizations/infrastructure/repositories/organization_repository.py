@@ -1,13 +1,15 @@
 """Organization repository for database operations."""
 
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import Uuid, and_, func, literal, null, or_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from src.modules.organizations.domain.models import Organization, OrganizationMembership
+from src.modules.users.domain.models import Role
 from src.shared.infrastructure.repositories.base import BaseRepository
 
 
@@ -167,3 +169,167 @@ class OrganizationRepository(BaseRepository[Organization]):
             )
         )
         return list(family_result.scalars().all())
+
+    async def get_identity_data(
+        self,
+        organization_id: UUID,
+        user_id: UUID,
+        child_organization_id: UUID | None = None,
+    ) -> dict[str, Any]:
+        """
+        Resolve organization identity data in a single SQL round trip.
+
+        Loads the organization, the optional child organization, the user's
+        active membership (with role) and the family organization IDs with
+        one statement, so a cold identity lookup uses one connection and one
+        round trip instead of one query per piece.
+
+        Deleted organizations are reported as not found. Inactive (but not
+        deleted) organizations are returned with is_active False so callers
+        can distinguish inactive from missing.
+
+        Args:
+            organization_id: The organization UUID.
+            user_id: The user UUID.
+            child_organization_id: Optional child organization UUID.
+
+        Returns:
+            Dict with keys:
+            - organization: Organization data dict, or None if not found.
+            - membership: Membership data dict, or None if not an active member.
+            - family: List of family organization IDs as strings.
+            - child_organization: Child organization data dict, or None if
+              not found (only present when child_organization_id is given).
+        """
+        now = datetime.now(timezone.utc)
+
+        # Anchor row so the statement returns even if the org does not exist
+        requested = select(
+            literal(organization_id, Uuid).label("id")
+        ).subquery("requested")
+
+        org = aliased(Organization, name="org")
+        child = aliased(Organization, name="child_org")
+
+        # Active, non-expired membership with role (first granted wins)
+        membership = (
+            select(
+                OrganizationMembership.id.label("membership_id"),
+                OrganizationMembership.role_id,
+                OrganizationMembership.is_active,
+                Role.code.label("role_code"),
+                Role.name.label("role_name"),
+            )
+            .outerjoin(Role, Role.id == OrganizationMembership.role_id)
+            .where(
+                OrganizationMembership.user_id == user_id,
+                OrganizationMembership.organization_id == requested.c.id,
+                OrganizationMembership.is_active.is_(True),
+                or_(
+                    OrganizationMembership.expires_at.is_(None),
+                    OrganizationMembership.expires_at > now,
+                ),
+            )
+            .order_by(OrganizationMembership.granted_at)
+            .limit(1)
+            .lateral("membership")
+        )
+
+        # Family: root (parent or self) + all of its children
+        family_root = func.coalesce(org.parent_id, org.id)
+        family_ids = (
+            select(func.array_agg(Organization.id))
+            .where(
+                Organization.deleted_at.is_(None),
+                or_(
+                    Organization.id == family_root,
+                    Organization.parent_id == family_root,
+                ),
+            )
+            .scalar_subquery()
+        )
+
+        columns = [
+            org.id.label("org_id"),
+            org.name.label("org_name"),
+            org.is_active.label("org_is_active"),
+            org.parent_id.label("org_parent_id"),
+            membership.c.membership_id,
+            membership.c.role_id,
+            membership.c.is_active.label("membership_is_active"),
+            membership.c.role_code,
+            membership.c.role_name,
+            family_ids.label("family_ids"),
+        ]
+        if child_organization_id is not None:
+            columns += [
+                child.id.label("child_id"),
+                child.name.label("child_name"),
+                child.is_active.label("child_is_active"),
+                child.parent_id.label("child_parent_id"),
+            ]
+        else:
+            columns += [null().label("child_id")]
+
+        query = (
+            select(*columns)
+            .select_from(requested)
+            .outerjoin(
+                org,
+                and_(org.id == requested.c.id, org.deleted_at.is_(None)),
+            )
+            .outerjoin(membership, true())
+        )
+        if child_organization_id is not None:
+            query = query.outerjoin(
+                child,
+                and_(
+                    child.id == child_organization_id,
+                    child.deleted_at.is_(None),
+                ),
+            )
+
+        row = (await self.session.execute(query)).one()
+
+        data: dict[str, Any] = {
+            "organization": self._identity_org_data(
+                row.org_id, row.org_name, row.org_is_active, row.org_parent_id
+            ),
+            "membership": (
+                {
+                    "membership_id": str(row.membership_id),
+                    "role_id": str(row.role_id),
+                    "role_code": row.role_code,
+                    "role_name": row.role_name,
+                    "is_active": row.membership_is_active,
+                }
+                if row.membership_id is not None
+                else None
+            ),
+            "family": [str(id) for id in row.family_ids or [organization_id]],
+        }
+        if child_organization_id is not None:
+            data["child_organization"] = self._identity_org_data(
+                row.child_id, row.child_name, row.child_is_active, row.child_parent_id
+            )
+        return data
+
+    @staticmethod
+    def _identity_org_data(
+        org_id: UUID | None,
+        name: str | None,
+        is_active: bool | None,
+        parent_id: UUID | None,
+    ) -> dict[str, Any] | None:
+        """Build the organization data dict used by identity resolution."""
+        if org_id is None:
+            return None
+
+        return {
+            "id": str(org_id),
+            "name": name,
+            "is_active": bool(is_active),
+            "parent_id": str(parent_id) if parent_id else None,
+            # Only root organizations (without parent) can have children
+            "can_have_children": parent_id is None,
+        }
@@ -8,6 +8,8 @@ from src.modules.professionals.domain.models.enums import (
     EducationLevel,
     Gender,
     MaritalStatus,
+    ProfessionalImportFileFormat,
+    ProfessionalImportStatus,
     ProfessionalType,
     ResidencyStatus,
     validate_council_for_professional_type,
@@ -32,6 +34,11 @@ from src.modules.professionals.domain.models.professional_education import (
     ProfessionalEducation,
     ProfessionalEducationBase,
 )
+from src.modules.professionals.domain.models.professional_import_job import (
+    ProfessionalImportJob,
+    ProfessionalImportJobBase,
+    ProfessionalImportRowError,
+)
 from src.modules.professionals.domain.models.professional_qualification import (
     ProfessionalQualification,
     ProfessionalQualificationBase,
@@ -63,6 +70,8 @@ __all__ = [
     "EducationLevel",
     "Gender",
     "MaritalStatus",
+    "ProfessionalImportFileFormat",
+    "ProfessionalImportStatus",
     "ProfessionalType",
     "ResidencyStatus",
     # Validators
@@ -73,6 +82,7 @@ __all__ = [
     "ProfessionalCompanyBase",
     "ProfessionalDocumentBase",
     "ProfessionalEducationBase",
+    "ProfessionalImportJobBase",
     "ProfessionalQualificationBase",
     "ProfessionalSpecialtyBase",
     "ProfessionalVersionBase",
@@ -83,6 +93,7 @@ __all__ = [
     "ProfessionalCompany",
     "ProfessionalDocument",
     "ProfessionalEducation",
+    "ProfessionalImportJob",
     "ProfessionalQualification",
     "ProfessionalSpecialty",
     "ProfessionalVersion",
@@ -96,4 +107,6 @@ __all__ = [
     "ProfessionalDataSnapshot",
     "QualificationSnapshot",
     "SpecialtySnapshot",
+    # Import job TypedDicts
+    "ProfessionalImportRowError",
 ]
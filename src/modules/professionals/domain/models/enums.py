@@ -102,6 +102,28 @@ class EducationLevel(str, Enum):
     FELLOWSHIP = "FELLOWSHIP"  # Fellowship
 
 
+class ProfessionalImportStatus(str, Enum):
+    """
+    Status of a bulk professional import job.
+
+    Flow: PENDING → RUNNING → COMPLETED
+    Failures: RUNNING → PENDING (retry scheduled, resumes after the last
+    imported chunk) or FAILED (attempts exhausted or unreadable file)
+    """
+
+    PENDING = "PENDING"  # Queued, waiting for a worker (or a retry)
+    RUNNING = "RUNNING"  # Claimed by a worker
+    COMPLETED = "COMPLETED"  # Every row processed (some may have errors)
+    FAILED = "FAILED"  # Failed permanently
+
+
+class ProfessionalImportFileFormat(str, Enum):
+    """Spreadsheet formats accepted by the professional import."""
+
+    CSV = "CSV"
+    XLSX = "XLSX"
+
+
 # ============================================================================
 # COUNCIL ↔ PROFESSIONAL TYPE VALIDATION
 # ============================================================================
@@ -146,6 +146,14 @@ class OrganizationProfessional(
             postgresql_ops={"": "gin_trgm_ops"},
             postgresql_where=text("deleted_at IS NULL"),
         ),
+        # B-tree index for CPF prefix search (LIKE '123%')
+        Index(
+            "idx_organization_professionals_org_cpf_prefix",
+            "organization_id",
+            "cpf",
+            postgresql_ops={"cpf": "text_pattern_ops"},
+            postgresql_where=text("cpf IS NOT NULL AND deleted_at IS NULL"),
+        ),
         # B-tree index for created_at sorting
         Index(
             "idx_organization_professionals_created_at",
@@ -0,0 +1,153 @@
+"""ProfessionalImportJob model - bulk professional import from a spreadsheet."""
+
+from typing import Any, Optional, TypedDict
+from uuid import UUID
+
+from pydantic import AwareDatetime
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field
+
+from src.modules.professionals.domain.models.enums import (
+    ProfessionalImportFileFormat,
+    ProfessionalImportStatus,
+)
+from src.shared.domain.models.base import BaseModel
+from src.shared.domain.models.fields import AwareDatetimeField
+from src.shared.domain.models.mixins import (
+    PrimaryKeyMixin,
+    TimestampMixin,
+    TrackingMixin,
+)
+
+
+class ProfessionalImportRowError(TypedDict):
+    """A spreadsheet row that was not imported (stored in the errors JSONB)."""
+
+    row: int  # Spreadsheet line number (the header is line 1)
+    field: str | None  # Column that failed validation, None for the whole row
+    message: str
+
+
+class ProfessionalImportJobBase(BaseModel):
+    """Base fields for ProfessionalImportJob."""
+
+    file_name: str = Field(
+        max_length=255,
+        description="Original name of the uploaded spreadsheet",
+    )
+    file_format: ProfessionalImportFileFormat = Field(
+        sa_type=SAEnum(
+            ProfessionalImportFileFormat,
+            name="professional_import_file_format",
+            create_constraint=True,
+        ),
+        description="Spreadsheet format (CSV or XLSX)",
+    )
+    status: ProfessionalImportStatus = Field(
+        default=ProfessionalImportStatus.PENDING,
+        sa_type=SAEnum(
+            ProfessionalImportStatus,
+            name="professional_import_status",
+            create_constraint=True,
+        ),
+        description="Job status",
+    )
+    attempts: int = Field(
+        default=0,
+        ge=0,
+        description="Number of processing attempts",
+    )
+    processed_rows: int = Field(
+        default=0,
+        ge=0,
+        description="Data rows read and committed so far (resume point for retries)",
+    )
+    imported_rows: int = Field(
+        default=0,
+        ge=0,
+        description="Rows imported as professionals",
+    )
+    error_rows: int = Field(
+        default=0,
+        ge=0,
+        description="Rows rejected (row errors beyond the stored limit are only counted)",
+    )
+    total_rows: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Data rows in the file (known once the whole file was read)",
+    )
+    error: Optional[str] = Field(
+        default=None,
+        max_length=2000,
+        description="Last job-level error message (unreadable file, missing columns...)",
+    )
+
+
+class ProfessionalImportJob(
+    ProfessionalImportJobBase,
+    TrackingMixin,
+    PrimaryKeyMixin,
+    TimestampMixin,
+    table=True,
+):
+    """
+    ProfessionalImportJob table model.
+
+    Tracks the import of a CSV/XLSX spreadsheet of professionals by the
+    worker. Rows are imported in chunks, each committed together with the
+    job's progress counters and row errors, so a retried job resumes after
+    the last committed chunk instead of importing rows twice.
+    """
+
+    __tablename__ = "professional_import_jobs"
+    __table_args__ = (
+        Index(
+            "idx_professional_import_jobs_org_created",
+            "organization_id",
+            "created_at",
+        ),
+    )
+
+    organization_id: UUID = Field(
+        foreign_key="organizations.id",
+        nullable=False,
+        description="Organization the professionals are imported into",
+    )
+    file_path: str = Field(
+        max_length=1024,
+        description="Storage path of the uploaded spreadsheet",
+    )
+    errors: list[dict[str, Any]] = Field(
+        default_factory=list,
+        sa_type=JSONB,
+        description="Row-level errors (ProfessionalImportRowError structure), capped per job",
+    )
+
+    started_at: Optional[AwareDatetime] = AwareDatetimeField(
+        default=None,
+        nullable=True,
+        description="When the current (or last) attempt started",
+    )
+    completed_at: Optional[AwareDatetime] = AwareDatetimeField(
+        default=None,
+        nullable=True,
+        description="When the job completed or failed permanently",
+    )
+
+    # === Properties ===
+
+    @property
+    def idempotency_key(self) -> str:
+        """Key identifying this job's work (also the message ID on the broker)."""
+        return f"professional_import:{self.id}"
+
+    @property
+    def is_in_flight(self) -> bool:
+        """Check if the job is still pending or running."""
+        return self.status in (
+            ProfessionalImportStatus.PENDING,
+            ProfessionalImportStatus.RUNNING,
+        )
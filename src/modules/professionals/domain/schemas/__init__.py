@@ -39,6 +39,10 @@ from src.modules.professionals.domain.schemas.professional_education import (
     ProfessionalEducationResponse,
     ProfessionalEducationUpdate,
 )
+from src.modules.professionals.domain.schemas.professional_import import (
+    ProfessionalImportJobResponse,
+    ProfessionalImportRowErrorResponse,
+)
 from src.modules.professionals.domain.schemas.professional_qualification import (
     ProfessionalQualificationCreate,
     ProfessionalQualificationDetailResponse,
@@ -139,4 +143,7 @@ __all__ = [
     "ProfessionalVersionResponse",
     "ProfessionalVersionDetailResponse",
     "ProfessionalVersionListResponse",
+    # ProfessionalImport
+    "ProfessionalImportJobResponse",
+    "ProfessionalImportRowErrorResponse",
 ]
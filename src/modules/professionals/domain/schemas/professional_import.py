@@ -0,0 +1,76 @@
+"""Schemas for bulk professional import jobs."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.modules.professionals.domain.models import (
+    ProfessionalImportFileFormat,
+    ProfessionalImportJob,
+    ProfessionalImportStatus,
+)
+
+
+class ProfessionalImportRowErrorResponse(BaseModel):
+    """A spreadsheet row that was not imported."""
+
+    row: int = Field(description="Line number in the spreadsheet (header is line 1)")
+    field: str | None = Field(
+        default=None,
+        description="Column that failed validation (null when the whole row failed)",
+    )
+    message: str = Field(description="Error message")
+
+
+class ProfessionalImportJobResponse(BaseModel):
+    """Status and progress of a bulk professional import."""
+
+    id: UUID
+    organization_id: UUID
+    file_name: str
+    file_format: ProfessionalImportFileFormat
+    status: ProfessionalImportStatus
+    attempts: int
+    processed_rows: int = Field(description="Rows processed so far")
+    imported_rows: int = Field(description="Rows imported as professionals")
+    error_rows: int = Field(description="Rows rejected")
+    total_rows: int | None = Field(
+        default=None,
+        description="Rows in the spreadsheet (known when the import completes)",
+    )
+    errors: list[ProfessionalImportRowErrorResponse] = Field(
+        default_factory=list,
+        description="Row errors (the first PROFESSIONAL_IMPORT_MAX_ROW_ERRORS)",
+    )
+    error: str | None = Field(
+        default=None,
+        description="Why the import failed (when FAILED) or is being retried",
+    )
+    created_at: datetime
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    @classmethod
+    def from_job(cls, job: ProfessionalImportJob) -> "ProfessionalImportJobResponse":
+        """Build the response from a ProfessionalImportJob."""
+        return cls(
+            id=job.id,
+            organization_id=job.organization_id,
+            file_name=job.file_name,
+            file_format=job.file_format,
+            status=job.status,
+            attempts=job.attempts,
+            processed_rows=job.processed_rows,
+            imported_rows=job.imported_rows,
+            error_rows=job.error_rows,
+            total_rows=job.total_rows,
+            errors=[
+                ProfessionalImportRowErrorResponse.model_validate(error)
+                for error in job.errors
+            ],
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            completed_at=job.completed_at,
+        )
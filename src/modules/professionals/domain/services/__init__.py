@@ -1,3 +1,19 @@
 """
 Serviços de domínio para profissionais.
 """
+
+from src.modules.professionals.domain.services.professional_import_row import (
+    REQUIRED_COLUMNS,
+    ParsedProfessionalRow,
+    missing_columns,
+    parse_professional_row,
+    row_error,
+)
+
+__all__ = [
+    "REQUIRED_COLUMNS",
+    "ParsedProfessionalRow",
+    "missing_columns",
+    "parse_professional_row",
+    "row_error",
+]
@@ -0,0 +1,203 @@
+"""
+Parsing and validation of professional import spreadsheet rows.
+
+A row is one professional with one qualification, in flat columns named
+after the composite create schema fields (full_name, cpf, city,
+council_number, ...), plus:
+- specialty_codes: global specialty codes separated by ";" or "," (the
+  first one is the primary specialty)
+- company_cnpj: CNPJ of an existing company to link the professional to
+
+Rows are validated with OrganizationProfessionalCompositeCreate, the
+same rules as POST /professionals/composite. Checks that need the
+database (uniqueness in the family, specialty codes, companies) are done
+per chunk by ProcessProfessionalImportJobUseCase.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from src.app.i18n import ProfessionalMessages, get_message
+from src.app.utils.cnpj import validate_cnpj
+from src.modules.professionals.domain.models import (
+    ProfessionalImportRowError,
+    validate_council_for_professional_type,
+)
+from src.modules.professionals.domain.schemas.organization_professional_composite import (
+    OrganizationProfessionalCompositeCreate,
+)
+
+
+SPECIALTY_CODES_COLUMN = "specialty_codes"
+COMPANY_CNPJ_COLUMN = "company_cnpj"
+
+QUALIFICATION_COLUMNS = frozenset(
+    {
+        "professional_type",
+        "graduation_year",
+        "council_type",
+        "council_number",
+        "council_state",
+    }
+)
+PROFESSIONAL_COLUMNS = frozenset(
+    OrganizationProfessionalCompositeCreate.model_fields
+) - {"qualification"}
+
+REQUIRED_COLUMNS = (
+    "full_name",
+    "city",
+    "state_code",
+    "postal_code",
+    "professional_type",
+    "council_type",
+    "council_number",
+    "council_state",
+)
+
+# Enum and UF columns are matched case-insensitively
+_UPPERCASE_COLUMNS = frozenset(
+    {
+        "gender",
+        "marital_status",
+        "state_code",
+        "professional_type",
+        "council_type",
+        "council_state",
+    }
+)
+_LIST_SEPARATOR = re.compile(r"[;,|]")
+
+
+@dataclass(slots=True)
+class ParsedProfessionalRow:
+    """A spreadsheet row that passed validation."""
+
+    line: int
+    data: OrganizationProfessionalCompositeCreate
+    specialty_codes: list[str]
+    company_cnpj: str | None
+    # Resolved from company_cnpj against the database
+    company_id: UUID | None = None
+
+
+def row_error(line: int, field: str | None, message: str) -> ProfessionalImportRowError:
+    """Build a row error."""
+    return {"row": line, "field": field, "message": message}
+
+
+def missing_columns(columns: list[str]) -> list[str]:
+    """Get the required columns missing from a spreadsheet header."""
+    present = set(columns)
+    return [column for column in REQUIRED_COLUMNS if column not in present]
+
+
+def _validation_errors(line: int, error: ValidationError) -> list[ProfessionalImportRowError]:
+    """Convert a Pydantic ValidationError into row errors, one per column."""
+    errors = []
+    for detail in error.errors():
+        field = next(
+            (part for part in reversed(detail["loc"]) if isinstance(part, str)),
+            None,
+        )
+        # Value objects (CPF, Phone, ...) raise translated ValueErrors
+        cause = detail.get("ctx", {}).get("error")
+        errors.append(row_error(line, field, str(cause) if cause else detail["msg"]))
+    return errors
+
+
+def _digits(value: str, length: int) -> str:
+    """Restore leading zeros of a document typed as a number in Excel."""
+    return value.zfill(length) if value.isdigit() and len(value) < length else value
+
+
+def parse_professional_row(
+    line: int,
+    values: dict[str, str],
+) -> ParsedProfessionalRow | list[ProfessionalImportRowError]:
+    """
+    Validate a spreadsheet row.
+
+    Args:
+        line: Line number in the spreadsheet (for error reporting).
+        values: Non-empty cells by normalized column name.
+
+    Returns:
+        The parsed row, or the list of its errors.
+    """
+    fields: dict[str, Any] = {
+        column: value.upper() if column in _UPPERCASE_COLUMNS else value
+        for column, value in values.items()
+    }
+    professional = {
+        column: value
+        for column, value in fields.items()
+        if column in PROFESSIONAL_COLUMNS
+    }
+    qualification = {
+        column: value
+        for column, value in fields.items()
+        if column in QUALIFICATION_COLUMNS
+    }
+    # The only qualification of an imported professional is the primary one
+    qualification["is_primary"] = True
+    if "cpf" in professional:
+        professional["cpf"] = _digits(professional["cpf"], 11)
+
+    errors: list[ProfessionalImportRowError] = []
+
+    company_cnpj = None
+    if COMPANY_CNPJ_COLUMN in values:
+        try:
+            company_cnpj = validate_cnpj(_digits(values[COMPANY_CNPJ_COLUMN], 14))
+        except ValueError as e:
+            errors.append(row_error(line, COMPANY_CNPJ_COLUMN, str(e)))
+
+    specialty_codes = [
+        code.strip().upper()
+        for code in _LIST_SEPARATOR.split(values.get(SPECIALTY_CODES_COLUMN, ""))
+        if code.strip()
+    ]
+    if len(specialty_codes) != len(set(specialty_codes)):
+        errors.append(
+            row_error(
+                line,
+                SPECIALTY_CODES_COLUMN,
+                get_message(ProfessionalMessages.DUPLICATE_SPECIALTY_IDS),
+            )
+        )
+
+    try:
+        data = OrganizationProfessionalCompositeCreate.model_validate(
+            {**professional, "qualification": qualification}
+        )
+    except ValidationError as e:
+        return errors + _validation_errors(line, e)
+
+    council_type = data.qualification.council_type
+    professional_type = data.qualification.professional_type
+    if not validate_council_for_professional_type(council_type, professional_type):
+        errors.append(
+            row_error(
+                line,
+                "council_type",
+                get_message(
+                    ProfessionalMessages.INVALID_COUNCIL_TYPE,
+                    council_type=council_type.value,
+                    professional_type=professional_type.value,
+                ),
+            )
+        )
+
+    if errors:
+        return errors
+    return ParsedProfessionalRow(
+        line=line,
+        data=data,
+        specialty_codes=specialty_codes,
+        company_cnpj=company_cnpj,
+    )
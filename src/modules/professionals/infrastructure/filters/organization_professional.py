@@ -21,7 +21,7 @@ class OrganizationProfessionalFilter(FilterSet):
     Filter for OrganizationProfessional queries.
 
     Supports:
-    - search: Full-text search across full_name, email, cpf (using pg_trgm)
+    - search: Search across full_name, email, cpf (using pg_trgm indexes)
     - gender: Filter by gender
     - marital_status: Filter by marital status
     - professional_type: Filter by professional type (DOCTOR, NURSE, etc.)
@@ -29,7 +29,11 @@ class OrganizationProfessionalFilter(FilterSet):
 
     search: Optional[SearchFilter] = Field(
         default=None,
-        description="Search by name, email or CPF (partial, case-insensitive)",
+        description=(
+            "Search by name, email or CPF (partial, case- and accent-insensitive; "
+            "CPF by prefix, with or without punctuation). Results are ranked by "
+            "relevance unless sort_by is given"
+        ),
     )
 
     gender: Optional[ListFilter[Gender]] = Field(
@@ -50,9 +54,9 @@ class OrganizationProfessionalFilter(FilterSet):
     class Config:
         """FilterSet configuration."""
 
-        field_columns = {
-            "search": ["full_name", "email", "cpf"],
-        }
+        # search is not mapped: OrganizationProfessionalRepository applies it
+        # on the trigram-indexed expressions (see repositories/search.py)
+        field_columns: dict[str, list[str]] = {}
 
 
 class OrganizationProfessionalSorting(SortingSet):
@@ -0,0 +1,19 @@
+"""Professionals module messaging (queues, messages and publishers)."""
+
+from src.modules.professionals.infrastructure.messaging.professional_import_jobs import (
+    PROFESSIONAL_IMPORT_QUEUE,
+    PROFESSIONAL_IMPORT_RETRY_QUEUE,
+    ProfessionalImportJobMessage,
+    declare_import_queues,
+    publish_import_job,
+    publish_import_job_retry,
+)
+
+__all__ = [
+    "PROFESSIONAL_IMPORT_QUEUE",
+    "PROFESSIONAL_IMPORT_RETRY_QUEUE",
+    "ProfessionalImportJobMessage",
+    "declare_import_queues",
+    "publish_import_job",
+    "publish_import_job_retry",
+]
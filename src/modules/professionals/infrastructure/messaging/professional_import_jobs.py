@@ -0,0 +1,88 @@
+"""
+Professional import job queues.
+
+Jobs are published to PROFESSIONAL_IMPORT_QUEUE on the default exchange
+and consumed by the worker (src/workers/handlers/professional_import_handler.py).
+Retries go through PROFESSIONAL_IMPORT_RETRY_QUEUE, which has no
+consumers: messages expire there and are dead-lettered back to the main
+queue, like the screening report retries.
+"""
+
+from uuid import UUID
+
+from faststream.rabbit import RabbitQueue
+from pydantic import BaseModel
+
+from src.app.dependencies import get_settings
+from src.modules.professionals.domain.models import ProfessionalImportJob
+from src.shared.infrastructure.messaging.broker import broker
+
+
+_settings = get_settings()
+
+PROFESSIONAL_IMPORT_QUEUE = RabbitQueue(
+    f"{_settings.LAVINMQ_QUEUE_PREFIX}professional_imports",
+    durable=True,
+)
+PROFESSIONAL_IMPORT_RETRY_QUEUE = RabbitQueue(
+    f"{_settings.LAVINMQ_QUEUE_PREFIX}professional_imports_retry",
+    durable=True,
+    arguments={
+        "x-dead-letter-exchange": "",
+        "x-dead-letter-routing-key": PROFESSIONAL_IMPORT_QUEUE.name,
+    },
+)
+
+
+async def declare_import_queues() -> None:
+    """
+    Declare the import queues on the broker.
+
+    Publishing to the default exchange silently drops messages routed to
+    a queue that does not exist yet, so both the API and the worker
+    declare the queues once connected.
+    """
+    await broker.declare_queue(PROFESSIONAL_IMPORT_QUEUE)
+    await broker.declare_queue(PROFESSIONAL_IMPORT_RETRY_QUEUE)
+
+
+class ProfessionalImportJobMessage(BaseModel):
+    """Message asking the worker to process an import job."""
+
+    job_id: UUID
+    idempotency_key: str
+
+
+async def publish_import_job(job: ProfessionalImportJob) -> None:
+    """
+    Publish an import job to the worker queue.
+
+    Args:
+        job: The job to process.
+    """
+    await broker.publish(
+        ProfessionalImportJobMessage(job_id=job.id, idempotency_key=job.idempotency_key),
+        queue=PROFESSIONAL_IMPORT_QUEUE,
+        persist=True,
+        message_id=job.idempotency_key,
+    )
+
+
+async def publish_import_job_retry(
+    message: ProfessionalImportJobMessage,
+    delay: int,
+) -> None:
+    """
+    Publish an import job again after a delay.
+
+    Args:
+        message: The message being retried.
+        delay: Seconds to wait before the job is delivered again.
+    """
+    await broker.publish(
+        message,
+        queue=PROFESSIONAL_IMPORT_RETRY_QUEUE,
+        persist=True,
+        message_id=message.idempotency_key,
+        expiration=delay,
+    )
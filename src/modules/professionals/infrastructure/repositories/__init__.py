@@ -23,6 +23,9 @@ from src.modules.professionals.infrastructure.repositories.professional_document
 from src.modules.professionals.infrastructure.repositories.professional_education_repository import (
     ProfessionalEducationRepository,
 )
+from src.modules.professionals.infrastructure.repositories.professional_import_job_repository import (
+    ProfessionalImportJobRepository,
+)
 from src.modules.professionals.infrastructure.repositories.professional_qualification_repository import (
     ProfessionalQualificationRepository,
 )
@@ -44,6 +47,7 @@ __all__ = [
     "ProfessionalCompanyRepository",
     "ProfessionalDocumentRepository",
     "ProfessionalEducationRepository",
+    "ProfessionalImportJobRepository",
     "ProfessionalQualificationRepository",
     "ProfessionalSpecialtyRepository",
     "ProfessionalVersionRepository",
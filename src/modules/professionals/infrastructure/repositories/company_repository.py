@@ -27,6 +27,15 @@ class CompanyRepository(BaseRepository[Company]):
         result = await self.session.execute(select(Company).where(Company.cnpj == cnpj))
         return result.scalar_one_or_none()
 
+    async def get_by_cnpjs(self, cnpjs: set[str] | list[str]) -> list[Company]:
+        """Get the companies with any of the given CNPJs."""
+        if not cnpjs:
+            return []
+        result = await self.session.execute(
+            select(Company).where(Company.cnpj.in_(list(cnpjs)))
+        )
+        return list(result.scalars().all())
+
     async def get_or_create_by_cnpj(
         self,
         cnpj: str,
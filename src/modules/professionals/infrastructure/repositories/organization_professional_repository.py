@@ -1,9 +1,28 @@
 """OrganizationProfessional repository for database operations."""
 
+from typing import Any
 from uuid import UUID
 
-from src.shared.domain.schemas import PaginatedResponse, PaginationParams
-from sqlalchemy import select
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+    PaginatedResponse,
+)
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Text,
+    and_,
+    cast,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only, selectinload
 
@@ -30,6 +49,22 @@ from src.shared.infrastructure.repositories import (
     ScopePolicy,
     SoftDeleteMixin,
 )
+from src.shared.infrastructure.repositories.search import (
+    contains_term,
+    cpf_prefix,
+    is_default_sorting,
+    search_document,
+    similarity_rank,
+    unaccent_lower,
+)
+
+
+def _json_object(**fields: Any) -> ColumnElement[Any]:
+    """Build json_build_object('key', value, ...) with constant keys."""
+    arguments: list[Any] = []
+    for key, value in fields.items():
+        arguments.extend((literal_column(f"'{key}'"), value))
+    return func.json_build_object(*arguments)
 
 
 class OrganizationProfessionalRepository(
@@ -212,13 +247,16 @@ class OrganizationProfessionalRepository(
     async def list_for_organization(
         self,
         organization_id: UUID,
-        pagination: PaginationParams,
+        pagination: CursorPaginationParams,
         *,
         family_org_ids: list[UUID] | tuple[UUID, ...] | None = None,
         scope_policy: ScopePolicy | None = None,
         filters: OrganizationProfessionalFilter | None = None,
         sorting: OrganizationProfessionalSorting | None = None,
-    ) -> PaginatedResponse[OrganizationProfessional]:
+        count_strategy: CountStrategy | None = None,
+    ) -> PaginatedResponse[OrganizationProfessional] | CursorPaginatedResponse[
+        OrganizationProfessional
+    ]:
         """
         List professionals with pagination, filtering, sorting, and scope support.
 
@@ -229,31 +267,18 @@ class OrganizationProfessionalRepository(
             scope_policy: Scope policy to apply. Uses default if None.
             filters: Optional filters (search, gender, marital_status, professional_type).
             sorting: Optional sorting (id, full_name, email, created_at).
+            count_strategy: How to compute the total (EXACT if None).
 
         Returns:
             Paginated list of professionals.
         """
-        org_ids = self._get_effective_org_ids(
-            organization_id=organization_id,
-            family_org_ids=family_org_ids or (),
+        query, rank = self._filtered_query(
+            organization_id,
+            family_org_ids=family_org_ids,
             scope_policy=scope_policy,
+            filters=filters,
+            sorting=sorting,
         )
-        query = self._apply_org_scope(super().get_query(), org_ids)  # type: ignore[misc]
-
-        # Apply professional_type filter via subquery (field is in ProfessionalQualification)
-        if (
-            filters
-            and filters.professional_type
-            and filters.professional_type.is_active()
-        ):
-            subquery = select(
-                ProfessionalQualification.organization_professional_id
-            ).where(
-                ProfessionalQualification.professional_type.in_(
-                    filters.professional_type.values
-                )
-            )
-            query = query.where(OrganizationProfessional.id.in_(subquery))
 
         return await self.list(
             filters=filters,
@@ -261,18 +286,26 @@ class OrganizationProfessionalRepository(
             limit=pagination.limit,
             offset=pagination.offset,
             base_query=query,
+            use_cursor=pagination.use_cursor,
+            cursor=pagination.cursor,
+            include_total=pagination.include_total,
+            count_strategy=count_strategy,
+            rank=rank,
         )
 
     async def list_for_organization_with_summary(
         self,
         organization_id: UUID,
-        pagination: PaginationParams,
+        pagination: CursorPaginationParams,
         *,
         family_org_ids: list[UUID] | tuple[UUID, ...] | None = None,
         scope_policy: ScopePolicy | None = None,
         filters: OrganizationProfessionalFilter | None = None,
         sorting: OrganizationProfessionalSorting | None = None,
-    ) -> PaginatedResponse[OrganizationProfessional]:
+        count_strategy: CountStrategy | None = None,
+    ) -> PaginatedResponse[OrganizationProfessional] | CursorPaginatedResponse[
+        OrganizationProfessional
+    ]:
         """
         List professionals with primary qualification and specialties loaded.
 
@@ -290,31 +323,18 @@ class OrganizationProfessionalRepository(
             scope_policy: Scope policy to apply. Uses default if None.
             filters: Optional filters (including professional_type).
             sorting: Optional sorting.
+            count_strategy: How to compute the total (EXACT if None).
 
         Returns:
             Paginated list of professionals with minimal data loaded.
         """
-        org_ids = self._get_effective_org_ids(
-            organization_id=organization_id,
-            family_org_ids=family_org_ids or (),
+        query, rank = self._filtered_query(
+            organization_id,
+            family_org_ids=family_org_ids,
             scope_policy=scope_policy,
+            filters=filters,
+            sorting=sorting,
         )
-        query = self._apply_org_scope(super().get_query(), org_ids)  # type: ignore[misc]
-
-        # Apply professional_type filter via subquery (field is in ProfessionalQualification)
-        if (
-            filters
-            and filters.professional_type
-            and filters.professional_type.is_active()
-        ):
-            subquery = select(
-                ProfessionalQualification.organization_professional_id
-            ).where(
-                ProfessionalQualification.professional_type.in_(
-                    filters.professional_type.values
-                )
-            )
-            query = query.where(OrganizationProfessional.id.in_(subquery))
 
         query = query.options(
             # Load only needed columns from OrganizationProfessional
@@ -353,8 +373,222 @@ class OrganizationProfessionalRepository(
             limit=pagination.limit,
             offset=pagination.offset,
             base_query=query,
+            use_cursor=pagination.use_cursor,
+            cursor=pagination.cursor,
+            include_total=pagination.include_total,
+            count_strategy=count_strategy,
+            rank=rank,
+        )
+
+    async def list_for_organization_summary_json(
+        self,
+        organization_id: UUID,
+        pagination: CursorPaginationParams,
+        *,
+        family_org_ids: list[UUID] | tuple[UUID, ...] | None = None,
+        scope_policy: ScopePolicy | None = None,
+        filters: OrganizationProfessionalFilter | None = None,
+        sorting: OrganizationProfessionalSorting | None = None,
+        count_strategy: CountStrategy | None = None,
+    ) -> PaginatedResponse[Row[Any]] | CursorPaginatedResponse[Row[Any]]:
+        """
+        List professional summaries as JSON built by PostgreSQL.
+
+        Same rows, filters, sorting and pagination as
+        list_for_organization_with_summary, but the page selects only the
+        summary columns and aggregates the primary qualification and its
+        specialties with json_build_object/json_agg. Each item is a Row
+        whose `item` is the OrganizationProfessionalListItem JSON text, so
+        no ORM or Pydantic object is built per professional.
+
+        Args:
+            organization_id: The organization UUID.
+            pagination: Pagination parameters.
+            family_org_ids: List of family org IDs (required for FAMILY scope).
+            scope_policy: Scope policy to apply. Uses default if None.
+            filters: Optional filters (including professional_type).
+            sorting: Optional sorting.
+            count_strategy: How to compute the total (EXACT if None).
+
+        Returns:
+            Paginated list of rows (id, sort columns and `item` JSON text).
+        """
+        query, rank = self._filtered_query(
+            organization_id,
+            family_org_ids=family_org_ids,
+            scope_policy=scope_policy,
+            filters=filters,
+            sorting=sorting,
+        )
+
+        return await self.list(  # type: ignore[return-value]
+            filters=filters,
+            sorting=sorting,
+            limit=pagination.limit,
+            offset=pagination.offset,
+            base_query=query,
+            use_cursor=pagination.use_cursor,
+            cursor=pagination.cursor,
+            include_total=pagination.include_total,
+            count_strategy=count_strategy,
+            rank=rank,
+            columns=[
+                # id and the sortable columns, for keyset cursors
+                OrganizationProfessional.id,
+                OrganizationProfessional.full_name,
+                OrganizationProfessional.email,
+                OrganizationProfessional.created_at,
+                self._summary_item_json().label("item"),
+            ],
         )
 
+    @staticmethod
+    def _summary_item_json() -> ColumnElement[str]:
+        """
+        Build one OrganizationProfessionalListItem as JSON text.
+
+        The primary qualification and its specialties come from correlated
+        subqueries; PostgreSQL evaluates them after ORDER BY/LIMIT, so only
+        for the rows of the page.
+        """
+        primary = and_(
+            ProfessionalQualification.organization_professional_id
+            == OrganizationProfessional.id,
+            ProfessionalQualification.is_primary.is_(True),
+        )
+        qualification = (
+            select(
+                _json_object(
+                    professional_type=ProfessionalQualification.professional_type,
+                    council_type=ProfessionalQualification.council_type,
+                    council_number=ProfessionalQualification.council_number,
+                    council_state=ProfessionalQualification.council_state,
+                    is_generalist=false(),
+                )
+            )
+            .where(primary)
+            .limit(1)
+            .scalar_subquery()
+        )
+        specialties = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        _json_object(id=Specialty.id, name=Specialty.name),
+                        ProfessionalSpecialty.id,
+                    )
+                )
+            )
+            .select_from(ProfessionalSpecialty)
+            .join(Specialty, Specialty.id == ProfessionalSpecialty.specialty_id)
+            .join(
+                ProfessionalQualification,
+                ProfessionalQualification.id == ProfessionalSpecialty.qualification_id,
+            )
+            .where(primary)
+            .scalar_subquery()
+        )
+        return cast(
+            _json_object(
+                id=OrganizationProfessional.id,
+                avatar_url=OrganizationProfessional.avatar_url,
+                full_name=OrganizationProfessional.full_name,
+                city=OrganizationProfessional.city,
+                state_code=OrganizationProfessional.state_code,
+                cpf=OrganizationProfessional.cpf,
+                phone=OrganizationProfessional.phone,
+                email=OrganizationProfessional.email,
+                qualification=qualification,
+                specialties=func.coalesce(specialties, literal_column("'[]'::json")),
+            ),
+            Text,
+        )
+
+    def _filtered_query(
+        self,
+        organization_id: UUID,
+        *,
+        family_org_ids: list[UUID] | tuple[UUID, ...] | None,
+        scope_policy: ScopePolicy | None,
+        filters: OrganizationProfessionalFilter | None,
+        sorting: OrganizationProfessionalSorting | None,
+    ) -> tuple[Select[tuple[OrganizationProfessional]], ColumnElement[float] | None]:
+        """
+        Build the scoped list query with the filters the FilterSet cannot map.
+
+        Applies the organization scope, the professional_type filter (a
+        column of ProfessionalQualification) and the search.
+
+        Returns:
+            Tuple of (query, relevance rank), see _apply_search.
+        """
+        org_ids = self._get_effective_org_ids(
+            organization_id=organization_id,
+            family_org_ids=family_org_ids or (),
+            scope_policy=scope_policy,
+        )
+        query = self._apply_org_scope(super().get_query(), org_ids)  # type: ignore[misc]
+
+        # Apply professional_type filter via subquery (field is in ProfessionalQualification)
+        if (
+            filters
+            and filters.professional_type
+            and filters.professional_type.is_active()
+        ):
+            subquery = select(
+                ProfessionalQualification.organization_professional_id
+            ).where(
+                ProfessionalQualification.professional_type.in_(
+                    filters.professional_type.values
+                )
+            )
+            query = query.where(OrganizationProfessional.id.in_(subquery))
+
+        return self._apply_search(query, filters, sorting)
+
+    def _apply_search(
+        self,
+        query: Select[tuple[OrganizationProfessional]],
+        filters: OrganizationProfessionalFilter | None,
+        sorting: OrganizationProfessionalSorting | None,
+    ) -> tuple[Select[tuple[OrganizationProfessional]], ColumnElement[float] | None]:
+        """
+        Apply the search filter on the trigram-indexed expressions.
+
+        CPF-shaped terms (digits, optionally punctuated) match CPFs by
+        prefix, using the (organization_id, cpf text_pattern_ops) index.
+        Other terms match name, email or CPF anywhere, case- and
+        accent-insensitively, using idx_organization_professionals_search_trgm.
+
+        Args:
+            query: The scoped base query.
+            filters: Optional filters (only search is applied here).
+            sorting: Requested sorting.
+
+        Returns:
+            Tuple of (filtered query, relevance rank). The rank (name/email
+            similarity) is None for CPF searches and when the client chose
+            a sort order.
+        """
+        if not (filters and filters.search and filters.search.is_active()):
+            return query, None
+
+        term = filters.search.value
+        digits = cpf_prefix(term)
+        if digits:
+            return query.where(OrganizationProfessional.cpf.like(f"{digits}%")), None
+
+        full_name = unaccent_lower(OrganizationProfessional.full_name)
+        email = unaccent_lower(OrganizationProfessional.email)
+        query = query.where(
+            contains_term(
+                search_document(full_name, email, OrganizationProfessional.cpf), term
+            )
+        )
+        if not is_default_sorting(sorting):
+            return query, None
+        return query, similarity_rank(term, full_name, email)
+
     async def exists_by_cpf(
         self,
         cpf: str,
@@ -487,6 +721,100 @@ class OrganizationProfessionalRepository(
             )
         )
 
+    async def find_identity_conflicts_in_family(
+        self,
+        family_org_ids: list[UUID] | tuple[UUID, ...],
+        *,
+        cpf: str | None = None,
+        email: str | None = None,
+        exclude_id: UUID | None = None,
+    ) -> set[str]:
+        """
+        Check CPF and email uniqueness in the family with a single query.
+
+        Equivalent to exists_by_cpf_in_family + exists_by_email_in_family,
+        in one round trip.
+
+        Args:
+            family_org_ids: List of all organization IDs in the family.
+            cpf: The CPF to check (skipped if None).
+            email: The email to check (skipped if None).
+            exclude_id: Optional ID to exclude (for updates).
+
+        Returns:
+            Names of the conflicting fields ("cpf", "email"), empty if none.
+        """
+        conditions = {
+            field: getattr(OrganizationProfessional, field) == value
+            for field, value in (("cpf", cpf), ("email", email))
+            if value
+        }
+        if not conditions:
+            return set()
+
+        query = self.get_query().where(
+            OrganizationProfessional.organization_id.in_(list(family_org_ids)),
+            or_(*conditions.values()),
+        )
+        if exclude_id:
+            query = query.where(OrganizationProfessional.id != exclude_id)
+
+        result = await self.session.execute(
+            query.with_only_columns(
+                *(func.bool_or(cond).label(field) for field, cond in conditions.items())
+            )
+        )
+        row = result.one()._mapping
+        return {field for field in conditions if row[field]}
+
+    async def find_identities_in_family(
+        self,
+        family_org_ids: list[UUID] | tuple[UUID, ...],
+        *,
+        cpfs: set[str],
+        emails: set[str],
+    ) -> tuple[set[str], set[str]]:
+        """
+        Find which CPFs and emails are already taken in the family.
+
+        Set-based version of find_identity_conflicts_in_family (bulk
+        import): one query for any number of values.
+
+        Args:
+            family_org_ids: List of all organization IDs in the family.
+            cpfs: CPFs to check.
+            emails: Emails to check.
+
+        Returns:
+            Tuple of (taken CPFs, taken emails).
+        """
+        conditions = []
+        if cpfs:
+            conditions.append(OrganizationProfessional.cpf.in_(list(cpfs)))
+        if emails:
+            conditions.append(OrganizationProfessional.email.in_(list(emails)))
+        if not conditions:
+            return set(), set()
+
+        query = self.get_query().where(
+            OrganizationProfessional.organization_id.in_(list(family_org_ids)),
+            or_(*conditions),
+        )
+        result = await self.session.execute(
+            query.with_only_columns(
+                OrganizationProfessional.cpf,
+                OrganizationProfessional.email,
+            )
+        )
+        taken_cpfs: set[str] = set()
+        taken_emails: set[str] = set()
+        for cpf, email in result.all():
+            if cpf in cpfs:
+                taken_cpfs.add(cpf)
+            if email in emails:
+                taken_emails.add(email)
+        return taken_cpfs, taken_emails
+
     async def _exists_in_family_with_exclude(
         self,
         family_org_ids: list[UUID] | tuple[UUID, ...],
@@ -0,0 +1,157 @@
+"""ProfessionalImportJob repository for database operations."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal, or_, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.professionals.domain.models import (
+    ProfessionalImportJob,
+    ProfessionalImportRowError,
+    ProfessionalImportStatus,
+)
+from src.shared.infrastructure.repositories import BaseRepository
+
+
+class ProfessionalImportJobRepository(BaseRepository[ProfessionalImportJob]):
+    """
+    Repository for ProfessionalImportJob model.
+
+    Jobs are claimed atomically by the worker, so redelivered messages
+    never import the same spreadsheet concurrently, and progress is
+    recorded with a single UPDATE in each chunk's transaction.
+    """
+
+    model = ProfessionalImportJob
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def get_by_id_for_organization(
+        self,
+        job_id: UUID,
+        organization_id: UUID,
+    ) -> ProfessionalImportJob | None:
+        """
+        Get job by ID for a specific organization.
+
+        Args:
+            job_id: The job UUID.
+            organization_id: The organization UUID.
+
+        Returns:
+            ProfessionalImportJob if found, None otherwise.
+        """
+        query = self.get_query().where(
+            ProfessionalImportJob.id == job_id,
+            ProfessionalImportJob.organization_id == organization_id,
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def claim(
+        self,
+        job_id: UUID,
+        stale_before: datetime,
+    ) -> ProfessionalImportJob | None:
+        """
+        Atomically mark a job as running for the current attempt.
+
+        A job can be claimed when it is pending, or when it is running but
+        has made no progress since stale_before (every chunk updates
+        updated_at, so a long import is not considered stale while it
+        advances).
+
+        Args:
+            job_id: The job UUID.
+            stale_before: Running jobs not updated since this are stale.
+
+        Returns:
+            The claimed job, or None if it is not claimable (already
+            running, completed, failed or missing).
+        """
+        stmt = (
+            update(ProfessionalImportJob)
+            .where(
+                ProfessionalImportJob.id == job_id,
+                or_(
+                    ProfessionalImportJob.status == ProfessionalImportStatus.PENDING,
+                    and_(
+                        ProfessionalImportJob.status
+                        == ProfessionalImportStatus.RUNNING,
+                        ProfessionalImportJob.updated_at < stale_before,
+                    ),
+                ),
+            )
+            .values(
+                status=ProfessionalImportStatus.RUNNING,
+                attempts=ProfessionalImportJob.attempts + 1,
+                started_at=func.now(),
+                updated_at=func.now(),
+            )
+            .returning(ProfessionalImportJob)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def record_progress(
+        self,
+        job_id: UUID,
+        *,
+        processed_rows: int,
+        imported_rows: int,
+        error_rows: int,
+        errors: list[ProfessionalImportRowError],
+    ) -> None:
+        """
+        Add a chunk's counters and row errors to a job with one UPDATE.
+
+        Runs in the chunk's transaction, so the rows and the progress are
+        committed (or rolled back) together.
+
+        Args:
+            job_id: The job UUID.
+            processed_rows: Rows read in the chunk.
+            imported_rows: Rows imported in the chunk.
+            error_rows: Rows rejected in the chunk.
+            errors: Row errors to append (already capped by the caller).
+        """
+        values: dict[str, object] = {
+            "processed_rows": ProfessionalImportJob.processed_rows + processed_rows,
+            "imported_rows": ProfessionalImportJob.imported_rows + imported_rows,
+            "error_rows": ProfessionalImportJob.error_rows + error_rows,
+            "updated_at": func.now(),
+        }
+        if errors:
+            values["errors"] = ProfessionalImportJob.errors.op("||", return_type=JSONB)(
+                literal(errors, JSONB)
+            )
+        await self.session.execute(
+            update(ProfessionalImportJob)
+            .where(ProfessionalImportJob.id == job_id)
+            .values(**values)
+        )
+
+    async def set_status(
+        self,
+        job_id: UUID,
+        status: ProfessionalImportStatus,
+        **values: object,
+    ) -> None:
+        """
+        Set a job's status (and other columns) with a single UPDATE.
+
+        Args:
+            job_id: The job UUID.
+            status: New status.
+            **values: Other columns to set (total_rows, error, ...).
+        """
+        stmt = (
+            update(ProfessionalImportJob)
+            .where(ProfessionalImportJob.id == job_id)
+            .values(status=status, updated_at=func.now(), **values)
+        )
+        await self.session.execute(stmt)
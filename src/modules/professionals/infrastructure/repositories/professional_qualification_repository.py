@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from src.shared.domain.schemas import PaginatedResponse, PaginationParams
-from sqlalchemy import Select, select
+from sqlalchemy import Select, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -93,6 +93,27 @@ class ProfessionalQualificationRepository(
         )
         return result.scalar_one_or_none()
 
+    async def list_for_professional_with_children(
+        self,
+        professional_id: UUID,
+    ) -> list[ProfessionalQualification]:
+        """
+        Get all qualifications of a professional with specialties and educations.
+
+        Args:
+            professional_id: The organization professional UUID.
+
+        Returns:
+            Qualifications with specialties and educations loaded.
+        """
+        result = await self.session.execute(
+            self._base_query_for_professional(professional_id).options(
+                selectinload(ProfessionalQualification.specialties),
+                selectinload(ProfessionalQualification.educations),
+            )
+        )
+        return list(result.scalars().all())
+
     async def get_by_professional_type(
         self,
         professional_id: UUID,
@@ -228,6 +249,44 @@ class ProfessionalQualificationRepository(
         result = await self.session.execute(select(query.exists()))
         return result.scalar_one()
 
+    async def find_councils_in_family(
+        self,
+        councils: set[tuple[str, str]],
+        family_org_ids: list[UUID] | tuple[UUID, ...],
+    ) -> set[tuple[str, str]]:
+        """
+        Find which council registrations already exist in the organization family.
+
+        Set-based version of council_exists_in_family: one query for any
+        number of registrations.
+
+        Args:
+            councils: (council_number, council_state) pairs to check.
+            family_org_ids: List of all organization IDs in the family.
+
+        Returns:
+            The pairs that already exist in the family.
+        """
+        if not councils:
+            return set()
+
+        query = (
+            select(
+                ProfessionalQualification.council_number,
+                ProfessionalQualification.council_state,
+            )
+            .where(
+                ProfessionalQualification.organization_id.in_(list(family_org_ids)),
+                tuple_(
+                    ProfessionalQualification.council_number,
+                    ProfessionalQualification.council_state,
+                ).in_(list(councils)),
+            )
+            .distinct()
+        )
+        result = await self.session.execute(query)
+        return {(number, state) for number, state in result.all()}
+
     async def get_by_council(
         self,
         council_number: str,
@@ -45,6 +45,12 @@ from src.modules.professionals.presentation.dependencies.professional_education
     UpdateProfessionalEducationUC,
 )
 
+# ProfessionalImport use case dependencies
+from src.modules.professionals.presentation.dependencies.professional_import import (
+    GetProfessionalImportJobUC,
+    RequestProfessionalImportUC,
+)
+
 # ProfessionalQualification use case dependencies
 from src.modules.professionals.presentation.dependencies.professional_qualification import (
     CreateProfessionalQualificationUC,
@@ -104,6 +110,9 @@ __all__ = [
     "DeleteProfessionalEducationUC",
     "GetProfessionalEducationUC",
     "ListProfessionalEducationsUC",
+    # ProfessionalImport
+    "RequestProfessionalImportUC",
+    "GetProfessionalImportJobUC",
     # ProfessionalQualification
     "CreateProfessionalQualificationUC",
     "UpdateProfessionalQualificationUC",
@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from src.app.dependencies import SessionDep
+from src.app.dependencies import ReadSessionDep, SessionDep
 from src.modules.professionals.use_cases import (
     CreateOrganizationProfessionalCompositeUseCase,
     CreateOrganizationProfessionalUseCase,
@@ -39,21 +39,21 @@ def get_delete_organization_professional_use_case(
 
 
 def get_organization_professional_use_case(
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> GetOrganizationProfessionalUseCase:
     """Factory for GetOrganizationProfessionalUseCase."""
     return GetOrganizationProfessionalUseCase(session)
 
 
 def get_list_organization_professionals_use_case(
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> ListOrganizationProfessionalsUseCase:
     """Factory for ListOrganizationProfessionalsUseCase."""
     return ListOrganizationProfessionalsUseCase(session)
 
 
 def get_list_organization_professionals_summary_use_case(
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> ListOrganizationProfessionalsSummaryUseCase:
     """Factory for ListOrganizationProfessionalsSummaryUseCase."""
     return ListOrganizationProfessionalsSummaryUseCase(session)
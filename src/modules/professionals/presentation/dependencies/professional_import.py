@@ -0,0 +1,36 @@
+"""Use case factory dependencies for ProfessionalImportJob."""
+
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.app.dependencies import SessionDep
+from src.modules.professionals.use_cases import (
+    GetProfessionalImportJobUseCase,
+    RequestProfessionalImportUseCase,
+)
+
+
+def get_request_professional_import_use_case(
+    session: SessionDep,
+) -> RequestProfessionalImportUseCase:
+    """Factory for RequestProfessionalImportUseCase."""
+    return RequestProfessionalImportUseCase(session)
+
+
+def get_professional_import_job_use_case(
+    session: SessionDep,
+) -> GetProfessionalImportJobUseCase:
+    """Factory for GetProfessionalImportJobUseCase (primary: polled right after the worker writes)."""
+    return GetProfessionalImportJobUseCase(session)
+
+
+# Type aliases for cleaner route signatures
+RequestProfessionalImportUC = Annotated[
+    RequestProfessionalImportUseCase,
+    Depends(get_request_professional_import_use_case),
+]
+GetProfessionalImportJobUC = Annotated[
+    GetProfessionalImportJobUseCase,
+    Depends(get_professional_import_job_use_case),
+]
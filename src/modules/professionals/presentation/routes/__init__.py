@@ -14,6 +14,9 @@ from src.modules.professionals.presentation.routes.professional_document_routes
 from src.modules.professionals.presentation.routes.professional_education_routes import (
     router as professional_education_router,
 )
+from src.modules.professionals.presentation.routes.professional_import_routes import (
+    router as professional_import_router,
+)
 from src.modules.professionals.presentation.routes.professional_qualification_routes import (
     router as professional_qualification_router,
 )
@@ -27,7 +30,8 @@ from src.modules.professionals.presentation.routes.professional_version_routes i
 # Create main professionals router
 router = APIRouter(prefix="/professionals", tags=["Professionals"])
 
-# Include all sub-routers
+# Include all sub-routers (imports first: /imports must not match /{professional_id})
+router.include_router(professional_import_router)
 router.include_router(organization_professional_router)
 router.include_router(professional_company_router)
 router.include_router(professional_document_router)
@@ -43,6 +47,7 @@ __all__ = [
     "professional_company_router",
     "professional_document_router",
     "professional_education_router",
+    "professional_import_router",
     "professional_qualification_router",
     "professional_specialty_router",
     "professional_version_router",
@@ -2,9 +2,13 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from fastapi_restkit.filterset import filter_as_query
-from src.shared.domain.schemas import PaginatedResponse, PaginationParams
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+)
 from fastapi_restkit.sortingset import sorting_as_query
 
 from src.app.constants.error_codes import ProfessionalErrorCodes
@@ -89,21 +93,25 @@ async def create_professional(
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[OrganizationProfessionalResponse],
+    response_model=CursorPaginatedResponse[OrganizationProfessionalResponse],
     summary="List professionals",
-    description="List all professionals in the organization with pagination, filtering and sorting.",
+    description=(
+        "List all professionals in the organization with pagination, filtering and sorting. "
+        "Use `pagination_mode=cursor` (then `cursor=<next_cursor>`) for keyset pagination; "
+        "`include_total=false` skips the count."
+    ),
 )
 async def list_professionals(
     ctx: OrganizationContext,
     use_case: ListOrganizationProfessionalsUC,
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     filters: OrganizationProfessionalFilter = Depends(
         filter_as_query(OrganizationProfessionalFilter)
     ),
     sorting: OrganizationProfessionalSorting = Depends(
         sorting_as_query(OrganizationProfessionalSorting)
     ),
-) -> PaginatedResponse[OrganizationProfessionalResponse]:
+) -> CursorPaginatedResponse[OrganizationProfessionalResponse]:
     """List all professionals in the organization."""
     result = await use_case.execute(
         organization_id=ctx.organization,
@@ -111,35 +119,41 @@ async def list_professionals(
         filters=filters,
         sorting=sorting,
         family_org_ids=ctx.family_org_ids,
+        count_strategy=CountStrategy.CACHED,
     )
     return result
 
 
 @router.get(
     "/summary",
-    response_model=PaginatedResponse[OrganizationProfessionalListItem],
+    response_model=CursorPaginatedResponse[OrganizationProfessionalListItem],
     summary="List professionals (summary)",
-    description="List professionals with simplified data: basic info, primary qualification, and specialties.",
+    description=(
+        "List professionals with simplified data: basic info, primary qualification, and specialties. "
+        "Supports keyset pagination via `pagination_mode=cursor` / `cursor`."
+    ),
 )
 async def list_professionals_summary(
     ctx: OrganizationContext,
     use_case: ListOrganizationProfessionalsSummaryUC,
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     filters: OrganizationProfessionalFilter = Depends(
         filter_as_query(OrganizationProfessionalFilter)
     ),
     sorting: OrganizationProfessionalSorting = Depends(
         sorting_as_query(OrganizationProfessionalSorting)
     ),
-) -> PaginatedResponse[OrganizationProfessionalListItem]:
-    """List professionals with summary data."""
-    return await use_case.execute(
+) -> Response:
+    """List professionals with summary data (JSON rendered by the use case)."""
+    content = await use_case.execute_json(
         organization_id=ctx.organization,
         pagination=pagination,
         filters=filters,
         sorting=sorting,
         family_org_ids=ctx.family_org_ids,
+        count_strategy=CountStrategy.CACHED,
     )
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -0,0 +1,135 @@
+"""Professional import routes (bulk import from spreadsheets)."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, File, UploadFile, status
+
+from src.app.constants.error_codes import ProfessionalErrorCodes
+from src.modules.professionals.domain.schemas import ProfessionalImportJobResponse
+from src.modules.professionals.presentation.dependencies import (
+    GetProfessionalImportJobUC,
+    OrganizationContext,
+    RequestProfessionalImportUC,
+)
+from src.shared.domain.schemas.common import ErrorResponse
+
+
+router = APIRouter(
+    prefix="/imports",
+    tags=["Professional Imports"],
+)
+
+
+@router.post(
+    "/",
+    response_model=ProfessionalImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Importar profissionais de planilha",
+    description="""
+Importa profissionais em lote a partir de uma planilha CSV ou XLSX
+(multipart/form-data, campo `file`).
+
+**Processamento assíncrono:**
+A planilha é armazenada e importada por um worker, em lotes. A resposta é
+a importação (job); consulte `GET /imports/{job_id}` até o status ser
+`COMPLETED` ou `FAILED`. Linhas inválidas não interrompem a importação:
+são contadas em `error_rows` e detalhadas em `errors` (linha, coluna e
+mensagem).
+
+**Colunas** (cabeçalho na primeira linha, uma linha por profissional):
+- Obrigatórias: `full_name`, `city`, `state_code`, `postal_code`,
+  `professional_type`, `council_type`, `council_number`, `council_state`
+- Opcionais: demais campos de `POST /professionals/composite` (`cpf`,
+  `email`, `phone`, `birth_date`, `gender`, `address`, `graduation_year`...)
+- `specialty_codes`: códigos das especialidades separados por `;` ou `,`
+  (a primeira é a principal)
+- `company_cnpj`: CNPJ de uma empresa já cadastrada, vinculada ao profissional
+
+**Regras:** as mesmas da criação composta (CPF, email e registro no
+conselho únicos na família de organizações), também entre linhas da
+própria planilha. Formações e documentos não são importados.
+""",
+    responses={
+        422: {
+            "model": ErrorResponse,
+            "description": "Arquivo inválido",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "unsupported_file": {
+                            "summary": "Formato não suportado",
+                            "value": {
+                                "code": ProfessionalErrorCodes.INVALID_IMPORT_FILE,
+                                "message": "Formato de arquivo não suportado. Envie uma planilha CSV ou XLSX",
+                            },
+                        },
+                        "file_too_large": {
+                            "summary": "Arquivo muito grande",
+                            "value": {
+                                "code": ProfessionalErrorCodes.INVALID_IMPORT_FILE,
+                                "message": "Arquivo muito grande. Tamanho máximo: 20 MB",
+                            },
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def import_professionals(
+    ctx: OrganizationContext,
+    use_case: RequestProfessionalImportUC,
+    file: Annotated[UploadFile, File(description="Planilha de profissionais (CSV ou XLSX)")],
+) -> ProfessionalImportJobResponse:
+    """Queue the import of a spreadsheet of professionals."""
+    job = await use_case.execute(
+        organization_id=ctx.organization,
+        file=file,
+        created_by=ctx.user,
+    )
+    return ProfessionalImportJobResponse.from_job(job)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ProfessionalImportJobResponse,
+    summary="Consultar importação de profissionais",
+    description="""
+Retorna o status de uma importação (PENDING, RUNNING, COMPLETED ou FAILED),
+o progresso (`processed_rows`, `imported_rows`, `error_rows`) e os erros
+por linha.
+
+`total_rows` é preenchido quando a planilha foi lida por completo.
+""",
+    responses={
+        404: {
+            "model": ErrorResponse,
+            "description": "Não encontrado",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "not_found": {
+                            "summary": "Importação não encontrada",
+                            "value": {
+                                "code": ProfessionalErrorCodes.IMPORT_JOB_NOT_FOUND,
+                                "message": "Importação de profissionais não encontrada",
+                            },
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def get_professional_import_job(
+    job_id: UUID,
+    ctx: OrganizationContext,
+    use_case: GetProfessionalImportJobUC,
+) -> ProfessionalImportJobResponse:
+    """Get the status and progress of a professional import."""
+    job = await use_case.execute(
+        organization_id=ctx.organization,
+        job_id=job_id,
+    )
+    return ProfessionalImportJobResponse.from_job(job)
@@ -41,6 +41,13 @@ from src.modules.professionals.use_cases.professional_education import (
     UpdateProfessionalEducationUseCase,
 )
 
+# ProfessionalImport use cases
+from src.modules.professionals.use_cases.professional_import import (
+    GetProfessionalImportJobUseCase,
+    ProcessProfessionalImportJobUseCase,
+    RequestProfessionalImportUseCase,
+)
+
 # ProfessionalQualification use cases
 from src.modules.professionals.use_cases.professional_qualification import (
     CreateProfessionalQualificationUseCase,
@@ -126,6 +133,10 @@ __all__ = [
     "DeleteProfessionalCompanyUseCase",
     "GetProfessionalCompanyUseCase",
     "ListProfessionalCompaniesUseCase",
+    # ProfessionalImport
+    "RequestProfessionalImportUseCase",
+    "GetProfessionalImportJobUseCase",
+    "ProcessProfessionalImportJobUseCase",
     # ProfessionalVersion
     "CreateProfessionalVersionUseCase",
     "ApplyProfessionalVersionUseCase",
@@ -22,9 +22,7 @@ from src.modules.professionals.domain.schemas.organization_professional_composit
 )
 from src.modules.professionals.infrastructure.repositories import (
     OrganizationProfessionalRepository,
-    ProfessionalEducationRepository,
     ProfessionalQualificationRepository,
-    ProfessionalSpecialtyRepository,
     SpecialtyRepository,
 )
 
@@ -45,14 +43,16 @@ class CreateOrganizationProfessionalCompositeUseCase:
     - Council registration uniqueness within the organization family
     - All specialty_ids exist in global specialties table
     - No duplicate specialty_ids in the request
+
+    Validation takes a fixed number of queries (CPF/email, council,
+    specialties) and all rows are inserted with a single flush on commit,
+    whatever the number of specialties and educations.
     """
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
         self.professional_repository = OrganizationProfessionalRepository(session)
         self.qualification_repository = ProfessionalQualificationRepository(session)
-        self.specialty_repository = ProfessionalSpecialtyRepository(session)
-        self.education_repository = ProfessionalEducationRepository(session)
         self.global_specialty_repository = SpecialtyRepository(session)
 
     async def execute(
@@ -90,23 +90,21 @@ class CreateOrganizationProfessionalCompositeUseCase:
         # 3. Validate specialties exist and no duplicates
         await self._validate_specialties(data)
 
-        # 4. Create professional
-        professional = await self._create_professional(
-            organization_id, data, created_by
-        )
+        # 4. Create professional (IDs are generated client-side, no flush needed)
+        professional = self._create_professional(organization_id, data, created_by)
 
         # 5. Create qualification
-        qualification = await self._create_qualification(
+        qualification = self._create_qualification(
             organization_id, professional.id, data
         )
 
         # 6. Create specialties
-        await self._create_specialties(qualification.id, data)
+        self._create_specialties(qualification.id, data)
 
         # 7. Create educations
-        await self._create_educations(qualification.id, organization_id, data)
+        self._create_educations(qualification.id, organization_id, data)
 
-        # 8. Commit and return with relations
+        # 8. Commit (single flush of all pending rows) and return with relations
         await self.session.commit()
 
         # Reload with relations
@@ -122,19 +120,15 @@ class CreateOrganizationProfessionalCompositeUseCase:
         data: OrganizationProfessionalCompositeCreate,
     ) -> None:
         """Validate CPF and email uniqueness within organization family."""
-        if data.cpf:
-            if await self.professional_repository.exists_by_cpf_in_family(
-                cpf=data.cpf,
-                family_org_ids=family_org_ids,
-            ):
-                raise ProfessionalCpfExistsError()
-
-        if data.email:
-            if await self.professional_repository.exists_by_email_in_family(
-                email=data.email,
-                family_org_ids=family_org_ids,
-            ):
-                raise ProfessionalEmailExistsError()
+        conflicts = await self.professional_repository.find_identity_conflicts_in_family(
+            family_org_ids,
+            cpf=data.cpf,
+            email=data.email,
+        )
+        if "cpf" in conflicts:
+            raise ProfessionalCpfExistsError()
+        if "email" in conflicts:
+            raise ProfessionalEmailExistsError()
 
     async def _validate_qualification_uniqueness(
         self,
@@ -162,13 +156,21 @@ class CreateOrganizationProfessionalCompositeUseCase:
         if len(specialty_ids) != len(set(specialty_ids)):
             raise DuplicateSpecialtyIdsError()
 
-        # Validate each specialty exists
+        if not specialty_ids:
+            return
+
+        # Validate all specialties exist (one query)
+        found_ids = {
+            specialty.id
+            for specialty in await self.global_specialty_repository.get_by_ids(
+                specialty_ids
+            )
+        }
         for specialty_id in specialty_ids:
-            specialty = await self.global_specialty_repository.get_by_id(specialty_id)
-            if specialty is None:
+            if specialty_id not in found_ids:
                 raise GlobalSpecialtyNotFoundError(specialty_id=str(specialty_id))
 
-    async def _create_professional(
+    def _create_professional(
         self,
         organization_id: UUID,
         data: OrganizationProfessionalCompositeCreate,
@@ -185,11 +187,9 @@ class CreateOrganizationProfessionalCompositeUseCase:
         )
 
         self.session.add(professional)
-        await self.session.flush()  # Get the ID without committing
-
         return professional
 
-    async def _create_qualification(
+    def _create_qualification(
         self,
         organization_id: UUID,
         professional_id: UUID,
@@ -207,11 +207,9 @@ class CreateOrganizationProfessionalCompositeUseCase:
         )
 
         self.session.add(qualification)
-        await self.session.flush()  # Get the ID without committing
-
         return qualification
 
-    async def _create_specialties(
+    def _create_specialties(
         self,
         qualification_id: UUID,
         data: OrganizationProfessionalCompositeCreate,
@@ -227,12 +225,9 @@ class CreateOrganizationProfessionalCompositeUseCase:
             self.session.add(specialty)
             specialties.append(specialty)
 
-        if specialties:
-            await self.session.flush()
-
         return specialties
 
-    async def _create_educations(
+    def _create_educations(
         self,
         qualification_id: UUID,
         organization_id: UUID,
@@ -250,7 +245,4 @@ class CreateOrganizationProfessionalCompositeUseCase:
             self.session.add(education)
             educations.append(education)
 
-        if educations:
-            await self.session.flush()
-
         return educations
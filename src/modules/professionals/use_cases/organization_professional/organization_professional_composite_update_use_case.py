@@ -3,7 +3,6 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi_restkit.filters import UUIDListFilter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.exceptions import (
@@ -35,10 +34,6 @@ from src.modules.professionals.domain.schemas.organization_professional_composit
     QualificationNestedUpdate,
     SpecialtyNestedUpdate,
 )
-from src.modules.professionals.infrastructure.filters import (
-    ProfessionalEducationFilter,
-    ProfessionalSpecialtyFilter,
-)
 from src.modules.professionals.infrastructure.repositories import (
     OrganizationProfessionalRepository,
     ProfessionalEducationRepository,
@@ -58,8 +53,14 @@ class UpdateOrganizationProfessionalCompositeUseCase:
     - Specialties/Educations:
       - With ID: update existing entity with PATCH semantics
       - Without ID: create new entity
-      - IDs not in list: soft delete
+      - IDs not in list: delete
       - None list: no changes to that entity type
+
+    Validation takes a fixed number of queries whatever the payload size:
+    CPF/email together, council registration, and all new specialty_ids
+    in one lookup; existing specialties and educations are loaded with the
+    qualification. Removed rows are deleted with one statement per table
+    and everything else is written by the commit flush.
     """
 
     def __init__(self, session: AsyncSession) -> None:
@@ -116,14 +117,19 @@ class UpdateOrganizationProfessionalCompositeUseCase:
         await self._update_professional(professional, data, updated_by)
 
         # 4. Handle qualification updates (if provided)
+        qualification = None
         if data.qualification is not None:
-            await self._handle_qualification_update(
+            qualification = await self._handle_qualification_update(
                 organization_id, professional_id, data.qualification, family_org_ids
             )
 
-        # 5. Commit and return with relations
+        # 5. Commit (single flush of all pending changes) and return with relations
         await self.session.commit()
 
+        if qualification is not None:
+            # Reload the nested collections changed by this update
+            self.session.expire(qualification, ["specialties", "educations"])
+
         return await self.professional_repository.get_by_id_with_relations(
             id=professional_id,
             organization_id=organization_id,
@@ -137,21 +143,16 @@ class UpdateOrganizationProfessionalCompositeUseCase:
         data: OrganizationProfessionalCompositeUpdate,
     ) -> None:
         """Validate CPF and email uniqueness within family (excluding current professional)."""
-        if data.cpf:
-            if await self.professional_repository.exists_by_cpf_in_family(
-                cpf=data.cpf,
-                family_org_ids=family_org_ids,
-                exclude_id=professional_id,
-            ):
-                raise ProfessionalCpfExistsError()
-
-        if data.email:
-            if await self.professional_repository.exists_by_email_in_family(
-                email=data.email,
-                family_org_ids=family_org_ids,
-                exclude_id=professional_id,
-            ):
-                raise ProfessionalEmailExistsError()
+        conflicts = await self.professional_repository.find_identity_conflicts_in_family(
+            family_org_ids,
+            cpf=data.cpf,
+            email=data.email,
+            exclude_id=professional_id,
+        )
+        if "cpf" in conflicts:
+            raise ProfessionalCpfExistsError()
+        if "email" in conflicts:
+            raise ProfessionalEmailExistsError()
 
     async def _update_professional(
         self,
@@ -171,16 +172,20 @@ class UpdateOrganizationProfessionalCompositeUseCase:
         professional.updated_by = updated_by
         professional.updated_at = datetime.now(timezone.utc)
 
-        await self.session.flush()
-
     async def _handle_qualification_update(
         self,
         organization_id: UUID,
         professional_id: UUID,
         qualification_data: QualificationNestedUpdate,
         family_org_ids: list[UUID] | tuple[UUID, ...],
-    ) -> None:
-        """Handle qualification update with nested specialties and educations."""
+    ) -> ProfessionalQualification:
+        """
+        Handle qualification update with nested specialties and educations.
+
+        Existing specialties and educations come with the qualification and
+        new specialty_ids are validated in one query, so the number of
+        statements does not depend on the payload size.
+        """
         qualification_id = qualification_data.id
 
         if qualification_id is None:
@@ -207,16 +212,36 @@ class UpdateOrganizationProfessionalCompositeUseCase:
 
         # Handle specialties (if provided - None means no changes)
         if qualification_data.specialties is not None:
-            await self._handle_specialties_update(
-                qualification_id, qualification_data.specialties
+            global_specialty_ids = await self._get_global_specialty_ids(
+                self._new_specialty_ids(qualification_data.specialties)
+            )
+            await self.specialty_repository.delete_many(
+                self._handle_specialties_update(
+                    qualification,
+                    qualification_data.specialties,
+                    global_specialty_ids,
+                )
             )
 
         # Handle educations (if provided - None means no changes)
         if qualification_data.educations is not None:
-            await self._handle_educations_update(
-                qualification_id, organization_id, qualification_data.educations
+            await self.education_repository.delete_many(
+                self._handle_educations_update(
+                    qualification, organization_id, qualification_data.educations
+                )
             )
 
+        return qualification
+
+    async def _get_global_specialty_ids(self, specialty_ids: list[UUID]) -> set[UUID]:
+        """Resolve which of the given global specialty IDs exist (one query)."""
+        if not specialty_ids:
+            return set()
+        specialties = await self.global_specialty_repository.get_by_ids(
+            list(set(specialty_ids))
+        )
+        return {specialty.id for specialty in specialties}
+
     async def _validate_council_uniqueness(
         self,
         family_org_ids: list[UUID] | tuple[UUID, ...],
@@ -229,14 +254,14 @@ class UpdateOrganizationProfessionalCompositeUseCase:
         council_state = data.council_state or current.council_state
 
         # Only validate if council info is being changed
-        if data.council_number is not None or data.council_state is not None:
-            if await self.qualification_repository.council_exists_in_family(
-                council_number=council_number,
-                council_state=council_state,
-                family_org_ids=family_org_ids,
-                exclude_id=qualification_id,
-            ):
-                raise CouncilRegistrationExistsError()
+        changed = data.council_number is not None or data.council_state is not None
+        if changed and await self.qualification_repository.council_exists_in_family(
+            council_number=council_number,
+            council_state=council_state,
+            family_org_ids=family_org_ids,
+            exclude_id=qualification_id,
+        ):
+            raise CouncilRegistrationExistsError()
 
     async def _update_qualification(
         self,
@@ -261,13 +286,12 @@ class UpdateOrganizationProfessionalCompositeUseCase:
 
         qualification.updated_at = datetime.now(timezone.utc)
 
-        await self.session.flush()
-
-    async def _handle_specialties_update(
+    def _handle_specialties_update(
         self,
-        qualification_id: UUID,
+        qualification: ProfessionalQualification,
         specialties_data: list[SpecialtyNestedUpdate],
-    ) -> None:
+        global_specialty_ids: set[UUID],
+    ) -> set[UUID]:
         """
         Handle specialties partial update.
 
@@ -275,18 +299,26 @@ class UpdateOrganizationProfessionalCompositeUseCase:
         - With ID + other fields: update existing
         - With ID only (no other fields): keep unchanged
         - Without ID: create new
-        - Existing IDs not in list: soft delete
+        - Existing IDs not in list: delete
+
+        Works on the specialties loaded with the qualification; creates and
+        updates are written by the final flush.
+
+        Returns:
+            IDs of the specialties to delete.
         """
-        # Get existing specialties
-        existing_specialties = await self._get_existing_specialties(qualification_id)
-        existing_ids = {s.id for s in existing_specialties}
+        existing_by_id = {s.id: s for s in qualification.specialties}
+        assigned_specialty_ids = {s.specialty_id for s in qualification.specialties}
 
         # Track IDs in the update request
         provided_ids: set[UUID] = set()
-        specialty_ids_to_create: list[UUID] = []
+        specialties_to_create: list[SpecialtyNestedUpdate] = []
 
         for specialty_data in specialties_data:
             if specialty_data.id is not None:
+                specialty = existing_by_id.get(specialty_data.id)
+                if specialty is None:
+                    raise SpecialtyNotFoundError()
                 provided_ids.add(specialty_data.id)
 
                 # Check if this is just an ID reference (keep unchanged) or an update
@@ -294,75 +326,54 @@ class UpdateOrganizationProfessionalCompositeUseCase:
                     exclude_unset=True, exclude={"id"}
                 )
                 if update_fields:
-                    # Update existing specialty
-                    await self._update_specialty(
-                        qualification_id, specialty_data.id, specialty_data
-                    )
+                    self._update_specialty(specialty, specialty_data)
             else:
-                # Create new specialty
                 if specialty_data.specialty_id is None:
                     raise SpecialtyNotFoundError()
-                specialty_ids_to_create.append(specialty_data.specialty_id)
-
-        # Validate no duplicate specialty_ids in creates
-        all_specialty_ids = specialty_ids_to_create.copy()
-        for s in existing_specialties:
-            if s.id in provided_ids:
-                all_specialty_ids.append(s.specialty_id)
+                specialties_to_create.append(specialty_data)
 
+        # Validate no duplicate specialty_ids between creates and kept specialties
+        all_specialty_ids = [s.specialty_id for s in specialties_to_create]
+        all_specialty_ids += [
+            existing_by_id[ps_id].specialty_id for ps_id in provided_ids
+        ]
         if len(all_specialty_ids) != len(set(all_specialty_ids)):
             raise DuplicateSpecialtyIdsError()
 
-        # Validate new specialty_ids exist
-        for specialty_id in specialty_ids_to_create:
-            specialty = await self.global_specialty_repository.get_by_id(specialty_id)
-            if specialty is None:
-                raise GlobalSpecialtyNotFoundError(specialty_id=str(specialty_id))
-
-        # Check for specialty_id conflicts with existing
-        for specialty_id in specialty_ids_to_create:
-            if await self.specialty_repository.specialty_exists_for_qualification(
-                qualification_id, specialty_id
-            ):
+        for specialty_data in specialties_to_create:
+            # Validate new specialty_ids exist (resolved in bulk by the caller)
+            if specialty_data.specialty_id not in global_specialty_ids:
+                raise GlobalSpecialtyNotFoundError(
+                    specialty_id=str(specialty_data.specialty_id)
+                )
+            # Check for specialty_id conflicts with existing
+            if specialty_data.specialty_id in assigned_specialty_ids:
                 raise SpecialtyAlreadyAssignedError()
 
         # Create new specialties
-        for specialty_data in specialties_data:
-            if specialty_data.id is None:
-                await self._create_specialty(qualification_id, specialty_data)
-
-        # Soft delete specialties not in the list
-        ids_to_delete = existing_ids - provided_ids
-        for specialty_id in ids_to_delete:
-            await self._soft_delete_specialty(specialty_id)
-
-    async def _get_existing_specialties(
-        self, qualification_id: UUID
-    ) -> list[ProfessionalSpecialty]:
-        """Get all existing specialties for a qualification."""
-        filters = ProfessionalSpecialtyFilter(
-            qualification_id=UUIDListFilter(values=[qualification_id])
-        )
-        result = await self.specialty_repository.list(
-            filters=filters,
-            limit=100,
-            offset=0,
-        )
-        return result.items
-
-    async def _update_specialty(
+        for specialty_data in specialties_to_create:
+            self._create_specialty(qualification.id, specialty_data)
+
+        # Delete specialties not in the list
+        return set(existing_by_id) - provided_ids
+
+    @staticmethod
+    def _new_specialty_ids(
+        specialties_data: list[SpecialtyNestedUpdate] | None,
+    ) -> list[UUID]:
+        """Global specialty IDs referenced by specialties to create."""
+        return [
+            s.specialty_id
+            for s in specialties_data or []
+            if s.id is None and s.specialty_id is not None
+        ]
+
+    def _update_specialty(
         self,
-        qualification_id: UUID,
-        specialty_id: UUID,
+        specialty: ProfessionalSpecialty,
         data: SpecialtyNestedUpdate,
     ) -> None:
         """Update an existing specialty."""
-        specialty = await self.specialty_repository.get_by_id_for_qualification(
-            specialty_id, qualification_id
-        )
-        if specialty is None:
-            raise SpecialtyNotFoundError()
-
         update_data = data.model_dump(
             exclude_unset=True, exclude={"id", "specialty_id"}
         )
@@ -371,9 +382,8 @@ class UpdateOrganizationProfessionalCompositeUseCase:
             setattr(specialty, field, value)
 
         specialty.updated_at = datetime.now(timezone.utc)
-        await self.session.flush()
 
-    async def _create_specialty(
+    def _create_specialty(
         self,
         qualification_id: UUID,
         data: SpecialtyNestedUpdate,
@@ -387,19 +397,14 @@ class UpdateOrganizationProfessionalCompositeUseCase:
         )
 
         self.session.add(specialty)
-        await self.session.flush()
         return specialty
 
-    async def _soft_delete_specialty(self, specialty_id: UUID) -> None:
-        """Delete a specialty."""
-        await self.specialty_repository.delete(specialty_id)
-
-    async def _handle_educations_update(
+    def _handle_educations_update(
         self,
-        qualification_id: UUID,
+        qualification: ProfessionalQualification,
         organization_id: UUID,
         educations_data: list[EducationNestedUpdate],
-    ) -> None:
+    ) -> set[UUID]:
         """
         Handle educations partial update.
 
@@ -407,17 +412,21 @@ class UpdateOrganizationProfessionalCompositeUseCase:
         - With ID + other fields: update existing
         - With ID only (no other fields): keep unchanged
         - Without ID: create new
-        - Existing IDs not in list: soft delete
+        - Existing IDs not in list: delete
+
+        Returns:
+            IDs of the educations to delete.
         """
-        # Get existing educations
-        existing_educations = await self._get_existing_educations(qualification_id)
-        existing_ids = {e.id for e in existing_educations}
+        existing_by_id = {e.id: e for e in qualification.educations}
 
         # Track IDs in the update request
         provided_ids: set[UUID] = set()
 
         for education_data in educations_data:
             if education_data.id is not None:
+                education = existing_by_id.get(education_data.id)
+                if education is None:
+                    raise EducationNotFoundError()
                 provided_ids.add(education_data.id)
 
                 # Check if this is just an ID reference (keep unchanged) or an update
@@ -425,10 +434,7 @@ class UpdateOrganizationProfessionalCompositeUseCase:
                     exclude_unset=True, exclude={"id"}
                 )
                 if update_fields:
-                    # Update existing education
-                    await self._update_education(
-                        qualification_id, education_data.id, education_data
-                    )
+                    self._update_education(education, education_data)
             else:
                 # Create new education (validate required fields)
                 if education_data.level is None:
@@ -438,51 +444,27 @@ class UpdateOrganizationProfessionalCompositeUseCase:
                 if education_data.institution is None:
                     raise InstitutionRequiredError()
 
-                await self._create_education(
-                    qualification_id, organization_id, education_data
+                self._create_education(
+                    qualification.id, organization_id, education_data
                 )
 
-        # Soft delete educations not in the list
-        ids_to_delete = existing_ids - provided_ids
-        for education_id in ids_to_delete:
-            await self._soft_delete_education(education_id)
-
-    async def _get_existing_educations(
-        self, qualification_id: UUID
-    ) -> list[ProfessionalEducation]:
-        """Get all existing educations for a qualification."""
-        filters = ProfessionalEducationFilter(
-            qualification_id=UUIDListFilter(values=[qualification_id])
-        )
-        result = await self.education_repository.list(
-            filters=filters,
-            limit=100,
-            offset=0,
-        )
-        return result.items
+        # Delete educations not in the list
+        return set(existing_by_id) - provided_ids
 
-    async def _update_education(
+    def _update_education(
         self,
-        qualification_id: UUID,
-        education_id: UUID,
+        education: ProfessionalEducation,
         data: EducationNestedUpdate,
     ) -> None:
         """Update an existing education."""
-        education = await self.education_repository.get_by_id_for_qualification(
-            education_id, qualification_id
-        )
-        if education is None:
-            raise EducationNotFoundError()
-
         update_data = data.model_dump(exclude_unset=True, exclude={"id"})
 
         for field, value in update_data.items():
             setattr(education, field, value)
 
         education.updated_at = datetime.now(timezone.utc)
-        await self.session.flush()
 
-    async def _create_education(
+    def _create_education(
         self,
         qualification_id: UUID,
         organization_id: UUID,
@@ -502,9 +484,4 @@ class UpdateOrganizationProfessionalCompositeUseCase:
         )
 
         self.session.add(education)
-        await self.session.flush()
         return education
-
-    async def _soft_delete_education(self, education_id: UUID) -> None:
-        """Delete an education."""
-        await self.education_repository.delete(education_id)
@@ -2,7 +2,11 @@
 
 from uuid import UUID
 
-from src.shared.domain.schemas import PaginatedResponse, PaginationParams
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.professionals.domain.models import OrganizationProfessional
@@ -28,6 +32,9 @@ class ListOrganizationProfessionalsSummaryUseCase:
     - Basic professional info (id, name, avatar, contact, location)
     - Primary qualification summary (type, council info)
     - List of specialties (id, name only)
+
+    `execute_json` renders the same response straight to JSON bytes, with
+    the items built by PostgreSQL, for the list endpoint.
     """
 
     def __init__(self, session: AsyncSession) -> None:
@@ -88,21 +95,23 @@ class ListOrganizationProfessionalsSummaryUseCase:
     async def execute(
         self,
         organization_id: UUID,
-        pagination: PaginationParams,
+        pagination: CursorPaginationParams,
         family_org_ids: list[UUID] | tuple[UUID, ...],
         *,
         filters: OrganizationProfessionalFilter | None = None,
         sorting: OrganizationProfessionalSorting | None = None,
-    ) -> PaginatedResponse[OrganizationProfessionalListItem]:
+        count_strategy: CountStrategy | None = None,
+    ) -> CursorPaginatedResponse[OrganizationProfessionalListItem]:
         """
         List professionals with summary data for an organization family.
 
         Args:
             organization_id: The organization UUID.
-            pagination: Pagination parameters.
+            pagination: Pagination parameters (offset or cursor mode).
             family_org_ids: List of all organization IDs in the family.
             filters: Optional filters (search, gender, marital_status, professional_type).
             sorting: Optional sorting (id, full_name, email, created_at).
+            count_strategy: How to compute the total (EXACT if None).
 
         Returns:
             Paginated list of professional summaries from the entire family.
@@ -113,17 +122,57 @@ class ListOrganizationProfessionalsSummaryUseCase:
             family_org_ids=family_org_ids,
             filters=filters,
             sorting=sorting,
+            count_strategy=count_strategy,
         )
 
         # Transform items to list item schema
         items = [self._build_list_item(p) for p in result.items]
 
-        return PaginatedResponse(
+        return CursorPaginatedResponse[OrganizationProfessionalListItem](
             items=items,
-            total=result.total,
-            page=result.page,
-            page_size=result.page_size,
-            total_pages=result.total_pages,
-            has_next=result.has_next,
-            has_previous=result.has_previous,
+            **result.model_dump(exclude={"items"}),
         )
+
+    async def execute_json(
+        self,
+        organization_id: UUID,
+        pagination: CursorPaginationParams,
+        family_org_ids: list[UUID] | tuple[UUID, ...],
+        *,
+        filters: OrganizationProfessionalFilter | None = None,
+        sorting: OrganizationProfessionalSorting | None = None,
+        count_strategy: CountStrategy | None = None,
+    ) -> bytes:
+        """
+        List professionals with summary data, rendered as JSON bytes.
+
+        Produces the same JSON as serializing execute()'s response, but
+        each item arrives from the database as JSON text (see
+        OrganizationProfessionalRepository.list_for_organization_summary_json)
+        and is copied into the body as is. Only the pagination metadata
+        goes through Pydantic.
+
+        Args:
+            organization_id: The organization UUID.
+            pagination: Pagination parameters (offset or cursor mode).
+            family_org_ids: List of all organization IDs in the family.
+            filters: Optional filters (search, gender, marital_status, professional_type).
+            sorting: Optional sorting (id, full_name, email, created_at).
+            count_strategy: How to compute the total (EXACT if None).
+
+        Returns:
+            JSON body of a paginated list of professional summaries.
+        """
+        result = await self.repository.list_for_organization_summary_json(
+            organization_id=organization_id,
+            pagination=pagination,
+            family_org_ids=family_org_ids,
+            filters=filters,
+            sorting=sorting,
+            count_strategy=count_strategy,
+        )
+
+        items = ",".join(row.item for row in result.items)
+        # '{"total":...}' -> '{"items":[...],"total":...}'
+        metadata = result.model_dump_json(exclude={"items"})
+        return f'{{"items":[{items}],{metadata[1:]}'.encode()
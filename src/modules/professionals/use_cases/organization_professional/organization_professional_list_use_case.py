@@ -2,7 +2,12 @@
 
 from uuid import UUID
 
-from src.shared.domain.schemas import PaginatedResponse, PaginationParams
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+    PaginatedResponse,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.professionals.domain.models import OrganizationProfessional
@@ -27,21 +32,25 @@ class ListOrganizationProfessionalsUseCase:
     async def execute(
         self,
         organization_id: UUID,
-        pagination: PaginationParams,
+        pagination: CursorPaginationParams,
         family_org_ids: list[UUID] | tuple[UUID, ...],
         *,
         filters: OrganizationProfessionalFilter | None = None,
         sorting: OrganizationProfessionalSorting | None = None,
-    ) -> PaginatedResponse[OrganizationProfessional]:
+        count_strategy: CountStrategy | None = None,
+    ) -> PaginatedResponse[OrganizationProfessional] | CursorPaginatedResponse[
+        OrganizationProfessional
+    ]:
         """
         List professionals for an organization family.
 
         Args:
             organization_id: The organization UUID.
-            pagination: Pagination parameters.
+            pagination: Pagination parameters (offset or cursor mode).
             family_org_ids: List of all organization IDs in the family.
             filters: Optional filters (search, gender, marital_status, professional_type).
             sorting: Optional sorting (id, full_name, email, created_at).
+            count_strategy: How to compute the total (EXACT if None).
 
         Returns:
             Paginated list of professionals from the entire family.
@@ -52,4 +61,5 @@ class ListOrganizationProfessionalsUseCase:
             family_org_ids=family_org_ids,
             filters=filters,
             sorting=sorting,
+            count_strategy=count_strategy,
         )
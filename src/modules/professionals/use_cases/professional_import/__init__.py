@@ -0,0 +1,17 @@
+"""Use cases for ProfessionalImportJob."""
+
+from src.modules.professionals.use_cases.professional_import.professional_import_get_use_case import (
+    GetProfessionalImportJobUseCase,
+)
+from src.modules.professionals.use_cases.professional_import.professional_import_process_use_case import (
+    ProcessProfessionalImportJobUseCase,
+)
+from src.modules.professionals.use_cases.professional_import.professional_import_request_use_case import (
+    RequestProfessionalImportUseCase,
+)
+
+__all__ = [
+    "GetProfessionalImportJobUseCase",
+    "ProcessProfessionalImportJobUseCase",
+    "RequestProfessionalImportUseCase",
+]
@@ -0,0 +1,47 @@
+"""Use case for getting a professional import job."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.exceptions import ProfessionalImportJobNotFoundError
+from src.modules.professionals.domain.models import ProfessionalImportJob
+from src.modules.professionals.infrastructure.repositories import (
+    ProfessionalImportJobRepository,
+)
+
+
+class GetProfessionalImportJobUseCase:
+    """Get the status and progress of an import job (for polling)."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.job_repository = ProfessionalImportJobRepository(session)
+
+    async def execute(
+        self,
+        organization_id: UUID,
+        job_id: UUID,
+    ) -> ProfessionalImportJob:
+        """
+        Get an import job of the organization.
+
+        Args:
+            organization_id: The organization UUID.
+            job_id: The import job UUID.
+
+        Returns:
+            The import job.
+
+        Raises:
+            ProfessionalImportJobNotFoundError: If job not found in the organization.
+        """
+        job = await self.job_repository.get_by_id_for_organization(
+            job_id=job_id,
+            organization_id=organization_id,
+        )
+
+        if not job:
+            raise ProfessionalImportJobNotFoundError()
+
+        return job
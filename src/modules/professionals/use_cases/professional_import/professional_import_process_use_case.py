@@ -0,0 +1,476 @@
+"""
+Process professional import job use case.
+
+Runs in the worker: claims an import job, streams its spreadsheet from
+storage and imports the rows in chunks. Each chunk takes a fixed number
+of queries, whatever its size:
+- one query for taken CPFs/emails and one for taken council registrations
+- one for unknown specialty codes and one for company CNPJs
+- one bulk INSERT per table (professionals, qualifications, specialties,
+  company links) and one UPDATE of the job's progress
+
+The rows and the progress of a chunk are committed together, so a retried
+job skips the rows already processed instead of importing them twice.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO
+from uuid import UUID
+
+from google.api_core.exceptions import GoogleAPIError
+from google.auth.exceptions import TransportError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.config import Settings
+from src.app.dependencies.settings import get_settings
+from src.app.i18n import ProfessionalMessages, get_message
+from src.app.logging import get_logger
+from src.modules.organizations.infrastructure.repositories import OrganizationRepository
+from src.modules.professionals.domain.models import (
+    OrganizationProfessional,
+    ProfessionalCompany,
+    ProfessionalImportFileFormat,
+    ProfessionalImportJob,
+    ProfessionalImportRowError,
+    ProfessionalImportStatus,
+    ProfessionalQualification,
+    ProfessionalSpecialty,
+)
+from src.modules.professionals.domain.services import (
+    ParsedProfessionalRow,
+    missing_columns,
+    parse_professional_row,
+    row_error,
+)
+from src.modules.professionals.infrastructure.repositories import (
+    CompanyRepository,
+    OrganizationProfessionalRepository,
+    ProfessionalCompanyRepository,
+    ProfessionalImportJobRepository,
+    ProfessionalQualificationRepository,
+    ProfessionalSpecialtyRepository,
+    SpecialtyRepository,
+)
+from src.shared.infrastructure.firebase import FirebaseStorageService
+from src.shared.infrastructure.spreadsheets import (
+    SpreadsheetError,
+    chunked,
+    read_csv,
+    read_xlsx,
+)
+
+
+logger = get_logger(__name__)
+
+# Downloaded spreadsheets larger than this are spooled to disk
+_SPOOL_MAX_SIZE = 1024 * 1024
+
+# Failures worth retrying: database, storage API and network errors
+_TRANSIENT_ERRORS = (SQLAlchemyError, GoogleAPIError, TransportError, OSError)
+
+ParsedChunk = list[tuple[int, ParsedProfessionalRow | list[ProfessionalImportRowError]]]
+
+
+class ImportFileRejectedError(Exception):
+    """The spreadsheet cannot be imported at all (not retryable)."""
+
+
+def _parse_chunk(chunks: Iterator[list[tuple[int, dict[str, str]]]]) -> ParsedChunk | None:
+    """Read and validate the next chunk of rows (blocking, runs in a thread)."""
+    try:
+        rows = next(chunks)
+    except StopIteration:
+        return None
+    except SpreadsheetError as e:
+        raise ImportFileRejectedError(
+            get_message(ProfessionalMessages.IMPORT_UNREADABLE_FILE, error=str(e))
+        ) from e
+    return [(line, parse_professional_row(line, values)) for line, values in rows]
+
+
+class ProcessProfessionalImportJobUseCase:
+    """Import the spreadsheet of a queued job."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        settings: Settings | None = None,
+    ) -> None:
+        self.session = session
+        self.settings = settings or get_settings()
+        self.job_repository = ProfessionalImportJobRepository(session)
+        self.organization_repository = OrganizationRepository(session)
+        self.professional_repository = OrganizationProfessionalRepository(session)
+        self.qualification_repository = ProfessionalQualificationRepository(session)
+        self.specialty_repository = ProfessionalSpecialtyRepository(session)
+        self.professional_company_repository = ProfessionalCompanyRepository(session)
+        self.global_specialty_repository = SpecialtyRepository(session)
+        self.company_repository = CompanyRepository(session)
+        self.storage_service = FirebaseStorageService(self.settings)
+        # Specialty code -> ID, shared by all chunks of the job
+        self._specialty_ids: dict[str, UUID] = {}
+
+    async def _fail(self, job_id: UUID, error: str) -> None:
+        """Mark a job as permanently failed."""
+        await self.job_repository.set_status(
+            job_id,
+            ProfessionalImportStatus.FAILED,
+            error=error[:2000],
+            completed_at=datetime.now(timezone.utc),
+        )
+        await self.session.commit()
+
+    async def execute(self, job_id: UUID) -> int | None:
+        """
+        Process an import job.
+
+        The job is claimed atomically, so duplicated or redelivered
+        messages for a job that is already running (and not stale),
+        completed or failed are ignored.
+
+        Args:
+            job_id: The import job ID.
+
+        Returns:
+            Seconds to wait before retrying the job, or None when there is
+            nothing left to do (completed, failed permanently or skipped).
+
+        Raises:
+            Exception: Errors other than database, storage and network
+                failures, after failing the job.
+        """
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            seconds=self.settings.PROFESSIONAL_IMPORT_JOB_TIMEOUT
+        )
+        job = await self.job_repository.claim(job_id, stale_before)
+
+        if job is None:
+            logger.info("professional_import_job_skipped", job_id=str(job_id))
+            return None
+
+        await self.session.commit()
+        attempts = job.attempts
+        log = logger.bind(
+            job_id=str(job_id),
+            organization_id=str(job.organization_id),
+            attempt=attempts,
+            resume_from=job.processed_rows,
+        )
+
+        try:
+            with SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as file:
+                await self.storage_service.download_to_file(job.file_path, file)
+                total_rows = await self._import(job, file)
+        except ImportFileRejectedError as e:
+            await self.session.rollback()
+            await self._fail(job_id, str(e))
+            log.warning("professional_import_job_rejected", error=str(e))
+            return None
+        except _TRANSIENT_ERRORS as e:
+            await self.session.rollback()
+
+            if attempts >= self.settings.PROFESSIONAL_IMPORT_JOB_MAX_ATTEMPTS:
+                await self._fail(job_id, str(e))
+                log.error("professional_import_job_failed", error=str(e))
+                return None
+
+            await self.job_repository.set_status(
+                job_id,
+                ProfessionalImportStatus.PENDING,
+                error=str(e)[:2000],
+            )
+            await self.session.commit()
+
+            delay = self.settings.PROFESSIONAL_IMPORT_JOB_RETRY_BACKOFF * 2 ** (attempts - 1)
+            log.warning("professional_import_job_retry", error=str(e), delay=delay)
+            return delay
+        except Exception as e:
+            # A bug, not worth retrying: fail the job instead of leaving it
+            # RUNNING, and let the worker report the error
+            await self.session.rollback()
+            await self._fail(job_id, str(e) or type(e).__name__)
+            raise
+
+        await self.job_repository.set_status(
+            job_id,
+            ProfessionalImportStatus.COMPLETED,
+            total_rows=total_rows,
+            error=None,
+            completed_at=datetime.now(timezone.utc),
+        )
+        await self.session.commit()
+        log.info("professional_import_job_completed", total_rows=total_rows)
+        return None
+
+    async def _import(self, job: ProfessionalImportJob, file: BinaryIO) -> int:
+        """
+        Import the rows not processed by previous attempts.
+
+        Args:
+            job: The claimed job.
+            file: The downloaded spreadsheet.
+
+        Returns:
+            Number of data rows in the spreadsheet.
+
+        Raises:
+            ImportFileRejectedError: If the file is unreadable or lacks
+                required columns.
+        """
+        reader = read_xlsx if job.file_format == ProfessionalImportFileFormat.XLSX else read_csv
+        try:
+            spreadsheet = await asyncio.to_thread(reader, file)
+        except SpreadsheetError as e:
+            raise ImportFileRejectedError(
+                get_message(ProfessionalMessages.IMPORT_UNREADABLE_FILE, error=str(e))
+            ) from e
+
+        if missing := missing_columns(spreadsheet.columns):
+            raise ImportFileRejectedError(
+                get_message(
+                    ProfessionalMessages.IMPORT_MISSING_COLUMNS,
+                    columns=", ".join(missing),
+                )
+            )
+
+        family_org_ids = await self.organization_repository.get_family_ids(
+            job.organization_id
+        )
+        processed_rows = job.processed_rows
+        stored_errors = len(job.errors)
+        chunks = chunked(
+            islice(spreadsheet.rows, processed_rows, None),
+            self.settings.PROFESSIONAL_IMPORT_CHUNK_SIZE,
+        )
+
+        while (parsed := await asyncio.to_thread(_parse_chunk, chunks)) is not None:
+            imported_rows, errors = await self._import_chunk(job, family_org_ids, parsed)
+            error_rows = len({error["row"] for error in errors})
+            stored = errors[: max(self.settings.PROFESSIONAL_IMPORT_MAX_ROW_ERRORS - stored_errors, 0)]
+
+            await self.job_repository.record_progress(
+                job.id,
+                processed_rows=len(parsed),
+                imported_rows=imported_rows,
+                error_rows=error_rows,
+                errors=stored,
+            )
+            await self.session.commit()
+
+            processed_rows += len(parsed)
+            stored_errors += len(stored)
+            logger.debug(
+                "professional_import_chunk_committed",
+                job_id=str(job.id),
+                processed_rows=processed_rows,
+                imported_rows=imported_rows,
+                error_rows=error_rows,
+            )
+
+        return processed_rows
+
+    async def _import_chunk(
+        self,
+        job: ProfessionalImportJob,
+        family_org_ids: list[UUID],
+        parsed: ParsedChunk,
+    ) -> tuple[int, list[ProfessionalImportRowError]]:
+        """
+        Check a chunk of parsed rows against the database and insert the valid ones.
+
+        Args:
+            job: The job being processed.
+            family_org_ids: Organization IDs of the job's organization family.
+            parsed: Parsed rows (or their validation errors) of the chunk.
+
+        Returns:
+            Tuple of (imported rows, row errors).
+        """
+        errors: list[ProfessionalImportRowError] = []
+        rows: list[ParsedProfessionalRow] = []
+        for _, result in parsed:
+            if isinstance(result, list):
+                errors.extend(result)
+            else:
+                rows.append(result)
+
+        rows = self._drop_duplicates(rows, errors)
+        rows = await self._check_database(family_org_ids, rows, errors)
+
+        professionals: list[OrganizationProfessional] = []
+        qualifications: list[ProfessionalQualification] = []
+        specialties: list[ProfessionalSpecialty] = []
+        companies: list[ProfessionalCompany] = []
+        now = datetime.now(timezone.utc)
+
+        for row in rows:
+            professional = OrganizationProfessional(
+                organization_id=job.organization_id,
+                created_by=job.created_by,
+                **row.data.model_dump(exclude={"qualification"}),
+            )
+            qualification = ProfessionalQualification(
+                organization_id=job.organization_id,
+                organization_professional_id=professional.id,
+                **row.data.qualification.model_dump(exclude={"specialties", "educations"}),
+            )
+            professionals.append(professional)
+            qualifications.append(qualification)
+            # The first specialty listed is the primary one
+            specialties.extend(
+                ProfessionalSpecialty(
+                    qualification_id=qualification.id,
+                    specialty_id=self._specialty_ids[code],
+                    is_primary=index == 0,
+                )
+                for index, code in enumerate(row.specialty_codes)
+            )
+            if row.company_id is not None:
+                companies.append(
+                    ProfessionalCompany(
+                        organization_id=job.organization_id,
+                        organization_professional_id=professional.id,
+                        company_id=row.company_id,
+                        joined_at=now,
+                    )
+                )
+
+        # Parents first: each INSERT is checked against the previous ones' rows
+        await self.professional_repository.insert_many(professionals)
+        await self.qualification_repository.insert_many(qualifications)
+        await self.specialty_repository.insert_many(specialties)
+        await self.professional_company_repository.insert_many(companies)
+
+        errors.sort(key=lambda error: error["row"])
+        return len(professionals), errors
+
+    @staticmethod
+    def _drop_duplicates(
+        rows: list[ParsedProfessionalRow],
+        errors: list[ProfessionalImportRowError],
+    ) -> list[ParsedProfessionalRow]:
+        """
+        Reject rows repeating the CPF, email or council of a previous row of the chunk.
+
+        Repetitions across chunks are caught by the database checks, as the
+        previous chunks are already committed.
+        """
+        first_lines: dict[tuple[str, object], int] = {}
+        unique = []
+        for row in rows:
+            qualification = row.data.qualification
+            keys = [
+                ("cpf", row.data.cpf),
+                ("email", row.data.email),
+                ("council_number", (qualification.council_number, qualification.council_state)),
+            ]
+            duplicates = [
+                (field, first_lines[(field, value)])
+                for field, value in keys
+                if value is not None and (field, value) in first_lines
+            ]
+            if duplicates:
+                errors.extend(
+                    row_error(
+                        row.line,
+                        field,
+                        get_message(ProfessionalMessages.IMPORT_DUPLICATED_IN_FILE, row=line),
+                    )
+                    for field, line in duplicates
+                )
+                continue
+            for field, value in keys:
+                if value is not None:
+                    first_lines[(field, value)] = row.line
+            unique.append(row)
+        return unique
+
+    async def _check_database(
+        self,
+        family_org_ids: list[UUID],
+        rows: list[ParsedProfessionalRow],
+        errors: list[ProfessionalImportRowError],
+    ) -> list[ParsedProfessionalRow]:
+        """
+        Reject rows conflicting with the database, with one query per check.
+
+        Checks the same rules as the composite create: CPF, email and
+        council registration unique in the family, specialties existing.
+        Company CNPJs must belong to existing companies, which are linked
+        to the professional (rows with company_id resolved on return).
+        """
+        cpfs = {row.data.cpf for row in rows if row.data.cpf}
+        emails = {row.data.email for row in rows if row.data.email}
+        councils = {
+            (row.data.qualification.council_number, row.data.qualification.council_state)
+            for row in rows
+        }
+        codes = {code for row in rows for code in row.specialty_codes} - self._specialty_ids.keys()
+        cnpjs = {row.company_cnpj for row in rows if row.company_cnpj}
+
+        taken_cpfs, taken_emails = await self.professional_repository.find_identities_in_family(
+            family_org_ids, cpfs=cpfs, emails=emails
+        )
+        taken_councils = await self.qualification_repository.find_councils_in_family(
+            councils, family_org_ids
+        )
+        for specialty in await self.global_specialty_repository.get_by_codes(codes):
+            self._specialty_ids[specialty.code] = specialty.id
+        company_ids = {
+            company.cnpj: company.id
+            for company in await self.company_repository.get_by_cnpjs(cnpjs)
+        }
+
+        valid = []
+        for row in rows:
+            qualification = row.data.qualification
+            row_errors = []
+            if row.data.cpf in taken_cpfs:
+                row_errors.append(
+                    row_error(row.line, "cpf", get_message(ProfessionalMessages.CPF_ALREADY_EXISTS))
+                )
+            if row.data.email in taken_emails:
+                row_errors.append(
+                    row_error(row.line, "email", get_message(ProfessionalMessages.EMAIL_ALREADY_EXISTS))
+                )
+            if (qualification.council_number, qualification.council_state) in taken_councils:
+                row_errors.append(
+                    row_error(
+                        row.line,
+                        "council_number",
+                        get_message(ProfessionalMessages.COUNCIL_REGISTRATION_EXISTS),
+                    )
+                )
+            row_errors.extend(
+                row_error(
+                    row.line,
+                    "specialty_codes",
+                    get_message(ProfessionalMessages.IMPORT_SPECIALTY_CODE_NOT_FOUND, code=code),
+                )
+                for code in row.specialty_codes
+                if code not in self._specialty_ids
+            )
+            if row.company_cnpj:
+                row.company_id = company_ids.get(row.company_cnpj)
+                if row.company_id is None:
+                    row_errors.append(
+                        row_error(
+                            row.line,
+                            "company_cnpj",
+                            get_message(
+                                ProfessionalMessages.IMPORT_COMPANY_CNPJ_NOT_FOUND,
+                                cnpj=row.company_cnpj,
+                            ),
+                        )
+                    )
+
+            if row_errors:
+                errors.extend(row_errors)
+            else:
+                valid.append(row)
+        return valid
@@ -0,0 +1,174 @@
+"""
+Request professional import use case.
+
+Stores an uploaded CSV/XLSX spreadsheet and queues an import job for the
+worker, instead of validating and inserting the rows in the request.
+"""
+
+import os
+from datetime import datetime, timezone
+from pathlib import PurePosixPath
+from uuid import UUID
+
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.config import Settings
+from src.app.dependencies.settings import get_settings
+from src.app.exceptions import InvalidImportFileError
+from src.app.i18n import ProfessionalMessages, get_message
+from src.app.logging import get_logger
+from src.modules.professionals.domain.models import (
+    ProfessionalImportFileFormat,
+    ProfessionalImportJob,
+    ProfessionalImportStatus,
+)
+from src.modules.professionals.infrastructure.messaging import publish_import_job
+from src.modules.professionals.infrastructure.repositories import (
+    ProfessionalImportJobRepository,
+)
+from src.shared.infrastructure.firebase import FirebaseStorageService
+
+
+logger = get_logger(__name__)
+
+CONTENT_TYPES = {
+    ProfessionalImportFileFormat.CSV: "text/csv",
+    ProfessionalImportFileFormat.XLSX: (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    ),
+}
+_EXTENSIONS = {
+    ".csv": ProfessionalImportFileFormat.CSV,
+    ".xlsx": ProfessionalImportFileFormat.XLSX,
+}
+
+
+class RequestProfessionalImportUseCase:
+    """
+    Queue the import of a spreadsheet of professionals.
+
+    Only the file type and size are checked here; the header and the rows
+    are validated by the worker (ProcessProfessionalImportJobUseCase),
+    which records the outcome of each row on the job.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        settings: Settings | None = None,
+    ) -> None:
+        self.session = session
+        self.settings = settings or get_settings()
+        self.job_repository = ProfessionalImportJobRepository(session)
+        self.storage_service = FirebaseStorageService(self.settings)
+
+    def _detect_format(self, file: UploadFile) -> ProfessionalImportFileFormat:
+        """Get the spreadsheet format from the file extension."""
+        extension = PurePosixPath(file.filename or "").suffix.lower()
+        file_format = _EXTENSIONS.get(extension)
+        if file_format is None:
+            raise InvalidImportFileError(details={"file_name": file.filename})
+        return file_format
+
+    def _validate_size(self, file: UploadFile) -> int:
+        """Check the file size against the import limit."""
+        file_size = file.size
+        if file_size is None:
+            file_size = file.file.seek(0, os.SEEK_END)
+            file.file.seek(0)
+
+        if file_size == 0:
+            raise InvalidImportFileError(
+                message=get_message(ProfessionalMessages.IMPORT_EMPTY_FILE),
+            )
+
+        max_size = self.settings.PROFESSIONAL_IMPORT_MAX_FILE_SIZE
+        if file_size > max_size:
+            raise InvalidImportFileError(
+                message=get_message(
+                    ProfessionalMessages.IMPORT_FILE_TOO_LARGE,
+                    max_size_mb=max_size // (1024 * 1024),
+                ),
+                details={"file_size": file_size, "max_size": max_size},
+            )
+        return file_size
+
+    async def _publish(self, job: ProfessionalImportJob) -> None:
+        """Queue the job, failing it if the broker is unavailable."""
+        try:
+            await publish_import_job(job)
+        except Exception as e:
+            logger.error(
+                "professional_import_job_publish_failed",
+                job_id=str(job.id),
+                error=str(e),
+            )
+            await self.job_repository.set_status(
+                job.id,
+                ProfessionalImportStatus.FAILED,
+                error=str(e)[:2000],
+                completed_at=datetime.now(timezone.utc),
+            )
+            await self.session.commit()
+            await self.session.refresh(job)
+
+    async def execute(
+        self,
+        organization_id: UUID,
+        file: UploadFile,
+        created_by: UUID | None = None,
+    ) -> ProfessionalImportJob:
+        """
+        Store a spreadsheet and queue its import.
+
+        Args:
+            organization_id: The organization the professionals are imported into.
+            file: The uploaded spreadsheet (from multipart/form-data).
+            created_by: UUID of the user requesting the import.
+
+        Returns:
+            The queued import job (poll it for progress).
+
+        Raises:
+            InvalidImportFileError: If the file is not a CSV/XLSX, is empty
+                or exceeds PROFESSIONAL_IMPORT_MAX_FILE_SIZE.
+        """
+        file_format = self._detect_format(file)
+        file_size = self._validate_size(file)
+        file_name = PurePosixPath(file.filename or "").name
+
+        job = ProfessionalImportJob(
+            organization_id=organization_id,
+            file_name=file_name[:255],
+            file_format=file_format,
+            file_path="",
+            created_by=created_by,
+            updated_by=created_by,
+        )
+        job.file_path = self.storage_service.professional_import_path(
+            organization_id, job.id, file_name
+        )
+
+        # Stored before the job exists, so the worker never sees a job without its file
+        await self.storage_service.store_file(
+            file=file.file,
+            path=job.file_path,
+            file_size=file_size,
+            content_type=CONTENT_TYPES[file_format],
+        )
+
+        self.session.add(job)
+        # The worker must see the job before the message arrives
+        await self.session.commit()
+        await self.session.refresh(job)
+
+        await self._publish(job)
+        logger.info(
+            "professional_import_job_queued",
+            job_id=str(job.id),
+            organization_id=str(organization_id),
+            file_format=file_format.value,
+            file_size=file_size,
+        )
+        return job
@@ -3,12 +3,19 @@
 This service handles the sync of qualifications including nested specialties
 and educations. It uses council_type + council_number + council_state as the
 natural key for matching qualifications.
+
+The sync is set-based: the current state is loaded and the snapshot is
+validated with a fixed number of queries, the diff is computed in memory,
+and the changes are written with one DELETE per table plus a single flush
+(one INSERT and one batched UPDATE per table), regardless of how many
+qualifications, specialties and educations the snapshot has.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi_restkit.filters import UUIDListFilter
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.exceptions import (
@@ -24,24 +31,31 @@ from src.modules.professionals.domain.models import (
     ProfessionalQualification,
     ProfessionalSpecialty,
 )
+from src.modules.professionals.domain.models.enums import ResidencyStatus
 from src.modules.professionals.domain.schemas.professional_version import (
     EducationInput,
     QualificationInput,
     SpecialtyInput,
 )
-from src.modules.professionals.infrastructure.filters import (
-    ProfessionalEducationFilter,
-    ProfessionalQualificationFilter,
-    ProfessionalSpecialtyFilter,
-)
 from src.modules.professionals.infrastructure.repositories import (
-    ProfessionalEducationRepository,
     ProfessionalQualificationRepository,
-    ProfessionalSpecialtyRepository,
     SpecialtyRepository,
 )
 
 
+CouncilKey = tuple[str, str, str]
+EducationKey = tuple[str, str, str]
+
+
+@dataclass
+class _SyncPlan:
+    """Rows to delete, per table (creates and updates are pending in the session)."""
+
+    qualification_ids: set[UUID] = field(default_factory=set)
+    specialty_ids: set[UUID] = field(default_factory=set)
+    education_ids: set[UUID] = field(default_factory=set)
+
+
 class QualificationSyncService:
     """
     Service for syncing qualification data from version snapshots.
@@ -54,13 +68,16 @@ class QualificationSyncService:
     - If match found: update existing qualification
     - If no match: create new qualification
     - Existing qualifications not in snapshot: delete
+
+    Round trips are constant: existing qualifications with their
+    specialties and educations (3 statements), global specialty
+    validation (1), council uniqueness (1), deletes (up to 3) and one
+    flush (up to one INSERT and one UPDATE batch per table).
     """
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
         self.qualification_repository = ProfessionalQualificationRepository(session)
-        self.specialty_repository = ProfessionalSpecialtyRepository(session)
-        self.education_repository = ProfessionalEducationRepository(session)
         self.global_specialty_repository = SpecialtyRepository(session)
 
     async def sync_qualifications(
@@ -89,93 +106,165 @@ class QualificationSyncService:
             DuplicateSpecialtyIdsError: If duplicate specialty_ids in request.
             GlobalSpecialtyNotFoundError: If referenced specialty doesn't exist.
         """
-        # Get existing qualifications for this professional
-        existing_qualifications = await self._get_existing_qualifications(
-            professional_id
-        )
+        # Validate the snapshot itself before touching the database
+        for qual_data in qualifications_data:
+            self._validate_specialties_input(qual_data.specialties)
+            self._validate_educations_input(qual_data.educations)
 
-        # Build lookup by natural key: (council_type, council_number, council_state)
-        existing_by_council: dict[tuple[str, str, str], ProfessionalQualification] = {}
-        for qual in existing_qualifications:
-            key = (
-                qual.council_type.value,
-                qual.council_number,
-                qual.council_state,
+        existing_qualifications = (
+            await self.qualification_repository.list_for_professional_with_children(
+                professional_id
             )
-            existing_by_council[key] = qual
+        )
+        existing_by_council: dict[CouncilKey, ProfessionalQualification] = {
+            self._council_key_of(qual): qual for qual in existing_qualifications
+        }
+
+        await self._validate_global_specialties(qualifications_data)
+        await self._validate_new_councils(
+            qualifications_data, existing_by_council, family_org_ids
+        )
 
-        # Track which existing qualifications were matched
+        now = datetime.now(timezone.utc)
+        plan = _SyncPlan()
         matched_ids: set[UUID] = set()
         result: list[ProfessionalQualification] = []
 
         for qual_data in qualifications_data:
-            # Build natural key from input
-            council_key = (
-                qual_data.council_type.value,
-                qual_data.council_number,
-                str(qual_data.council_state),
-            )
-
-            existing_qual = existing_by_council.get(council_key)
+            existing_qual = existing_by_council.get(self._council_key(qual_data))
 
             if existing_qual:
-                # Update existing qualification
                 matched_ids.add(existing_qual.id)
-                updated_qual = await self._update_qualification(
-                    qualification=existing_qual,
-                    data=qual_data,
-                    updated_by=updated_by,
+                self._update_qualification(existing_qual, qual_data, updated_by, now)
+                self._diff_specialties(
+                    existing_qual, qual_data.specialties, updated_by, now, plan
+                )
+                self._diff_educations(
+                    existing_qual, qual_data.educations, updated_by, now, plan
                 )
-                result.append(updated_qual)
+                result.append(existing_qual)
             else:
-                # Validate council uniqueness in family before creating
-                if await self.qualification_repository.council_exists_in_family(
-                    council_number=qual_data.council_number,
-                    council_state=str(qual_data.council_state),
-                    family_org_ids=family_org_ids,
-                ):
-                    raise CouncilRegistrationExistsError()
-
-                # Create new qualification
-                new_qual = await self._create_qualification(
-                    professional_id=professional_id,
-                    organization_id=organization_id,
-                    data=qual_data,
-                    updated_by=updated_by,
+                result.append(
+                    self._create_qualification(
+                        professional_id, organization_id, qual_data, updated_by
+                    )
                 )
-                result.append(new_qual)
 
-        # Delete qualifications not in snapshot
-        for qual in existing_qualifications:
-            if qual.id not in matched_ids:
-                await self._delete_qualification(qual)
+        # Qualifications not in snapshot (specialties/educations cascade in the database)
+        plan.qualification_ids = {
+            qual.id for qual in existing_qualifications if qual.id not in matched_ids
+        }
 
+        await self._apply_deletes(plan)
         await self.session.flush()
         return result
 
-    async def _get_existing_qualifications(
-        self,
-        professional_id: UUID,
-    ) -> list[ProfessionalQualification]:
-        """Get all existing qualifications for a professional."""
-        filters = ProfessionalQualificationFilter(
-            organization_professional_id=UUIDListFilter(values=[professional_id])
+    # =========================================================================
+    # Keys
+    # =========================================================================
+
+    @staticmethod
+    def _council_key(data: QualificationInput) -> CouncilKey:
+        return (
+            data.council_type.value,
+            data.council_number,
+            str(data.council_state),
         )
-        paginated = await self.qualification_repository.list(
-            filters=filters,
-            limit=100,
-            offset=0,
+
+    @staticmethod
+    def _council_key_of(qualification: ProfessionalQualification) -> CouncilKey:
+        return (
+            qualification.council_type.value,
+            qualification.council_number,
+            qualification.council_state,
         )
-        return paginated.items
 
-    async def _create_qualification(
+    @staticmethod
+    def _education_key(data: EducationInput) -> EducationKey:
+        return (data.level.value, data.course_name, data.institution)  # type: ignore[union-attr, return-value]
+
+    @staticmethod
+    def _education_key_of(education: ProfessionalEducation) -> EducationKey:
+        return (education.level.value, education.course_name, education.institution)
+
+    # =========================================================================
+    # Validation (bulk)
+    # =========================================================================
+
+    @staticmethod
+    def _validate_specialties_input(specialties_data: list[SpecialtyInput]) -> None:
+        """Validate no duplicate specialty_ids within a qualification."""
+        specialty_ids = [spec.specialty_id for spec in specialties_data]
+        if len(specialty_ids) != len(set(specialty_ids)):
+            raise DuplicateSpecialtyIdsError()
+
+    @staticmethod
+    def _validate_educations_input(educations_data: list[EducationInput]) -> None:
+        """Validate required education fields."""
+        for edu_data in educations_data:
+            if edu_data.level is None:
+                raise LevelRequiredError()
+            if not edu_data.course_name:
+                raise CourseNameRequiredError()
+            if not edu_data.institution:
+                raise InstitutionRequiredError()
+
+    async def _validate_global_specialties(
+        self,
+        qualifications_data: list[QualificationInput],
+    ) -> None:
+        """Validate that every referenced global specialty exists (one query)."""
+        requested = [
+            spec.specialty_id
+            for qual_data in qualifications_data
+            for spec in qual_data.specialties
+        ]
+        if not requested:
+            return
+
+        found = {
+            specialty.id
+            for specialty in await self.global_specialty_repository.get_by_ids(
+                list(set(requested))
+            )
+        }
+        for specialty_id in requested:
+            if specialty_id not in found:
+                raise GlobalSpecialtyNotFoundError(specialty_id=str(specialty_id))
+
+    async def _validate_new_councils(
+        self,
+        qualifications_data: list[QualificationInput],
+        existing_by_council: dict[CouncilKey, ProfessionalQualification],
+        family_org_ids: list[UUID] | tuple[UUID, ...],
+    ) -> None:
+        """Validate council uniqueness in family for qualifications to create (one query)."""
+        new_councils: list[tuple[str, str]] = [
+            (qual_data.council_number, str(qual_data.council_state))
+            for qual_data in qualifications_data
+            if self._council_key(qual_data) not in existing_by_council
+        ]
+        if len(new_councils) != len(set(new_councils)):
+            raise CouncilRegistrationExistsError()
+
+        if await self.qualification_repository.find_councils_in_family(
+            councils=set(new_councils),
+            family_org_ids=family_org_ids,
+        ):
+            raise CouncilRegistrationExistsError()
+
+    # =========================================================================
+    # Qualifications
+    # =========================================================================
+
+    def _create_qualification(
         self,
         professional_id: UUID,
         organization_id: UUID,
         data: QualificationInput,
         updated_by: UUID,
     ) -> ProfessionalQualification:
-        """Create a new qualification with nested entities."""
+        """Add a new qualification with nested entities to the session."""
         qualification = ProfessionalQualification(
             organization_id=organization_id,
             organization_professional_id=professional_id,
@@ -189,73 +278,62 @@ class QualificationSyncService:
             updated_by=updated_by,
         )
         self.session.add(qualification)
-        await self.session.flush()
 
-        # Sync nested entities
-        await self._sync_specialties(
-            qualification_id=qualification.id,
-            specialties_data=data.specialties,
-            updated_by=updated_by,
+        # IDs are generated client-side, so children can reference it before the flush
+        self.session.add_all(
+            [
+                self._build_specialty(qualification.id, spec_data, updated_by)
+                for spec_data in data.specialties
+            ]
         )
-        await self._sync_educations(
-            qualification_id=qualification.id,
-            organization_id=organization_id,
-            educations_data=data.educations,
-            updated_by=updated_by,
+        self.session.add_all(
+            [
+                self._build_education(
+                    qualification.id, organization_id, edu_data, updated_by
+                )
+                for edu_data in data.educations
+            ]
         )
-
         return qualification
 
-    async def _update_qualification(
-        self,
+    @staticmethod
+    def _update_qualification(
         qualification: ProfessionalQualification,
         data: QualificationInput,
         updated_by: UUID,
-    ) -> ProfessionalQualification:
-        """Update an existing qualification with nested entities."""
-        # Update qualification fields (council fields are natural key, don't update)
+        now: datetime,
+    ) -> None:
+        """Update qualification fields (council fields are natural key, don't update)."""
         qualification.professional_type = data.professional_type
         qualification.is_primary = data.is_primary
         qualification.graduation_year = data.graduation_year
         qualification.updated_by = updated_by
-        qualification.updated_at = datetime.now(timezone.utc)
-
-        await self.session.flush()
-
-        # Sync nested entities
-        await self._sync_specialties(
-            qualification_id=qualification.id,
-            specialties_data=data.specialties,
-            updated_by=updated_by,
-        )
-        await self._sync_educations(
-            qualification_id=qualification.id,
-            organization_id=qualification.organization_id,
-            educations_data=data.educations,
-            updated_by=updated_by,
-        )
-
-        return qualification
-
-    async def _delete_qualification(
-        self,
-        qualification: ProfessionalQualification,
-    ) -> None:
-        """Delete a qualification and rely on cascade for nested entities."""
-        await self.qualification_repository.delete(qualification.id)
+        qualification.updated_at = now
+
+    async def _apply_deletes(self, plan: _SyncPlan) -> None:
+        """Delete removed rows with one statement per table."""
+        for model, ids in (
+            (ProfessionalQualification, plan.qualification_ids),
+            (ProfessionalSpecialty, plan.specialty_ids),
+            (ProfessionalEducation, plan.education_ids),
+        ):
+            if ids:
+                await self.session.execute(delete(model).where(model.id.in_(ids)))
 
     # =========================================================================
-    # Specialties Sync
+    # Specialties
     # =========================================================================
 
-    async def _sync_specialties(
+    def _diff_specialties(
         self,
-        qualification_id: UUID,
+        qualification: ProfessionalQualification,
         specialties_data: list[SpecialtyInput],
         updated_by: UUID,
-    ) -> list[ProfessionalSpecialty]:
+        now: datetime,
+        plan: _SyncPlan,
+    ) -> None:
         """
-        Sync specialties for a qualification.
+        Diff specialties of an existing qualification.
 
         Strategy:
         - Match by specialty_id (reference to global specialty)
@@ -263,86 +341,33 @@ class QualificationSyncService:
         - If no match: create new
         - Existing not in snapshot: delete
         """
-        existing_specialties = await self._get_existing_specialties(qualification_id)
-
-        # Build lookup by specialty_id
         existing_by_specialty_id: dict[UUID, ProfessionalSpecialty] = {
-            s.specialty_id: s for s in existing_specialties
+            spec.specialty_id: spec for spec in qualification.specialties
         }
-
-        # Track matched and validate duplicates
         matched_ids: set[UUID] = set()
-        specialty_ids_in_request: list[UUID] = []
-        result: list[ProfessionalSpecialty] = []
-
-        for spec_data in specialties_data:
-            specialty_ids_in_request.append(spec_data.specialty_id)
-
-        # Validate no duplicate specialty_ids
-        if len(specialty_ids_in_request) != len(set(specialty_ids_in_request)):
-            raise DuplicateSpecialtyIdsError()
 
         for spec_data in specialties_data:
-            # Validate global specialty exists
-            global_specialty = await self.global_specialty_repository.get_by_id(
-                spec_data.specialty_id
-            )
-            if global_specialty is None:
-                raise GlobalSpecialtyNotFoundError(
-                    specialty_id=str(spec_data.specialty_id)
-                )
-
             existing_spec = existing_by_specialty_id.get(spec_data.specialty_id)
-
             if existing_spec:
-                # Update existing
                 matched_ids.add(existing_spec.id)
-                updated_spec = await self._update_specialty(
-                    specialty=existing_spec,
-                    data=spec_data,
-                    updated_by=updated_by,
-                )
-                result.append(updated_spec)
+                self._update_specialty(existing_spec, spec_data, updated_by, now)
             else:
-                # Create new
-                new_spec = await self._create_specialty(
-                    qualification_id=qualification_id,
-                    data=spec_data,
-                    updated_by=updated_by,
+                self.session.add(
+                    self._build_specialty(qualification.id, spec_data, updated_by)
                 )
-                result.append(new_spec)
-
-        # Delete specialties not in snapshot
-        for spec in existing_specialties:
-            if spec.id not in matched_ids:
-                await self.specialty_repository.delete(spec.id)
-        return result
 
-    async def _get_existing_specialties(
-        self,
-        qualification_id: UUID,
-    ) -> list[ProfessionalSpecialty]:
-        """Get all existing specialties for a qualification."""
-        filters = ProfessionalSpecialtyFilter(
-            qualification_id=UUIDListFilter(values=[qualification_id])
-        )
-        paginated = await self.specialty_repository.list(
-            filters=filters,
-            limit=100,
-            offset=0,
+        plan.specialty_ids.update(
+            spec.id for spec in qualification.specialties if spec.id not in matched_ids
         )
-        return paginated.items
 
-    async def _create_specialty(
-        self,
+    @staticmethod
+    def _build_specialty(
         qualification_id: UUID,
         data: SpecialtyInput,
         updated_by: UUID,
     ) -> ProfessionalSpecialty:
-        """Create a new specialty."""
-        from src.modules.professionals.domain.models.enums import ResidencyStatus
-
-        specialty = ProfessionalSpecialty(
+        """Build a new specialty."""
+        return ProfessionalSpecialty(
             qualification_id=qualification_id,
             specialty_id=data.specialty_id,
             is_primary=data.is_primary,
@@ -359,19 +384,15 @@ class QualificationSyncService:
             created_by=updated_by,
             updated_by=updated_by,
         )
-        self.session.add(specialty)
-        await self.session.flush()
-        return specialty
 
-    async def _update_specialty(
-        self,
+    @staticmethod
+    def _update_specialty(
         specialty: ProfessionalSpecialty,
         data: SpecialtyInput,
         updated_by: UUID,
-    ) -> ProfessionalSpecialty:
+        now: datetime,
+    ) -> None:
         """Update an existing specialty."""
-        from src.modules.professionals.domain.models.enums import ResidencyStatus
-
         specialty.is_primary = data.is_primary
         specialty.rqe_number = data.rqe_number
         specialty.rqe_state = str(data.rqe_state) if data.rqe_state else None
@@ -386,24 +407,22 @@ class QualificationSyncService:
             str(data.certificate_url) if data.certificate_url else None
         )
         specialty.updated_by = updated_by
-        specialty.updated_at = datetime.now(timezone.utc)
-
-        await self.session.flush()
-        return specialty
+        specialty.updated_at = now
 
     # =========================================================================
-    # Educations Sync
+    # Educations
     # =========================================================================
 
-    async def _sync_educations(
+    def _diff_educations(
         self,
-        qualification_id: UUID,
-        organization_id: UUID,
+        qualification: ProfessionalQualification,
         educations_data: list[EducationInput],
         updated_by: UUID,
-    ) -> list[ProfessionalEducation]:
+        now: datetime,
+        plan: _SyncPlan,
+    ) -> None:
         """
-        Sync educations for a qualification.
+        Diff educations of an existing qualification.
 
         Strategy:
         - Match by (level, course_name, institution) as natural key
@@ -411,88 +430,39 @@ class QualificationSyncService:
         - If no match: create new
         - Existing not in snapshot: delete
         """
-        existing_educations = await self._get_existing_educations(qualification_id)
-
-        # Build lookup by natural key: (level, course_name, institution)
-        existing_by_key: dict[tuple[str, str, str], ProfessionalEducation] = {}
-        for edu in existing_educations:
-            key = (
-                edu.level.value,
-                edu.course_name,
-                edu.institution,
-            )
-            existing_by_key[key] = edu
-
+        existing_by_key: dict[EducationKey, ProfessionalEducation] = {
+            self._education_key_of(edu): edu for edu in qualification.educations
+        }
         matched_ids: set[UUID] = set()
-        result: list[ProfessionalEducation] = []
 
         for edu_data in educations_data:
-            # Validate required fields
-            if edu_data.level is None:
-                raise LevelRequiredError()
-            if not edu_data.course_name:
-                raise CourseNameRequiredError()
-            if not edu_data.institution:
-                raise InstitutionRequiredError()
-
-            # Build natural key from input
-            edu_key = (
-                edu_data.level.value,
-                edu_data.course_name,
-                edu_data.institution,
-            )
-
-            existing_edu = existing_by_key.get(edu_key)
-
+            existing_edu = existing_by_key.get(self._education_key(edu_data))
             if existing_edu:
-                # Update existing
                 matched_ids.add(existing_edu.id)
-                updated_edu = await self._update_education(
-                    education=existing_edu,
-                    data=edu_data,
-                    updated_by=updated_by,
-                )
-                result.append(updated_edu)
+                self._update_education(existing_edu, edu_data, updated_by, now)
             else:
-                # Create new
-                new_edu = await self._create_education(
-                    qualification_id=qualification_id,
-                    organization_id=organization_id,
-                    data=edu_data,
-                    updated_by=updated_by,
+                self.session.add(
+                    self._build_education(
+                        qualification.id,
+                        qualification.organization_id,
+                        edu_data,
+                        updated_by,
+                    )
                 )
-                result.append(new_edu)
 
-        # Delete educations not in snapshot
-        for edu in existing_educations:
-            if edu.id not in matched_ids:
-                await self.education_repository.delete(edu.id)
-        return result
-
-    async def _get_existing_educations(
-        self,
-        qualification_id: UUID,
-    ) -> list[ProfessionalEducation]:
-        """Get all existing educations for a qualification."""
-        filters = ProfessionalEducationFilter(
-            qualification_id=UUIDListFilter(values=[qualification_id])
+        plan.education_ids.update(
+            edu.id for edu in qualification.educations if edu.id not in matched_ids
         )
-        paginated = await self.education_repository.list(
-            filters=filters,
-            limit=100,
-            offset=0,
-        )
-        return paginated.items
 
-    async def _create_education(
-        self,
+    @staticmethod
+    def _build_education(
         qualification_id: UUID,
         organization_id: UUID,
         data: EducationInput,
         updated_by: UUID,
     ) -> ProfessionalEducation:
-        """Create a new education."""
-        education = ProfessionalEducation(
+        """Build a new education."""
+        return ProfessionalEducation(
             organization_id=organization_id,
             qualification_id=qualification_id,
             level=data.level,
@@ -507,16 +477,14 @@ class QualificationSyncService:
             created_by=updated_by,
             updated_by=updated_by,
         )
-        self.session.add(education)
-        await self.session.flush()
-        return education
 
-    async def _update_education(
-        self,
+    @staticmethod
+    def _update_education(
         education: ProfessionalEducation,
         data: EducationInput,
         updated_by: UUID,
-    ) -> ProfessionalEducation:
+        now: datetime,
+    ) -> None:
         """Update an existing education."""
         education.start_year = data.start_year
         education.end_year = data.end_year
@@ -527,7 +495,4 @@ class QualificationSyncService:
         )
         education.notes = data.notes
         education.updated_by = updated_by
-        education.updated_at = datetime.now(timezone.utc)
-
-        await self.session.flush()
-        return education
+        education.updated_at = now
@@ -5,6 +5,7 @@ from src.modules.screening.domain.models.enums import (
     ChangeType,
     ClientValidationOutcome,
     ConversationOutcome,
+    ReportJobStatus,
     ScreeningDocumentStatus,
     ScreeningStatus,
     SourceType,
@@ -29,6 +30,10 @@ from src.modules.screening.domain.models.screening_process import (
     ScreeningProcess,
     ScreeningProcessBase,
 )
+from src.modules.screening.domain.models.screening_report_job import (
+    ScreeningReportJob,
+    ScreeningReportJobBase,
+)
 from src.modules.screening.domain.models.steps import (
     ClientValidationStep,
     ClientValidationStepBase,
@@ -51,6 +56,7 @@ __all__ = [
     "ChangeType",
     "ClientValidationOutcome",
     "ConversationOutcome",
+    "ReportJobStatus",
     "ScreeningDocumentStatus",
     "ScreeningStatus",
     "SourceType",
@@ -89,4 +95,7 @@ __all__ = [
     "ScreeningAlert",
     "ScreeningAlertBase",
     "create_alert_note",
+    # Report job model
+    "ScreeningReportJob",
+    "ScreeningReportJobBase",
 ]
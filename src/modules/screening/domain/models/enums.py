@@ -191,3 +191,17 @@ class AlertCategory(str, Enum):
     COMPLIANCE = "COMPLIANCE"  # Regulatory/compliance issue
     QUALIFICATION = "QUALIFICATION"  # Problem with qualification/registration
     OTHER = "OTHER"  # Other issues
+
+
+class ReportJobStatus(str, Enum):
+    """
+    Status of a compliance report generation job.
+
+    Flow: PENDING → RUNNING → COMPLETED
+    Failures: RUNNING → PENDING (retry scheduled) or FAILED (attempts exhausted)
+    """
+
+    PENDING = "PENDING"  # Queued, waiting for a worker (or a retry)
+    RUNNING = "RUNNING"  # Claimed by a worker
+    COMPLETED = "COMPLETED"  # Report generated and URL saved
+    FAILED = "FAILED"  # Failed permanently
@@ -0,0 +1,107 @@
+"""ScreeningReportJob model - asynchronous compliance report generation."""
+
+from typing import Optional
+from uuid import UUID
+
+from pydantic import AwareDatetime
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field
+
+from src.modules.screening.domain.models.enums import ReportJobStatus
+from src.shared.domain.models.base import BaseModel
+from src.shared.domain.models.fields import AwareDatetimeField
+from src.shared.domain.models.mixins import (
+    PrimaryKeyMixin,
+    TimestampMixin,
+    TrackingMixin,
+)
+
+
+class ScreeningReportJobBase(BaseModel):
+    """Base fields for ScreeningReportJob."""
+
+    version: int = Field(
+        ge=1,
+        description="Report version for the screening (idempotency key with process_id)",
+    )
+    status: ReportJobStatus = Field(
+        default=ReportJobStatus.PENDING,
+        sa_type=SAEnum(ReportJobStatus, name="report_job_status", create_constraint=True),
+        description="Job status",
+    )
+    attempts: int = Field(
+        default=0,
+        ge=0,
+        description="Number of processing attempts",
+    )
+    report_url: Optional[str] = Field(
+        default=None,
+        max_length=2048,
+        description="URL of the generated report (when completed)",
+    )
+    error: Optional[str] = Field(
+        default=None,
+        max_length=2000,
+        description="Last error message",
+    )
+
+
+class ScreeningReportJob(
+    ScreeningReportJobBase,
+    TrackingMixin,
+    PrimaryKeyMixin,
+    TimestampMixin,
+    table=True,
+):
+    """
+    ScreeningReportJob table model.
+
+    Tracks the generation of a compliance report by the worker. There is
+    at most one job per (process_id, version): requesting a report while a
+    job is pending or running, or without force after it completed,
+    returns the existing job instead of queuing a new one.
+    """
+
+    __tablename__ = "screening_report_jobs"
+    __table_args__ = (
+        UniqueConstraint(
+            "process_id",
+            "version",
+            name="uq_screening_report_jobs_process_version",
+        ),
+    )
+
+    organization_id: UUID = Field(
+        foreign_key="organizations.id",
+        nullable=False,
+        description="Organization that owns the screening process",
+    )
+    process_id: UUID = Field(
+        foreign_key="screening_processes.id",
+        nullable=False,
+        description="Screening process the report is generated for",
+    )
+
+    started_at: Optional[AwareDatetime] = AwareDatetimeField(
+        default=None,
+        nullable=True,
+        description="When the current (or last) attempt started",
+    )
+    completed_at: Optional[AwareDatetime] = AwareDatetimeField(
+        default=None,
+        nullable=True,
+        description="When the job completed or failed permanently",
+    )
+
+    # === Properties ===
+
+    @property
+    def idempotency_key(self) -> str:
+        """Key identifying this job's work (also the message ID on the broker)."""
+        return f"{self.process_id}:{self.version}"
+
+    @property
+    def is_in_flight(self) -> bool:
+        """Check if the job is still pending or running."""
+        return self.status in (ReportJobStatus.PENDING, ReportJobStatus.RUNNING)
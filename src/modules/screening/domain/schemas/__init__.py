@@ -22,6 +22,9 @@ from src.modules.screening.domain.schemas.screening_alert import (
 from src.modules.screening.domain.schemas.screening_document import (
     ScreeningDocumentCreate,
     ScreeningDocumentResponse,
+    ScreeningDocumentUploadConfirm,
+    ScreeningDocumentUploadUrlRequest,
+    ScreeningDocumentUploadUrlResponse,
 )
 from src.modules.screening.domain.schemas.screening_process import (
     ScreeningProcessCancel,
@@ -79,6 +82,9 @@ __all__ = [
     # Screening Document
     "ScreeningDocumentCreate",
     "ScreeningDocumentResponse",
+    "ScreeningDocumentUploadConfirm",
+    "ScreeningDocumentUploadUrlRequest",
+    "ScreeningDocumentUploadUrlResponse",
     # Screening Process
     "ScreeningProcessCancel",
     "ScreeningProcessCreate",
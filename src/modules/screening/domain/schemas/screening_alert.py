@@ -85,3 +85,7 @@ class ScreeningAlertListResponse(BaseModel):
     alerts: list[ScreeningAlertResponse]
     total_count: int
     pending_count: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor da próxima página (quando limit é informado)",
+    )
@@ -91,3 +91,51 @@ class ScreeningDocumentListResponse(BaseModel):
     pending_review: int
     approved: int
     correction_needed: int
+
+
+class ScreeningDocumentUploadUrlRequest(BaseModel):
+    """Request a signed URL to upload a screening document directly to storage."""
+
+    file_name: str = Field(
+        min_length=1,
+        max_length=255,
+        description="Original file name",
+    )
+    file_size: int = Field(
+        gt=0,
+        description="File size in bytes",
+    )
+    content_type: str = Field(
+        description="MIME type of the file (PDF, JPEG, PNG, WebP, HEIC)",
+    )
+
+
+class ScreeningDocumentUploadUrlResponse(BaseModel):
+    """Signed URL for a direct-to-storage upload."""
+
+    upload_url: str = Field(description="Signed URL to PUT the file to")
+    method: str = Field(default="PUT", description="HTTP method for the upload")
+    headers: dict[str, str] = Field(
+        description="Headers the upload request must send exactly as given",
+    )
+    path: str = Field(description="Storage path, sent back on confirm")
+    expires_at: datetime = Field(description="When the signed URL expires (UTC)")
+
+
+class ScreeningDocumentUploadConfirm(BaseModel):
+    """Confirm a direct-to-storage upload."""
+
+    path: str = Field(description="Storage path returned by the upload URL request")
+    file_name: str = Field(
+        min_length=1,
+        max_length=255,
+        description="Original file name",
+    )
+    expires_at: Optional[datetime] = Field(
+        default=None,
+        description="Document expiration date (UTC)",
+    )
+    notes: Optional[str] = Field(
+        default=None,
+        description="Notes about the document",
+    )
@@ -5,6 +5,11 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from src.modules.screening.domain.models.enums import ReportJobStatus
+from src.modules.screening.domain.models.screening_report_job import (
+    ScreeningReportJob,
+)
+
 
 class QualificationData(BaseModel):
     """Data for professional qualification section."""
@@ -110,3 +115,34 @@ class ScreeningReportResponse(BaseModel):
     url: str
     generated_at: datetime
     screening_id: UUID
+
+
+class ScreeningReportJobResponse(BaseModel):
+    """Status of a compliance report generation job."""
+
+    id: UUID
+    screening_id: UUID
+    version: int
+    status: ReportJobStatus
+    attempts: int
+    url: str | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    @classmethod
+    def from_job(cls, job: ScreeningReportJob) -> "ScreeningReportJobResponse":
+        """Build the response from a ScreeningReportJob."""
+        return cls(
+            id=job.id,
+            screening_id=job.process_id,
+            version=job.version,
+            status=job.status,
+            attempts=job.attempts,
+            url=job.report_url,
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            completed_at=job.completed_at,
+        )
@@ -0,0 +1,19 @@
+"""Screening module messaging (queues, messages and publishers)."""
+
+from src.modules.screening.infrastructure.messaging.screening_report_jobs import (
+    SCREENING_REPORT_QUEUE,
+    SCREENING_REPORT_RETRY_QUEUE,
+    ScreeningReportJobMessage,
+    declare_report_queues,
+    publish_report_job,
+    publish_report_job_retry,
+)
+
+__all__ = [
+    "SCREENING_REPORT_QUEUE",
+    "SCREENING_REPORT_RETRY_QUEUE",
+    "ScreeningReportJobMessage",
+    "declare_report_queues",
+    "publish_report_job",
+    "publish_report_job_retry",
+]
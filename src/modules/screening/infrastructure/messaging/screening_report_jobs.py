@@ -0,0 +1,93 @@
+"""
+Compliance report job queues.
+
+Jobs are published to SCREENING_REPORT_QUEUE on the default exchange and
+consumed by the worker (src/workers/handlers/screening_report_handler.py).
+Retries are published to SCREENING_REPORT_RETRY_QUEUE with a per-message
+expiration; it has no consumers, so expired messages are dead-lettered
+back to the main queue, which gives a delayed retry without a plugin.
+"""
+
+from uuid import UUID
+
+from faststream.rabbit import RabbitQueue
+from pydantic import BaseModel
+
+from src.app.dependencies import get_settings
+from src.modules.screening.domain.models.screening_report_job import (
+    ScreeningReportJob,
+)
+from src.shared.infrastructure.messaging.broker import broker
+
+
+_settings = get_settings()
+
+SCREENING_REPORT_QUEUE = RabbitQueue(
+    f"{_settings.LAVINMQ_QUEUE_PREFIX}screening_reports",
+    durable=True,
+)
+SCREENING_REPORT_RETRY_QUEUE = RabbitQueue(
+    f"{_settings.LAVINMQ_QUEUE_PREFIX}screening_reports_retry",
+    durable=True,
+    arguments={
+        "x-dead-letter-exchange": "",
+        "x-dead-letter-routing-key": SCREENING_REPORT_QUEUE.name,
+    },
+)
+
+
+async def declare_report_queues() -> None:
+    """
+    Declare the report queues on the broker.
+
+    Publishing to the default exchange silently drops messages routed to
+    a queue that does not exist yet, so both the API and the worker
+    declare the queues once connected.
+    """
+    await broker.declare_queue(SCREENING_REPORT_QUEUE)
+    await broker.declare_queue(SCREENING_REPORT_RETRY_QUEUE)
+
+
+class ScreeningReportJobMessage(BaseModel):
+    """Message asking the worker to process a report job."""
+
+    job_id: UUID
+    idempotency_key: str
+
+
+async def publish_report_job(job: ScreeningReportJob) -> None:
+    """
+    Publish a report job to the worker queue.
+
+    The idempotency key is used as message ID; the worker relies on the
+    job row (not on the message) to skip duplicates.
+
+    Args:
+        job: The job to process.
+    """
+    await broker.publish(
+        ScreeningReportJobMessage(job_id=job.id, idempotency_key=job.idempotency_key),
+        queue=SCREENING_REPORT_QUEUE,
+        persist=True,
+        message_id=job.idempotency_key,
+    )
+
+
+async def publish_report_job_retry(
+    message: ScreeningReportJobMessage,
+    delay: int,
+) -> None:
+    """
+    Publish a report job again after a delay.
+
+    Args:
+        message: The message being retried.
+        delay: Seconds to wait before the job is delivered again.
+    """
+    await broker.publish(
+        message,
+        queue=SCREENING_REPORT_RETRY_QUEUE,
+        persist=True,
+        message_id=message.idempotency_key,
+        expiration=delay,
+    )
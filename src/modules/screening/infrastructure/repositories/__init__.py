@@ -12,6 +12,9 @@ from src.modules.screening.infrastructure.repositories.screening_document_reposi
 from src.modules.screening.infrastructure.repositories.screening_process_repository import (
     ScreeningProcessRepository,
 )
+from src.modules.screening.infrastructure.repositories.screening_report_job_repository import (
+    ScreeningReportJobRepository,
+)
 from src.modules.screening.infrastructure.repositories.step_repositories import (
     BaseStepRepository,
     ClientValidationStepRepository,
@@ -31,6 +34,8 @@ __all__ = [
     "ScreeningAlertRepository",
     # Document
     "ScreeningDocumentRepository",
+    # Report jobs
+    "ScreeningReportJobRepository",
     # Steps (base)
     "BaseStepRepository",
     # Steps (specific)
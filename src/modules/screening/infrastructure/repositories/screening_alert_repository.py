@@ -7,6 +7,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.screening.domain.models.screening_alert import ScreeningAlert
 from src.shared.infrastructure.repositories import BaseRepository
+from src.shared.infrastructure.repositories.keyset import (
+    decode_cursor,
+    encode_cursor,
+    keyset_order_by,
+    keyset_predicate,
+    resolve_keyset,
+)
 
 
 class ScreeningAlertRepository(BaseRepository[ScreeningAlert]):
@@ -126,6 +133,50 @@ class ScreeningAlertRepository(BaseRepository[ScreeningAlert]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def list_page_for_process(
+        self,
+        process_id: UUID,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[ScreeningAlert], str | None]:
+        """
+        List a page of alerts for a process using keyset pagination.
+
+        Same ordering as `list_for_process` (created_at desc, id desc).
+
+        Args:
+            process_id: The screening process UUID.
+            limit: Maximum number of alerts to return.
+            cursor: Cursor from a previous page (`next_cursor`).
+
+        Returns:
+            Tuple of (alerts, next_cursor). next_cursor is None on the last page.
+
+        Raises:
+            ValidationError: If the cursor is invalid.
+        """
+        keyset = resolve_keyset(ScreeningAlert, None)
+        query = self._base_query_for_process(process_id)
+
+        if cursor:
+            sort_value, last_id = decode_cursor(cursor, keyset)
+            query = query.where(
+                keyset_predicate(ScreeningAlert, keyset, sort_value, last_id)
+            )
+
+        query = query.order_by(*keyset_order_by(ScreeningAlert, keyset)).limit(
+            limit + 1
+        )
+        result = await self.session.execute(query)
+        alerts = list(result.scalars().all())
+
+        next_cursor = None
+        if len(alerts) > limit:
+            alerts = alerts[:limit]
+            next_cursor = encode_cursor(keyset, alerts[-1])
+
+        return alerts, next_cursor
+
     async def count_for_process(
         self,
         process_id: UUID,
@@ -2,16 +2,27 @@
 
 from uuid import UUID
 
-from src.shared.domain.schemas import PaginatedResponse, PaginationParams
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+    PaginatedResponse,
+)
 from sqlalchemy import Select, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.modules.professionals.domain.models import (
+    OrganizationProfessional,
+    ProfessionalQualification,
+)
 from src.modules.screening.domain.models import (
     DocumentUploadStep,
     ScreeningDocument,
     ScreeningProcess,
     ScreeningStatus,
+    ScreeningStepMixin,
 )
 from src.modules.screening.infrastructure.filters import (
     ScreeningProcessFilter,
@@ -140,16 +151,73 @@ class ScreeningProcessRepository(
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_id_for_report(
+        self,
+        id: UUID,
+        organization_id: UUID,
+        family_org_ids: list[UUID] | tuple[UUID, ...] | None,
+        scope_policy: ScopePolicy | None = None,
+    ) -> ScreeningProcess | None:
+        """
+        Get screening process with everything the compliance report reads.
+
+        Loads the steps, documents with their document type and professional
+        document, and the professional with qualifications, specialties and
+        educations. Each relationship is one SELECT ... IN query, so the
+        number of round trips doesn't grow with the number of documents.
+
+        Args:
+            id: The screening process UUID.
+            organization_id: The organization UUID.
+            family_org_ids: List of family org IDs (required for FAMILY scope).
+            scope_policy: Scope policy to apply. Uses default if None.
+
+        Returns:
+            ScreeningProcess with loaded relationships.
+        """
+        query = (
+            self._base_query_for_organization(
+                organization_id=organization_id,
+                family_org_ids=family_org_ids,
+                scope_policy=scope_policy,
+            )
+            .where(ScreeningProcess.id == id)
+            .options(
+                # Load all step relationships
+                selectinload(ScreeningProcess.conversation_step),
+                selectinload(ScreeningProcess.professional_data_step),
+                selectinload(ScreeningProcess.document_upload_step).options(
+                    selectinload(DocumentUploadStep.documents).options(
+                        selectinload(ScreeningDocument.document_type),
+                        selectinload(ScreeningDocument.professional_document),
+                    ),
+                ),
+                selectinload(ScreeningProcess.document_review_step),
+                selectinload(ScreeningProcess.payment_info_step),
+                selectinload(ScreeningProcess.client_validation_step),
+                # Load professional data
+                selectinload(ScreeningProcess.organization_professional).options(
+                    selectinload(OrganizationProfessional.qualifications).options(
+                        selectinload(ProfessionalQualification.specialties),
+                        selectinload(ProfessionalQualification.educations),
+                    ),
+                ),
+            )
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
     async def list_for_organization(
         self,
         organization_id: UUID,
-        pagination: PaginationParams,
+        pagination: CursorPaginationParams,
         *,
         family_org_ids: list[UUID] | tuple[UUID, ...] | None,
         scope_policy: ScopePolicy | None = None,
         filters: ScreeningProcessFilter | None = None,
         sorting: ScreeningProcessSorting | None = None,
-    ) -> PaginatedResponse[ScreeningProcess]:
+        count_strategy: CountStrategy | None = None,
+    ) -> PaginatedResponse[ScreeningProcess] | CursorPaginatedResponse[ScreeningProcess]:
         """
         List screening processes for an organization.
 
@@ -164,6 +232,7 @@ class ScreeningProcessRepository(
             scope_policy: Scope policy to apply. Uses default if None.
             filters: Optional filters.
             sorting: Optional sorting.
+            count_strategy: How to compute the total (EXACT if None).
 
         Returns:
             Paginated list of screening processes.
@@ -179,19 +248,24 @@ class ScreeningProcessRepository(
             limit=pagination.page_size,
             offset=(pagination.page - 1) * pagination.page_size,
             base_query=base_query,
+            use_cursor=pagination.use_cursor,
+            cursor=pagination.cursor,
+            include_total=pagination.include_total,
+            count_strategy=count_strategy,
         )
 
     async def list_for_actor(
         self,
         organization_id: UUID,
         actor_id: UUID,
-        pagination: PaginationParams,
+        pagination: CursorPaginationParams,
         *,
         family_org_ids: list[UUID] | tuple[UUID, ...] | None,
         scope_policy: ScopePolicy | None = None,
         filters: ScreeningProcessFilter | None = None,
         sorting: ScreeningProcessSorting | None = None,
-    ) -> PaginatedResponse[ScreeningProcess]:
+        count_strategy: CountStrategy | None = None,
+    ) -> PaginatedResponse[ScreeningProcess] | CursorPaginatedResponse[ScreeningProcess]:
         """
         List screening processes assigned to a specific user.
 
@@ -209,6 +283,7 @@ class ScreeningProcessRepository(
             scope_policy: Scope policy to apply. Uses default if None.
             filters: Optional additional filters.
             sorting: Optional sorting.
+            count_strategy: How to compute the total (EXACT if None).
 
         Returns:
             Paginated list of screening processes.
@@ -228,7 +303,48 @@ class ScreeningProcessRepository(
             limit=pagination.page_size,
             offset=(pagination.page - 1) * pagination.page_size,
             base_query=base_query,
+            use_cursor=pagination.use_cursor,
+            cursor=pagination.cursor,
+            include_total=pagination.include_total,
+            count_strategy=count_strategy,
+        )
+
+    async def create_with_steps(
+        self,
+        process: ScreeningProcess,
+        steps: list[ScreeningStepMixin],
+    ) -> ScreeningProcess:
+        """
+        Insert a screening process and its steps in a single statement.
+
+        Each step goes to its own table, so the steps are written as
+        data-modifying CTEs of the process INSERT ... RETURNING (foreign
+        keys are checked at the end of the statement). IDs are generated
+        client-side, and server defaults come back through RETURNING, so
+        no flush/refresh round trips are needed.
+
+        Args:
+            process: Transient screening process (with its ID set).
+            steps: Transient steps referencing process.id.
+
+        Returns:
+            The persisted ScreeningProcess (attached to the session).
+        """
+        step_ctes = [
+            insert(type(step))
+            .values(**self._insert_values(step))
+            .returning(type(step).id)
+            .cte(f"insert_{type(step).__tablename__}")
+            for step in steps
+        ]
+        stmt = (
+            insert(ScreeningProcess)
+            .values(**self._insert_values(process))
+            .returning(ScreeningProcess)
+            .add_cte(*step_ctes)
         )
+        result = await self.session.scalars(stmt)
+        return result.one()
 
     async def get_active_by_cpf(
         self,
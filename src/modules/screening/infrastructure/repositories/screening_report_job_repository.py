@@ -0,0 +1,192 @@
+"""ScreeningReportJob repository for database operations."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.screening.domain.models.enums import ReportJobStatus
+from src.modules.screening.domain.models.screening_report_job import (
+    ScreeningReportJob,
+)
+from src.shared.infrastructure.repositories import BaseRepository
+
+
+class ScreeningReportJobRepository(BaseRepository[ScreeningReportJob]):
+    """
+    Repository for ScreeningReportJob model.
+
+    Jobs are created idempotently per (process_id, version) and claimed
+    atomically by the worker, so duplicated requests or redelivered
+    messages never generate the same report twice concurrently.
+    """
+
+    model = ScreeningReportJob
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    def _base_query_for_process(
+        self,
+        process_id: UUID,
+    ) -> Select[tuple[ScreeningReportJob]]:
+        """
+        Get base query filtered by process.
+
+        Args:
+            process_id: The screening process UUID.
+
+        Returns:
+            Query filtered by process.
+        """
+        return select(ScreeningReportJob).where(
+            ScreeningReportJob.process_id == process_id
+        )
+
+    async def get_by_id_for_process(
+        self,
+        job_id: UUID,
+        process_id: UUID,
+    ) -> ScreeningReportJob | None:
+        """
+        Get job by ID for a specific process.
+
+        Args:
+            job_id: The job UUID.
+            process_id: The screening process UUID.
+
+        Returns:
+            ScreeningReportJob if found, None otherwise.
+        """
+        query = self._base_query_for_process(process_id).where(
+            ScreeningReportJob.id == job_id
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_latest_for_process(
+        self,
+        process_id: UUID,
+    ) -> ScreeningReportJob | None:
+        """
+        Get the job with the highest version for a process.
+
+        Args:
+            process_id: The screening process UUID.
+
+        Returns:
+            Latest ScreeningReportJob if any, None otherwise.
+        """
+        query = (
+            self._base_query_for_process(process_id)
+            .order_by(ScreeningReportJob.version.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def create_idempotent(
+        self,
+        job: ScreeningReportJob,
+    ) -> tuple[ScreeningReportJob, bool]:
+        """
+        Insert a job unless one already exists for (process_id, version).
+
+        Concurrent requests computing the same next version race on the
+        unique constraint; the loser gets the winner's job back.
+
+        Args:
+            job: Job to insert.
+
+        Returns:
+            Tuple of (job, created). When created is False, the returned
+            job is the existing one.
+        """
+        stmt = (
+            insert(ScreeningReportJob)
+            .values(**self._insert_values(job))
+            .on_conflict_do_nothing(
+                constraint="uq_screening_report_jobs_process_version"
+            )
+            .returning(ScreeningReportJob.id)
+        )
+        result = await self.session.execute(stmt)
+        created_id = result.scalar_one_or_none()
+
+        query = self._base_query_for_process(job.process_id).where(
+            ScreeningReportJob.version == job.version
+        )
+        existing = await self.session.execute(
+            query.execution_options(populate_existing=True)
+        )
+        return existing.scalar_one(), created_id is not None
+
+    async def claim(
+        self,
+        job_id: UUID,
+        stale_before: datetime,
+    ) -> ScreeningReportJob | None:
+        """
+        Atomically mark a job as running for the current attempt.
+
+        A job can be claimed when it is pending, or when it is running but
+        its attempt started before stale_before (the worker processing it
+        died without finishing).
+
+        Args:
+            job_id: The job UUID.
+            stale_before: Running attempts started before this are stale.
+
+        Returns:
+            The claimed job, or None if it is not claimable (already
+            running, completed, failed or missing).
+        """
+        stmt = (
+            update(ScreeningReportJob)
+            .where(
+                ScreeningReportJob.id == job_id,
+                or_(
+                    ScreeningReportJob.status == ReportJobStatus.PENDING,
+                    and_(
+                        ScreeningReportJob.status == ReportJobStatus.RUNNING,
+                        ScreeningReportJob.started_at < stale_before,
+                    ),
+                ),
+            )
+            .values(
+                status=ReportJobStatus.RUNNING,
+                attempts=ScreeningReportJob.attempts + 1,
+                started_at=func.now(),
+                updated_at=func.now(),
+            )
+            .returning(ScreeningReportJob)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def set_status(
+        self,
+        job_id: UUID,
+        status: ReportJobStatus,
+        **values: object,
+    ) -> None:
+        """
+        Set a job's status (and other columns) with a single UPDATE.
+
+        Used by the worker after rolling back a failed attempt, when the
+        job instance loaded in the session is expired.
+
+        Args:
+            job_id: The job UUID.
+            status: New status.
+            **values: Other columns to set (report_url, error, ...).
+        """
+        stmt = (
+            update(ScreeningReportJob)
+            .where(ScreeningReportJob.id == job_id)
+            .values(status=status, updated_at=func.now(), **values)
+        )
+        await self.session.execute(stmt)
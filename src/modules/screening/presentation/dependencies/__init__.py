@@ -5,10 +5,11 @@ from src.modules.screening.presentation.dependencies.screening import (
     CreateScreeningProcessUC,
     DeleteScreeningProcessUC,
     FinalizeScreeningProcessUC,
-    GenerateScreeningReportUC,
     GetScreeningProcessByTokenUC,
     GetScreeningProcessUC,
+    GetScreeningReportJobUC,
     ListScreeningProcessesUC,
+    RequestScreeningReportUC,
     ReuseDocumentUC,
     ReviewDocumentUC,
 )
@@ -20,7 +21,9 @@ from src.modules.screening.presentation.dependencies.screening_alert import (
 )
 from src.modules.screening.presentation.dependencies.screening_document import (
     ConfigureDocumentsUC,
+    ConfirmDocumentUploadUC,
     DeleteScreeningDocumentUC,
+    RequestDocumentUploadUrlUC,
     ReviewDocumentUC as ReviewDocumentStepUC,
     UploadDocumentUC,
 )
@@ -51,10 +54,11 @@ __all__ = [
     "CreateScreeningProcessUC",
     "DeleteScreeningProcessUC",
     "FinalizeScreeningProcessUC",
-    "GenerateScreeningReportUC",
     "GetScreeningProcessByTokenUC",
     "GetScreeningProcessUC",
+    "GetScreeningReportJobUC",
     "ListScreeningProcessesUC",
+    "RequestScreeningReportUC",
     "ReuseDocumentUC",
     "ReviewDocumentUC",
     # Alert dependencies
@@ -73,7 +77,9 @@ __all__ = [
     "GoBackToStepUC",
     # Document step dependencies
     "ConfigureDocumentsUC",
+    "ConfirmDocumentUploadUC",
     "DeleteScreeningDocumentUC",
+    "RequestDocumentUploadUrlUC",
     "ReviewDocumentStepUC",
     "UploadDocumentUC",
 ]
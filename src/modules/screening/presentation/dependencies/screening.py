@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from src.app.dependencies import SessionDep
+from src.app.dependencies import ReadSessionDep, SessionDep
 from src.modules.screening.use_cases import (
     CancelScreeningProcessUseCase,
     CreateScreeningProcessUseCase,
@@ -17,7 +17,8 @@ from src.modules.screening.use_cases import (
     ReviewDocumentUseCase,
 )
 from src.modules.screening.use_cases.screening_report import (
-    GenerateScreeningReportUseCase,
+    GetScreeningReportJobUseCase,
+    RequestScreeningReportUseCase,
 )
 
 # =============================================================================
@@ -52,7 +53,7 @@ def get_get_screening_process_by_token_use_case(
 
 
 def get_list_screening_processes_use_case(
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> ListScreeningProcessesUseCase:
     return ListScreeningProcessesUseCase(session)
 
@@ -114,13 +115,22 @@ ReviewDocumentUC = Annotated[
 ]
 
 
-# Report use case factory
-def get_generate_screening_report_use_case(
+# Report use case factories
+def get_request_screening_report_use_case(
     session: SessionDep,
-) -> GenerateScreeningReportUseCase:
-    return GenerateScreeningReportUseCase(session)
+) -> RequestScreeningReportUseCase:
+    return RequestScreeningReportUseCase(session)
+
 
+def get_get_screening_report_job_use_case(
+    session: SessionDep,
+) -> GetScreeningReportJobUseCase:
+    return GetScreeningReportJobUseCase(session)
 
-GenerateScreeningReportUC = Annotated[
-    GenerateScreeningReportUseCase, Depends(get_generate_screening_report_use_case)
+
+RequestScreeningReportUC = Annotated[
+    RequestScreeningReportUseCase, Depends(get_request_screening_report_use_case)
+]
+GetScreeningReportJobUC = Annotated[
+    GetScreeningReportJobUseCase, Depends(get_get_screening_report_job_use_case)
 ]
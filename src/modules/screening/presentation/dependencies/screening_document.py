@@ -10,7 +10,9 @@ from src.modules.screening.use_cases.screening_step.document_review import (
 )
 from src.modules.screening.use_cases.screening_step.document_upload import (
     ConfigureDocumentsUseCase,
+    ConfirmDocumentUploadUseCase,
     DeleteScreeningDocumentUseCase,
+    RequestDocumentUploadUrlUseCase,
     UploadDocumentUseCase,
 )
 
@@ -35,6 +37,22 @@ def get_upload_document_use_case(
     return UploadDocumentUseCase(session, settings)
 
 
+def get_request_document_upload_url_use_case(
+    session: SessionDep,
+    settings: SettingsDep,
+) -> RequestDocumentUploadUrlUseCase:
+    """Factory for RequestDocumentUploadUrlUseCase."""
+    return RequestDocumentUploadUrlUseCase(session, settings)
+
+
+def get_confirm_document_upload_use_case(
+    session: SessionDep,
+    settings: SettingsDep,
+) -> ConfirmDocumentUploadUseCase:
+    """Factory for ConfirmDocumentUploadUseCase."""
+    return ConfirmDocumentUploadUseCase(session, settings)
+
+
 def get_delete_screening_document_use_case(
     session: SessionDep,
     settings: SettingsDep,
@@ -69,6 +87,16 @@ UploadDocumentUC = Annotated[
     Depends(get_upload_document_use_case),
 ]
 
+RequestDocumentUploadUrlUC = Annotated[
+    RequestDocumentUploadUrlUseCase,
+    Depends(get_request_document_upload_url_use_case),
+]
+
+ConfirmDocumentUploadUC = Annotated[
+    ConfirmDocumentUploadUseCase,
+    Depends(get_confirm_document_upload_use_case),
+]
+
 DeleteScreeningDocumentUC = Annotated[
     DeleteScreeningDocumentUseCase,
     Depends(get_delete_screening_document_use_case),
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
 from src.app.constants.error_codes import ScreeningErrorCodes
 from src.app.dependencies import OrganizationContext
@@ -154,12 +154,24 @@ async def list_alerts(
     screening_id: UUID,
     ctx: OrganizationContext,
     use_case: ListScreeningAlertsUC,
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=100,
+        description="Tamanho da página (ativa paginação por cursor)",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Cursor retornado em next_cursor",
+    ),
 ) -> ScreeningAlertListResponse:
     """List all alerts for a screening process."""
     return await use_case.execute(
         organization_id=ctx.organization,
         process_id=screening_id,
         family_org_ids=ctx.family_org_ids,
+        limit=limit,
+        cursor=cursor,
     )
 
 
@@ -14,6 +14,9 @@ from src.app.dependencies import OrganizationContext
 from src.shared.domain.schemas import ErrorResponse
 from src.modules.screening.domain.schemas.screening_document import (
     ScreeningDocumentResponse,
+    ScreeningDocumentUploadConfirm,
+    ScreeningDocumentUploadUrlRequest,
+    ScreeningDocumentUploadUrlResponse,
 )
 from src.modules.screening.domain.schemas.steps import (
     ConfigureDocumentsRequest,
@@ -22,7 +25,9 @@ from src.modules.screening.domain.schemas.steps import (
 )
 from src.modules.screening.presentation.dependencies.screening_document import (
     ConfigureDocumentsUC,
+    ConfirmDocumentUploadUC,
     DeleteScreeningDocumentUC,
+    RequestDocumentUploadUrlUC,
     ReviewDocumentUC,
     UploadDocumentUC,
 )
@@ -161,6 +166,60 @@ async def upload_document(
     )
 
 
+@router.post(
+    "/{screening_id}/documents/{document_id}/upload-url",
+    response_model=ScreeningDocumentUploadUrlResponse,
+    summary="Gerar URL de upload direto",
+    description=(
+        "Gera uma URL assinada de curta duração para enviar o arquivo direto "
+        "ao Firebase Storage (PUT com os headers retornados), sem passar pela API. "
+        "Após o envio, confirme com POST .../upload/confirm informando o path."
+    ),
+)
+async def request_document_upload_url(
+    screening_id: UUID,
+    document_id: UUID,
+    data: ScreeningDocumentUploadUrlRequest,
+    ctx: OrganizationContext,
+    use_case: RequestDocumentUploadUrlUC,
+) -> ScreeningDocumentUploadUrlResponse:
+    """Issue a signed URL for a direct-to-storage upload."""
+    # Note: screening_id is used for authorization check in the future
+    _ = screening_id
+    return await use_case.execute(
+        screening_document_id=document_id,
+        data=data,
+    )
+
+
+@router.post(
+    "/{screening_id}/documents/{document_id}/upload/confirm",
+    response_model=ScreeningDocumentResponse,
+    summary="Confirmar upload direto",
+    description=(
+        "Confirma um arquivo enviado com a URL de upload direto. "
+        "Tamanho e tipo são lidos do objeto no Storage; arquivos inválidos são "
+        "removidos. Cria o ProfessionalDocument (is_pending=True) e o vincula "
+        "ao ScreeningDocument, como no upload via multipart."
+    ),
+)
+async def confirm_document_upload(
+    screening_id: UUID,
+    document_id: UUID,
+    data: ScreeningDocumentUploadConfirm,
+    ctx: OrganizationContext,
+    use_case: ConfirmDocumentUploadUC,
+) -> ScreeningDocumentResponse:
+    """Confirm a direct-to-storage upload."""
+    # Note: screening_id is used for authorization check in the future
+    _ = screening_id
+    return await use_case.execute(
+        screening_document_id=document_id,
+        data=data,
+        uploaded_by=ctx.user,
+    )
+
+
 @router.post(
     "/{screening_id}/documents/{document_id}/reuse",
     response_model=ScreeningDocumentResponse,
@@ -4,7 +4,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 from fastapi_restkit.filterset import filter_as_query
-from src.shared.domain.schemas import PaginatedResponse, PaginationParams
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+)
 from fastapi_restkit.sortingset import sorting_as_query
 
 from src.app.constants.error_codes import ScreeningErrorCodes
@@ -25,12 +29,13 @@ from src.modules.screening.presentation.dependencies import (
     CreateScreeningProcessUC,
     DeleteScreeningProcessUC,
     FinalizeScreeningProcessUC,
-    GenerateScreeningReportUC,
     GetScreeningProcessUC,
+    GetScreeningReportJobUC,
     ListScreeningProcessesUC,
+    RequestScreeningReportUC,
 )
 from src.modules.screening.domain.schemas.screening_report import (
-    ScreeningReportResponse,
+    ScreeningReportJobResponse,
 )
 from src.shared.domain.schemas import ErrorResponse
 
@@ -96,7 +101,7 @@ async def create_screening_process(
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[ScreeningProcessListResponse],
+    response_model=CursorPaginatedResponse[ScreeningProcessListResponse],
     summary="Listar triagens",
     description="""
 Lista todos os processos de triagem da organização.
@@ -112,17 +117,25 @@ Lista todos os processos de triagem da organização.
 - `id`: Ordena por ID (UUID v7 = ordem temporal)
 - `created_at`: Ordena por data de criação
 - `status`: Ordena por status
+
+**Paginação por cursor:**
+- `pagination_mode=cursor`: Ativa paginação por keyset (ordem pelo primeiro campo + id)
+- `cursor`: Valor de `next_cursor` da resposta anterior
+- `include_total=false`: Não calcula o total (mais rápido em tabelas grandes)
+
+**Total:** contagem limitada (`count_strategy=capped`); acima do limite,
+`total` é o próprio limite e `total_is_exact` é `false` ("1000+").
 """,
 )
 async def list_screening_processes(
     ctx: OrganizationContext,
     use_case: ListScreeningProcessesUC,
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     filters: ScreeningProcessFilter = Depends(filter_as_query(ScreeningProcessFilter)),
     sorting: ScreeningProcessSorting = Depends(
         sorting_as_query(ScreeningProcessSorting)
     ),
-) -> PaginatedResponse[ScreeningProcessListResponse]:
+) -> CursorPaginatedResponse[ScreeningProcessListResponse]:
     """List all screening processes for the organization."""
     return await use_case.execute(
         organization_id=ctx.organization,
@@ -130,6 +143,7 @@ async def list_screening_processes(
         family_org_ids=ctx.family_org_ids,
         filters=filters,
         sorting=sorting,
+        count_strategy=CountStrategy.CAPPED,
     )
 
 
@@ -363,11 +377,11 @@ async def finalize_screening_process(
 
 @router.post(
     "/{screening_id}/compliance-report",
-    response_model=ScreeningReportResponse,
-    status_code=status.HTTP_200_OK,
+    response_model=ScreeningReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Gerar relatório de compliance",
     description="""
-Gera um relatório PDF de compliance para uma triagem aprovada.
+Solicita a geração de um relatório PDF de compliance para uma triagem aprovada.
 
 O relatório contém:
 - Dados pessoais do profissional
@@ -375,9 +389,15 @@ O relatório contém:
 - Lista de documentos verificados com links de download
 - Histórico completo da triagem
 
-**Cache:**
-O PDF é gerado e armazenado no Firebase Storage. Chamadas subsequentes
-retornam a URL do PDF já gerado, a menos que `force=true`.
+**Geração assíncrona:**
+O PDF é gerado por um worker e armazenado no Firebase Storage. A resposta
+é a geração (job) do relatório; consulte
+`GET /{screening_id}/compliance-report/jobs/{job_id}` até o status ser
+`COMPLETED` (campo `url`) ou `FAILED` (campo `error`).
+
+**Deduplicação:**
+- Se já existe uma geração PENDING/RUNNING, ela é retornada
+- Se o relatório já foi gerado, a geração concluída é retornada, a menos que `force=true`
 
 **Regras:**
 - Só triagens com status APPROVED podem gerar relatório
@@ -425,7 +445,7 @@ retornam a URL do PDF já gerado, a menos que `force=true`.
                 "application/json": {
                     "examples": {
                         "generation_failed": {
-                            "summary": "Falha na geração do PDF",
+                            "summary": "Falha ao enfileirar a geração do PDF",
                             "value": {
                                 "code": ScreeningErrorCodes.SCREENING_REPORT_GENERATION_FAILED,
                                 "message": "Falha ao gerar o relatório de compliance",
@@ -440,13 +460,61 @@ retornam a URL do PDF já gerado, a menos que `force=true`.
 async def generate_compliance_report(
     screening_id: UUID,
     ctx: OrganizationContext,
-    use_case: GenerateScreeningReportUC,
+    use_case: RequestScreeningReportUC,
     force: bool = False,
-) -> ScreeningReportResponse:
-    """Generate a compliance report PDF for an approved screening."""
-    return await use_case.execute(
+) -> ScreeningReportJobResponse:
+    """Request a compliance report PDF for an approved screening."""
+    job = await use_case.execute(
         organization_id=ctx.organization,
         screening_id=screening_id,
+        requested_by=ctx.user,
         family_org_ids=ctx.family_org_ids,
         force=force,
     )
+    return ScreeningReportJobResponse.from_job(job)
+
+
+@router.get(
+    "/{screening_id}/compliance-report/jobs/{job_id}",
+    response_model=ScreeningReportJobResponse,
+    summary="Consultar geração do relatório de compliance",
+    description="""
+Retorna o status de uma geração de relatório de compliance
+(PENDING, RUNNING, COMPLETED ou FAILED).
+
+Quando `COMPLETED`, o campo `url` contém o link do PDF.
+""",
+    responses={
+        404: {
+            "model": ErrorResponse,
+            "description": "Não encontrado",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "not_found": {
+                            "summary": "Geração não encontrada",
+                            "value": {
+                                "code": ScreeningErrorCodes.SCREENING_REPORT_JOB_NOT_FOUND,
+                                "message": "Geração de relatório não encontrada",
+                            },
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def get_compliance_report_job(
+    screening_id: UUID,
+    job_id: UUID,
+    ctx: OrganizationContext,
+    use_case: GetScreeningReportJobUC,
+) -> ScreeningReportJobResponse:
+    """Get the status of a compliance report generation."""
+    job = await use_case.execute(
+        organization_id=ctx.organization,
+        screening_id=screening_id,
+        job_id=job_id,
+        family_org_ids=ctx.family_org_ids,
+    )
+    return ScreeningReportJobResponse.from_job(job)
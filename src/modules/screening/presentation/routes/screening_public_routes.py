@@ -8,10 +8,15 @@ from fastapi import APIRouter, File, Form, UploadFile
 
 from src.modules.screening.domain.schemas import (
     ScreeningDocumentResponse,
+    ScreeningDocumentUploadConfirm,
+    ScreeningDocumentUploadUrlRequest,
+    ScreeningDocumentUploadUrlResponse,
     ScreeningProcessDetailResponse,
 )
 from src.modules.screening.presentation.dependencies import (
+    ConfirmDocumentUploadUC,
     GetScreeningProcessByTokenUC,
+    RequestDocumentUploadUrlUC,
     UploadDocumentUC,
 )
 
@@ -69,3 +74,57 @@ async def upload_document_by_token(
         expires_at=expires_at,
         notes=notes,
     )
+
+
+@router.post(
+    "/{token}/documents/{document_id}/upload-url",
+    response_model=ScreeningDocumentUploadUrlResponse,
+    summary="Gerar URL de upload direto (público)",
+    description=(
+        "Gera uma URL assinada de curta duração para enviar o arquivo direto "
+        "ao Firebase Storage usando o token público. "
+        "Após o envio, confirme com POST .../upload/confirm informando o path."
+    ),
+)
+async def request_document_upload_url_by_token(
+    token: str,
+    document_id: UUID,
+    data: ScreeningDocumentUploadUrlRequest,
+    get_screening_use_case: GetScreeningProcessByTokenUC,
+    use_case: RequestDocumentUploadUrlUC,
+) -> ScreeningDocumentUploadUrlResponse:
+    """Issue a signed upload URL using public token."""
+    # Validate the token and get screening (ensures token is valid)
+    await get_screening_use_case.execute(token=token)
+
+    return await use_case.execute(
+        screening_document_id=document_id,
+        data=data,
+    )
+
+
+@router.post(
+    "/{token}/documents/{document_id}/upload/confirm",
+    response_model=ScreeningDocumentResponse,
+    summary="Confirmar upload direto (público)",
+    description=(
+        "Confirma um arquivo enviado com a URL de upload direto usando o token público. "
+        "Tamanho e tipo são lidos do objeto no Storage; arquivos inválidos são removidos."
+    ),
+)
+async def confirm_document_upload_by_token(
+    token: str,
+    document_id: UUID,
+    data: ScreeningDocumentUploadConfirm,
+    get_screening_use_case: GetScreeningProcessByTokenUC,
+    use_case: ConfirmDocumentUploadUC,
+) -> ScreeningDocumentResponse:
+    """Confirm a direct upload using public token."""
+    # Validate the token and get screening (ensures token is valid)
+    await get_screening_use_case.execute(token=token)
+
+    return await use_case.execute(
+        screening_document_id=document_id,
+        data=data,
+        uploaded_by=None,  # No authenticated user
+    )
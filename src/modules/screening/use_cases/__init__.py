@@ -27,9 +27,11 @@ from src.modules.screening.use_cases.screening_step import (
     CompleteDocumentReviewStepUseCase,
     CompleteDocumentUploadStepUseCase,
     CompleteSimpleStepUseCase,
+    ConfirmDocumentUploadUseCase,
     ConfigureDocumentsUseCase,
     DeleteScreeningDocumentUseCase,
     GoBackToStepUseCase,
+    RequestDocumentUploadUrlUseCase,
     ReuseDocumentUseCase,
     ReviewDocumentUseCase,
     UploadDocumentUseCase,
@@ -67,9 +69,11 @@ __all__ = [
     "CompleteDocumentReviewStepUseCase",
     "CompleteDocumentUploadStepUseCase",
     "CompleteSimpleStepUseCase",
+    "ConfirmDocumentUploadUseCase",
     "ConfigureDocumentsUseCase",
     "DeleteScreeningDocumentUseCase",
     "GoBackToStepUseCase",
+    "RequestDocumentUploadUrlUseCase",
     "ReuseDocumentUseCase",
     "ReviewDocumentUseCase",
     "UploadDocumentUseCase",
@@ -15,6 +15,9 @@ from src.modules.screening.infrastructure.repositories import (
 )
 
 
+DEFAULT_ALERTS_PAGE_SIZE = 20
+
+
 class ListScreeningAlertsUseCase:
     """
     List alerts for a screening process.
@@ -32,6 +35,8 @@ class ListScreeningAlertsUseCase:
         organization_id: UUID,
         process_id: UUID,
         family_org_ids: tuple[UUID, ...] | list[UUID] | None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> ScreeningAlertListResponse:
         """
         Execute the list alerts use case.
@@ -40,12 +45,15 @@ class ListScreeningAlertsUseCase:
             organization_id: The organization UUID.
             process_id: The screening process UUID.
             family_org_ids: Organization family IDs for scope validation.
+            limit: Optional page size. When set, alerts are paginated by cursor.
+            cursor: Cursor from a previous page (`next_cursor`).
 
         Returns:
             List response with alerts and counts.
 
         Raises:
             ScreeningProcessNotFoundError: If process not found.
+            ValidationError: If the cursor is invalid.
         """
         # Validate process exists
         process = await self.process_repo.get_by_id_for_organization(
@@ -56,8 +64,16 @@ class ListScreeningAlertsUseCase:
         if not process:
             raise ScreeningProcessNotFoundError(screening_id=str(process_id))
 
-        # Get alerts
-        alerts = await self.alert_repo.list_for_process(process_id)
+        # Get alerts (keyset page when limit/cursor is given)
+        next_cursor = None
+        if limit is not None or cursor:
+            alerts, next_cursor = await self.alert_repo.list_page_for_process(
+                process_id,
+                limit=limit or DEFAULT_ALERTS_PAGE_SIZE,
+                cursor=cursor,
+            )
+        else:
+            alerts = await self.alert_repo.list_for_process(process_id)
 
         # Get counts
         total_count, pending_count = await self.alert_repo.count_for_process(process_id)
@@ -66,4 +82,5 @@ class ListScreeningAlertsUseCase:
             alerts=[ScreeningAlertResponse.model_validate(a) for a in alerts],
             total_count=total_count,
             pending_count=pending_count,
+            next_cursor=next_cursor,
         )
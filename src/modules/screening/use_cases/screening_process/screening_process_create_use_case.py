@@ -36,6 +36,7 @@ from src.modules.screening.domain.models.steps import (
     DocumentUploadStep,
     PaymentInfoStep,
     ProfessionalDataStep,
+    ScreeningStepMixin,
 )
 from src.modules.screening.domain.schemas import (
     ScreeningProcessCreate,
@@ -45,15 +46,10 @@ from src.modules.screening.domain.schemas.screening_process import (
     OrganizationProfessionalSummary,
 )
 from src.modules.screening.infrastructure.repositories import (
-    ClientValidationStepRepository,
-    ConversationStepRepository,
-    DocumentReviewStepRepository,
-    DocumentUploadStepRepository,
     OrganizationScreeningSettingsRepository,
-    PaymentInfoStepRepository,
-    ProfessionalDataStepRepository,
     ScreeningProcessRepository,
 )
+from src.modules.users.domain.models import User
 from src.modules.users.domain.schemas.organization_user import UserInfo
 from src.modules.users.infrastructure.repositories import UserRepository
 from src.shared.infrastructure.repositories.specialty_repository import (
@@ -94,13 +90,6 @@ class CreateScreeningProcessUseCase:
         self.professional_repository = OrganizationProfessionalRepository(session)
         self.user_repository = UserRepository(session)
         self.specialty_repository = SpecialtyRepository(session)
-        # Step repositories
-        self.conversation_step_repo = ConversationStepRepository(session)
-        self.professional_data_step_repo = ProfessionalDataStepRepository(session)
-        self.document_upload_step_repo = DocumentUploadStepRepository(session)
-        self.document_review_step_repo = DocumentReviewStepRepository(session)
-        self.payment_info_step_repo = PaymentInfoStepRepository(session)
-        self.client_validation_step_repo = ClientValidationStepRepository(session)
 
     async def execute(
         self,
@@ -175,57 +164,44 @@ class CreateScreeningProcessUseCase:
             access_token=access_token,
             token_expires_at=token_expires_at,
         )
-        process = await self.repository.create(process)
-        await self.session.flush()
-
-        # Create steps based on configuration
-        await self._create_steps(
+        # Process and steps in one INSERT ... RETURNING round trip
+        steps = self._build_steps(
             process=process,
             include_payment_info=include_payment_info,
             include_client_validation=include_client_validation,
         )
+        process = await self.repository.create_with_steps(process, steps)
 
-        await self.session.flush()
-        await self.session.refresh(process)
-
-        # Re-fetch with all related data for complete response
-        process_with_details = await self.repository.get_by_id_with_details(
-            id=process.id,
-            organization_id=organization_id,
-            family_org_ids=family_org_ids,
+        # The response is built from in-memory objects; only the users and
+        # the specialty are fetched (users in a single query)
+        users = await self.user_repository.get_by_ids(
+            {user_id for user_id in (created_by, process.supervisor_id) if user_id}
         )
 
         professional_summary: OrganizationProfessionalSummary | None = None
-        if process_with_details and process_with_details.organization_professional:
+        if existing_professional:
             professional_summary = OrganizationProfessionalSummary.model_validate(
-                process_with_details.organization_professional
+                existing_professional
             )
 
-        response = ScreeningProcessDetailResponse.model_validate(process_with_details)
-        if process_with_details:
-            response = response.model_copy(
-                update={"step_info": process_with_details.step_info}
-            )
+        response = ScreeningProcessDetailResponse.model_validate(process)
         return response.model_copy(
             update={
+                "step_info": process.step_info,
                 "professional": professional_summary,
                 "expected_specialty": await self._get_specialty_summary(
-                    process_with_details.expected_specialty_id
-                    if process_with_details
-                    else None
-                ),
-                "owner": await self._get_user_summary(created_by),
-                "current_actor": await self._get_user_summary(created_by),
-                "supervisor": await self._get_user_summary(
-                    process_with_details.supervisor_id if process_with_details else None
+                    process.expected_specialty_id
                 ),
+                "owner": self._get_user_summary(users, created_by),
+                "current_actor": self._get_user_summary(users, created_by),
+                "supervisor": self._get_user_summary(users, process.supervisor_id),
             }
         )
 
-    async def _get_user_summary(self, user_id: UUID | None) -> UserInfo | None:
-        if user_id is None:
-            return None
-        user = await self.user_repository.get_by_id(user_id)
+    def _get_user_summary(
+        self, users: dict[UUID, User], user_id: UUID | None
+    ) -> UserInfo | None:
+        user = users.get(user_id) if user_id else None
         if user is None:
             return None
         return UserInfo.model_validate(user)
@@ -374,79 +350,46 @@ class CreateScreeningProcessUseCase:
             }
         return step_info
 
-    async def _create_steps(
+    def _build_steps(
         self,
         process: ScreeningProcess,
         include_payment_info: bool = True,
         include_client_validation: bool = False,
-    ) -> None:
+    ) -> list[ScreeningStepMixin]:
         """
-        Create process steps based on configuration.
+        Build process steps based on configuration.
 
         Fixed order (6 possible steps):
-        1. CONVERSATION (required) - Initial phone call
+        1. CONVERSATION (required) - Initial phone call (starts IN_PROGRESS)
         2. PROFESSIONAL_DATA (required) - Personal + qualification + specialties
         3. DOCUMENT_UPLOAD (required) - Upload documents
         4. DOCUMENT_REVIEW (required) - Review documents
         5. PAYMENT_INFO (optional) - Bank account + company
         6. CLIENT_VALIDATION (optional) - Client approval
         """
-        current_order = 1
-
-        # 1. Conversation (required) - starts IN_PROGRESS
-        conversation_step = ConversationStep(
-            process_id=process.id,
-            order=current_order,
-            status=StepStatus.IN_PROGRESS,
-        )
-        await self.conversation_step_repo.create(conversation_step)
-        current_order += 1
-
-        # 2. Professional Data (required)
-        professional_data_step = ProfessionalDataStep(
-            process_id=process.id,
-            order=current_order,
-            status=StepStatus.PENDING,
-        )
-        await self.professional_data_step_repo.create(professional_data_step)
-        current_order += 1
-
-        # 3. Document Upload (required)
-        document_upload_step = DocumentUploadStep(
-            process_id=process.id,
-            order=current_order,
-            status=StepStatus.PENDING,
-        )
-        await self.document_upload_step_repo.create(document_upload_step)
-        current_order += 1
-
-        # 4. Document Review (required)
-        document_review_step = DocumentReviewStep(
-            process_id=process.id,
-            order=current_order,
-            status=StepStatus.PENDING,
-        )
-        await self.document_review_step_repo.create(document_review_step)
-        current_order += 1
-
-        # 5. Payment Info (optional)
+        step_models: list[type[ScreeningStepMixin]] = [
+            ConversationStep,
+            ProfessionalDataStep,
+            DocumentUploadStep,
+            DocumentReviewStep,
+        ]
         if include_payment_info:
-            payment_info_step = PaymentInfoStep(
-                process_id=process.id,
-                order=current_order,
-                status=StepStatus.PENDING,
-            )
-            await self.payment_info_step_repo.create(payment_info_step)
-            current_order += 1
-
-        # 6. Client Validation (optional)
+            step_models.append(PaymentInfoStep)
         if include_client_validation:
-            client_validation_step = ClientValidationStep(
+            step_models.append(ClientValidationStep)
+
+        return [
+            step_model(
                 process_id=process.id,
-                order=current_order,
-                status=StepStatus.PENDING,
+                order=order,
+                status=(
+                    StepStatus.IN_PROGRESS
+                    if step_model is ConversationStep
+                    else StepStatus.PENDING
+                ),
             )
-            await self.client_validation_step_repo.create(client_validation_step)
+            for order, step_model in enumerate(step_models, start=1)
+        ]
 
     def _generate_access_token(self) -> str:
         """Generate a secure access token for professional self-service."""
@@ -20,7 +20,11 @@ from src.modules.screening.infrastructure.filters import (
 from src.modules.screening.infrastructure.repositories import ScreeningProcessRepository
 from src.modules.users.domain.schemas.organization_user import UserInfo
 from src.modules.users.infrastructure.repositories import UserRepository
-from src.shared.domain.schemas import PaginatedResponse, PaginationParams
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+)
 from src.shared.infrastructure.repositories.specialty_repository import (
     SpecialtyRepository,
 )
@@ -56,20 +60,22 @@ class ListScreeningProcessesUseCase:
     async def execute(
         self,
         organization_id: UUID,
-        pagination: PaginationParams,
+        pagination: CursorPaginationParams,
         family_org_ids: tuple[UUID, ...] | list[UUID] | None,
         filters: ScreeningProcessFilter | None = None,
         sorting: ScreeningProcessSorting | None = None,
-    ) -> PaginatedResponse[ScreeningProcessListResponse]:
+        count_strategy: CountStrategy | None = None,
+    ) -> CursorPaginatedResponse[ScreeningProcessListResponse]:
         """
         List screening processes with pagination.
 
         Args:
             organization_id: The organization ID.
-            pagination: Pagination parameters.
+            pagination: Pagination parameters (offset or cursor mode).
             family_org_ids: Organization family IDs for scope validation.
             filters: Optional filter parameters.
             sorting: Optional sorting parameters.
+            count_strategy: How to compute the total (EXACT if None).
 
         Returns:
             Paginated list of screening processes.
@@ -80,6 +86,7 @@ class ListScreeningProcessesUseCase:
             family_org_ids=family_org_ids,
             filters=filters,
             sorting=sorting,
+            count_strategy=count_strategy,
         )
 
         # Collect all unique IDs for batch loading
@@ -147,12 +154,7 @@ class ListScreeningProcessesUseCase:
                 }
             )
             items.append(response)
-        return PaginatedResponse[ScreeningProcessListResponse](
+        return CursorPaginatedResponse[ScreeningProcessListResponse](
             items=items,
-            total=result.total,
-            page=result.page,
-            page_size=result.page_size,
-            total_pages=result.total_pages,
-            has_next=result.has_next,
-            has_previous=result.has_previous,
+            **result.model_dump(exclude={"items"}),
         )
@@ -3,5 +3,23 @@
 from src.modules.screening.use_cases.screening_report.generate_screening_report_use_case import (
     GenerateScreeningReportUseCase,
 )
+from src.modules.screening.use_cases.screening_report.get_screening_report_job_use_case import (
+    GetScreeningReportJobUseCase,
+)
+from src.modules.screening.use_cases.screening_report.process_screening_report_job_use_case import (
+    ProcessScreeningReportJobUseCase,
+)
+from src.modules.screening.use_cases.screening_report.report_context_builder import (
+    ScreeningReportContextBuilder,
+)
+from src.modules.screening.use_cases.screening_report.request_screening_report_use_case import (
+    RequestScreeningReportUseCase,
+)
 
-__all__ = ["GenerateScreeningReportUseCase"]
+__all__ = [
+    "GenerateScreeningReportUseCase",
+    "GetScreeningReportJobUseCase",
+    "ProcessScreeningReportJobUseCase",
+    "RequestScreeningReportUseCase",
+    "ScreeningReportContextBuilder",
+]
@@ -0,0 +1,63 @@
+"""Get screening compliance report job use case."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.exceptions import (
+    ScreeningProcessNotFoundError,
+    ScreeningReportJobNotFoundError,
+)
+from src.modules.screening.domain.models import ScreeningReportJob
+from src.modules.screening.infrastructure.repositories import (
+    ScreeningProcessRepository,
+    ScreeningReportJobRepository,
+)
+
+
+class GetScreeningReportJobUseCase:
+    """Get the status of a compliance report job (for polling)."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.process_repository = ScreeningProcessRepository(session)
+        self.job_repository = ScreeningReportJobRepository(session)
+
+    async def execute(
+        self,
+        organization_id: UUID,
+        screening_id: UUID,
+        job_id: UUID,
+        family_org_ids: tuple[UUID, ...] | list[UUID] | None,
+    ) -> ScreeningReportJob:
+        """
+        Get a report job of a screening.
+
+        Args:
+            organization_id: The organization ID.
+            screening_id: The screening process ID.
+            job_id: The report job ID.
+            family_org_ids: Organization family IDs for scope validation.
+
+        Returns:
+            The report job.
+
+        Raises:
+            ScreeningProcessNotFoundError: If screening not found.
+            ScreeningReportJobNotFoundError: If job not found for the screening.
+        """
+        process = await self.process_repository.get_by_id_for_organization(
+            id=screening_id,
+            organization_id=organization_id,
+            family_org_ids=family_org_ids,
+        )
+
+        if not process:
+            raise ScreeningProcessNotFoundError(screening_id=str(screening_id))
+
+        job = await self.job_repository.get_by_id_for_process(job_id, process.id)
+
+        if not job:
+            raise ScreeningReportJobNotFoundError(job_id=str(job_id))
+
+        return job
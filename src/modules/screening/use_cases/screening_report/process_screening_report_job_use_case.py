@@ -0,0 +1,124 @@
+"""
+Process screening compliance report job use case.
+
+Runs in the worker: claims a report job, generates the PDF with
+GenerateScreeningReportUseCase and records the outcome on the job.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.dependencies.settings import get_settings
+from src.app.exceptions import (
+    ScreeningNotApprovedError,
+    ScreeningProcessNotFoundError,
+)
+from src.app.logging import get_logger
+from src.modules.screening.domain.models import ReportJobStatus
+from src.modules.screening.infrastructure.repositories import (
+    ScreeningReportJobRepository,
+)
+from src.modules.screening.use_cases.screening_report.generate_screening_report_use_case import (
+    GenerateScreeningReportUseCase,
+)
+
+
+logger = get_logger(__name__)
+
+
+class ProcessScreeningReportJobUseCase:
+    """Generate the compliance report of a queued job."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.settings = get_settings()
+        self.job_repository = ScreeningReportJobRepository(session)
+        self.generate_use_case = GenerateScreeningReportUseCase(session)
+
+    async def _fail(self, job_id: UUID, error: str) -> None:
+        """Mark a job as permanently failed."""
+        await self.job_repository.set_status(
+            job_id,
+            ReportJobStatus.FAILED,
+            error=error[:2000],
+            completed_at=datetime.now(timezone.utc),
+        )
+        await self.session.commit()
+
+    async def execute(self, job_id: UUID) -> int | None:
+        """
+        Process a report job.
+
+        The job is claimed atomically, so duplicated or redelivered
+        messages for a job that is already running (and not stale),
+        completed or failed are ignored.
+
+        Args:
+            job_id: The report job ID.
+
+        Returns:
+            Seconds to wait before retrying the job, or None when there is
+            nothing left to do (completed, failed permanently or skipped).
+        """
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            seconds=self.settings.SCREENING_REPORT_JOB_TIMEOUT
+        )
+        job = await self.job_repository.claim(job_id, stale_before)
+
+        if job is None:
+            logger.info("screening_report_job_skipped", job_id=str(job_id))
+            return None
+
+        await self.session.commit()
+        attempts = job.attempts
+        log = logger.bind(
+            job_id=str(job_id),
+            screening_id=str(job.process_id),
+            version=job.version,
+            attempt=attempts,
+        )
+
+        try:
+            report = await self.generate_use_case.execute(
+                organization_id=job.organization_id,
+                screening_id=job.process_id,
+                family_org_ids=None,
+                force=True,
+            )
+        except (ScreeningProcessNotFoundError, ScreeningNotApprovedError) as e:
+            # Not retryable: the screening changed after the job was queued
+            await self.session.rollback()
+            await self._fail(job_id, e.message)
+            log.warning("screening_report_job_rejected", error=e.message)
+            return None
+        except Exception as e:
+            await self.session.rollback()
+
+            if attempts >= self.settings.SCREENING_REPORT_JOB_MAX_ATTEMPTS:
+                await self._fail(job_id, str(e))
+                log.error("screening_report_job_failed", error=str(e))
+                return None
+
+            await self.job_repository.set_status(
+                job_id,
+                ReportJobStatus.PENDING,
+                error=str(e)[:2000],
+            )
+            await self.session.commit()
+
+            delay = self.settings.SCREENING_REPORT_JOB_RETRY_BACKOFF * 2 ** (attempts - 1)
+            log.warning("screening_report_job_retry", error=str(e), delay=delay)
+            return delay
+
+        await self.job_repository.set_status(
+            job_id,
+            ReportJobStatus.COMPLETED,
+            report_url=report.url,
+            error=None,
+            completed_at=datetime.now(timezone.utc),
+        )
+        await self.session.commit()
+        log.info("screening_report_job_completed")
+        return None
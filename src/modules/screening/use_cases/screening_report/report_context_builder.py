@@ -0,0 +1,411 @@
+"""
+Compliance report context builder.
+
+Builds the ScreeningReportContext for a screening process with a fixed
+number of queries: the process graph is loaded by
+ScreeningProcessRepository.get_by_id_for_report, then every referenced
+user and specialty is collected and resolved in one bulk query each.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.screening.domain.models import ScreeningProcess
+from src.modules.screening.domain.models.enums import (
+    ScreeningDocumentStatus,
+    StepType,
+    STEP_TYPE_METADATA,
+)
+from src.modules.screening.domain.schemas.screening_report import (
+    DocumentData,
+    EducationData,
+    QualificationData,
+    ScreeningReportContext,
+    SpecialtyData,
+    StepHistoryData,
+)
+from src.modules.users.infrastructure.repositories import UserRepository
+from src.shared.infrastructure.pdf import PDFGeneratorService
+from src.shared.infrastructure.repositories.specialty_repository import (
+    SpecialtyRepository,
+)
+
+
+# Label mappings for enums
+PROFESSIONAL_TYPE_LABELS: dict[str, str] = {
+    "DOCTOR": "Médico",
+    "NURSE": "Enfermeiro(a)",
+    "NURSING_TECH": "Técnico(a) de Enfermagem",
+    "PHARMACIST": "Farmacêutico(a)",
+    "DENTIST": "Dentista",
+    "PHYSIOTHERAPIST": "Fisioterapeuta",
+    "PSYCHOLOGIST": "Psicólogo(a)",
+    "NUTRITIONIST": "Nutricionista",
+    "BIOMEDIC": "Biomédico(a)",
+}
+
+GENDER_LABELS: dict[str, str] = {
+    "MALE": "Masculino",
+    "FEMALE": "Feminino",
+}
+
+EDUCATION_LEVEL_LABELS: dict[str, str] = {
+    "TECHNICAL": "Técnico",
+    "UNDERGRADUATE": "Graduação",
+    "SPECIALIZATION": "Especialização",
+    "MASTERS": "Mestrado",
+    "DOCTORATE": "Doutorado",
+    "POSTDOC": "Pós-doutorado",
+    "COURSE": "Curso",
+    "FELLOWSHIP": "Fellowship",
+}
+
+RESIDENCY_STATUS_LABELS: dict[str, str] = {
+    "R1": "R1 (1º ano)",
+    "R2": "R2 (2º ano)",
+    "R3": "R3 (3º ano)",
+    "R4": "R4 (4º ano)",
+    "R5": "R5 (5º ano)",
+    "R6": "R6 (6º ano)",
+    "COMPLETED": "Concluída",
+}
+
+STEP_STATUS_LABELS: dict[str, str] = {
+    "PENDING": "Pendente",
+    "IN_PROGRESS": "Em Andamento",
+    "COMPLETED": "Concluído",
+    "APPROVED": "Aprovado",
+    "REJECTED": "Rejeitado",
+    "SKIPPED": "Ignorado",
+    "CANCELLED": "Cancelado",
+    "CORRECTION_NEEDED": "Correção Necessária",
+}
+
+DOCUMENT_STATUS_LABELS: dict[str, str] = {
+    "PENDING_UPLOAD": "Pendente Upload",
+    "PENDING_REVIEW": "Pendente Revisão",
+    "APPROVED": "Aprovado",
+    "CORRECTION_NEEDED": "Correção Necessária",
+    "SKIPPED": "Ignorado",
+    "REUSED": "Reutilizado",
+}
+
+
+@dataclass
+class ReportReferences:
+    """IDs referenced by a screening report, resolved in bulk."""
+
+    user_ids: set[UUID] = field(default_factory=set)
+    specialty_ids: set[UUID] = field(default_factory=set)
+    user_names: dict[UUID, str] = field(default_factory=dict)
+    specialty_names: dict[UUID, str] = field(default_factory=dict)
+
+    def add_user(self, user_id: UUID | str | None) -> None:
+        """Collect a user ID (review history stores them as strings)."""
+        if user_id:
+            self.user_ids.add(UUID(str(user_id)))
+
+    def user_name(self, user_id: UUID | str | None) -> str | None:
+        """Get a resolved user's full name."""
+        if not user_id:
+            return None
+        return self.user_names.get(UUID(str(user_id)))
+
+
+class ScreeningReportContextBuilder:
+    """
+    Build the compliance report context for a screening process.
+
+    Expects a process loaded with ScreeningProcessRepository.get_by_id_for_report.
+    Building happens in three phases:
+    1. Collect every user ID (owner, finalizer, document uploaders and
+       reviewers, step completers) and the expected specialty ID
+    2. Resolve them with one query per table
+    3. Assemble the context from memory
+    """
+
+    def __init__(self, session: AsyncSession, pdf_service: PDFGeneratorService) -> None:
+        self.user_repository = UserRepository(session)
+        self.specialty_repository = SpecialtyRepository(session)
+        self.pdf_service = pdf_service
+
+    async def build(self, process: ScreeningProcess) -> ScreeningReportContext:
+        """
+        Build the full report context from screening data.
+
+        Args:
+            process: Screening process with report relationships loaded.
+
+        Returns:
+            ScreeningReportContext ready to render.
+        """
+        refs = self._collect_references(process)
+        await self._resolve_references(refs)
+        return self._build_context(process, refs)
+
+    def _collect_references(self, process: ScreeningProcess) -> ReportReferences:
+        """Collect every user and specialty ID the report displays."""
+        refs = ReportReferences()
+
+        refs.add_user(process.owner_id)
+        refs.add_user(process.updated_by)
+
+        if process.expected_specialty_id:
+            refs.specialty_ids.add(process.expected_specialty_id)
+
+        if process.document_upload_step:
+            for doc in process.document_upload_step.documents:
+                refs.add_user(doc.created_by)
+                if doc.review_history:
+                    refs.add_user(doc.review_history[-1].get("user_id"))
+
+        for step in self._steps_by_type(process).values():
+            if step is not None:
+                refs.add_user(step.completed_by)
+
+        return refs
+
+    async def _resolve_references(self, refs: ReportReferences) -> None:
+        """Resolve collected IDs with one bulk query per table."""
+        refs.user_names = await self.user_repository.get_names_by_ids(refs.user_ids)
+
+        specialties = await self.specialty_repository.get_by_ids(
+            list(refs.specialty_ids)
+        )
+        refs.specialty_names = {specialty.id: specialty.name for specialty in specialties}
+
+    @staticmethod
+    def _steps_by_type(process: ScreeningProcess) -> dict:
+        """Map step types to their step objects."""
+        return {
+            StepType.CONVERSATION: process.conversation_step,
+            StepType.PROFESSIONAL_DATA: process.professional_data_step,
+            StepType.DOCUMENT_UPLOAD: process.document_upload_step,
+            StepType.DOCUMENT_REVIEW: process.document_review_step,
+            StepType.PAYMENT_INFO: process.payment_info_step,
+            StepType.CLIENT_VALIDATION: process.client_validation_step,
+        }
+
+    def _build_qualification_data(
+        self,
+        process: ScreeningProcess,
+    ) -> QualificationData | None:
+        """Build qualification data for the expected professional type."""
+        if not process.organization_professional:
+            return None
+
+        professional = process.organization_professional
+        expected_type = process.expected_professional_type
+
+        # Find the qualification matching the expected professional type
+        for qual in professional.qualifications:
+            if qual.professional_type.value == expected_type:
+                return QualificationData(
+                    professional_type=qual.professional_type.value,
+                    professional_type_label=PROFESSIONAL_TYPE_LABELS.get(
+                        qual.professional_type.value, qual.professional_type.value
+                    ),
+                    council_type=qual.council_type.value,
+                    council_number=qual.council_number,
+                    council_state=qual.council_state,
+                    graduation_year=qual.graduation_year,
+                )
+
+        return None
+
+    def _build_specialty_data(
+        self,
+        process: ScreeningProcess,
+        refs: ReportReferences,
+    ) -> SpecialtyData | None:
+        """Build specialty data for the expected specialty."""
+        if not process.expected_specialty_id:
+            return None
+
+        if not process.organization_professional:
+            return None
+
+        professional = process.organization_professional
+
+        # Get the specialty name from reference data
+        specialty_name = refs.specialty_names.get(process.expected_specialty_id)
+        if not specialty_name:
+            return None
+
+        # Find the professional's specialty matching the expected one
+        for qual in professional.qualifications:
+            for spec in qual.specialties:
+                if spec.specialty_id == process.expected_specialty_id:
+                    return SpecialtyData(
+                        name=specialty_name,
+                        rqe_number=spec.rqe_number,
+                        rqe_state=spec.rqe_state,
+                        residency_status=spec.residency_status.value if spec.residency_status else None,
+                        residency_status_label=RESIDENCY_STATUS_LABELS.get(
+                            spec.residency_status.value, None
+                        ) if spec.residency_status else None,
+                        residency_institution=spec.residency_institution,
+                    )
+
+        # If not found in qualifications, just return the specialty name
+        return SpecialtyData(name=specialty_name)
+
+    def _build_educations_data(
+        self,
+        process: ScreeningProcess,
+    ) -> list[EducationData]:
+        """Build education data list."""
+        if not process.organization_professional:
+            return []
+
+        professional = process.organization_professional
+        educations = []
+
+        for qual in professional.qualifications:
+            for edu in qual.educations:
+                educations.append(
+                    EducationData(
+                        level=edu.level.value,
+                        level_label=EDUCATION_LEVEL_LABELS.get(
+                            edu.level.value, edu.level.value
+                        ),
+                        course_name=edu.course_name,
+                        institution=edu.institution,
+                        start_year=edu.start_year,
+                        end_year=edu.end_year,
+                        is_completed=edu.is_completed or False,
+                    )
+                )
+
+        return educations
+
+    def _build_documents_data(
+        self,
+        process: ScreeningProcess,
+        refs: ReportReferences,
+    ) -> list[DocumentData]:
+        """Build documents data list."""
+        documents = []
+
+        if not process.document_upload_step:
+            return documents
+
+        for doc in process.document_upload_step.documents:
+            reviewed_by_name = None
+            if doc.review_history:
+                # Get the last review action
+                reviewed_by_name = refs.user_name(doc.review_history[-1].get("user_id"))
+
+            # Get download URL from professional document if uploaded
+            download_url = None
+            if doc.professional_document_id and doc.professional_document:
+                download_url = doc.professional_document.file_url
+
+            documents.append(
+                DocumentData(
+                    document_type_name=doc.document_type.name if doc.document_type else "Documento",
+                    status=doc.status.value,
+                    status_label=DOCUMENT_STATUS_LABELS.get(
+                        doc.status.value, doc.status.value
+                    ),
+                    uploaded_at=doc.professional_document.created_at if doc.professional_document else None,
+                    uploaded_by_name=refs.user_name(doc.created_by),
+                    reviewed_at=doc.updated_at if doc.status in [ScreeningDocumentStatus.APPROVED, ScreeningDocumentStatus.CORRECTION_NEEDED] else None,
+                    reviewed_by_name=reviewed_by_name,
+                    download_url=download_url,
+                )
+            )
+
+        return documents
+
+    def _build_steps_history(
+        self,
+        process: ScreeningProcess,
+        refs: ReportReferences,
+    ) -> list[StepHistoryData]:
+        """Build step history data list."""
+        steps = []
+        step_map = self._steps_by_type(process)
+
+        for step_type in StepType:
+            step = step_map.get(step_type)
+            if step is None:
+                continue
+
+            metadata = STEP_TYPE_METADATA.get(step_type, {})
+            steps.append(
+                StepHistoryData(
+                    step_type=step_type.value,
+                    step_label=metadata.get("title", step_type.value),
+                    status=step.status.value,
+                    status_label=STEP_STATUS_LABELS.get(
+                        step.status.value, step.status.value
+                    ),
+                    completed_at=step.completed_at,
+                    completed_by_name=refs.user_name(step.completed_by),
+                )
+            )
+
+        return steps
+
+    def _build_context(
+        self,
+        process: ScreeningProcess,
+        refs: ReportReferences,
+    ) -> ScreeningReportContext:
+        """Assemble the report context from loaded data and resolved references."""
+        professional = process.organization_professional
+
+        # Build address string
+        address_parts = []
+        if professional:
+            if professional.street:
+                addr = professional.street
+                if professional.number:
+                    addr += f", {professional.number}"
+                if professional.complement:
+                    addr += f" - {professional.complement}"
+                address_parts.append(addr)
+            if professional.neighborhood:
+                address_parts.append(professional.neighborhood)
+
+        address = ", ".join(address_parts) if address_parts else None
+
+        return ScreeningReportContext(
+            # Header
+            screening_id=process.id,
+            generated_at=datetime.now(timezone.utc),
+            logo_base64=self.pdf_service.get_logo_base64(),
+            placeholder_base64=self.pdf_service.get_placeholder_base64(),
+            # Personal Data
+            professional_photo_base64=None,  # TODO: Fetch from storage if available
+            professional_name=professional.full_name if professional else process.professional_name or "Não informado",
+            professional_cpf=professional.cpf if professional else process.professional_cpf or "",
+            professional_email=professional.email if professional else process.professional_email,
+            professional_phone=professional.phone if professional else process.professional_phone,
+            professional_birth_date=professional.birth_date if professional else None,
+            professional_gender=professional.gender.value if professional and professional.gender else None,
+            professional_gender_label=GENDER_LABELS.get(
+                professional.gender.value, None
+            ) if professional and professional.gender else None,
+            professional_nationality=professional.nationality if professional else None,
+            professional_address=address,
+            professional_city=professional.city if professional else None,
+            professional_state=professional.state if professional else None,
+            professional_postal_code=professional.postal_code if professional else None,
+            # Professional Data
+            qualification=self._build_qualification_data(process),
+            specialty=self._build_specialty_data(process, refs),
+            educations=self._build_educations_data(process),
+            # Documents
+            documents=self._build_documents_data(process, refs),
+            # History
+            created_at=process.created_at,
+            owner_name=refs.user_name(process.owner_id),
+            steps_history=self._build_steps_history(process, refs),
+            completed_at=process.completed_at,
+            completed_by_name=refs.user_name(process.updated_by),
+        )
@@ -0,0 +1,178 @@
+"""
+Request screening compliance report use case.
+
+Creates (or reuses) a report job for an approved screening process and
+queues it for the worker, instead of generating the PDF in the request.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.dependencies.settings import get_settings
+from src.app.exceptions import (
+    ScreeningNotApprovedError,
+    ScreeningProcessNotFoundError,
+    ScreeningReportGenerationError,
+)
+from src.app.logging import get_logger
+from src.modules.screening.domain.models import (
+    ReportJobStatus,
+    ScreeningReportJob,
+    ScreeningStatus,
+)
+from src.modules.screening.infrastructure.messaging import publish_report_job
+from src.modules.screening.infrastructure.repositories import (
+    ScreeningProcessRepository,
+    ScreeningReportJobRepository,
+)
+
+
+logger = get_logger(__name__)
+
+
+class RequestScreeningReportUseCase:
+    """
+    Request a compliance report for an approved screening.
+
+    Deduplication rules:
+    - a pending or running job is returned as is (re-queued if stale)
+    - a completed job is returned unless force=True
+    - otherwise a new version is created and queued
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.settings = get_settings()
+        self.process_repository = ScreeningProcessRepository(session)
+        self.job_repository = ScreeningReportJobRepository(session)
+
+    def _is_stale(self, job: ScreeningReportJob) -> bool:
+        """Check if an in-flight job stopped making progress (lost message or dead worker)."""
+        last_activity = (
+            job.started_at
+            if job.status == ReportJobStatus.RUNNING
+            else job.updated_at or job.created_at
+        )
+        if last_activity is None:
+            return False
+        timeout = timedelta(seconds=self.settings.SCREENING_REPORT_JOB_TIMEOUT)
+        return last_activity < datetime.now(timezone.utc) - timeout
+
+    async def _publish(self, job: ScreeningReportJob) -> None:
+        """Queue the job, failing it if the broker is unavailable."""
+        try:
+            await publish_report_job(job)
+        except Exception as e:
+            logger.error(
+                "screening_report_job_publish_failed",
+                job_id=str(job.id),
+                screening_id=str(job.process_id),
+                error=str(e),
+            )
+            await self.job_repository.set_status(
+                job.id,
+                ReportJobStatus.FAILED,
+                error=str(e)[:2000],
+                completed_at=datetime.now(timezone.utc),
+            )
+            await self.session.commit()
+            raise ScreeningReportGenerationError(error=str(e)) from e
+
+    async def execute(
+        self,
+        organization_id: UUID,
+        screening_id: UUID,
+        requested_by: UUID,
+        family_org_ids: tuple[UUID, ...] | list[UUID] | None,
+        *,
+        force: bool = False,
+    ) -> ScreeningReportJob:
+        """
+        Request a compliance report for an approved screening.
+
+        Args:
+            organization_id: The organization ID.
+            screening_id: The screening process ID.
+            requested_by: The user requesting the report.
+            family_org_ids: Organization family IDs for scope validation.
+            force: If True, generate a new version even if one completed.
+
+        Returns:
+            The job generating (or that generated) the report.
+
+        Raises:
+            ScreeningProcessNotFoundError: If screening not found.
+            ScreeningNotApprovedError: If screening is not approved.
+            ScreeningReportGenerationError: If the job cannot be queued.
+        """
+        process = await self.process_repository.get_by_id_for_organization(
+            id=screening_id,
+            organization_id=organization_id,
+            family_org_ids=family_org_ids,
+        )
+
+        if not process:
+            raise ScreeningProcessNotFoundError(screening_id=str(screening_id))
+
+        if process.status != ScreeningStatus.APPROVED:
+            raise ScreeningNotApprovedError(
+                screening_id=str(screening_id),
+                current_status=process.status.value,
+            )
+
+        latest = await self.job_repository.get_latest_for_process(process.id)
+
+        if latest and latest.is_in_flight:
+            if self._is_stale(latest):
+                logger.warning(
+                    "screening_report_job_requeued",
+                    job_id=str(latest.id),
+                    screening_id=str(screening_id),
+                    status=latest.status.value,
+                )
+                await self._publish(latest)
+            return latest
+
+        if latest and latest.status == ReportJobStatus.COMPLETED and not force:
+            return latest
+
+        if latest is None and process.compliance_report_url and not force:
+            # Report generated before jobs existed: record it as version 1
+            job, _ = await self.job_repository.create_idempotent(
+                ScreeningReportJob(
+                    organization_id=process.organization_id,
+                    process_id=process.id,
+                    version=1,
+                    status=ReportJobStatus.COMPLETED,
+                    report_url=process.compliance_report_url,
+                    completed_at=process.updated_at or process.created_at,
+                    created_by=requested_by,
+                    updated_by=requested_by,
+                )
+            )
+            return job
+
+        job, created = await self.job_repository.create_idempotent(
+            ScreeningReportJob(
+                organization_id=process.organization_id,
+                process_id=process.id,
+                version=(latest.version + 1) if latest else 1,
+                created_by=requested_by,
+                updated_by=requested_by,
+            )
+        )
+        # The worker must see the job before the message arrives
+        await self.session.commit()
+
+        if created:
+            await self._publish(job)
+            logger.info(
+                "screening_report_job_queued",
+                job_id=str(job.id),
+                screening_id=str(screening_id),
+                version=job.version,
+            )
+
+        return job
@@ -19,9 +19,11 @@ from src.modules.screening.use_cases.screening_step.document_review import (
 )
 from src.modules.screening.use_cases.screening_step.document_upload import (
     CompleteDocumentUploadStepUseCase,
+    ConfirmDocumentUploadUseCase,
     ConfigureDocumentsUseCase,
     DeleteScreeningDocumentUseCase,
     GetDocumentUploadStepUseCase,
+    RequestDocumentUploadUrlUseCase,
     ReuseDocumentUseCase,
     UploadDocumentUseCase,
 )
@@ -46,9 +48,11 @@ __all__ = [
     "ReviewDocumentUseCase",
     # Document Upload
     "CompleteDocumentUploadStepUseCase",
+    "ConfirmDocumentUploadUseCase",
     "ConfigureDocumentsUseCase",
     "DeleteScreeningDocumentUseCase",
     "GetDocumentUploadStepUseCase",
+    "RequestDocumentUploadUrlUseCase",
     "ReuseDocumentUseCase",
     "UploadDocumentUseCase",
     # Professional Data
@@ -3,6 +3,9 @@
 from src.modules.screening.use_cases.screening_step.document_upload.complete_document_upload_step_use_case import (
     CompleteDocumentUploadStepUseCase,
 )
+from src.modules.screening.use_cases.screening_step.document_upload.confirm_document_upload_use_case import (
+    ConfirmDocumentUploadUseCase,
+)
 from src.modules.screening.use_cases.screening_step.document_upload.configure_documents_use_case import (
     ConfigureDocumentsUseCase,
 )
@@ -12,6 +15,9 @@ from src.modules.screening.use_cases.screening_step.document_upload.delete_scree
 from src.modules.screening.use_cases.screening_step.document_upload.get_document_upload_step_use_case import (
     GetDocumentUploadStepUseCase,
 )
+from src.modules.screening.use_cases.screening_step.document_upload.request_document_upload_url_use_case import (
+    RequestDocumentUploadUrlUseCase,
+)
 from src.modules.screening.use_cases.screening_step.document_upload.reuse_document_use_case import (
     ReuseDocumentUseCase,
 )
@@ -21,9 +27,11 @@ from src.modules.screening.use_cases.screening_step.document_upload.upload_docum
 
 __all__ = [
     "CompleteDocumentUploadStepUseCase",
+    "ConfirmDocumentUploadUseCase",
     "ConfigureDocumentsUseCase",
     "DeleteScreeningDocumentUseCase",
     "GetDocumentUploadStepUseCase",
+    "RequestDocumentUploadUrlUseCase",
     "ReuseDocumentUseCase",
     "UploadDocumentUseCase",
 ]
@@ -0,0 +1,106 @@
+"""Use case for confirming a direct-to-storage document upload."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.config import Settings
+from src.app.exceptions import ValidationError
+from src.modules.screening.domain.schemas.screening_document import (
+    ScreeningDocumentResponse,
+    ScreeningDocumentUploadConfirm,
+)
+from src.modules.screening.use_cases.screening_step.document_upload.upload_document_use_case import (
+    UploadDocumentUseCase,
+)
+from src.shared.infrastructure.firebase import UploadedFile
+
+
+class ConfirmDocumentUploadUseCase:
+    """
+    Confirm a file uploaded directly to Storage with a signed URL.
+
+    Flow:
+    1. Validate ScreeningDocument and step status (same rules as upload)
+    2. Check the path belongs to this document's storage folder
+    3. Read size and MIME type from the stored object (not from the client)
+    4. Validate them; invalid objects are deleted
+    5. Create ProfessionalDocument and link it, as in UploadDocumentUseCase
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        settings: Settings | None = None,
+    ) -> None:
+        self.upload_use_case = UploadDocumentUseCase(session, settings)
+        self.storage_service = self.upload_use_case.storage_service
+
+    async def execute(
+        self,
+        screening_document_id: UUID,
+        data: ScreeningDocumentUploadConfirm,
+        uploaded_by: UUID | None,
+    ) -> ScreeningDocumentResponse:
+        """
+        Confirm a direct upload.
+
+        Args:
+            screening_document_id: The screening document ID.
+            data: Storage path from the upload URL request and document fields.
+            uploaded_by: User uploading the document (None for public access).
+
+        Returns:
+            Updated screening document response.
+
+        Raises:
+            NotFoundError: If screening document not found.
+            ScreeningStepNotConfiguredError: If step is not configured.
+            ScreeningStepNotInProgressError: If step is not in progress.
+            ValidationError: If the path is invalid, the file was not uploaded
+                or doesn't meet requirements.
+        """
+        doc, step, process = await self.upload_use_case.load_uploadable_document(
+            screening_document_id
+        )
+
+        # Only accept objects inside this document's folder
+        prefix = self.storage_service.screening_document_prefix(
+            organization_id=process.organization_id,
+            professional_id=process.organization_professional_id,
+            screening_id=process.id,
+            document_type_id=doc.document_type_id,
+        )
+        name = data.path.removeprefix(prefix)
+        if name == data.path or not name or "/" in name:
+            raise ValidationError(
+                message="Caminho do arquivo não pertence a este documento",
+                details={"path": data.path},
+            )
+
+        # Trust the stored object, not the declared size/type
+        metadata = await self.storage_service.get_file_metadata(data.path)
+        if metadata is None:
+            raise ValidationError(
+                message="Arquivo não encontrado no storage. Envie o arquivo antes de confirmar",
+                details={"path": data.path},
+            )
+        content_type = await self.storage_service.validate_stored_file(metadata)
+
+        url = await self.storage_service.generate_download_url(data.path)
+
+        return await self.upload_use_case.finalize_upload(
+            doc=doc,
+            step=step,
+            process=process,
+            uploaded_file=UploadedFile(
+                url=url,
+                path=data.path,
+                content_type=content_type,
+                size=metadata.size,
+            ),
+            file_name=data.file_name,
+            uploaded_by=uploaded_by,
+            expires_at=data.expires_at,
+            notes=data.notes,
+        )
@@ -0,0 +1,79 @@
+"""Use case for issuing a signed direct-to-storage upload URL."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.config import Settings
+from src.modules.screening.domain.schemas.screening_document import (
+    ScreeningDocumentUploadUrlRequest,
+    ScreeningDocumentUploadUrlResponse,
+)
+from src.modules.screening.use_cases.screening_step.document_upload.upload_document_use_case import (
+    UploadDocumentUseCase,
+)
+
+
+class RequestDocumentUploadUrlUseCase:
+    """
+    Issue a short-lived signed URL to upload a screening document.
+
+    Direct upload flow:
+    1. Client requests an upload URL with the file's name, size and type
+    2. Validate ScreeningDocument and step status (same rules as upload)
+    3. Validate declared size and type, sign a PUT URL for the document path
+    4. Client PUTs the file straight to Storage
+    5. Client confirms (ConfirmDocumentUploadUseCase) with the returned path
+
+    The file bytes never pass through the API.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        settings: Settings | None = None,
+    ) -> None:
+        self.upload_use_case = UploadDocumentUseCase(session, settings)
+        self.storage_service = self.upload_use_case.storage_service
+
+    async def execute(
+        self,
+        screening_document_id: UUID,
+        data: ScreeningDocumentUploadUrlRequest,
+    ) -> ScreeningDocumentUploadUrlResponse:
+        """
+        Create a signed upload URL.
+
+        Args:
+            screening_document_id: The screening document ID.
+            data: Declared file name, size and content type.
+
+        Returns:
+            Signed URL, required headers, storage path and expiration.
+
+        Raises:
+            NotFoundError: If screening document not found.
+            ScreeningStepNotConfiguredError: If step is not configured.
+            ScreeningStepNotInProgressError: If step is not in progress.
+            ValidationError: If document status doesn't allow upload or file is invalid.
+        """
+        doc, _, process = await self.upload_use_case.load_uploadable_document(
+            screening_document_id
+        )
+
+        signed = await self.storage_service.create_upload_url(
+            file_name=data.file_name,
+            file_size=data.file_size,
+            content_type=data.content_type,
+            organization_id=process.organization_id,
+            professional_id=process.organization_professional_id,
+            screening_id=process.id,
+            document_type_id=doc.document_type_id,
+        )
+
+        return ScreeningDocumentUploadUrlResponse(
+            upload_url=signed.url,
+            headers=signed.headers,
+            path=signed.path,
+            expires_at=signed.expires_at,
+        )
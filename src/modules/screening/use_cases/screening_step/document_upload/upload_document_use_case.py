@@ -22,7 +22,7 @@ from src.modules.professionals.infrastructure.repositories import (
     ProfessionalDocumentRepository,
     ProfessionalQualificationRepository,
 )
-from src.modules.screening.domain.models import ScreeningProcess
+from src.modules.screening.domain.models import DocumentUploadStep, ScreeningProcess
 from src.modules.screening.domain.models.enums import (
     ScreeningDocumentStatus,
     StepStatus,
@@ -36,7 +36,7 @@ from src.modules.screening.infrastructure.repositories import (
     ScreeningDocumentRepository,
 )
 from src.shared.domain.models import DocumentCategory, DocumentType
-from src.shared.infrastructure.firebase import FirebaseStorageService
+from src.shared.infrastructure.firebase import FirebaseStorageService, UploadedFile
 
 
 class UploadDocumentUseCase:
@@ -98,6 +98,53 @@ class UploadDocumentUseCase:
             ScreeningStepNotInProgressError: If step is not in progress.
             ValidationError: If document status doesn't allow upload or file is invalid.
         """
+        doc, step, process = await self.load_uploadable_document(
+            screening_document_id
+        )
+
+        # 7. Upload file to Firebase Storage
+        file_size = file.size or 0
+        uploaded_file = await self.storage_service.upload_file(
+            file=file.file,
+            file_name=file.filename or "document",
+            file_size=file_size,
+            content_type=file.content_type,
+            organization_id=process.organization_id,
+            professional_id=process.organization_professional_id,
+            screening_id=process.id,
+            document_type_id=doc.document_type_id,
+        )
+
+        return await self.finalize_upload(
+            doc=doc,
+            step=step,
+            process=process,
+            uploaded_file=uploaded_file,
+            file_name=file.filename or "document",
+            uploaded_by=uploaded_by,
+            expires_at=expires_at,
+            notes=notes,
+        )
+
+    async def load_uploadable_document(
+        self,
+        screening_document_id: UUID,
+    ) -> tuple[ScreeningDocument, DocumentUploadStep, ScreeningProcess]:
+        """
+        Load a screening document and check that it can receive an upload.
+
+        Args:
+            screening_document_id: The screening document ID.
+
+        Returns:
+            Tuple of (document, upload step, screening process).
+
+        Raises:
+            NotFoundError: If screening document not found.
+            ScreeningStepNotConfiguredError: If step is not configured.
+            ScreeningStepNotInProgressError: If step is not in progress.
+            ValidationError: If document status doesn't allow upload.
+        """
         # 1. Get screening document with document type
         doc = await self.document_repository.get_by_id_with_type(screening_document_id)
         if not doc:
@@ -135,8 +182,6 @@ class UploadDocumentUseCase:
                 message=f"Documento não pode receber upload no status {doc.status.value}",
             )
 
-        # 5. Get document type for category inference
-        document_type: DocumentType = doc.document_type
         process: ScreeningProcess = step.process
 
         # 6. Validate we have an organization_professional_id
@@ -145,18 +190,41 @@ class UploadDocumentUseCase:
                 message="Processo de triagem não possui profissional vinculado",
             )
 
-        # 7. Upload file to Firebase Storage
-        file_size = file.size or 0
-        uploaded_file = await self.storage_service.upload_file(
-            file=file.file,
-            file_name=file.filename or "document",
-            file_size=file_size,
-            content_type=file.content_type,
-            organization_id=process.organization_id,
-            professional_id=process.organization_professional_id,
-            screening_id=process.id,
-            document_type_id=doc.document_type_id,
-        )
+        return doc, step, process
+
+    async def finalize_upload(
+        self,
+        doc: ScreeningDocument,
+        step: DocumentUploadStep,
+        process: ScreeningProcess,
+        uploaded_file: UploadedFile,
+        file_name: str,
+        uploaded_by: UUID | None,
+        *,
+        expires_at: datetime | None = None,
+        notes: str | None = None,
+    ) -> ScreeningDocumentResponse:
+        """
+        Record a stored file as the screening document's upload.
+
+        Creates the pending ProfessionalDocument, links it to the screening
+        document and updates the step upload count.
+
+        Args:
+            doc: Screening document (from load_uploadable_document).
+            step: Its upload step.
+            process: Its screening process.
+            uploaded_file: The file already stored in Firebase Storage.
+            file_name: Original file name.
+            uploaded_by: User uploading the document (None for public access).
+            expires_at: Optional expiration date for the document.
+            notes: Optional notes about the document.
+
+        Returns:
+            Updated screening document response.
+        """
+        # Document type for category inference
+        document_type: DocumentType = doc.document_type
 
         # 8. Infer qualification_id and specialty_id based on document category
         qualification_id, specialty_id = await self._infer_document_links(
@@ -170,7 +238,7 @@ class UploadDocumentUseCase:
             organization_professional_id=process.organization_professional_id,
             document_type_id=doc.document_type_id,
             file_url=uploaded_file.url,
-            file_name=file.filename or "document",
+            file_name=file_name,
             file_size=uploaded_file.size,
             mime_type=uploaded_file.content_type,
             expires_at=expires_at,
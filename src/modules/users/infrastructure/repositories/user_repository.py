@@ -53,6 +53,40 @@ class UserRepository(BaseRepository[User]):
         result = await self.session.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, ids: set[UUID] | list[UUID]) -> dict[UUID, User]:
+        """
+        Get multiple users in one query.
+
+        Args:
+            ids: User UUIDs.
+
+        Returns:
+            Mapping of user ID to User (missing users are omitted).
+        """
+        if not ids:
+            return {}
+
+        result = await self.session.execute(select(User).where(User.id.in_(ids)))
+        return {user.id: user for user in result.scalars().all()}
+
+    async def get_names_by_ids(self, ids: set[UUID] | list[UUID]) -> dict[UUID, str]:
+        """
+        Get full names of multiple users in one query.
+
+        Args:
+            ids: User UUIDs.
+
+        Returns:
+            Mapping of user ID to full name (missing users are omitted).
+        """
+        if not ids:
+            return {}
+
+        result = await self.session.execute(
+            select(User.id, User.full_name).where(User.id.in_(ids))
+        )
+        return {user_id: full_name for user_id, full_name in result.all()}
+
     @staticmethod
     def extract_role_codes(user: User) -> list[str]:
         """
@@ -0,0 +1,22 @@
+"""Organization membership cache utilities."""
+
+from uuid import UUID
+
+from src.shared.infrastructure.cache import get_redis_cache
+
+
+async def invalidate_membership_cache(user_id: UUID, organization_id: UUID) -> None:
+    """
+    Invalidate the cached membership used by the identity middleware.
+
+    Evicts the key from Redis and from the in-process cache of every worker,
+    so role or status changes take effect on the next request.
+
+    Args:
+        user_id: The member's user ID.
+        organization_id: The organization ID.
+    """
+    cache = get_redis_cache()
+    if cache:
+        cache_key = cache.membership_cache_key(str(user_id), str(organization_id))
+        await cache.delete(cache_key)
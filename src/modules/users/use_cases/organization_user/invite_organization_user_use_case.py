@@ -27,6 +27,8 @@ from src.modules.users.infrastructure.services import (
     get_invitation_token_service,
 )
 from src.shared.infrastructure.email import EmailService, get_email_service
+from src.shared.infrastructure.messaging.email_outbox import notify_email_outbox
+from src.shared.infrastructure.repositories import EmailOutboxRepository
 
 
 class InviteOrganizationUserUseCase:
@@ -36,6 +38,11 @@ class InviteOrganizationUserUseCase:
     Handles two scenarios:
     1. User exists in system → Creates membership directly (can still send notification)
     2. User doesn't exist → Creates user placeholder, sends invitation email
+
+    The invitation email is written to the email outbox in the same
+    transaction as the membership and sent by the worker, so the request
+    never waits on the email provider and no email goes out for an
+    invitation that was rolled back.
     """
 
     def __init__(
@@ -50,6 +57,7 @@ class InviteOrganizationUserUseCase:
         self.user_repository = UserRepository(session)
         self.role_repository = RoleRepository(session)
         self.org_repository = OrganizationRepository(session)
+        self.outbox_repository = EmailOutboxRepository(session)
         self.email_service = email_service or get_email_service()
         self.token_service = token_service or get_invitation_token_service()
         self.settings = settings or get_settings()
@@ -158,8 +166,8 @@ class InviteOrganizationUserUseCase:
         )
         invitation_link = self.token_service.get_invitation_link(token)
 
-        # Send invitation email
-        await self.email_service.send_invitation_email(
+        # Queue invitation email (sent by the worker after commit)
+        email = self.email_service.build_invitation_email(
             to=data.email,
             invitee_name=data.full_name or "",
             organization_name=organization.name if organization else "Organização",
@@ -168,9 +176,13 @@ class InviteOrganizationUserUseCase:
             invitation_link=invitation_link,
             expires_in_days=self.settings.INVITATION_TOKEN_EXPIRE_DAYS,
         )
+        outbox_email = await self.outbox_repository.enqueue("invitation", email)
 
         await self.session.commit()
 
+        # Wake the worker up (best effort, it also polls the outbox)
+        await notify_email_outbox([outbox_email.id])
+
         # Refresh to get relationships
         await self.session.refresh(
             membership, attribute_names=["user", "role", "organization"]
@@ -12,6 +12,9 @@ from src.app.exceptions import (
 from src.modules.users.infrastructure.repositories import (
     OrganizationMembershipRepository,
 )
+from src.modules.users.use_cases.organization_user.cache import (
+    invalidate_membership_cache,
+)
 
 
 class RemoveOrganizationUserUseCase:
@@ -73,3 +76,4 @@ class RemoveOrganizationUserUseCase:
         )
 
         await self.session.commit()
+        await invalidate_membership_cache(membership.user_id, organization_id)
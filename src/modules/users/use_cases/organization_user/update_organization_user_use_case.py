@@ -13,6 +13,9 @@ from src.modules.users.infrastructure.repositories import (
     OrganizationMembershipRepository,
     RoleRepository,
 )
+from src.modules.users.use_cases.organization_user.cache import (
+    invalidate_membership_cache,
+)
 
 
 class UpdateOrganizationUserUseCase:
@@ -77,6 +80,7 @@ class UpdateOrganizationUserUseCase:
             membership.updated_by = updated_by
 
         await self.session.commit()
+        await invalidate_membership_cache(membership.user_id, organization_id)
         await self.session.refresh(
             membership, attribute_names=["user", "role", "organization"]
         )
@@ -15,7 +15,12 @@ from src.shared.domain.models.document_type import (
     DocumentType,
     DocumentTypeBase,
 )
-from src.shared.domain.models.enums import AccountType, PixKeyType
+from src.shared.domain.models.email_outbox import EmailOutbox, EmailOutboxBase
+from src.shared.domain.models.enums import (
+    AccountType,
+    EmailOutboxStatus,
+    PixKeyType,
+)
 from src.shared.domain.models.fields import (
     AwareDatetimeField,
     CNPJField,
@@ -50,10 +55,13 @@ __all__ = [
     "DocumentCategory",
     "DocumentType",
     "DocumentTypeBase",
+    "EmailOutbox",
+    "EmailOutboxBase",
     "Specialty",
     "SpecialtyBase",
     # Shared enums
     "AccountType",
+    "EmailOutboxStatus",
     "PixKeyType",
     # Fields
     "AwareDatetimeField",
@@ -0,0 +1,107 @@
+"""EmailOutbox model - emails written in the business transaction, sent by the worker."""
+
+from typing import Optional
+
+from pydantic import AwareDatetime
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import Index, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field
+
+from src.shared.domain.models.base import BaseModel
+from src.shared.domain.models.enums import EmailOutboxStatus
+from src.shared.domain.models.fields import AwareDatetimeField
+from src.shared.domain.models.mixins import PrimaryKeyMixin, TimestampMixin
+
+
+class EmailOutboxBase(BaseModel):
+    """Base fields for EmailOutbox."""
+
+    kind: str = Field(
+        max_length=50,
+        description="Email kind (e.g., invitation), used for tags and logs",
+    )
+    recipients: list[str] = Field(
+        sa_type=JSONB,
+        description="Recipient email addresses",
+    )
+    subject: str = Field(
+        max_length=255,
+        description="Email subject",
+    )
+    html: str = Field(
+        sa_type=Text,
+        description="Rendered HTML content",
+    )
+    tags: list[dict[str, str]] = Field(
+        default_factory=list,
+        sa_type=JSONB,
+        description="Provider tags ({name, value})",
+    )
+    status: EmailOutboxStatus = Field(
+        default=EmailOutboxStatus.PENDING,
+        sa_type=SAEnum(
+            EmailOutboxStatus, name="email_outbox_status", create_constraint=True
+        ),
+        description="Delivery status",
+    )
+    attempts: int = Field(
+        default=0,
+        ge=0,
+        description="Number of delivery attempts",
+    )
+    error: Optional[str] = Field(
+        default=None,
+        max_length=2000,
+        description="Last delivery error",
+    )
+    provider_message_id: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        description="Message ID returned by the email provider",
+    )
+
+
+class EmailOutbox(
+    EmailOutboxBase,
+    PrimaryKeyMixin,
+    TimestampMixin,
+    table=True,
+):
+    """
+    EmailOutbox table model.
+
+    Emails are inserted in the same transaction as the change that
+    triggers them (e.g., an invitation), so they are sent if and only if
+    it commits. The worker claims due rows in batches, sends them and
+    records the outcome; failed sends are retried with backoff.
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Worker polling: due pending emails, oldest first
+        Index(
+            "ix_email_outbox_due",
+            "next_attempt_at",
+            postgresql_where="status IN ('PENDING', 'SENDING')",
+        ),
+    )
+
+    next_attempt_at: AwareDatetime = AwareDatetimeField(
+        sa_column_kwargs={
+            "server_default": func.now(),
+            "nullable": False,
+        },
+        nullable=False,
+        description="When the email becomes due (now on insert, later on retry)",
+    )
+    locked_at: Optional[AwareDatetime] = AwareDatetimeField(
+        default=None,
+        nullable=True,
+        description="When a worker claimed the email (stale claims are retaken)",
+    )
+    sent_at: Optional[AwareDatetime] = AwareDatetimeField(
+        default=None,
+        nullable=True,
+        description="When the provider accepted the email",
+    )
@@ -26,3 +26,17 @@ class PixKeyType(str, Enum):
     EMAIL = "EMAIL"  # E-mail
     PHONE = "PHONE"  # Telefone celular
     RANDOM = "RANDOM"  # Chave aleatória (EVP)
+
+
+class EmailOutboxStatus(str, Enum):
+    """
+    Delivery status of an email in the outbox.
+
+    Flow: PENDING → SENDING → SENT
+    Failures: SENDING → PENDING (retry scheduled) or FAILED (attempts exhausted)
+    """
+
+    PENDING = "PENDING"  # Waiting for the worker (or for its next attempt)
+    SENDING = "SENDING"  # Claimed by a worker
+    SENT = "SENT"  # Accepted by the email provider
+    FAILED = "FAILED"  # Failed permanently
@@ -34,8 +34,13 @@ class TimestampMixin(SQLModel):
     Tracks creation and last update times using database-level defaults
     for consistency across different application instances.
     Uses timezone-aware datetime fields for proper UTC storage.
+
+    Server-generated values are fetched eagerly with RETURNING on INSERT
+    and UPDATE, so flushed entities don't need a refresh round trip.
     """
 
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: AwareDatetime = AwareDatetimeField(
         sa_column_kwargs={
             "server_default": func.now(),
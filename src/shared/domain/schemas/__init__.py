@@ -19,6 +19,11 @@ from src.shared.domain.schemas.document_type import (
     DocumentTypeResponse,
     DocumentTypeUpdate,
 )
+from src.shared.domain.schemas.pagination import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+)
 from src.shared.domain.schemas.specialty import (
     SpecialtyListResponse,
     SpecialtyResponse,
@@ -29,6 +34,9 @@ __all__ = [
     "HealthResponse",
     "PaginatedResponse",
     "PaginationParams",
+    "CountStrategy",
+    "CursorPaginatedResponse",
+    "CursorPaginationParams",
     # BankAccount
     "BankAccountResponse",
     "BankInfo",
@@ -0,0 +1,180 @@
+"""Cursor (keyset) pagination and count strategy schemas."""
+
+from enum import StrEnum
+from typing import Generic, Literal, TypeVar
+
+from fastapi_restkit.models import PaginationParams
+from pydantic import BaseModel, Field
+
+
+T = TypeVar("T")
+
+
+class CountStrategy(StrEnum):
+    """
+    How the total of a paginated list is computed.
+
+    - EXACT: COUNT(*) over the filtered query.
+    - CAPPED: COUNT(*) over at most cap + 1 rows ("1000+").
+    - ESTIMATE: Planner row estimate from EXPLAIN (exact for small results).
+    - CACHED: Exact count cached briefly by a hash of the filtered query
+      (not exact when served from the cache, as it may be stale).
+    - WINDOW: Exact count via `count(*) OVER ()` in the page query itself
+      (one round trip; offset mode only, EXACT otherwise).
+    - NONE: No count at all.
+    """
+
+    EXACT = "exact"
+    CAPPED = "capped"
+    ESTIMATE = "estimate"
+    CACHED = "cached"
+    WINDOW = "window"
+    NONE = "none"
+
+
+class CursorPaginationParams(PaginationParams):
+    """
+    Pagination parameters with opt-in keyset (cursor) mode.
+
+    Offset mode (default) behaves exactly like PaginationParams.
+    Cursor mode is enabled by `pagination_mode=cursor` or by passing a
+    `cursor` returned in a previous response's `next_cursor`. In cursor
+    mode `page` is ignored and pages are fetched with
+    `WHERE (sort_key, id) < (last_sort_key, last_id)` instead of OFFSET.
+    """
+
+    pagination_mode: Literal["offset", "cursor"] = Field(
+        default="offset",
+        description="Modo de paginação: offset (page/page_size) ou cursor",
+    )
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor opaco retornado em next_cursor (ativa o modo cursor)",
+    )
+    include_total: bool = Field(
+        default=True,
+        description="Calcula o total de registros (false pula a contagem)",
+    )
+
+    @property
+    def use_cursor(self) -> bool:
+        """Whether keyset pagination should be used."""
+        return self.pagination_mode == "cursor" or bool(self.cursor)
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """
+    Paginated response supporting both offset and cursor modes.
+
+    Field-compatible with PaginatedResponse. `total` and `total_pages` may
+    be None when counting is skipped, and `next_cursor` points to the next
+    page in cursor mode. `count_strategy` and `total_is_exact` describe how
+    `total` was computed.
+    """
+
+    items: list[T]
+    total: int | None
+    page: int
+    page_size: int
+    total_pages: int | None
+    has_next: bool
+    has_previous: bool
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor da próxima página (modo cursor)",
+    )
+    count_strategy: CountStrategy | None = Field(
+        default=None,
+        description="Estratégia usada para calcular o total",
+    )
+    total_is_exact: bool = Field(
+        default=True,
+        description="Indica se o total é exato (false para estimativas, limites e contagens em cache)",
+    )
+
+    @classmethod
+    def create_offset(
+        cls,
+        items: list[T],
+        *,
+        page: int,
+        page_size: int,
+        has_next: bool,
+        total: int | None,
+        count_strategy: CountStrategy,
+        total_is_exact: bool,
+    ) -> "CursorPaginatedResponse[T]":
+        """
+        Create an offset-mode paginated response with count metadata.
+
+        Args:
+            items: List of items for current page.
+            page: Current page number.
+            page_size: Requested page size.
+            has_next: Whether there is a next page (not derived from total,
+                      which may be approximate).
+            total: Total count, None if not computed.
+            count_strategy: Strategy used to compute the total.
+            total_is_exact: Whether the total is exact.
+
+        Returns:
+            CursorPaginatedResponse with offset metadata.
+        """
+        return cls(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=_total_pages(total, page_size),
+            has_next=has_next,
+            has_previous=page > 1,
+            count_strategy=count_strategy,
+            total_is_exact=total_is_exact,
+        )
+
+    @classmethod
+    def create_cursor(
+        cls,
+        items: list[T],
+        *,
+        page_size: int,
+        next_cursor: str | None,
+        has_previous: bool,
+        total: int | None = None,
+        count_strategy: CountStrategy | None = None,
+        total_is_exact: bool = True,
+    ) -> "CursorPaginatedResponse[T]":
+        """
+        Create a cursor-mode paginated response.
+
+        Args:
+            items: List of items for current page.
+            page_size: Requested page size.
+            next_cursor: Cursor for the next page, None on the last page.
+            has_previous: Whether this page was fetched with a cursor.
+            total: Total count of all items, None if not computed.
+            count_strategy: Strategy used to compute the total.
+            total_is_exact: Whether the total is exact.
+
+        Returns:
+            CursorPaginatedResponse with cursor metadata.
+        """
+        return cls(
+            items=items,
+            total=total,
+            page=1,
+            page_size=page_size,
+            total_pages=_total_pages(total, page_size),
+            has_next=next_cursor is not None,
+            has_previous=has_previous,
+            next_cursor=next_cursor,
+            count_strategy=count_strategy,
+            total_is_exact=total_is_exact,
+        )
+
+
+def _total_pages(total: int | None, page_size: int) -> int | None:
+    """Compute the number of pages, None when the total is unknown."""
+    if total is None or page_size <= 0:
+        return None
+    return (total + page_size - 1) // page_size
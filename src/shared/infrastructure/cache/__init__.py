@@ -1,5 +1,6 @@
 """Cache infrastructure services."""
 
+from src.shared.infrastructure.cache.local_cache import LocalCache
 from src.shared.infrastructure.cache.redis_cache import (
     RedisCache,
     get_redis_cache,
@@ -7,6 +8,7 @@ from src.shared.infrastructure.cache.redis_cache import (
 )
 
 __all__ = [
+    "LocalCache",
     "RedisCache",
     "get_redis_cache",
     "set_redis_cache",
@@ -0,0 +1,139 @@
+"""In-process L1 cache with TTL and LRU eviction."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+# Key prefixes grouped for hit/miss accounting (most specific first)
+KEY_FAMILIES: tuple[str, ...] = (
+    "firebase_token",
+    "user:fb",
+    "membership",
+    "org:family",
+    "org",
+    "doc_types",
+    "count",
+)
+
+
+def key_family(key: str) -> str:
+    """
+    Get the accounting family of a cache key.
+
+    Args:
+        key: Cache key (e.g., "org:family:<uuid>").
+
+    Returns:
+        Matching entry from KEY_FAMILIES, or the first key segment.
+    """
+    for family in KEY_FAMILIES:
+        if key.startswith(family) and key[len(family) : len(family) + 1] == ":":
+            return family
+    return key.split(":", 1)[0]
+
+
+@dataclass(slots=True)
+class CacheFamilyStats:
+    """Hit/miss (and coalesced load) counters for a key family."""
+
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return counters as a plain dict."""
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+class LocalCache:
+    """
+    Bounded in-process TTL/LRU cache.
+
+    Stores already-deserialized values so hot keys skip both the Redis
+    round trip and json.loads. Values returned from the cache are shared
+    between callers and must be treated as read-only.
+
+    Not thread-safe: intended to be used from a single event loop.
+    """
+
+    def __init__(self, max_size: int, default_ttl: int) -> None:
+        """
+        Initialize local cache.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction.
+            default_ttl: Maximum time-to-live for entries in seconds.
+        """
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        Get value from the local cache.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Tuple of (hit, value). Value is None on miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Set value in the local cache.
+
+        Args:
+            key: Cache key.
+            value: Deserialized value.
+            ttl: Time-to-live in seconds, capped at the default TTL.
+        """
+        effective_ttl = (
+            self._default_ttl if ttl is None else min(ttl, self._default_ttl)
+        )
+        if effective_ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + effective_ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete value from the local cache.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            True if the key was present.
+        """
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
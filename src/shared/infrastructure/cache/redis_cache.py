@@ -1,35 +1,95 @@
 """Redis cache service for application caching."""
 
-import json
+import asyncio
 import hashlib
+import random
+import secrets
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
 
+from src.app import serialization
 from src.app.logging import get_logger
+from src.shared.infrastructure.cache.local_cache import (
+    CacheFamilyStats,
+    LocalCache,
+    key_family,
+)
 
 
 logger = get_logger(__name__)
 
+# Pub/sub channel used to broadcast L1 invalidations to all workers
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# How often workers waiting on another worker's load re-check the cache
+LOCK_POLL_INTERVAL = 0.05
+
+# Release a load lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class RedisCache:
     """
     Async Redis cache service with JSON serialization.
 
     Provides get/set/delete operations with automatic JSON serialization
-    and graceful degradation on connection errors.
+    (src.app.serialization) and graceful degradation on connection errors.
+
+    When a LocalCache is provided, it is used as an in-process L1 tier in
+    front of Redis. Deletes are broadcast on a Redis pub/sub channel so
+    every worker evicts the key from its own L1 tier. Hit/miss counters
+    are kept per key family (see `stats()`).
+
+    Cache misses can be loaded through `get_or_load`/`coalesce_load`,
+    which let only one loader per key run at a time: concurrent callers in
+    the same process await the same in-flight load, and (when a lock
+    timeout is configured) workers in other processes wait for the lock
+    holder to populate the cache instead of hitting the database too.
+    TTLs can be jittered so keys written together don't expire together.
     """
 
-    def __init__(self, redis_url: str) -> None:
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        local_cache: LocalCache | None = None,
+        ttl_jitter: float = 0.0,
+        lock_timeout: float | None = None,
+    ) -> None:
         """
         Initialize Redis cache.
 
         Args:
             redis_url: Redis connection URL (e.g., redis://localhost:6379/0)
+            local_cache: Optional in-process L1 cache.
+            ttl_jitter: Fraction of each TTL to randomly add or subtract
+                        (e.g., 0.1 = ±10%). 0 disables jitter.
+            lock_timeout: Seconds a cross-process load lock is held before
+                          it expires. None disables the Redis lock (loads
+                          are still coalesced within the process).
         """
         self._redis_url = redis_url
         self._client: Redis | None = None
+        self._local = local_cache
+        self._ttl_jitter = ttl_jitter
+        self._lock_timeout = lock_timeout
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._pubsub: PubSub | None = None
+        self._listener: asyncio.Task[None] | None = None
+        self._stats: defaultdict[str, CacheFamilyStats] = defaultdict(
+            CacheFamilyStats
+        )
 
     async def connect(self) -> None:
         """Establish connection to Redis."""
@@ -41,8 +101,23 @@ class RedisCache:
             )
             logger.info("redis_connected", url=self._redis_url.split("@")[-1])
 
+            if self._local is not None:
+                await self._start_invalidation_listener()
+
     async def disconnect(self) -> None:
         """Close Redis connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
         if self._client is not None:
             await self._client.close()
             self._client = None
@@ -52,24 +127,42 @@ class RedisCache:
         """
         Get value from cache.
 
+        Checks the local L1 tier first (if enabled), then Redis.
+
         Args:
             key: Cache key.
 
         Returns:
             Deserialized value or None if not found or on error.
         """
+        stats = self._stats[key_family(key)]
+
+        if self._local is not None:
+            hit, value = self._local.get(key)
+            if hit:
+                stats.local_hits += 1
+                return value
+
         if self._client is None:
+            stats.misses += 1
             return None
 
         try:
             value = await self._client.get(key)
             if value is None:
+                stats.misses += 1
                 return None
-            return json.loads(value)
-        except (redis.RedisError, json.JSONDecodeError) as e:
+            deserialized = serialization.loads(value)
+        except (redis.RedisError, serialization.JSONDecodeError) as e:
             logger.warning("redis_get_error", key=key, error=str(e))
+            stats.misses += 1
             return None
 
+        stats.redis_hits += 1
+        if self._local is not None:
+            self._local.set(key, deserialized)
+        return deserialized
+
     async def set(
         self,
         key: str,
@@ -82,40 +175,339 @@ class RedisCache:
         Args:
             key: Cache key.
             value: Value to cache (must be JSON serializable).
-            ttl: Time-to-live in seconds. None for no expiration.
+            ttl: Time-to-live in seconds (jittered if configured).
+                 None for no expiration.
 
         Returns:
             True if successful, False on error.
         """
+        try:
+            serialized = serialization.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.warning("redis_set_error", key=key, error=str(e))
+            return False
+
+        if self._local is not None:
+            # Store the JSON round-tripped value so L1 hits return
+            # exactly what an L2 (Redis) hit would
+            self._local.set(key, serialization.loads(serialized), ttl=ttl)
+
         if self._client is None:
             return False
 
         try:
-            serialized = json.dumps(value, default=str)
             if ttl is not None:
-                await self._client.setex(key, ttl, serialized)
+                await self._client.setex(key, self._jittered_ttl(ttl), serialized)
             else:
                 await self._client.set(key, serialized)
             return True
-        except (redis.RedisError, TypeError, ValueError) as e:
+        except redis.RedisError as e:
             logger.warning("redis_set_error", key=key, error=str(e))
             return False
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get multiple values from cache in a single round trip.
+
+        Keys found in the local L1 tier are served from memory; the rest
+        are fetched from Redis with one MGET.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Dict with the deserialized values of the keys that were found.
+            Missing keys (or keys that failed to load) are omitted.
+        """
+        found: dict[str, Any] = {}
+        remaining: list[str] = []
+
+        for key in keys:
+            if self._local is not None:
+                hit, value = self._local.get(key)
+                if hit:
+                    self._stats[key_family(key)].local_hits += 1
+                    found[key] = value
+                    continue
+            remaining.append(key)
+
+        if not remaining:
+            return found
+
+        values: list[str | None] = [None] * len(remaining)
+        if self._client is not None:
+            try:
+                values = await self._client.mget(remaining)
+            except redis.RedisError as e:
+                logger.warning("redis_mget_error", keys=remaining, error=str(e))
+
+        for key, value in zip(remaining, values, strict=True):
+            stats = self._stats[key_family(key)]
+            if value is None:
+                stats.misses += 1
+                continue
+            try:
+                deserialized = serialization.loads(value)
+            except serialization.JSONDecodeError as e:
+                logger.warning("redis_get_error", key=key, error=str(e))
+                stats.misses += 1
+                continue
+
+            stats.redis_hits += 1
+            found[key] = deserialized
+            if self._local is not None:
+                self._local.set(key, deserialized)
+
+        return found
+
+    async def set_many(self, items: dict[str, tuple[Any, int | None]]) -> bool:
+        """
+        Set multiple values in cache in a single pipelined round trip.
+
+        Args:
+            items: Dict mapping cache key to (value, ttl). Values must be
+                   JSON serializable; ttl is in seconds (jittered if
+                   configured), None for no expiration.
+
+        Returns:
+            True if successful, False on error.
+        """
+        if not items:
+            return True
+
+        serialized_items: list[tuple[str, bytes, int | None]] = []
+        for key, (value, ttl) in items.items():
+            try:
+                serialized = serialization.dumps(value)
+            except (TypeError, ValueError) as e:
+                logger.warning("redis_set_error", key=key, error=str(e))
+                return False
+            serialized_items.append((key, serialized, ttl))
+
+            if self._local is not None:
+                self._local.set(key, serialization.loads(serialized), ttl=ttl)
+
+        if self._client is None:
+            return False
+
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, serialized, ttl in serialized_items:
+                    if ttl is not None:
+                        pipe.setex(key, self._jittered_ttl(ttl), serialized)
+                    else:
+                        pipe.set(key, serialized)
+                await pipe.execute()
+            return True
+        except redis.RedisError as e:
+            logger.warning("redis_set_many_error", keys=list(items), error=str(e))
+            return False
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+    ) -> Any | None:
+        """
+        Get value from cache, loading and caching it on a miss.
+
+        Concurrent misses for the same key share a single loader call
+        (see `coalesce_load`). None results are not cached.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine function returning the value to cache.
+            ttl: Time-to-live in seconds. None for no expiration.
+
+        Returns:
+            Cached or freshly loaded value.
+
+        Raises:
+            Exception: Whatever the loader raises (shared by all waiters).
+        """
+        # Try cache first
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        async def load_and_set() -> dict[str, Any]:
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl)
+            return {key: value}
+
+        loaded = await self.coalesce_load([key], load_and_set)
+        return loaded.get(key)
+
+    async def coalesce_load(
+        self,
+        keys: list[str],
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Load missing cache keys with stampede protection.
+
+        Only one loader runs per key set at a time in this process; other
+        callers await its result. When a lock timeout is configured, a
+        Redis lock extends this across processes: workers that don't get
+        the lock poll the cache until the holder has written the keys (or
+        released the lock) instead of running the loader themselves.
+
+        The loader is responsible for writing its results to the cache
+        before returning, so waiters in other processes can pick them up.
+
+        Args:
+            keys: Cache keys the loader will produce.
+            loader: Coroutine function returning a dict keyed by cache key.
+
+        Returns:
+            Dict returned by the loader, or the cached values when another
+            worker loaded them first.
+
+        Raises:
+            Exception: Whatever the loader raises (shared by all waiters).
+        """
+        flight_key = "|".join(sorted(set(keys)))
+
+        async def load() -> dict[str, Any]:
+            return await self._load_with_lock(flight_key, keys, loader)
+
+        return await self._single_flight(flight_key, load)
+
+    async def _single_flight(
+        self,
+        flight_key: str,
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Run loader once per flight key; concurrent callers share the result."""
+        task = self._inflight.get(flight_key)
+        if task is not None:
+            self._stats[key_family(flight_key)].coalesced += 1
+            return await asyncio.shield(task)
+
+        # Run in its own task so a cancelled caller doesn't cancel the load
+        # for everyone else awaiting it
+        task = asyncio.create_task(loader())
+        self._inflight[flight_key] = task
+
+        def _done(finished: asyncio.Task[Any]) -> None:
+            if self._inflight.get(flight_key) is finished:
+                del self._inflight[flight_key]
+            # Mark exception as retrieved even if every caller went away
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _load_with_lock(
+        self,
+        flight_key: str,
+        keys: list[str],
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Run loader under a Redis lock, or wait for the lock holder's result."""
+        if self._lock_timeout is None or self._client is None:
+            return await loader()
+
+        lock_key = f"lock:{hashlib.sha256(flight_key.encode()).hexdigest()[:32]}"
+        token = secrets.token_hex(16)
+
+        try:
+            acquired = await self._client.set(
+                lock_key, token, nx=True, px=int(self._lock_timeout * 1000)
+            )
+        except redis.RedisError as e:
+            logger.warning("redis_lock_error", key=lock_key, error=str(e))
+            return await loader()
+
+        if acquired:
+            try:
+                return await loader()
+            finally:
+                await self._release_lock(lock_key, token)
+
+        # Another worker is loading these keys - wait for its result
+        found = await self._wait_for_keys(lock_key, keys)
+        if found is not None:
+            self._stats[key_family(flight_key)].coalesced += 1
+            return found
+
+        return await loader()
+
+    async def _wait_for_keys(
+        self,
+        lock_key: str,
+        keys: list[str],
+    ) -> dict[str, Any] | None:
+        """
+        Poll until all keys are cached or the lock is gone.
+
+        Returns:
+            Dict with all keys, or None if the lock expired or was released
+            without the keys being cached (e.g., the holder failed or the
+            result was not cacheable).
+        """
+        deadline = time.monotonic() + (self._lock_timeout or 0)
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            try:
+                values = await self._client.mget(keys)
+                if all(value is not None for value in values):
+                    found = {
+                        key: serialization.loads(value)
+                        for key, value in zip(keys, values, strict=True)
+                    }
+                    if self._local is not None:
+                        for key, value in found.items():
+                            self._local.set(key, value)
+                    return found
+                if not await self._client.exists(lock_key):
+                    return None
+            except (redis.RedisError, serialization.JSONDecodeError) as e:
+                logger.warning("redis_lock_wait_error", key=lock_key, error=str(e))
+                return None
+
+        return None
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        """Release a load lock if it is still owned by this caller."""
+        try:
+            await self._client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except redis.RedisError as e:
+            logger.warning("redis_unlock_error", key=lock_key, error=str(e))
+
+    def _jittered_ttl(self, ttl: int) -> int:
+        """Spread a TTL by ±ttl_jitter so keys written together expire apart."""
+        spread = int(ttl * self._ttl_jitter)
+        if spread <= 0:
+            return ttl
+        return max(1, ttl + random.randint(-spread, spread))
+
     async def delete(self, key: str) -> bool:
         """
         Delete value from cache.
 
+        Also evicts the key from the local L1 tier of every worker.
+
         Args:
             key: Cache key.
 
         Returns:
             True if key was deleted, False if not found or on error.
         """
+        if self._local is not None:
+            self._local.delete(key)
+
         if self._client is None:
             return False
 
         try:
             result = await self._client.delete(key)
+            if self._local is not None:
+                await self._client.publish(INVALIDATION_CHANNEL, key)
             return result > 0
         except redis.RedisError as e:
             logger.warning("redis_delete_error", key=key, error=str(e))
@@ -140,6 +532,45 @@ class RedisCache:
             logger.warning("redis_exists_error", key=key, error=str(e))
             return False
 
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get hit/miss counters per key family.
+
+        Returns:
+            Dict mapping key family to local_hits/redis_hits/misses counters.
+        """
+        return {family: stats.as_dict() for family, stats in self._stats.items()}
+
+    async def _start_invalidation_listener(self) -> None:
+        """Subscribe to the invalidation channel and evict keys from L1."""
+        if self._client is None:
+            return
+
+        try:
+            self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(INVALIDATION_CHANNEL)
+        except redis.RedisError as e:
+            logger.warning("redis_invalidation_subscribe_error", error=str(e))
+            self._pubsub = None
+            return
+
+        self._listener = asyncio.create_task(self._listen_for_invalidations())
+
+    async def _listen_for_invalidations(self) -> None:
+        """Evict invalidated keys from L1 until cancelled."""
+        while self._pubsub is not None and self._local is not None:
+            try:
+                async for message in self._pubsub.listen():
+                    if message["type"] == "message":
+                        self._local.delete(message["data"])
+                return
+            except redis.RedisError as e:
+                # Entries published while disconnected may be missed, so
+                # drop the whole L1 tier before resubscribing
+                logger.warning("redis_invalidation_listener_error", error=str(e))
+                self._local.clear()
+                await asyncio.sleep(1)
+
     @staticmethod
     def hash_token(token: str) -> str:
         """
@@ -206,6 +637,33 @@ class RedisCache:
         """
         return f"membership:{user_id}:{organization_id}"
 
+    @staticmethod
+    def family_org_ids_cache_key(organization_id: str) -> str:
+        """
+        Generate cache key for an organization's family IDs.
+
+        Args:
+            organization_id: Organization UUID as string.
+
+        Returns:
+            Cache key string.
+        """
+        return f"org:family:{organization_id}"
+
+    @staticmethod
+    def count_cache_key(namespace: str, query_hash: str) -> str:
+        """
+        Generate cache key for a paginated list count.
+
+        Args:
+            namespace: Table or resource name.
+            query_hash: Hash of the filtered count query and its parameters.
+
+        Returns:
+            Cache key string.
+        """
+        return f"count:{namespace}:{query_hash}"
+
 
 # Global cache instance (initialized in app lifespan)
 _redis_cache: RedisCache | None = None
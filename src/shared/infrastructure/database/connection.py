@@ -1,8 +1,56 @@
 """Database connection and session management."""
 
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.app.config import Settings
 from src.app.dependencies.settings import get_settings
+from src.app.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _prepared_statement_name() -> str:
+    """
+    Generate a globally unique prepared statement name.
+
+    PgBouncer (the Neon pooler) tracks prepared statements per client and
+    re-prepares them on whichever server connection runs the transaction.
+    asyncpg's default counter-based names (`__asyncpg_stmt_1__`) repeat
+    across clients, so they can collide on a shared server connection.
+    """
+    return f"__asyncpg_{uuid4().hex}__"
+
+
+def _connection_args(settings: Settings) -> dict:
+    """
+    Build engine arguments for the configured statement mode.
+
+    - unprepared: no statement caching at all (neither asyncpg's cache nor
+      SQLAlchemy's prepared statement LRU); every query is parsed and
+      planned by PostgreSQL.
+    - pooler: SQLAlchemy's per-connection LRU of prepared statements with
+      unique names, safe behind a transaction-mode pooler that supports
+      protocol-level prepared statements (PgBouncer >= 1.21).
+    - direct: same as unprepared for the main (pooled) engine; the read
+      engine gets the prepared statement cache instead.
+    """
+    args = settings.neon_connection_args_async
+
+    if settings.DATABASE_STATEMENT_MODE == "pooler":
+        statement_args = {
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "prepared_statement_name_func": _prepared_statement_name,
+        }
+    else:
+        statement_args = {"prepared_statement_cache_size": 0}
+
+    return {
+        **args,
+        "connect_args": {**args["connect_args"], **statement_args},
+    }
 
 
 def create_engine():
@@ -11,20 +59,61 @@ def create_engine():
 
     engine = create_async_engine(
         settings.database_url_async,
-        **settings.neon_connection_args_async,
+        **_connection_args(settings),
         pool_pre_ping=True,
     )
 
     return engine
 
 
-# Global engine instance
+def create_read_engine(default_engine):
+    """
+    Create the engine used by hot read paths.
+
+    In `direct` mode this is a small pool of direct (non-pooler) Neon
+    connections, where session-level prepared statements are always safe.
+    In every other mode, or without DATABASE_DIRECT_URL, it is the default
+    engine.
+    """
+    settings = get_settings()
+
+    if settings.DATABASE_STATEMENT_MODE != "direct":
+        return default_engine
+
+    direct_url = settings.database_direct_url_async
+    if direct_url is None:
+        logger.warning("database_direct_url_missing", mode="direct")
+        return default_engine
+
+    args = settings.neon_connection_args_async
+    return create_async_engine(
+        direct_url,
+        pool_size=settings.DATABASE_DIRECT_POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=args["pool_timeout"],
+        pool_recycle=args["pool_recycle"],
+        connect_args={
+            **args["connect_args"],
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        },
+        pool_pre_ping=True,
+    )
+
+
+# Global engine instances
 engine = create_engine()
+read_engine = create_read_engine(engine)
 
-# Session factory
+# Session factories
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
     autoflush=False,
 )
+read_session_factory = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
@@ -4,5 +4,25 @@ from src.shared.infrastructure.email.email_service import (
     EmailService,
     get_email_service,
 )
+from src.shared.infrastructure.email.transport import (
+    EmailTransport,
+    EmailTransportError,
+    FakeEmailTransport,
+    OutgoingEmail,
+    ResendEmailTransport,
+    UnconfiguredEmailTransport,
+    get_email_transport,
+)
 
-__all__ = ["EmailService", "get_email_service"]
+__all__ = [
+    "EmailService",
+    "get_email_service",
+    # Transports (used by the outbox worker)
+    "EmailTransport",
+    "EmailTransportError",
+    "FakeEmailTransport",
+    "OutgoingEmail",
+    "ResendEmailTransport",
+    "UnconfiguredEmailTransport",
+    "get_email_transport",
+]
@@ -1,5 +1,6 @@
 """Email service for sending emails via Resend."""
 
+import asyncio
 from functools import lru_cache
 from typing import Any
 
@@ -7,6 +8,7 @@ import resend
 
 from src.app.config import Settings
 from src.app.logging import get_logger
+from src.shared.infrastructure.email.transport import OutgoingEmail
 
 logger = get_logger(__name__)
 
@@ -85,9 +87,10 @@ class EmailService:
             if tags:
                 params["tags"] = tags
 
-            # Resend uses sync API, we run it directly
-            # In production, consider using a worker queue
-            response = resend.Emails.send(params)
+            # Resend uses a sync API: run it in a thread. Emails sent from
+            # request handlers should go through the outbox instead
+            # (EmailOutboxRepository.enqueue), delivered by the worker.
+            response = await asyncio.to_thread(resend.Emails.send, params)
 
             logger.info(
                 "email_sent",
@@ -107,7 +110,7 @@ class EmailService:
             )
             raise
 
-    async def send_invitation_email(
+    def build_invitation_email(
         self,
         to: str,
         invitee_name: str,
@@ -116,9 +119,9 @@ class EmailService:
         role_name: str,
         invitation_link: str,
         expires_in_days: int = 7,
-    ) -> dict[str, Any] | None:
+    ) -> OutgoingEmail:
         """
-        Send an organization invitation email.
+        Render an organization invitation email.
 
         Args:
             to: Invitee email address
@@ -130,7 +133,7 @@ class EmailService:
             expires_in_days: Number of days until invitation expires
 
         Returns:
-            Resend API response or None if not configured
+            The rendered email (to send or enqueue in the outbox)
         """
         subject = f"Convite para {organization_name} - Quero Plantão"
 
@@ -183,8 +186,8 @@ class EmailService:
         </html>
         """
 
-        return await self.send_email(
-            to=to,
+        return OutgoingEmail(
+            to=[to],
             subject=subject,
             html=html,
             tags=[
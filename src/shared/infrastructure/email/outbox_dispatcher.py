@@ -0,0 +1,172 @@
+"""Delivery of outbox emails by the worker (batching, rate limiting, retries)."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.app.config import Settings
+from src.app.logging import get_logger
+from src.shared.domain.models.email_outbox import EmailOutbox
+from src.shared.infrastructure.email.transport import (
+    EmailTransport,
+    EmailTransportError,
+    OutgoingEmail,
+)
+from src.shared.infrastructure.repositories.email_outbox_repository import (
+    EmailOutboxRepository,
+)
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """
+    Spaces calls so that at most `rate` start per second.
+
+    Shared by all concurrent drains of a worker, so the limit holds for
+    the process as a whole.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.interval = 1 / rate
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for the next free slot."""
+        async with self._lock:
+            delay = self._next_slot - self._clock()
+            if delay > 0:
+                await self._sleep(delay)
+            self._next_slot = max(self._clock(), self._next_slot) + self.interval
+
+
+class EmailOutboxDispatcher:
+    """
+    Sends pending outbox emails.
+
+    Each batch is claimed in its own short transaction, sent with one
+    provider request (rate limited) while no transaction is open, and its
+    outcome recorded in another short transaction. A failed request puts
+    the whole batch back with exponential backoff, or marks it as FAILED
+    once attempts are exhausted.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        transport: EmailTransport,
+        settings: Settings,
+        *,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.transport = transport
+        self.batch_size = settings.EMAIL_OUTBOX_BATCH_SIZE
+        self.max_attempts = settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        self.retry_backoff = settings.EMAIL_OUTBOX_RETRY_BACKOFF
+        self.lock_timeout = timedelta(seconds=settings.EMAIL_OUTBOX_LOCK_TIMEOUT)
+        self.rate_limiter = rate_limiter or RateLimiter(
+            settings.EMAIL_OUTBOX_RATE_LIMIT
+        )
+
+    async def drain(self) -> int:
+        """
+        Send due emails until none are left or a send request fails.
+
+        Returns:
+            Number of emails sent.
+        """
+        sent = 0
+        while True:
+            claimed, delivered = await self.dispatch_batch()
+            sent += delivered
+            if claimed < self.batch_size or delivered < claimed:
+                return sent
+
+    async def dispatch_batch(self) -> tuple[int, int]:
+        """
+        Claim, send and record one batch.
+
+        Returns:
+            Tuple of (emails claimed, emails sent).
+        """
+        stale_before = datetime.now(timezone.utc) - self.lock_timeout
+        async with self.session_factory() as session:
+            emails = await EmailOutboxRepository(session).claim_batch(
+                self.batch_size, stale_before
+            )
+            await session.commit()
+
+        if not emails:
+            return 0, 0
+
+        await self.rate_limiter.acquire()
+        try:
+            provider_ids = await self.transport.send_batch(
+                [self._to_outgoing(email) for email in emails]
+            )
+        except Exception as e:
+            await self._record_failure(emails, e)
+            return len(emails), 0
+
+        if len(provider_ids) != len(emails):
+            # Transport broke its contract: record it instead of leaving rows SENDING
+            await self._record_failure(
+                emails,
+                EmailTransportError(
+                    f"Transport returned {len(provider_ids)} IDs for {len(emails)} emails"
+                ),
+            )
+            return len(emails), 0
+
+        async with self.session_factory() as session:
+            await EmailOutboxRepository(session).mark_sent(
+                list(zip([email.id for email in emails], provider_ids, strict=True))
+            )
+            await session.commit()
+
+        logger.info(
+            "email_outbox_batch_sent",
+            count=len(emails),
+            kinds=sorted({email.kind for email in emails}),
+        )
+        return len(emails), len(emails)
+
+    async def _record_failure(self, emails: list[EmailOutbox], error: Exception) -> None:
+        """Schedule a retry (or fail permanently) every email of a batch."""
+        async with self.session_factory() as session:
+            failed = await EmailOutboxRepository(session).record_failure(
+                [email.id for email in emails],
+                str(error) or type(error).__name__,
+                max_attempts=self.max_attempts,
+                backoff_seconds=self.retry_backoff,
+            )
+            await session.commit()
+
+        logger.warning(
+            "email_outbox_batch_failed",
+            count=len(emails),
+            failed_permanently=failed,
+            error=str(error),
+        )
+
+    @staticmethod
+    def _to_outgoing(email: EmailOutbox) -> OutgoingEmail:
+        return OutgoingEmail(
+            to=email.recipients,
+            subject=email.subject,
+            html=email.html,
+            tags=email.tags,
+        )
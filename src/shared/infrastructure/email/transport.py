@@ -0,0 +1,137 @@
+"""Email transports used by the outbox worker to deliver emails."""
+
+import asyncio
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Protocol
+from uuid import uuid4
+
+import resend
+
+from src.app.config import Settings
+from src.app.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    """A rendered email, ready to be queued or sent."""
+
+    to: list[str]
+    subject: str
+    html: str
+    tags: list[dict[str, str]] = field(default_factory=list)
+
+
+class EmailTransportError(Exception):
+    """Raised when the provider rejects or fails a send request."""
+
+
+class EmailTransport(Protocol):
+    """Sends batches of emails with one provider request."""
+
+    async def send_batch(self, emails: list[OutgoingEmail]) -> list[str | None]:
+        """
+        Send emails with a single provider request.
+
+        Args:
+            emails: Emails to send (at most 100).
+
+        Returns:
+            Provider message ID of each email, in order.
+
+        Raises:
+            EmailTransportError: If the request fails (no email was sent).
+        """
+        ...
+
+
+class ResendEmailTransport:
+    """Transport using Resend's batch API (up to 100 emails per request)."""
+
+    def __init__(self, settings: Settings) -> None:
+        self.from_address = f"{settings.RESEND_FROM_NAME} <{settings.RESEND_FROM_EMAIL}>"
+        resend.api_key = settings.RESEND_API_KEY
+
+    def _params(self, email: OutgoingEmail) -> dict[str, Any]:
+        params: dict[str, Any] = {
+            "from": self.from_address,
+            "to": email.to,
+            "subject": email.subject,
+            "html": email.html,
+        }
+        if email.tags:
+            params["tags"] = email.tags
+        return params
+
+    async def send_batch(self, emails: list[OutgoingEmail]) -> list[str | None]:
+        """Send emails with one batch request (the SDK is sync, so in a thread)."""
+        try:
+            response = await asyncio.to_thread(
+                resend.Batch.send, [self._params(email) for email in emails]
+            )
+        except Exception as e:
+            raise EmailTransportError(str(e)) from e
+
+        data = response.get("data", []) if isinstance(response, dict) else response
+        # Not padded: a short list is rejected by the dispatcher
+        return [item.get("id") for item in data or []]
+
+
+class FakeEmailTransport:
+    """
+    In-memory transport for tests and benchmarks.
+
+    Records sent emails instead of delivering them. Can simulate provider
+    latency and fail the first `fail_times` requests.
+    """
+
+    def __init__(self, *, latency: float = 0.0, fail_times: int = 0) -> None:
+        self.latency = latency
+        self.fail_times = fail_times
+        self.requests = 0
+        self.sent: list[OutgoingEmail] = []
+
+    async def send_batch(self, emails: list[OutgoingEmail]) -> list[str | None]:
+        """Record the emails (or fail, while fail_times lasts)."""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise EmailTransportError("Simulated provider failure")
+
+        self.sent.extend(emails)
+        return [f"fake-{uuid4()}" for _ in emails]
+
+
+class UnconfiguredEmailTransport:
+    """
+    Transport for environments without Resend.
+
+    Fails every request instead of pretending to deliver, so outbox rows
+    are retried with backoff and end FAILED ("email not configured"),
+    and nothing is kept in memory.
+    """
+
+    async def send_batch(self, emails: list[OutgoingEmail]) -> list[str | None]:
+        """Refuse the batch (no email is sent)."""
+        logger.warning("email_not_configured", count=len(emails))
+        raise EmailTransportError("email not configured")
+
+
+@lru_cache
+def get_email_transport() -> EmailTransport:
+    """Get the email transport (Resend when configured, unconfigured otherwise)."""
+    from src.app.dependencies import get_settings
+
+    settings = get_settings()
+    if settings.RESEND_API_KEY:
+        return ResendEmailTransport(settings)
+
+    logger.warning(
+        "email_not_configured",
+        message="Email service not configured, emails will not be delivered",
+    )
+    return UnconfiguredEmailTransport()
@@ -10,6 +10,8 @@ from src.shared.infrastructure.firebase.storage_service import (
     ALLOWED_MIME_TYPES,
     MAX_FILE_SIZE,
     FirebaseStorageService,
+    SignedUpload,
+    StoredFileMetadata,
     UploadedFile,
     get_storage_service,
     set_storage_service,
@@ -25,6 +27,8 @@ __all__ = [
     "ALLOWED_MIME_TYPES",
     "MAX_FILE_SIZE",
     "FirebaseStorageService",
+    "SignedUpload",
+    "StoredFileMetadata",
     "UploadedFile",
     "get_storage_service",
     "set_storage_service",
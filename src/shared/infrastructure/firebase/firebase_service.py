@@ -1,12 +1,17 @@
 """Firebase Admin SDK service for token verification."""
 
+import asyncio
 import base64
 import json
+import re
+import threading
 import time
 from dataclasses import dataclass
 
 import firebase_admin
+import httpx
 from firebase_admin import auth, credentials
+from jose import ExpiredSignatureError, JWTError, jwt
 
 from src.app.config import Settings
 from src.app.exceptions import (
@@ -17,10 +22,28 @@ from src.app.exceptions import (
     RevokedTokenError,
 )
 from src.app.logging import get_logger
+from src.shared.infrastructure.cache import LocalCache, RedisCache
 
 
 logger = get_logger(__name__)
 
+# Google public keys used to sign Firebase ID tokens (x509 PEM by kid)
+FIREBASE_PUBLIC_KEYS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/"
+    "securetoken@system.gserviceaccount.com"
+)
+FIREBASE_ISSUER_PREFIX = "https://securetoken.google.com/"
+
+# Public key refresh timing (seconds)
+PUBLIC_KEYS_DEFAULT_MAX_AGE = 3600
+PUBLIC_KEYS_REFRESH_MARGIN = 300
+PUBLIC_KEYS_RETRY_INTERVAL = 30
+
+# Firebase ID tokens live for at most one hour
+TOKEN_CLAIMS_CACHE_TTL = 3600
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
 
 @dataclass(frozen=True, slots=True)
 class FirebaseTokenInfo:
@@ -51,6 +74,25 @@ class FirebaseService:
         self._settings = settings
         self._initialized = False
 
+        # Local verification state
+        self._public_keys: dict[str, str] = {}
+        self._public_keys_expire_at: float = 0.0
+        self._public_keys_lock = threading.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        self._claims_cache = LocalCache(
+            max_size=settings.FIREBASE_TOKEN_CACHE_MAX_SIZE,
+            default_ttl=TOKEN_CLAIMS_CACHE_TTL,
+        )
+
+    @property
+    def project_id(self) -> str:
+        """Firebase project ID used as token audience."""
+        if self._settings.FIREBASE_PROJECT_ID:
+            return self._settings.FIREBASE_PROJECT_ID
+        if firebase_admin._apps:
+            return firebase_admin.get_app().project_id or ""
+        return ""
+
     def initialize(self) -> None:
         """
         Initialize Firebase Admin SDK.
@@ -176,6 +218,234 @@ class FirebaseService:
                 details={"error": str(e)},
             ) from e
 
+    async def verify_token_async(self, token: str) -> FirebaseTokenInfo:
+        """
+        Verify a Firebase ID token without blocking the event loop.
+
+        Verified claims are kept in an in-process cache keyed by the token
+        hash until the token expires, so repeated requests with the same
+        token skip verification entirely and nothing is written to Redis.
+
+        Uses local signature verification against the cached Google public
+        keys when FIREBASE_LOCAL_TOKEN_VERIFICATION is enabled, otherwise
+        the Admin SDK. Either way verification runs in a worker thread.
+
+        Args:
+            token: Firebase ID token to verify.
+
+        Returns:
+            FirebaseTokenInfo with verified token claims.
+
+        Raises:
+            InvalidTokenError: If token is invalid or malformed.
+            ExpiredTokenError: If token has expired.
+            RevokedTokenError: If token has been revoked (SDK mode only).
+            FirebaseAuthError: For other Firebase authentication errors.
+        """
+        token_hash = RedisCache.hash_token(token)
+
+        # Try in-process claims cache first
+        hit, cached = self._claims_cache.get(token_hash)
+        if hit:
+            if cached.exp > time.time():
+                return cached
+            self._claims_cache.delete(token_hash)
+
+        if self._settings.FIREBASE_LOCAL_TOKEN_VERIFICATION:
+            token_info = await asyncio.to_thread(self.verify_token_local, token)
+        else:
+            token_info = await asyncio.to_thread(self.verify_token, token)
+
+        # Cache verified claims until the token expires
+        ttl = self.calculate_token_ttl(token_info)
+        if ttl > 0:
+            self._claims_cache.set(token_hash, token_info, ttl=ttl)
+
+        return token_info
+
+    def verify_token_local(self, token: str) -> FirebaseTokenInfo:
+        """
+        Verify a Firebase ID token locally against Google public keys.
+
+        Checks the RS256 signature, expiration, audience (project ID),
+        issuer and subject as documented for third-party JWT libraries.
+        Does not check revocation. Blocking: call from a worker thread.
+
+        Args:
+            token: Firebase ID token to verify.
+
+        Returns:
+            FirebaseTokenInfo with verified token claims.
+
+        Raises:
+            InvalidTokenError: If token is invalid or malformed.
+            ExpiredTokenError: If token has expired.
+            FirebaseAuthError: If public keys cannot be fetched.
+        """
+        project_id = self.project_id
+
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError as e:
+            raise InvalidTokenError(
+                message="Invalid Firebase token",
+                details={"error": str(e)},
+            ) from e
+
+        kid = header.get("kid")
+        if header.get("alg") != "RS256" or not kid:
+            raise InvalidTokenError(
+                message="Invalid Firebase token",
+                details={"error": "Unexpected token header"},
+            )
+
+        public_key = self._get_public_key(kid)
+
+        try:
+            claims = jwt.decode(
+                token,
+                public_key,
+                algorithms=["RS256"],
+                audience=project_id,
+                issuer=f"{FIREBASE_ISSUER_PREFIX}{project_id}",
+            )
+        except ExpiredSignatureError as e:
+            raise ExpiredTokenError(
+                message="Firebase token has expired",
+                details={"error": str(e)},
+            ) from e
+        except JWTError as e:
+            raise InvalidTokenError(
+                message="Invalid Firebase token",
+                details={"error": str(e)},
+            ) from e
+
+        uid = claims.get("sub")
+        if not isinstance(uid, str) or not uid or len(uid) > 128:
+            raise InvalidTokenError(
+                message="Invalid Firebase token",
+                details={"error": "Invalid subject claim"},
+            )
+
+        if claims.get("auth_time", 0) > time.time():
+            raise InvalidTokenError(
+                message="Invalid Firebase token",
+                details={"error": "Authentication time is in the future"},
+            )
+
+        return FirebaseTokenInfo(
+            uid=uid,
+            email=claims.get("email"),
+            email_verified=claims.get("email_verified", False),
+            exp=claims["exp"],
+            iat=claims.get("iat", 0),
+        )
+
+    def _get_public_key(self, kid: str) -> str:
+        """
+        Get a public key by ID, fetching the key set if stale or unknown.
+
+        Blocking: call from a worker thread.
+
+        Raises:
+            InvalidTokenError: If no public key matches the token kid.
+            FirebaseAuthError: If public keys cannot be fetched.
+        """
+        if not self._has_fresh_key(kid):
+            with self._public_keys_lock:
+                # Another thread may have refreshed while we waited
+                if not self._has_fresh_key(kid):
+                    self._fetch_public_keys()
+
+        public_key = self._public_keys.get(kid)
+        if public_key is None:
+            raise InvalidTokenError(
+                message="Invalid Firebase token",
+                details={"error": "Unknown signing key"},
+            )
+        return public_key
+
+    def _has_fresh_key(self, kid: str) -> bool:
+        """Check if the key set is fresh and contains the given key ID."""
+        return kid in self._public_keys and time.time() < self._public_keys_expire_at
+
+    def _fetch_public_keys(self) -> float:
+        """
+        Fetch the Google public key set and its cache lifetime.
+
+        Blocking: call from a worker thread.
+
+        Returns:
+            Seconds the key set may be cached for (from Cache-Control).
+
+        Raises:
+            FirebaseAuthError: If the key set cannot be fetched.
+        """
+        try:
+            response = httpx.get(FIREBASE_PUBLIC_KEYS_URL, timeout=10.0)
+            response.raise_for_status()
+            keys = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise FirebaseAuthError(
+                message="Failed to fetch Firebase certificates",
+                details={"error": str(e)},
+            ) from e
+
+        match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+        max_age = int(match.group(1)) if match else PUBLIC_KEYS_DEFAULT_MAX_AGE
+
+        self._public_keys = keys
+        self._public_keys_expire_at = time.time() + max_age
+        logger.debug("firebase_public_keys_refreshed", keys=len(keys), max_age=max_age)
+        return max_age
+
+    async def start_public_key_refresh(self) -> None:
+        """
+        Start refreshing the public key set in the background.
+
+        Keys are refreshed shortly before they expire so request-time
+        verification never waits on the network. No-op when local
+        verification is disabled or the refresh task is already running.
+        """
+        if not self._settings.FIREBASE_LOCAL_TOKEN_VERIFICATION:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        self._refresh_task = asyncio.create_task(self._refresh_public_keys_loop())
+
+    async def stop_public_key_refresh(self) -> None:
+        """Stop the background public key refresh task."""
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    async def _refresh_public_keys_loop(self) -> None:
+        """Refresh public keys before they expire, retrying on failure."""
+        while True:
+            try:
+                max_age = await asyncio.to_thread(self._fetch_locked)
+                delay = max(
+                    max_age - PUBLIC_KEYS_REFRESH_MARGIN,
+                    PUBLIC_KEYS_RETRY_INTERVAL,
+                )
+            except FirebaseAuthError as e:
+                logger.warning("firebase_public_keys_refresh_failed", error=str(e))
+                delay = PUBLIC_KEYS_RETRY_INTERVAL
+
+            await asyncio.sleep(delay)
+
+    def _fetch_locked(self) -> float:
+        """Fetch public keys while holding the key set lock."""
+        with self._public_keys_lock:
+            return self._fetch_public_keys()
+
     def calculate_token_ttl(self, token_info: FirebaseTokenInfo) -> int:
         """
         Calculate TTL for caching a token based on expiration.
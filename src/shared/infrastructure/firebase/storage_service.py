@@ -1,7 +1,11 @@
 """Firebase Storage service for file uploads."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from io import BytesIO
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING, Any, BinaryIO
 from uuid import UUID
@@ -33,6 +37,25 @@ ALLOWED_MIME_TYPES = frozenset(
 # Maximum file size (10 MB)
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
+# Resumable upload chunks must be a multiple of 256 KB (GCS requirement)
+CHUNK_SIZE_MULTIPLE = 256 * 1024
+
+# Shared across service instances: bounds concurrent Storage I/O per worker
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Get (or create) the thread pool used for blocking Storage calls."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="storage",
+            )
+        return _executor
+
 
 @dataclass(frozen=True, slots=True)
 class UploadedFile:
@@ -44,24 +67,65 @@ class UploadedFile:
     size: int
 
 
+@dataclass(frozen=True, slots=True)
+class SignedUpload:
+    """Signed URL the client uses to upload a file directly to Storage."""
+
+    url: str
+    path: str
+    headers: dict[str, str]
+    expires_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class StoredFileMetadata:
+    """Metadata of an object as recorded by Storage."""
+
+    path: str
+    size: int
+    content_type: str | None
+
+
 class FirebaseStorageService:
     """
     Firebase Storage service for file uploads.
 
     Provides methods to upload files to Firebase Storage
     with validation and organized path structure.
+
+    The Storage SDK is blocking, so every call runs in a dedicated thread
+    pool (FIREBASE_STORAGE_UPLOAD_CONCURRENCY threads per worker) instead of
+    on the event loop. Uploads stream the file in resumable chunks rather
+    than reading it into memory.
+
+    For local testing, pass a bucket (e.g., a fake) or point
+    STORAGE_EMULATOR_HOST at a GCS emulator.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, bucket: "Bucket | None" = None) -> None:
         """
         Initialize Firebase Storage service.
 
         Args:
             settings: Application settings with Firebase configuration.
+            bucket: Optional bucket to use instead of the Firebase default
+                    (e.g., an emulator or fake bucket).
         """
         self._settings = settings
         self._bucket_name = settings.FIREBASE_STORAGE_BUCKET
-        self._bucket: Bucket | None = None
+        self._bucket: Bucket | None = bucket
+        self._chunk_size = max(
+            CHUNK_SIZE_MULTIPLE,
+            settings.FIREBASE_STORAGE_CHUNK_SIZE
+            // CHUNK_SIZE_MULTIPLE
+            * CHUNK_SIZE_MULTIPLE,
+        )
+        self._executor = _get_executor(settings.FIREBASE_STORAGE_UPLOAD_CONCURRENCY)
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        """Run a blocking Storage call in the storage thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
 
     def _get_bucket(self) -> Any:
         """Get or initialize the storage bucket."""
@@ -152,15 +216,57 @@ class FirebaseStorageService:
         # Add timestamp to prevent collisions
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
 
-        path = (
+        prefix = self.screening_document_prefix(
+            organization_id=organization_id,
+            professional_id=professional_id,
+            screening_id=screening_id,
+            document_type_id=document_type_id,
+        )
+
+        return f"{prefix}{timestamp}_{safe_name}"
+
+    @staticmethod
+    def screening_document_prefix(
+        organization_id: UUID,
+        professional_id: UUID,
+        screening_id: UUID,
+        document_type_id: UUID,
+    ) -> str:
+        """
+        Get the folder holding a screening document's uploads.
+
+        Used to check that a client-provided path (direct uploads) belongs
+        to the document being confirmed.
+
+        Returns:
+            Path prefix ending with "/".
+        """
+        return (
             f"organizations/{organization_id}"
             f"/professionals/{professional_id}"
             f"/screenings/{screening_id}"
-            f"/{document_type_id}"
-            f"/{timestamp}_{safe_name}"
+            f"/{document_type_id}/"
         )
 
-        return path
+    @staticmethod
+    def professional_import_path(
+        organization_id: UUID,
+        job_id: UUID,
+        file_name: str,
+    ) -> str:
+        """
+        Generate the storage path of a professional import spreadsheet.
+
+        Structure: organizations/{org_id}/professional_imports/{job_id}/{filename}
+
+        Returns:
+            Full path in storage bucket.
+        """
+        safe_name = PurePosixPath(file_name).name.replace(" ", "_")
+        return (
+            f"organizations/{organization_id}"
+            f"/professional_imports/{job_id}/{safe_name}"
+        )
 
     async def upload_file(
         self,
@@ -176,8 +282,11 @@ class FirebaseStorageService:
         """
         Upload a file to Firebase Storage.
 
+        The file is streamed in resumable chunks from a worker thread, so
+        neither the upload nor URL signing blocks the event loop.
+
         Args:
-            file: File-like object with the content.
+            file: File-like object with the content (e.g., UploadFile.file).
             file_name: Original file name.
             file_size: Size of the file in bytes.
             content_type: MIME type of the file.
@@ -204,24 +313,13 @@ class FirebaseStorageService:
             file_name=file_name,
         )
 
-        # Upload to Firebase Storage
-        bucket = self._get_bucket()
-        blob = bucket.blob(path)
-
-        # Read content (sync operation - Firebase SDK is sync)
-        content = file.read()
-
-        blob.upload_from_string(
-            content,
-            content_type=validated_content_type,
-        )
-
-        # Make the blob publicly accessible or generate signed URL
-        # Using signed URL for security (1 year validity)
-        url = blob.generate_signed_url(
-            version="v4",
-            expiration=timedelta(days=365),
-            method="GET",
+        # Stream to Firebase Storage off the event loop
+        url = await self._run(
+            self._upload_blocking,
+            file,
+            path,
+            file_size,
+            validated_content_type,
         )
 
         logger.info(
@@ -238,6 +336,171 @@ class FirebaseStorageService:
             size=file_size,
         )
 
+    async def create_upload_url(
+        self,
+        file_name: str,
+        file_size: int,
+        content_type: str | None,
+        organization_id: UUID,
+        professional_id: UUID,
+        screening_id: UUID,
+        document_type_id: UUID,
+    ) -> SignedUpload:
+        """
+        Create a short-lived signed URL for a direct-to-storage upload.
+
+        The client PUTs the file to the URL with the returned headers; the
+        API never receives the bytes. The signature binds the content type
+        and an upload size range, so GCS rejects anything else. The declared
+        size and type are validated here and checked again against the
+        stored object on confirm (see get_file_metadata).
+
+        Args:
+            file_name: Original file name.
+            file_size: Declared size of the file in bytes.
+            content_type: Declared MIME type of the file.
+            organization_id: Organization UUID.
+            professional_id: Professional UUID.
+            screening_id: Screening process UUID.
+            document_type_id: Document type UUID.
+
+        Returns:
+            SignedUpload with URL, path, required headers and expiration.
+
+        Raises:
+            ValidationError: If the declared file doesn't meet requirements.
+        """
+        validated_content_type = self._validate_file(file_size, content_type)
+
+        path = self._generate_path(
+            organization_id=organization_id,
+            professional_id=professional_id,
+            screening_id=screening_id,
+            document_type_id=document_type_id,
+            file_name=file_name,
+        )
+
+        ttl = timedelta(seconds=self._settings.FIREBASE_STORAGE_UPLOAD_URL_TTL)
+        expires_at = datetime.now(timezone.utc) + ttl
+        headers = {
+            "Content-Type": validated_content_type,
+            "x-goog-content-length-range": f"0,{MAX_FILE_SIZE}",
+        }
+
+        url = await self._run(self._sign_upload_blocking, path, ttl, headers)
+
+        logger.info(
+            "upload_url_created",
+            path=path,
+            size=file_size,
+            content_type=validated_content_type,
+        )
+
+        return SignedUpload(url=url, path=path, headers=headers, expires_at=expires_at)
+
+    async def upload_bytes(
+        self,
+        content: bytes,
+        path: str,
+        content_type: str,
+    ) -> str:
+        """
+        Upload in-memory content to a given path and sign its download URL.
+
+        For files generated by the backend (e.g., compliance report PDFs).
+        Validation is up to the caller.
+
+        Args:
+            content: File content.
+            path: Path of the file in the bucket.
+            content_type: MIME type of the file.
+
+        Returns:
+            Signed download URL.
+        """
+        url = await self._run(
+            self._upload_blocking, BytesIO(content), path, len(content), content_type
+        )
+        logger.info("file_stored", path=path, size=len(content), content_type=content_type)
+        return url
+
+    async def store_file(
+        self,
+        file: BinaryIO,
+        path: str,
+        file_size: int,
+        content_type: str,
+    ) -> None:
+        """
+        Stream a file to a given path, without signing a download URL.
+
+        For files only read back by the backend (e.g., import spreadsheets
+        processed by the worker). Validation is up to the caller.
+
+        Args:
+            file: File-like object with the content (e.g., UploadFile.file).
+            path: Path of the file in the bucket.
+            file_size: Size of the file in bytes.
+            content_type: MIME type of the file.
+        """
+        await self._run(self._store_blocking, file, path, file_size, content_type)
+        logger.info("file_stored", path=path, size=file_size, content_type=content_type)
+
+    async def download_to_file(self, path: str, file: BinaryIO) -> None:
+        """
+        Download a stored object into a file, in chunks.
+
+        The file is rewound afterwards, ready to be read.
+
+        Args:
+            path: Path of the file in the bucket.
+            file: Writable file-like object (e.g., a SpooledTemporaryFile).
+        """
+        await self._run(self._download_blocking, path, file)
+
+    async def get_file_metadata(self, path: str) -> StoredFileMetadata | None:
+        """
+        Get size and content type of a stored object.
+
+        Args:
+            path: Path of the file in the bucket.
+
+        Returns:
+            StoredFileMetadata, or None if the object doesn't exist.
+        """
+        return await self._run(self._get_metadata_blocking, path)
+
+    async def validate_stored_file(self, metadata: StoredFileMetadata) -> str:
+        """
+        Validate a directly uploaded object, deleting it when invalid.
+
+        Args:
+            metadata: Metadata read from Storage.
+
+        Returns:
+            Validated content type.
+
+        Raises:
+            ValidationError: If the object doesn't meet requirements.
+        """
+        try:
+            return self._validate_file(metadata.size, metadata.content_type)
+        except ValidationError:
+            await self.delete_file(metadata.path)
+            raise
+
+    async def generate_download_url(self, path: str) -> str:
+        """
+        Sign a download URL for a stored object.
+
+        Args:
+            path: Path of the file in the bucket.
+
+        Returns:
+            Signed download URL.
+        """
+        return await self._run(self._sign_download_blocking, path)
+
     async def delete_file(self, path: str) -> bool:
         """
         Delete a file from Firebase Storage.
@@ -249,15 +512,101 @@ class FirebaseStorageService:
             True if deleted, False if not found.
         """
         try:
-            bucket = self._get_bucket()
-            blob = bucket.blob(path)
-            blob.delete()
+            await self._run(self._delete_blocking, path)
             logger.info("file_deleted", path=path)
             return True
         except Exception as e:
             logger.warning("file_delete_failed", path=path, error=str(e))
             return False
 
+    def _upload_blocking(
+        self,
+        file: BinaryIO,
+        path: str,
+        file_size: int,
+        content_type: str,
+    ) -> str:
+        """
+        Upload a file and sign its URL (blocking, runs in the thread pool).
+
+        Returns:
+            Signed download URL.
+        """
+        self._store_blocking(file, path, file_size, content_type)
+        return self._sign_download_blocking(path)
+
+    def _store_blocking(
+        self,
+        file: BinaryIO,
+        path: str,
+        file_size: int,
+        content_type: str,
+    ) -> None:
+        """
+        Upload a file (blocking, runs in the thread pool).
+
+        Setting chunk_size makes the SDK use a resumable upload that reads
+        and sends one chunk at a time.
+        """
+        blob = self._get_bucket().blob(path)
+        blob.chunk_size = self._chunk_size
+        blob.upload_from_file(
+            file,
+            rewind=True,
+            size=file_size,
+            content_type=content_type,
+        )
+
+    def _download_blocking(self, path: str, file: BinaryIO) -> None:
+        """Download a blob in chunks (blocking, runs in the thread pool)."""
+        blob = self._get_bucket().blob(path)
+        blob.chunk_size = self._chunk_size
+        blob.download_to_file(file)
+        file.seek(0)
+
+    def _sign_download_blocking(self, path: str) -> str:
+        """Sign a download URL (blocking, runs in the thread pool)."""
+        # Using signed URL for security (1 year validity)
+        return self._get_bucket().blob(path).generate_signed_url(
+            version="v4",
+            expiration=timedelta(days=365),
+            method="GET",
+        )
+
+    def _sign_upload_blocking(
+        self,
+        path: str,
+        expiration: timedelta,
+        headers: dict[str, str],
+    ) -> str:
+        """Sign a PUT URL for a direct upload (blocking, runs in the thread pool)."""
+        return self._get_bucket().blob(path).generate_signed_url(
+            version="v4",
+            expiration=expiration,
+            method="PUT",
+            content_type=headers["Content-Type"],
+            headers={
+                key: value
+                for key, value in headers.items()
+                if key != "Content-Type"
+            },
+        )
+
+    def _get_metadata_blocking(self, path: str) -> StoredFileMetadata | None:
+        """Fetch object metadata (blocking, runs in the thread pool)."""
+        blob = self._get_bucket().get_blob(path)
+        if blob is None:
+            return None
+        return StoredFileMetadata(
+            path=path,
+            size=blob.size or 0,
+            content_type=blob.content_type,
+        )
+
+    def _delete_blocking(self, path: str) -> None:
+        """Delete a blob (blocking, runs in the thread pool)."""
+        self._get_bucket().blob(path).delete()
+
 
 # Global storage service instance
 _storage_service: FirebaseStorageService | None = None
@@ -0,0 +1,62 @@
+"""
+Email outbox wake-up queue.
+
+Emails are stored in the email_outbox table (the source of truth). After
+committing, producers publish a notification to EMAIL_OUTBOX_QUEUE so the
+worker (src/workers/handlers/email_outbox_handler.py) sends them right
+away; the worker also polls the table periodically, so a lost
+notification only delays an email.
+"""
+
+from uuid import UUID
+
+from faststream.rabbit import RabbitQueue
+from pydantic import BaseModel
+
+from src.app.dependencies import get_settings
+from src.app.logging import get_logger
+from src.shared.infrastructure.messaging.broker import broker
+
+
+logger = get_logger(__name__)
+_settings = get_settings()
+
+EMAIL_OUTBOX_QUEUE = RabbitQueue(
+    f"{_settings.LAVINMQ_QUEUE_PREFIX}email_outbox",
+    durable=True,
+)
+
+
+async def declare_email_queues() -> None:
+    """Declare the email outbox queue on the broker."""
+    await broker.declare_queue(EMAIL_OUTBOX_QUEUE)
+
+
+class EmailOutboxNotification(BaseModel):
+    """Message telling the worker that outbox emails are due."""
+
+    email_ids: list[UUID]
+
+
+async def notify_email_outbox(email_ids: list[UUID]) -> None:
+    """
+    Wake the worker up to send newly committed outbox emails.
+
+    Best effort: failures are logged and the periodic poll sends the
+    emails later. Call only after the transaction that enqueued them
+    has committed.
+
+    Args:
+        email_ids: IDs of the enqueued emails (for tracing).
+    """
+    try:
+        await broker.publish(
+            EmailOutboxNotification(email_ids=email_ids),
+            queue=EMAIL_OUTBOX_QUEUE,
+        )
+    except Exception as e:
+        logger.warning(
+            "email_outbox_notify_failed",
+            error=str(e),
+            email_ids=[str(email_id) for email_id in email_ids],
+        )
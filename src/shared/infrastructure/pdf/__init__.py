@@ -1,5 +1,15 @@
 """PDF generation infrastructure."""
 
-from src.shared.infrastructure.pdf.pdf_generator_service import PDFGeneratorService
+from src.shared.infrastructure.pdf.pdf_generator_service import (
+    PDFGeneratorService,
+    RenderedPDF,
+    get_pdf_generator_service,
+    shutdown_render_pools,
+)
 
-__all__ = ["PDFGeneratorService"]
+__all__ = [
+    "PDFGeneratorService",
+    "RenderedPDF",
+    "get_pdf_generator_service",
+    "shutdown_render_pools",
+]
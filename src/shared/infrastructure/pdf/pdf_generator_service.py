@@ -1,13 +1,22 @@
 """PDF generation service using WeasyPrint."""
 
+import asyncio
 import base64
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from weasyprint import HTML
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 
+from src.app.config import Settings
+from src.app.dependencies.settings import get_settings
 from src.app.logging import get_logger
 
 logger = get_logger(__name__)
@@ -16,6 +25,96 @@ logger = get_logger(__name__)
 # Path to assets folder
 ASSETS_PATH = Path(__file__).parent.parent.parent.parent / "assets" / "images"
 
+# Render process pools, one per templates directory (shared across services)
+_render_pools: dict[Path, ProcessPoolExecutor] = {}
+_render_pools_lock = threading.Lock()
+
+# Inside a render process: service with preloaded templates
+_process_service: "PDFGeneratorService | None" = None
+
+# Services, one per templates directory (shared across use cases)
+_services: dict[Path, "PDFGeneratorService"] = {}
+_services_lock = threading.Lock()
+
+
+def _init_render_process(templates_dir: Path) -> None:
+    """Render process initializer: build the Jinja environment once."""
+    global _process_service
+    _process_service = PDFGeneratorService(templates_dir)
+    _process_service.preload_templates()
+
+
+def _render_in_process(template_name: str, context: dict[str, Any]) -> "RenderedPDF":
+    """Render a PDF inside a render process."""
+    if _process_service is None:
+        raise RuntimeError("Render process not initialized")
+    return _process_service.render_pdf(template_name, context)
+
+
+def _get_render_pool(templates_dir: Path, settings: Settings) -> ProcessPoolExecutor:
+    """Get (or create) the render process pool for a templates directory."""
+    with _render_pools_lock:
+        pool = _render_pools.get(templates_dir)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=settings.PDF_RENDER_WORKERS,
+                initializer=_init_render_process,
+                initargs=(templates_dir,),
+                max_tasks_per_child=settings.PDF_RENDER_MAX_TASKS_PER_CHILD,
+            )
+            _render_pools[templates_dir] = pool
+        return pool
+
+
+def get_pdf_generator_service(templates_dir: Path) -> "PDFGeneratorService":
+    """
+    Get (or create) the shared service for a templates directory.
+
+    Use cases are built per request/message; sharing the service keeps its
+    warm rendering context (used when PDF_RENDER_WORKERS=0) across renders.
+    """
+    with _services_lock:
+        service = _services.get(templates_dir)
+        if service is None:
+            service = PDFGeneratorService(templates_dir)
+            _services[templates_dir] = service
+        return service
+
+
+def shutdown_render_pools() -> None:
+    """Shut down all render process pools (application shutdown)."""
+    with _render_pools_lock:
+        for pool in _render_pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+        _render_pools.clear()
+
+
+@lru_cache(maxsize=32)
+def _load_image_as_base64(image_path: Path) -> str:
+    """Load an image file as base64 (memoized: assets don't change at runtime)."""
+    if not image_path.exists():
+        logger.warning("image_not_found", path=str(image_path))
+        return ""
+
+    with open(image_path, "rb") as f:
+        return base64.b64encode(f.read()).decode("utf-8")
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedPDF:
+    """
+    A rendered PDF with per-stage timings.
+
+    Attributes:
+        content: PDF bytes.
+        timings: Milliseconds per stage: render_html (Jinja), layout
+                 (WeasyPrint HTML parsing, styling and pagination) and
+                 write (PDF serialization).
+    """
+
+    content: bytes
+    timings: dict[str, float] = field(default_factory=dict)
+
 
 def format_cpf(value: str | None) -> str:
     """Format CPF as XXX.XXX.XXX-XX."""
@@ -59,16 +158,32 @@ class PDFGeneratorService:
     Service for generating PDFs from HTML templates using WeasyPrint.
 
     Uses Jinja2 for template rendering and WeasyPrint for PDF generation.
+
+    Rendering is CPU-bound and holds the GIL, so generate_pdf runs it in a
+    bounded process pool (PDF_RENDER_WORKERS processes per API worker, each
+    with the templates preloaded) instead of on the event loop. With
+    PDF_RENDER_WORKERS=0 it runs in a thread: the loop stays responsive but
+    rendering still competes for the GIL.
+
+    Each service keeps a warm rendering context: compiled Jinja templates,
+    one WeasyPrint FontConfiguration, the parsed companion stylesheet of
+    each template ("report.html" -> "report.css", if present) and an image
+    cache, so repeated renders only pay for the document itself. The
+    context is built lazily by render_pdf, so a service that only hands
+    renders to the process pool never loads fonts. Use
+    get_pdf_generator_service to share one service per templates directory.
     """
 
-    def __init__(self, templates_dir: Path) -> None:
+    def __init__(self, templates_dir: Path, settings: Settings | None = None) -> None:
         """
         Initialize PDF generator service.
 
         Args:
             templates_dir: Path to directory containing HTML templates.
+            settings: Application settings (render pool size).
         """
         self._templates_dir = templates_dir
+        self._settings = settings or get_settings()
         self._env = Environment(
             loader=FileSystemLoader(str(templates_dir)),
             autoescape=select_autoescape(["html", "xml"]),
@@ -78,24 +193,98 @@ class PDFGeneratorService:
         self._env.filters["format_cep"] = format_cep
         self._env.filters["format_phone"] = format_phone
 
-    def _load_image_as_base64(self, image_path: Path) -> str:
-        """Load an image file and return as base64 encoded string."""
-        if not image_path.exists():
-            logger.warning("image_not_found", path=str(image_path))
-            return ""
-        
-        with open(image_path, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
+        # Warm rendering context (filled lazily, reused across renders)
+        self._font_config: FontConfiguration | None = None
+        # Renders share the context, so threads render one at a time
+        self._render_lock = threading.Lock()
+        self._templates: dict[str, Template] = {}
+        self._stylesheets: dict[str, list[CSS]] = {}
+        self._image_cache: dict[str, Any] = {}
 
     def get_logo_base64(self) -> str:
         """Get the logo image as base64."""
-        logo_path = ASSETS_PATH / "logo.png"
-        return self._load_image_as_base64(logo_path)
+        return _load_image_as_base64(ASSETS_PATH / "logo.png")
 
     def get_placeholder_base64(self) -> str:
         """Get the avatar placeholder as base64."""
-        placeholder_path = ASSETS_PATH / "avatar-placeholder.png"
-        return self._load_image_as_base64(placeholder_path)
+        return _load_image_as_base64(ASSETS_PATH / "avatar-placeholder.png")
+
+    def _get_template(self, template_name: str) -> Template:
+        """Get a compiled template."""
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._env.get_template(template_name)
+            self._templates[template_name] = template
+        return template
+
+    def _get_font_config(self) -> FontConfiguration:
+        """Get the font configuration (fontconfig is loaded on first use)."""
+        if self._font_config is None:
+            self._font_config = FontConfiguration()
+        return self._font_config
+
+    def _get_stylesheets(self, template_name: str) -> list[CSS]:
+        """Get the parsed companion stylesheet of a template (may be empty)."""
+        stylesheets = self._stylesheets.get(template_name)
+        if stylesheets is None:
+            css_path = self._templates_dir / Path(template_name).with_suffix(".css")
+            stylesheets = (
+                [CSS(filename=str(css_path), font_config=self._get_font_config())]
+                if css_path.exists()
+                else []
+            )
+            self._stylesheets[template_name] = stylesheets
+        return stylesheets
+
+    def preload_templates(self) -> None:
+        """Compile every HTML template and parse its stylesheet."""
+        for template_path in self._templates_dir.glob("*.html"):
+            self._get_template(template_path.name)
+            self._get_stylesheets(template_path.name)
+
+    def render_pdf(self, template_name: str, context: dict[str, Any]) -> RenderedPDF:
+        """
+        Render a template to PDF (blocking, CPU-bound).
+
+        Args:
+            template_name: Name of the template file.
+            context: Dictionary of variables to pass to the template.
+
+        Returns:
+            RenderedPDF with the content and per-stage timings.
+        """
+        with self._render_lock:
+            return self._render_pdf(template_name, context)
+
+    def _render_pdf(self, template_name: str, context: dict[str, Any]) -> RenderedPDF:
+        """Render a template to PDF (caller holds the render lock)."""
+        timings: dict[str, float] = {}
+
+        # Render HTML
+        start = time.perf_counter()
+        html_content = self._get_template(template_name).render(**context)
+        stylesheets = self._get_stylesheets(template_name)
+        timings["render_html_ms"] = (time.perf_counter() - start) * 1000
+
+        # Layout
+        start = time.perf_counter()
+        document = HTML(
+            string=html_content,
+            base_url=str(self._templates_dir),
+        ).render(
+            stylesheets=stylesheets,
+            font_config=self._get_font_config(),
+            cache=self._image_cache,
+        )
+        timings["layout_ms"] = (time.perf_counter() - start) * 1000
+
+        # Write PDF
+        start = time.perf_counter()
+        pdf_buffer = BytesIO()
+        document.write_pdf(pdf_buffer)
+        timings["write_ms"] = (time.perf_counter() - start) * 1000
+
+        return RenderedPDF(content=pdf_buffer.getvalue(), timings=timings)
 
     async def generate_pdf(
         self,
@@ -105,6 +294,9 @@ class PDFGeneratorService:
         """
         Generate a PDF from an HTML template.
 
+        Rendering runs in the render process pool; the context must be
+        picklable (e.g., a pydantic model_dump()).
+
         Args:
             template_name: Name of the template file (e.g., 'screening_report.html').
             context: Dictionary of variables to pass to the template.
@@ -118,24 +310,32 @@ class PDFGeneratorService:
         logger.info("generating_pdf", template=template_name)
 
         try:
-            # Load and render template
-            template = self._env.get_template(template_name)
-            html_content = template.render(**context)
-
-            # Generate PDF
-            pdf_buffer = BytesIO()
-            HTML(string=html_content, base_url=str(self._templates_dir)).write_pdf(
-                pdf_buffer
-            )
+            start = time.perf_counter()
+            if self._settings.PDF_RENDER_WORKERS > 0:
+                loop = asyncio.get_running_loop()
+                rendered = await loop.run_in_executor(
+                    _get_render_pool(self._templates_dir, self._settings),
+                    _render_in_process,
+                    template_name,
+                    context,
+                )
+            else:
+                rendered = await asyncio.to_thread(
+                    self.render_pdf, template_name, context
+                )
+            total_ms = (time.perf_counter() - start) * 1000
 
-            pdf_bytes = pdf_buffer.getvalue()
             logger.info(
                 "pdf_generated",
                 template=template_name,
-                size_bytes=len(pdf_bytes),
+                size_bytes=len(rendered.content),
+                total_ms=round(total_ms, 1),
+                # Time waiting for a free render process (plus IPC)
+                queue_ms=round(total_ms - sum(rendered.timings.values()), 1),
+                **{stage: round(ms, 1) for stage, ms in rendered.timings.items()},
             )
 
-            return pdf_bytes
+            return rendered.content
 
         except Exception as e:
             logger.error(
@@ -6,6 +6,9 @@ from src.shared.infrastructure.repositories.base import BaseRepository
 from src.shared.infrastructure.repositories.document_type_repository import (
     DocumentTypeRepository,
 )
+from src.shared.infrastructure.repositories.email_outbox_repository import (
+    EmailOutboxRepository,
+)
 from src.shared.infrastructure.repositories.mixins import SoftDeleteMixin
 from src.shared.infrastructure.repositories.organization_scope_mixin import (
     OrganizationScopeMixin,
@@ -22,5 +25,6 @@ __all__ = [
     "ScopePolicy",
     # Entity repositories
     "DocumentTypeRepository",
+    "EmailOutboxRepository",
     "SpecialtyRepository",
 ]
@@ -1,14 +1,37 @@
 """Base repository with common CRUD operations."""
 
-from typing import TYPE_CHECKING, Generic, TypeVar
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from uuid import UUID
 
-from src.shared.domain.schemas import PaginatedResponse, PaginationParams
-from sqlalchemy import Select, desc, func, select
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    PaginatedResponse,
+    PaginationParams,
+)
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    delete,
+    desc,
+    func,
+    insert,
+    inspect,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
 from src.app.exceptions import NotFoundError
+from src.shared.infrastructure.repositories.counting import count_rows
+from src.shared.infrastructure.repositories.keyset import (
+    decode_cursor,
+    encode_cursor,
+    keyset_order_by,
+    keyset_predicate,
+    resolve_keyset,
+)
 
 
 if TYPE_CHECKING:
@@ -18,6 +41,9 @@ if TYPE_CHECKING:
 
 ModelT = TypeVar("ModelT", bound=SQLModel)
 
+# Relationship loader strategies populated by Session.refresh()
+_EAGER_LOADERS = frozenset({"selectin", "joined", "subquery", "immediate"})
+
 
 class BaseRepository(Generic[ModelT]):
     """
@@ -49,6 +75,27 @@ class BaseRepository(Generic[ModelT]):
         """
         return select(self.model)
 
+    @staticmethod
+    def _insert_values(entity: SQLModel) -> dict[str, object]:
+        """
+        Get the column values of an entity for an INSERT statement.
+
+        Unset (None) columns are left out, so server defaults (created_at,
+        updated_at, version) apply and come back through RETURNING.
+
+        Args:
+            entity: Transient entity to insert.
+
+        Returns:
+            Mapping of attribute name to value.
+        """
+        values: dict[str, object] = {}
+        for attr in inspect(type(entity)).column_attrs:
+            value = getattr(entity, attr.key, None)
+            if value is not None:
+                values[attr.key] = value
+        return values
+
     async def get_by_id(self, id: UUID) -> ModelT | None:
         """Get entity by ID."""
         query = self.get_query().where(self.model.id == id)  # type: ignore[attr-defined]
@@ -73,20 +120,68 @@ class BaseRepository(Generic[ModelT]):
         limit: int = 25,
         offset: int = 0,
         base_query: Select[tuple[ModelT]] | None = None,
-    ) -> PaginatedResponse[ModelT]:
+        use_cursor: bool = False,
+        cursor: str | None = None,
+        include_total: bool = True,
+        count_strategy: CountStrategy | None = None,
+        rank: ColumnElement[float] | None = None,
+        columns: Sequence[ColumnElement[Any]] | None = None,
+    ) -> PaginatedResponse[ModelT] | CursorPaginatedResponse[ModelT]:
         """
         List entities with pagination, filtering, and sorting.
 
+        Offset mode (default) counts all matching rows and pages with
+        OFFSET/LIMIT. Keyset mode (`use_cursor=True` or a `cursor`) pages
+        with an opaque cursor over (sort key, id) instead, so deep pages
+        cost the same as the first one and the count can be skipped.
+
+        With a `count_strategy`, the total is computed with that strategy
+        (see CountStrategy) and a CursorPaginatedResponse carrying the
+        strategy used is returned. Without one, offset mode keeps the
+        exact count and plain PaginatedResponse.
+
         Args:
             filters: Optional FilterSet to apply.
             sorting: Optional SortingSet to apply.
             limit: Maximum number of items to return (default: 25).
-            offset: Number of items to skip (default: 0).
+            offset: Number of items to skip (default: 0). Ignored in keyset mode.
             base_query: Optional custom base query. If not provided, uses get_query().
+            use_cursor: Use keyset pagination even without a cursor (first page).
+            cursor: Cursor from a previous keyset page (`next_cursor`).
+            include_total: Whether to count matching rows. False skips the
+                           count (CountStrategy.NONE).
+            count_strategy: How to compute the total. Defaults to EXACT.
+            rank: Optional relevance expression (e.g., search similarity).
+                  In offset mode, rows are ordered by it (highest first)
+                  and sorting only breaks ties. Ignored in keyset mode,
+                  whose cursor covers the sort column and id only.
+            columns: Optional projection. The page is selected as these
+                     columns and items are Rows instead of entities, so no
+                     ORM objects are built. Must include id, and the sort
+                     columns in keyset mode (the cursor is read from them).
 
         Returns:
-            PaginatedResponse with items and pagination metadata.
+            PaginatedResponse with items and pagination metadata, or
+            CursorPaginatedResponse in keyset mode or with a count strategy.
+
+        Raises:
+            ValidationError: If the cursor is invalid for the given sorting.
         """
+        strategy = count_strategy or CountStrategy.EXACT
+        if not include_total:
+            strategy = CountStrategy.NONE
+
+        if use_cursor or cursor:
+            return await self._list_keyset(
+                filters=filters,
+                sorting=sorting,
+                limit=limit,
+                base_query=base_query,
+                cursor=cursor,
+                count_strategy=strategy,
+                columns=columns,
+            )
+
         # Build base query
         query = base_query if base_query is not None else self.get_query()
 
@@ -94,46 +189,316 @@ class BaseRepository(Generic[ModelT]):
         if filters:
             query = filters.apply_to_query(query, self.model)
 
+        if strategy == CountStrategy.WINDOW:
+            return await self._list_window(
+                query=query,
+                sorting=sorting,
+                limit=limit,
+                offset=offset,
+                rank=rank,
+                columns=columns,
+            )
+
+        # Count total matching records (filters applied, no ordering)
+        count = await count_rows(
+            self.session,
+            query,
+            strategy,
+            namespace=self.model.__tablename__,  # type: ignore[attr-defined]
+        )
+
+        query = self._apply_ordering(query, sorting, rank=rank)
+        page = (offset // limit) + 1 if limit > 0 else 1
+
+        if count_strategy is None and count.total is not None:
+            # Apply pagination and execute
+            items = await self._fetch_items(query.offset(offset).limit(limit), columns)
+
+            pagination = PaginationParams(page=page, page_size=limit)
+            return PaginatedResponse.create(
+                items=items,
+                total=count.total,
+                pagination=pagination,
+            )
+
+        # The total may be approximate: fetch one extra row for has_next
+        items = await self._fetch_items(query.offset(offset).limit(limit + 1), columns)
+        has_next = len(items) > limit
+
+        return CursorPaginatedResponse.create_offset(
+            items=items[:limit],
+            page=page,
+            page_size=limit,
+            has_next=has_next,
+            total=count.total,
+            count_strategy=count.strategy,
+            total_is_exact=count.exact,
+        )
+
+    async def _list_window(
+        self,
+        *,
+        query: Select[tuple[ModelT]],
+        sorting: "SortingSet | None",
+        limit: int,
+        offset: int,
+        rank: ColumnElement[float] | None = None,
+        columns: Sequence[ColumnElement[Any]] | None = None,
+    ) -> CursorPaginatedResponse[ModelT]:
+        """
+        List a page and its total in a single statement.
+
+        Adds `count(*) OVER ()` to the page query, so PostgreSQL returns
+        the total of all matching rows next to every row of the page and
+        the separate COUNT round trip is avoided. A page past the end has
+        no rows to carry the total; only then is a COUNT issued.
+        """
+        rows, total = await self._fetch_with_total(
+            self._apply_ordering(query, sorting, rank=rank)
+            .offset(offset)
+            .limit(limit),
+            columns,
+        )
+
+        if total is None:
+            total = 0
+            if offset > 0:
+                count = await count_rows(
+                    self.session,
+                    query,
+                    CountStrategy.EXACT,
+                    namespace=self.model.__tablename__,  # type: ignore[attr-defined]
+                )
+                total = count.total or 0
+
+        return CursorPaginatedResponse.create_offset(
+            items=rows,
+            page=(offset // limit) + 1 if limit > 0 else 1,
+            page_size=limit,
+            has_next=offset + len(rows) < total,
+            total=total,
+            count_strategy=CountStrategy.WINDOW,
+            total_is_exact=True,
+        )
+
+    async def _fetch_with_total(
+        self,
+        query: Select[tuple[ModelT]],
+        columns: Sequence[ColumnElement[Any]] | None = None,
+    ) -> tuple[list[Any], int | None]:
+        """
+        Execute a query with a `count(*) OVER ()` column.
+
+        The window is evaluated before LIMIT/OFFSET, so it holds the total
+        of all matching rows.
+
+        Returns:
+            Tuple of (entities, or rows with a projection, total). Total is
+            None when no row came back.
+        """
+        total_count = func.count().over().label("total_count")
+        if columns:
+            query = query.with_only_columns(*columns, total_count)
+        else:
+            query = query.add_columns(total_count)
+        result = await self.session.execute(query)
+        rows = result.all()
+        if not rows:
+            return [], None
+        if columns:
+            return list(rows), rows[0].total_count
+        return [row[0] for row in rows], rows[0].total_count
+
+    async def _fetch_items(
+        self,
+        query: Select[tuple[ModelT]],
+        columns: Sequence[ColumnElement[Any]] | None,
+    ) -> list[Any]:
+        """Execute a page query, returning entities (or Rows with a projection)."""
+        if columns:
+            result = await self.session.execute(query.with_only_columns(*columns))
+            return list(result.all())
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    def _apply_ordering(
+        self,
+        query: Select[tuple[ModelT]],
+        sorting: "SortingSet | None",
+        *,
+        rank: ColumnElement[float] | None = None,
+    ) -> Select[tuple[ModelT]]:
+        """Apply sorting, defaulting to created_at desc when available."""
+        if rank is not None:
+            query = query.order_by(desc(rank))
         # Apply sorting using SortingSet.apply_to_query()
         if sorting:
-            query = sorting.apply_to_query(query, self.model)
-        elif hasattr(self.model, "created_at"):
-            query = query.order_by(desc(self.model.created_at))  # type: ignore[attr-defined]
+            return sorting.apply_to_query(query, self.model)
+        if hasattr(self.model, "created_at"):
+            return query.order_by(desc(self.model.created_at))  # type: ignore[attr-defined]
+        return query
+
+    async def _list_keyset(
+        self,
+        *,
+        filters: "FilterSet | None",
+        sorting: "SortingSet | None",
+        limit: int,
+        base_query: Select[tuple[ModelT]] | None,
+        cursor: str | None,
+        count_strategy: CountStrategy,
+        columns: Sequence[ColumnElement[Any]] | None = None,
+    ) -> CursorPaginatedResponse[ModelT]:
+        """
+        List entities with keyset (cursor) pagination.
+
+        Orders by the first sort field plus id and fetches one extra row to
+        know whether there is a next page.
+        """
+        # Build base query
+        query = base_query if base_query is not None else self.get_query()
 
-        # Count total matching records (apply filters to count query too)
-        count_base = base_query if base_query is not None else self.get_query()
+        # Apply filters using FilterSet.apply_to_query()
         if filters:
-            count_base = filters.apply_to_query(count_base, self.model)
-        count_query = select(func.count()).select_from(count_base.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
+            query = filters.apply_to_query(query, self.model)
 
-        # Apply pagination and execute
-        query = query.offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
+        # Count before the cursor predicate narrows the result
+        count = await count_rows(
+            self.session,
+            query,
+            count_strategy,
+            namespace=self.model.__tablename__,  # type: ignore[attr-defined]
+        )
 
-        page = (offset // limit) + 1 if limit > 0 else 1
-        pagination = PaginationParams(page=page, page_size=limit)
+        keyset = resolve_keyset(self.model, sorting)
+        if cursor:
+            sort_value, last_id = decode_cursor(cursor, keyset)
+            query = query.where(
+                keyset_predicate(self.model, keyset, sort_value, last_id)
+            )
+
+        query = query.order_by(*keyset_order_by(self.model, keyset)).limit(limit + 1)
+        items = await self._fetch_items(query, columns)
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(keyset, items[-1])
 
-        return PaginatedResponse.create(
+        return CursorPaginatedResponse.create_cursor(
             items=items,
-            total=total,
-            pagination=pagination,
+            page_size=limit,
+            next_cursor=next_cursor,
+            has_previous=cursor is not None,
+            total=count.total,
+            count_strategy=count.strategy,
+            total_is_exact=count.exact,
         )
 
-    async def create(self, entity: ModelT) -> ModelT:
-        """Create new entity."""
+    async def _refresh_unloaded(self, entity: ModelT) -> None:
+        """
+        Refresh only the attributes left unloaded by the flush.
+
+        Server defaults come back through RETURNING (eager_defaults on
+        TimestampMixin), so this is usually a no-op; it only issues a
+        SELECT for server-generated columns that weren't fetched and for
+        eagerly loaded relationships (lazy="selectin") a full refresh
+        used to populate.
+        """
+        state = inspect(entity)
+        unloaded = [
+            attr.key for attr in state.mapper.column_attrs if attr.key in state.unloaded
+        ]
+        unloaded += [
+            rel.key
+            for rel in state.mapper.relationships
+            if rel.lazy in _EAGER_LOADERS and rel.key in state.unloaded
+        ]
+        if unloaded:
+            await self.session.refresh(entity, attribute_names=unloaded)
+
+    async def create(self, entity: ModelT, *, flush: bool = True) -> ModelT:
+        """
+        Create new entity.
+
+        Args:
+            entity: Entity to insert.
+            flush: If False, only add it to the session; the INSERT is sent
+                with the next flush/commit (unit-of-work boundary), batched
+                with other pending rows of the same table.
+
+        Returns:
+            The entity (with server defaults loaded when flushed).
+        """
         self.session.add(entity)
-        await self.session.flush()
-        await self.session.refresh(entity)
+        if flush:
+            await self.session.flush()
+            await self._refresh_unloaded(entity)
         return entity
 
-    async def update(self, entity: ModelT) -> ModelT:
-        """Update existing entity."""
-        self.session.add(entity)
+    async def create_many(self, entities: list[ModelT]) -> list[ModelT]:
+        """
+        Create multiple entities with a single flush.
+
+        Rows of the same table are sent as one INSERT ... RETURNING
+        (insertmanyvalues) instead of one statement per entity.
+
+        Args:
+            entities: Entities to insert.
+
+        Returns:
+            The entities, with server defaults loaded.
+        """
+        if not entities:
+            return entities
+        self.session.add_all(entities)
         await self.session.flush()
-        await self.session.refresh(entity)
+        for entity in entities:
+            await self._refresh_unloaded(entity)
+        return entities
+
+    async def insert_many(self, entities: Sequence[ModelT]) -> int:
+        """
+        Insert many transient entities with one bulk INSERT (no RETURNING).
+
+        For imports: unlike create_many, entities are not added to the
+        session (no identity map, unit of work or refresh), so IDs must be
+        set client-side (PrimaryKeyMixin does) and server defaults are not
+        loaded back. Columns set on any entity are sent for all of them
+        (None where unset); columns unset on every entity get their server
+        defaults.
+
+        Args:
+            entities: Entities to insert.
+
+        Returns:
+            Number of inserted rows.
+        """
+        if not entities:
+            return 0
+        rows = [self._insert_values(entity) for entity in entities]
+        columns = {column for row in rows for column in row}
+        await self.session.execute(
+            insert(self.model),
+            [{column: row.get(column) for column in columns} for row in rows],
+        )
+        return len(rows)
+
+    async def update(self, entity: ModelT, *, flush: bool = True) -> ModelT:
+        """
+        Update existing entity.
+
+        Args:
+            entity: Entity with modified attributes.
+            flush: If False, defer the UPDATE to the next flush/commit.
+
+        Returns:
+            The entity (with server onupdate values loaded when flushed).
+        """
+        self.session.add(entity)
+        if flush:
+            await self.session.flush()
+            await self._refresh_unloaded(entity)
         return entity
 
     async def delete(self, id: UUID) -> None:
@@ -142,6 +507,27 @@ class BaseRepository(Generic[ModelT]):
         await self.session.delete(entity)
         await self.session.flush()
 
+    async def delete_many(self, ids: set[UUID] | list[UUID]) -> int:
+        """
+        Delete entities by ID with a single DELETE statement.
+
+        Unlike delete(), ORM cascades are not applied: dependent rows must
+        be removed by the database (ON DELETE CASCADE). Matching objects in
+        the session are marked as deleted.
+
+        Args:
+            ids: Entity UUIDs to delete.
+
+        Returns:
+            Number of deleted rows.
+        """
+        if not ids:
+            return 0
+        result = await self.session.execute(
+            delete(self.model).where(self.model.id.in_(list(ids)))  # type: ignore[attr-defined]
+        )
+        return result.rowcount  # type: ignore[attr-defined]
+
     async def list_all(
         self,
         *,
@@ -170,11 +556,44 @@ class BaseRepository(Generic[ModelT]):
         if filters:
             query = filters.apply_to_query(query, self.model)
 
-        # Apply sorting using SortingSet.apply_to_query()
-        if sorting:
-            query = sorting.apply_to_query(query, self.model)
-        elif hasattr(self.model, "created_at"):
-            query = query.order_by(desc(self.model.created_at))  # type: ignore[attr-defined]
-
+        query = self._apply_ordering(query, sorting)
         result = await self.session.execute(query)
         return list(result.scalars().all())
+
+    async def list_all_with_total(
+        self,
+        *,
+        filters: "FilterSet | None" = None,
+        sorting: "SortingSet | None" = None,
+        base_query: Select[tuple[ModelT]] | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[ModelT], int]:
+        """
+        List entities (optionally the first `limit`) with the total count.
+
+        Items and total come from a single statement using
+        `count(*) OVER ()`, e.g. for autocomplete lists that show
+        "first 50 of 1234".
+
+        Args:
+            filters: Optional FilterSet to apply.
+            sorting: Optional SortingSet to apply.
+            base_query: Optional custom base query. If not provided, uses get_query().
+            limit: Optional maximum number of items to return.
+
+        Returns:
+            Tuple of (entities, total matching count).
+        """
+        # Build base query
+        query = base_query if base_query is not None else self.get_query()
+
+        # Apply filters using FilterSet.apply_to_query()
+        if filters:
+            query = filters.apply_to_query(query, self.model)
+
+        query = self._apply_ordering(query, sorting)
+        if limit is not None:
+            query = query.limit(limit)
+
+        items, total = await self._fetch_with_total(query)
+        return items, total or 0
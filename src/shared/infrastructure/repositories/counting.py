@@ -0,0 +1,192 @@
+"""Count strategies for paginated list queries."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from src.app.dependencies.settings import get_settings
+from src.app.logging import get_logger
+from src.shared.domain.schemas import CountStrategy
+from src.shared.infrastructure.cache import get_redis_cache
+
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CountResult:
+    """
+    Outcome of counting a list query.
+
+    Attributes:
+        total: Row count (or estimate/cap), None when counting was skipped.
+        strategy: Strategy actually used (may differ from the requested one
+                  when falling back, e.g. ESTIMATE → EXACT for small results).
+        exact: Whether `total` is the exact number of matching rows.
+    """
+
+    total: int | None
+    strategy: CountStrategy
+    exact: bool
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the statement's bind params."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_rows(
+    session: AsyncSession,
+    query: Select,
+    strategy: CountStrategy,
+    *,
+    namespace: str,
+) -> CountResult:
+    """
+    Count the rows of a filtered list query using the given strategy.
+
+    The query must already have filters applied and no ORDER BY, OFFSET
+    or LIMIT (those are irrelevant to the count). WINDOW needs the page
+    query itself (see BaseRepository.list), so a standalone count for it
+    is EXACT.
+
+    Args:
+        session: Database session.
+        query: Filtered select query.
+        strategy: Count strategy to use.
+        namespace: Table/resource name used in cache keys and logs.
+
+    Returns:
+        CountResult with the total and the strategy used.
+    """
+    if strategy == CountStrategy.NONE:
+        return CountResult(total=None, strategy=strategy, exact=False)
+
+    if strategy == CountStrategy.CAPPED:
+        return await _count_capped(session, query)
+
+    if strategy == CountStrategy.ESTIMATE:
+        return await _count_estimate(session, query, namespace)
+
+    if strategy == CountStrategy.CACHED:
+        return await _count_cached(session, query, namespace)
+
+    return CountResult(
+        total=await _count_exact(session, query),
+        strategy=CountStrategy.EXACT,
+        exact=True,
+    )
+
+
+async def _count_exact(session: AsyncSession, query: Select) -> int:
+    """Run COUNT(*) over the filtered query."""
+    count_query = select(func.count()).select_from(query.subquery())
+    result = await session.execute(count_query)
+    return result.scalar_one()
+
+
+async def _count_capped(session: AsyncSession, query: Select) -> CountResult:
+    """
+    Count at most cap + 1 rows.
+
+    Stops scanning after cap + 1 matches. Totals above the cap are reported
+    as the cap with exact=False (shown as "1000+").
+    """
+    cap = get_settings().PAGINATION_COUNT_CAP
+    count_query = select(func.count()).select_from(query.limit(cap + 1).subquery())
+    total = (await session.execute(count_query)).scalar_one()
+
+    if total > cap:
+        return CountResult(total=cap, strategy=CountStrategy.CAPPED, exact=False)
+    return CountResult(total=total, strategy=CountStrategy.CAPPED, exact=True)
+
+
+async def _count_estimate(
+    session: AsyncSession,
+    query: Select,
+    namespace: str,
+) -> CountResult:
+    """
+    Use the planner's row estimate from EXPLAIN.
+
+    Estimates are cheap but unreliable for small, selective results, so
+    estimates below PAGINATION_ESTIMATE_MIN_ROWS fall back to an exact count.
+    """
+    result = await session.execute(_Explain(query))
+    raw = result.scalar_one()
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+
+    try:
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        logger.warning("count_estimate_unavailable", namespace=namespace)
+        estimate = 0
+
+    if estimate < get_settings().PAGINATION_ESTIMATE_MIN_ROWS:
+        return CountResult(
+            total=await _count_exact(session, query),
+            strategy=CountStrategy.EXACT,
+            exact=True,
+        )
+
+    return CountResult(total=estimate, strategy=CountStrategy.ESTIMATE, exact=False)
+
+
+async def _count_cached(
+    session: AsyncSession,
+    query: Select,
+    namespace: str,
+) -> CountResult:
+    """
+    Exact count cached for a short TTL, keyed by a hash of the query.
+
+    The hash covers the compiled SQL and its bound parameters, so each
+    distinct organization scope + filter combination gets its own entry.
+    Counts are not invalidated on writes; they may be stale for up to
+    PAGINATION_COUNT_CACHE_TTL seconds, so cache hits are reported as not
+    exact (a freshly computed count is). Falls back to EXACT without Redis.
+    """
+    cache = get_redis_cache()
+    if cache is None:
+        return CountResult(
+            total=await _count_exact(session, query),
+            strategy=CountStrategy.EXACT,
+            exact=True,
+        )
+
+    key = cache.count_cache_key(namespace, _query_hash(query))
+
+    # Try cache first
+    cached = await cache.get(key)
+    if isinstance(cached, int):
+        # May be up to PAGINATION_COUNT_CACHE_TTL seconds stale
+        return CountResult(total=cached, strategy=CountStrategy.CACHED, exact=False)
+
+    total = await _count_exact(session, query)
+    await cache.set(key, total, ttl=get_settings().PAGINATION_COUNT_CACHE_TTL)
+    return CountResult(total=total, strategy=CountStrategy.CACHED, exact=True)
+
+
+def _query_hash(query: Select) -> str:
+    """Hash a query's compiled SQL and bound parameters."""
+    compiled = query.compile(dialect=postgresql.dialect())
+    params = sorted((name, repr(value)) for name, value in compiled.params.items())
+    payload = f"{compiled}|{params}"
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
@@ -0,0 +1,184 @@
+"""EmailOutbox repository for database operations."""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.shared.domain.models.email_outbox import EmailOutbox
+from src.shared.domain.models.enums import EmailOutboxStatus
+from src.shared.infrastructure.email.transport import OutgoingEmail
+from src.shared.infrastructure.repositories.base import BaseRepository
+
+
+class EmailOutboxRepository(BaseRepository[EmailOutbox]):
+    """
+    Repository for EmailOutbox model.
+
+    Emails are enqueued in the caller's transaction and claimed by the
+    worker in batches with SKIP LOCKED, so concurrent workers never send
+    the same email twice, and outcomes are recorded with a constant number
+    of statements per batch.
+    """
+
+    model = EmailOutbox
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def enqueue(self, kind: str, email: OutgoingEmail) -> EmailOutbox:
+        """
+        Add an email to the outbox in the current transaction.
+
+        The row is written with the caller's next flush/commit, so the
+        email is only sent if that transaction commits.
+
+        Args:
+            kind: Email kind (e.g., invitation).
+            email: The rendered email.
+
+        Returns:
+            The pending outbox entry.
+        """
+        entry = EmailOutbox(
+            kind=kind,
+            recipients=email.to,
+            subject=email.subject,
+            html=email.html,
+            tags=email.tags,
+        )
+        return await self.create(entry, flush=False)
+
+    async def claim_batch(
+        self,
+        limit: int,
+        stale_before: datetime,
+    ) -> list[EmailOutbox]:
+        """
+        Atomically claim due emails for sending.
+
+        Claims pending emails whose next attempt is due, and emails stuck
+        in SENDING since before stale_before (the worker sending them died
+        before recording the outcome). Rows locked by another worker are
+        skipped.
+
+        Args:
+            limit: Maximum number of emails to claim.
+            stale_before: SENDING claims older than this are retaken.
+
+        Returns:
+            The claimed emails (status SENDING, attempts incremented).
+        """
+        due = (
+            select(EmailOutbox.id)
+            .where(
+                or_(
+                    and_(
+                        EmailOutbox.status == EmailOutboxStatus.PENDING,
+                        EmailOutbox.next_attempt_at <= func.now(),
+                    ),
+                    and_(
+                        EmailOutbox.status == EmailOutboxStatus.SENDING,
+                        EmailOutbox.locked_at < stale_before,
+                    ),
+                )
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(due.scalar_subquery()))
+            .values(
+                status=EmailOutboxStatus.SENDING,
+                attempts=EmailOutbox.attempts + 1,
+                locked_at=func.now(),
+                updated_at=func.now(),
+            )
+            .returning(EmailOutbox)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def mark_sent(self, sent: list[tuple[UUID, str | None]]) -> None:
+        """
+        Mark emails as sent with one batched UPDATE (executemany).
+
+        Args:
+            sent: (email ID, provider message ID) pairs.
+        """
+        if not sent:
+            return
+        now = datetime.now(timezone.utc)
+        await self.session.execute(
+            update(EmailOutbox),
+            [
+                {
+                    "id": email_id,
+                    "status": EmailOutboxStatus.SENT,
+                    "provider_message_id": provider_message_id,
+                    "sent_at": now,
+                    "locked_at": None,
+                    "error": None,
+                }
+                for email_id, provider_message_id in sent
+            ],
+        )
+
+    async def record_failure(
+        self,
+        ids: list[UUID],
+        error: str,
+        *,
+        max_attempts: int,
+        backoff_seconds: int,
+    ) -> int:
+        """
+        Record a failed attempt for a batch of emails.
+
+        Emails with attempts left go back to PENDING, due after an
+        exponential backoff (backoff_seconds * 2^(attempts - 1)); the
+        others are marked as FAILED.
+
+        Args:
+            ids: The email UUIDs.
+            error: Error message of the failed attempt.
+            max_attempts: Attempts after which an email fails permanently.
+            backoff_seconds: Base delay before the next attempt.
+
+        Returns:
+            Number of emails marked as FAILED.
+        """
+        if not ids:
+            return 0
+        exhausted = EmailOutbox.attempts >= max_attempts
+        delay_seconds = backoff_seconds * func.power(2, EmailOutbox.attempts - 1)
+        error = error[:2000]
+
+        failed = await self.session.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(ids), exhausted)
+            .values(
+                status=EmailOutboxStatus.FAILED,
+                error=error,
+                locked_at=None,
+                updated_at=func.now(),
+            )
+        )
+        await self.session.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(ids), ~exhausted)
+            .values(
+                status=EmailOutboxStatus.PENDING,
+                error=error,
+                locked_at=None,
+                # make_interval(years, months, weeks, days, hours, mins, secs)
+                next_attempt_at=func.now()
+                + func.make_interval(0, 0, 0, 0, 0, 0, delay_seconds),
+                updated_at=func.now(),
+            )
+        )
+        return failed.rowcount  # type: ignore[attr-defined]
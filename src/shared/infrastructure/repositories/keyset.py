@@ -0,0 +1,247 @@
+"""Keyset (cursor) pagination helpers for repositories."""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import and_, desc, or_, tuple_
+from sqlalchemy.sql import ColumnElement, operators
+from sqlmodel import SQLModel
+
+from src.app.exceptions import ValidationError
+from src.app.i18n import ResourceMessages, get_message
+
+
+if TYPE_CHECKING:
+    from fastapi_restkit.sortingset import SortingSet
+
+
+@dataclass(frozen=True, slots=True)
+class Keyset:
+    """
+    Ordering used for keyset pagination: one sort column plus id.
+
+    Attributes:
+        column: Sort column, or None when ordering by id only.
+        attribute: Model attribute name of the sort column.
+        descending: Sort direction (applies to both sort column and id).
+        signature: Stable description of the ordering, embedded in cursors
+                   so a cursor can't be reused with a different sort.
+    """
+
+    column: Any
+    attribute: str | None
+    descending: bool
+    signature: str
+
+
+def resolve_keyset(
+    model: type[SQLModel],
+    sorting: "SortingSet | None",
+) -> Keyset:
+    """
+    Resolve the keyset ordering from a SortingSet.
+
+    Uses the first sort field plus id as tie-breaker. Without sorting,
+    falls back to created_at desc (same default as offset mode), or id desc
+    for models without created_at. Since ids are UUIDv7, sorting by id is
+    time-ordered.
+
+    Args:
+        model: Repository model class.
+        sorting: Optional SortingSet.
+
+    Returns:
+        Keyset ordering.
+    """
+    clauses = sorting.to_sqlalchemy(model) if sorting else []
+
+    if clauses:
+        clause = clauses[0]
+        column = clause.element
+        descending = clause.modifier is operators.desc_op
+        attribute = getattr(column, "key", None)
+    elif hasattr(model, "created_at"):
+        column = model.created_at  # type: ignore[attr-defined]
+        descending = True
+        attribute = "created_at"
+    else:
+        column = None
+        descending = True
+        attribute = None
+
+    if attribute == "id":
+        column, attribute = None, None
+
+    direction = "desc" if descending else "asc"
+    signature = f"{attribute or 'id'}:{direction}"
+    return Keyset(
+        column=column,
+        attribute=attribute,
+        descending=descending,
+        signature=signature,
+    )
+
+
+def keyset_order_by(model: type[SQLModel], keyset: Keyset) -> list[ColumnElement]:
+    """Build ORDER BY clauses for a keyset (sort column, then id)."""
+    id_column = model.id  # type: ignore[attr-defined]
+    columns = [keyset.column, id_column] if keyset.column is not None else [id_column]
+    if keyset.descending:
+        return [desc(column) for column in columns]
+    return [column.asc() for column in columns]
+
+
+def keyset_predicate(
+    model: type[SQLModel],
+    keyset: Keyset,
+    sort_value: Any,
+    last_id: UUID,
+) -> ColumnElement[bool]:
+    """
+    Build the WHERE predicate selecting rows after the cursor position.
+
+    Non-nullable sort columns use a row comparison so PostgreSQL can seek
+    on a composite (sort column, id) index. Nullable columns follow
+    PostgreSQL's default NULL placement (NULLS LAST for ASC, NULLS FIRST
+    for DESC).
+
+    Args:
+        model: Repository model class.
+        keyset: Keyset ordering.
+        sort_value: Sort column value of the last row of the previous page.
+        last_id: Id of the last row of the previous page.
+
+    Returns:
+        SQLAlchemy boolean expression.
+    """
+    id_column = model.id  # type: ignore[attr-defined]
+    column = keyset.column
+
+    def after(left: Any, right: Any) -> ColumnElement[bool]:
+        return left < right if keyset.descending else left > right
+
+    if column is None:
+        return after(id_column, last_id)
+
+    if not _is_nullable(column):
+        return after(tuple_(column, id_column), tuple_(sort_value, last_id))
+
+    if sort_value is None:
+        if keyset.descending:
+            # NULLs come first: remaining NULLs by id, then all non-NULLs
+            return or_(
+                and_(column.is_(None), after(id_column, last_id)),
+                column.is_not(None),
+            )
+        # NULLs come last: only remaining NULLs by id
+        return and_(column.is_(None), after(id_column, last_id))
+
+    condition = or_(
+        after(column, sort_value),
+        and_(column == sort_value, after(id_column, last_id)),
+    )
+    if not keyset.descending:
+        # NULLs come after every non-NULL value in ascending order
+        condition = or_(condition, column.is_(None))
+    return condition
+
+
+def encode_cursor(keyset: Keyset, item: Any) -> str:
+    """
+    Encode an opaque cursor pointing after the given item.
+
+    Args:
+        keyset: Keyset ordering used for the page.
+        item: Last entity of the page.
+
+    Returns:
+        URL-safe base64 cursor.
+    """
+    value = getattr(item, keyset.attribute) if keyset.attribute else None
+    payload = {
+        "s": keyset.signature,
+        "v": _to_json(value),
+        "id": str(item.id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keyset: Keyset) -> tuple[Any, UUID]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor string.
+        keyset: Keyset ordering of the current request.
+
+    Returns:
+        Tuple of (sort value, last id), with the sort value converted back
+        to the column's Python type.
+
+    Raises:
+        ValidationError: If the cursor is malformed or was created with a
+                         different ordering.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != keyset.signature:
+            raise ValueError("cursor ordering mismatch")
+        last_id = UUID(payload["id"])
+        sort_value = _from_json(keyset.column, payload.get("v"))
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValidationError(
+            message=get_message(ResourceMessages.INVALID_CURSOR),
+            details={"cursor": cursor},
+        ) from e
+
+    return sort_value, last_id
+
+
+def _is_nullable(column: Any) -> bool:
+    """Check if a sort column (Column or mapped attribute) allows NULL."""
+    nullable = getattr(column, "nullable", None)
+    if nullable is None:
+        # Mapped attribute (e.g., Model.created_at): inspect its column
+        try:
+            nullable = column.property.columns[0].nullable
+        except (AttributeError, IndexError):
+            nullable = True
+    return bool(nullable)
+
+
+def _to_json(value: Any) -> Any:
+    """Convert a sort value to a JSON-compatible value."""
+    if isinstance(value, Enum):
+        return value.value
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _from_json(column: Any, value: Any) -> Any:
+    """Convert a JSON cursor value back to the column's Python type."""
+    if value is None or column is None:
+        return value
+
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+
+    if issubclass(python_type, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, date):
+        return date.fromisoformat(value)
+    if issubclass(python_type, (UUID, Decimal, Enum)):
+        return python_type(value)
+    return value
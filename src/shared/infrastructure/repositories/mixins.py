@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, select, update
 from sqlmodel import SQLModel
 
 from src.app.exceptions import NotFoundError
@@ -80,6 +80,30 @@ class SoftDeleteMixin(Generic[ModelT]):
         self.session.add(entity)
         await self.session.flush()
 
+    async def delete_many(self, ids: set[UUID] | list[UUID]) -> int:
+        """
+        Soft delete entities by ID with a single UPDATE statement.
+
+        Overrides BaseRepository.delete_many() to perform soft delete.
+
+        Args:
+            ids: The entity UUIDs to soft delete.
+
+        Returns:
+            Number of soft-deleted rows.
+        """
+        if not ids:
+            return 0
+        result = await self.session.execute(
+            update(self.model)
+            .where(
+                self.model.id.in_(list(ids)),  # type: ignore[attr-defined]
+                self.model.deleted_at.is_(None),  # type: ignore[attr-defined]
+            )
+            .values(deleted_at=datetime.now(timezone.utc))
+        )
+        return result.rowcount  # type: ignore[attr-defined]
+
     async def restore(self, id: UUID) -> ModelT:
         """
         Restore a soft-deleted entity by clearing deleted_at.
@@ -3,7 +3,11 @@
 from typing import TYPE_CHECKING, Generic, Literal, TypeVar
 from uuid import UUID
 
-from src.shared.domain.schemas import PaginatedResponse
+from src.shared.domain.schemas import (
+    CountStrategy,
+    CursorPaginatedResponse,
+    PaginatedResponse,
+)
 from sqlalchemy import Select, select
 from sqlmodel import SQLModel
 
@@ -142,7 +146,8 @@ class OrganizationScopeMixin(Generic[ModelT]):
         limit: int = 25,
         offset: int = 0,
         scope_policy: ScopePolicy | None = None,
-    ) -> PaginatedResponse[ModelT]:
+        count_strategy: CountStrategy | None = None,
+    ) -> PaginatedResponse[ModelT] | CursorPaginatedResponse[ModelT]:
         """
         List entities within organization scope with pagination.
 
@@ -154,9 +159,11 @@ class OrganizationScopeMixin(Generic[ModelT]):
             limit: Maximum number of items to return (default: 25).
             offset: Number of items to skip (default: 0).
             scope_policy: The scope policy to apply. Uses default if None.
+            count_strategy: How to compute the total (see BaseRepository.list).
 
         Returns:
-            PaginatedResponse with items filtered by organization scope.
+            PaginatedResponse with items filtered by organization scope
+            (CursorPaginatedResponse when a count strategy is given).
         """
         org_ids = self._get_effective_org_ids(
             organization_id=organization_id,
@@ -175,6 +182,7 @@ class OrganizationScopeMixin(Generic[ModelT]):
             limit=limit,
             offset=offset,
             base_query=base_query,
+            count_strategy=count_strategy,
         )
 
     async def exists_in_family(
@@ -0,0 +1,98 @@
+"""
+Indexed text search helpers (pg_trgm + unaccent).
+
+Search conditions are built on the same expressions as the GIN trigram
+indexes, `f_unaccent(lower(column))` (f_unaccent is the IMMUTABLE wrapper
+created in migration 000000000001), so PostgreSQL can answer them from the
+index. The plain `unaccent(column) ILIKE ...` used by SearchFilter is not
+immutable and matches no index, so it always scans the table.
+"""
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import ColumnElement, Text, func, literal, literal_column
+
+from src.app.utils.cpf import normalize_cpf
+
+
+if TYPE_CHECKING:
+    from fastapi_restkit.sortingset import SortingSet
+
+
+# Digits with optional CPF punctuation (e.g., "123.456", "123456789-09")
+_CPF_TERM = re.compile(r"^[\d.\-\s]+$")
+_LIKE_SPECIAL = re.compile(r"([\\%_])")
+
+# Shortest CPF prefix searched as a CPF (shorter digit terms match anywhere)
+MIN_CPF_PREFIX = 3
+
+
+def unaccent_lower(value: Any) -> ColumnElement[str]:
+    """Build `f_unaccent(lower(value))`, the expression the search indexes use."""
+    return func.f_unaccent(func.lower(value), type_=Text)
+
+
+def search_document(*expressions: Any) -> ColumnElement[str]:
+    """
+    Build `COALESCE(a, '') || ' ' || COALESCE(b, '') || ...`.
+
+    Must be given the same expressions, in the same order, as the
+    multi-column trigram index it should use.
+    """
+    empty = literal_column("''", Text)
+    document = func.coalesce(expressions[0], empty)
+    for expression in expressions[1:]:
+        document = document + literal_column("' '", Text) + func.coalesce(
+            expression, empty
+        )
+    return document
+
+
+def contains_term(expression: ColumnElement[str], term: str) -> ColumnElement[bool]:
+    """
+    Match rows whose (normalized) expression contains the search term.
+
+    The term is lowercased and unaccented like the indexed expression, and
+    LIKE wildcards in it are escaped, so "50%" searches for a literal "%".
+    """
+    escaped = _LIKE_SPECIAL.sub(r"\\\1", term)
+    return expression.like(unaccent_lower(literal(f"%{escaped}%", Text)))
+
+
+def similarity_rank(term: str, *expressions: Any) -> ColumnElement[float]:
+    """
+    Rank rows by how well the term matches any of the expressions.
+
+    Uses pg_trgm's word_similarity (best match of the term against a part
+    of the value), so "silva" ranks "Maria Silva" above "Silvana Souza".
+    """
+    normalized = unaccent_lower(literal(term, Text))
+    ranks = [func.word_similarity(normalized, expression) for expression in expressions]
+    return ranks[0] if len(ranks) == 1 else func.greatest(*ranks)
+
+
+def cpf_prefix(term: str) -> str | None:
+    """
+    Get the CPF digits of a CPF-shaped search term.
+
+    Args:
+        term: The search term.
+
+    Returns:
+        The digits, if the term is only digits and CPF punctuation with
+        at least MIN_CPF_PREFIX digits; None otherwise.
+    """
+    if not _CPF_TERM.match(term):
+        return None
+    digits = normalize_cpf(term)
+    return digits if len(digits) >= MIN_CPF_PREFIX else None
+
+
+def is_default_sorting(sorting: "SortingSet | None") -> bool:
+    """Check whether the client kept the default order (then rank by relevance)."""
+    if sorting is None:
+        return True
+    return list(sorting.sort_by) == list(
+        getattr(sorting.Config, "default_sorting", [])
+    )
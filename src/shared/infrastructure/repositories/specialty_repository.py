@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from src.shared.domain.schemas import PaginatedResponse
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.domain.models.specialty import Specialty
@@ -13,6 +13,13 @@ from src.shared.infrastructure.filters.specialty import (
 )
 from src.shared.infrastructure.repositories.base import BaseRepository
 from src.shared.infrastructure.repositories.mixins import SoftDeleteMixin
+from src.shared.infrastructure.repositories.search import (
+    contains_term,
+    is_default_sorting,
+    search_document,
+    similarity_rank,
+    unaccent_lower,
+)
 
 
 class SpecialtyRepository(
@@ -81,7 +88,11 @@ class SpecialtyRepository(
         offset: int = 0,
     ) -> PaginatedResponse[Specialty]:
         """
-        Search specialties by name (case-insensitive partial match).
+        Search specialties by name (case- and accent-insensitive partial match).
+
+        Matches on the expression of idx_specialties_search_trgm (code and
+        name), so the trigram index is used. With the default sorting,
+        results are ranked by name similarity, name breaking ties.
 
         Args:
             name: The search term.
@@ -91,12 +102,22 @@ class SpecialtyRepository(
         Returns:
             Paginated list of matching specialties.
         """
-        query = self.get_query().where(Specialty.name.ilike(f"%{name}%"))
+        specialty_name = unaccent_lower(Specialty.name)
+        query = self.get_query().where(
+            contains_term(
+                search_document(func.lower(Specialty.code), specialty_name), name
+            )
+        )
         return await self.list(
             sorting=sorting,
             limit=limit,
             offset=offset,
             base_query=query,
+            rank=(
+                similarity_rank(name, specialty_name)
+                if is_default_sorting(sorting)
+                else None
+            ),
         )
 
     async def get_by_ids(self, ids: list[UUID]) -> list[Specialty]:
@@ -117,6 +138,24 @@ class SpecialtyRepository(
         )
         return list(result.scalars().all())
 
+    async def get_by_codes(self, codes: set[str] | list[str]) -> list[Specialty]:
+        """
+        Get multiple specialties by their codes.
+
+        Args:
+            codes: Specialty codes.
+
+        Returns:
+            List of specialties found.
+        """
+        if not codes:
+            return []
+
+        result = await self.session.execute(
+            self.get_query().where(Specialty.code.in_(list(codes)))
+        )
+        return list(result.scalars().all())
+
     async def code_exists(
         self,
         code: str,
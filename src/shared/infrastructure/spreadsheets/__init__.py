@@ -0,0 +1,19 @@
+"""Spreadsheet (CSV/XLSX) reading infrastructure."""
+
+from src.shared.infrastructure.spreadsheets.spreadsheet_reader import (
+    SpreadsheetError,
+    SpreadsheetRows,
+    chunked,
+    normalize_column,
+    read_csv,
+    read_xlsx,
+)
+
+__all__ = [
+    "SpreadsheetError",
+    "SpreadsheetRows",
+    "chunked",
+    "normalize_column",
+    "read_csv",
+    "read_xlsx",
+]
@@ -0,0 +1,168 @@
+"""
+Streaming CSV/XLSX readers for bulk imports.
+
+Both readers yield one row at a time from a binary file (CSV decoded as
+it is read, XLSX through openpyxl's read-only mode), so a spreadsheet
+with hundreds of thousands of rows is never loaded into memory at once.
+Rows come as a mapping of normalized header names to cell text, with
+their line number in the spreadsheet (the header is line 1).
+"""
+
+import codecs
+import csv
+import io
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, BinaryIO, TypeVar
+
+from openpyxl import load_workbook
+
+
+T = TypeVar("T")
+
+# Bytes inspected to pick the CSV encoding and delimiter
+_SNIFF_SIZE = 64 * 1024
+_CSV_DELIMITERS = (";", ",", "\t")
+
+
+class SpreadsheetError(Exception):
+    """Raised when a spreadsheet cannot be read (corrupt file, bad encoding...)."""
+
+
+@dataclass(slots=True)
+class SpreadsheetRows:
+    """Header and row iterator of an open spreadsheet."""
+
+    columns: list[str]
+    rows: Iterator[tuple[int, dict[str, str]]]
+
+
+def normalize_column(name: Any) -> str:
+    """Normalize a header cell ("Full Name " -> "full_name")."""
+    return "_".join(str(name or "").strip().lower().split())
+
+
+def _cell_text(value: Any) -> str:
+    """Convert an XLSX cell value to the text a CSV export would have."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.date().isoformat() if value.time() == datetime.min.time() else value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        # Numeric cells (CPF, phone, year) come back as floats
+        return str(int(value))
+    return str(value).strip()
+
+
+def _rows_by_column(
+    columns: list[str],
+    rows: Iterable[tuple[int, list[Any]]],
+) -> Iterator[tuple[int, dict[str, str]]]:
+    """Map row cells to their columns, skipping blank rows."""
+    for line, cells in rows:
+        values = {
+            column: text
+            for column, cell in zip(columns, cells)
+            if column and (text := _cell_text(cell))
+        }
+        if values:
+            yield line, values
+
+
+def read_csv(file: BinaryIO) -> SpreadsheetRows:
+    """
+    Open a CSV file for streaming.
+
+    The encoding (UTF-8, with or without BOM, or Windows-1252 as exported
+    by Excel) and the delimiter (";", "," or tab) are detected from the
+    beginning of the file.
+
+    Args:
+        file: Binary file positioned at the start.
+
+    Returns:
+        SpreadsheetRows with the normalized header.
+
+    Raises:
+        SpreadsheetError: If the file has no header row.
+    """
+    sample = file.read(_SNIFF_SIZE)
+    file.seek(0)
+
+    encoding = "utf-8-sig"
+    try:
+        # Incremental decoder: a multi-byte char cut at the sample end is fine
+        codecs.getincrementaldecoder(encoding)().decode(sample)
+    except UnicodeDecodeError:
+        encoding = "cp1252"
+
+    first_line = sample.split(b"\n", 1)[0].decode(encoding, errors="replace")
+    delimiter = max(_CSV_DELIMITERS, key=first_line.count)
+
+    text = io.TextIOWrapper(file, encoding=encoding, newline="")
+    reader = csv.reader(text, delimiter=delimiter)
+    try:
+        header = next(reader)
+    except StopIteration:
+        raise SpreadsheetError("empty file") from None
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise SpreadsheetError(str(e)) from e
+    columns = [normalize_column(name) for name in header]
+
+    def rows() -> Iterator[tuple[int, list[Any]]]:
+        try:
+            yield from enumerate(reader, start=2)
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise SpreadsheetError(str(e)) from e
+
+    return SpreadsheetRows(columns=columns, rows=_rows_by_column(columns, rows()))
+
+
+def read_xlsx(file: BinaryIO) -> SpreadsheetRows:
+    """
+    Open the first worksheet of an XLSX file for streaming.
+
+    Uses openpyxl's read-only mode, which parses the sheet XML as rows are
+    requested; formulas are read as their cached values.
+
+    Args:
+        file: Seekable binary file.
+
+    Returns:
+        SpreadsheetRows with the normalized header.
+
+    Raises:
+        SpreadsheetError: If the file is not a valid workbook or is empty.
+    """
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception as e:
+        raise SpreadsheetError(str(e)) from e
+
+    sheet_rows = workbook.active.iter_rows(values_only=True)
+    header = next(sheet_rows, None)
+    if header is None:
+        workbook.close()
+        raise SpreadsheetError("empty file")
+    columns = [normalize_column(name) for name in header]
+
+    def rows() -> Iterator[tuple[int, list[Any]]]:
+        try:
+            yield from ((line, list(cells)) for line, cells in enumerate(sheet_rows, start=2))
+        except Exception as e:
+            raise SpreadsheetError(str(e)) from e
+        finally:
+            workbook.close()
+
+    return SpreadsheetRows(columns=columns, rows=_rows_by_column(columns, rows()))
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split an iterable into lists of at most size items."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
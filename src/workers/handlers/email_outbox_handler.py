@@ -0,0 +1,58 @@
+"""Email outbox delivery handler."""
+
+import asyncio
+
+from faststream import AckPolicy
+from faststream.rabbit import Channel, RabbitRouter
+
+from src.app.dependencies import get_settings
+from src.app.logging import get_logger
+from src.shared.infrastructure.database.connection import async_session_factory
+from src.shared.infrastructure.email import get_email_transport
+from src.shared.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+from src.shared.infrastructure.messaging.email_outbox import (
+    EMAIL_OUTBOX_QUEUE,
+    EmailOutboxNotification,
+)
+
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+router = RabbitRouter()
+
+# One dispatcher per worker: its rate limiter is shared by the queue
+# handler and the periodic poll
+dispatcher = EmailOutboxDispatcher(
+    async_session_factory,
+    get_email_transport(),
+    settings,
+)
+
+
+@router.subscriber(
+    EMAIL_OUTBOX_QUEUE,
+    # A drain sends every due email, so one notification at a time is enough
+    channel=Channel(prefetch_count=1),
+    # Delivery state lives in the outbox rows; failed sends are retried by
+    # the dispatcher (with backoff), never by redelivering the notification
+    ack_policy=AckPolicy.REJECT_ON_ERROR,
+)
+async def handle_email_outbox(message: EmailOutboxNotification) -> None:
+    """Send due outbox emails."""
+    await dispatcher.drain()
+
+
+async def poll_email_outbox() -> None:
+    """
+    Periodically send due outbox emails.
+
+    Covers notifications that were never published (broker down when the
+    API committed) and retries whose backoff has elapsed.
+    """
+    while True:
+        try:
+            await dispatcher.drain()
+        except Exception as e:
+            logger.error("email_outbox_poll_failed", error=str(e))
+        await asyncio.sleep(settings.EMAIL_OUTBOX_POLL_INTERVAL)
@@ -0,0 +1,39 @@
+"""Professional spreadsheet import handler."""
+
+from faststream import AckPolicy
+from faststream.rabbit import Channel, RabbitRouter
+
+from src.app.dependencies import get_settings
+from src.app.logging import get_logger
+from src.modules.professionals.infrastructure.messaging import (
+    PROFESSIONAL_IMPORT_QUEUE,
+    ProfessionalImportJobMessage,
+    publish_import_job_retry,
+)
+from src.modules.professionals.use_cases.professional_import import (
+    ProcessProfessionalImportJobUseCase,
+)
+from src.shared.infrastructure.database.connection import async_session_factory
+
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+router = RabbitRouter()
+
+
+@router.subscriber(
+    PROFESSIONAL_IMPORT_QUEUE,
+    # Unacked deliveries per worker = spreadsheets imported concurrently
+    channel=Channel(prefetch_count=settings.PROFESSIONAL_IMPORT_JOB_CONCURRENCY),
+    # Retries are scheduled through the retry queue (with backoff) and state
+    # lives in the job row, so an unexpected error must not requeue at once
+    ack_policy=AckPolicy.REJECT_ON_ERROR,
+)
+async def handle_professional_import_job(message: ProfessionalImportJobMessage) -> None:
+    """Import the spreadsheet of a queued job."""
+    async with async_session_factory() as session:
+        delay = await ProcessProfessionalImportJobUseCase(session).execute(message.job_id)
+
+    if delay is not None:
+        await publish_import_job_retry(message, delay)
@@ -0,0 +1,39 @@
+"""Compliance report generation handler."""
+
+from faststream import AckPolicy
+from faststream.rabbit import Channel, RabbitRouter
+
+from src.app.dependencies import get_settings
+from src.app.logging import get_logger
+from src.modules.screening.infrastructure.messaging import (
+    SCREENING_REPORT_QUEUE,
+    ScreeningReportJobMessage,
+    publish_report_job_retry,
+)
+from src.modules.screening.use_cases.screening_report import (
+    ProcessScreeningReportJobUseCase,
+)
+from src.shared.infrastructure.database.connection import async_session_factory
+
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+router = RabbitRouter()
+
+
+@router.subscriber(
+    SCREENING_REPORT_QUEUE,
+    # Unacked deliveries per worker = reports generated concurrently
+    channel=Channel(prefetch_count=settings.SCREENING_REPORT_JOB_CONCURRENCY),
+    # Retries are scheduled through the retry queue (with backoff) and state
+    # lives in the job row, so an unexpected error must not requeue at once
+    ack_policy=AckPolicy.REJECT_ON_ERROR,
+)
+async def handle_screening_report_job(message: ScreeningReportJobMessage) -> None:
+    """Generate the compliance report of a queued job."""
+    async with async_session_factory() as session:
+        delay = await ProcessScreeningReportJobUseCase(session).execute(message.job_id)
+
+    if delay is not None:
+        await publish_report_job_retry(message, delay)
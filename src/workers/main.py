@@ -5,12 +5,24 @@ import asyncio
 from faststream import FastStream
 
 from src.app.dependencies import get_settings
+from src.modules.professionals.infrastructure.messaging import declare_import_queues
+from src.modules.screening.infrastructure.messaging import declare_report_queues
 from src.shared.infrastructure.messaging.broker import broker
+from src.shared.infrastructure.messaging.email_outbox import declare_email_queues
+from src.shared.infrastructure.pdf import shutdown_render_pools
+from src.workers.handlers import (
+    email_outbox_handler,
+    professional_import_handler,
+    screening_report_handler,
+)
 
 
 # Create FastStream application
 app = FastStream(broker)
 
+# Background tasks started after the broker is up
+_background_tasks: set[asyncio.Task] = set()
+
 
 @app.on_startup
 async def on_startup() -> None:
@@ -19,18 +31,33 @@ async def on_startup() -> None:
     print(f"Starting {settings.APP_NAME} worker...")
 
 
+@app.after_startup
+async def after_startup() -> None:
+    """Declare queues that have no subscriber (retry queue) and start polling."""
+    await declare_report_queues()
+    await declare_import_queues()
+    await declare_email_queues()
+    _background_tasks.add(
+        asyncio.create_task(email_outbox_handler.poll_email_outbox())
+    )
+
+
 @app.on_shutdown
 async def on_shutdown() -> None:
     """Worker shutdown event."""
     settings = get_settings()
     print(f"Shutting down {settings.APP_NAME} worker...")
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
+    shutdown_render_pools()
 
 
-# TODO: Register handlers as they are created
-# Example:
-# from src.app.workers.handlers import email_handler, notification_handler
-# broker.include_router(email_handler.router)
-# broker.include_router(notification_handler.router)
+# Handlers
+broker.include_router(screening_report_handler.router)
+broker.include_router(professional_import_handler.router)
+broker.include_router(email_outbox_handler.router)
 
 
 def run() -> None:
@@ -1,14 +1,13 @@
 """Pytest configuration and fixtures."""
 
+from uuid import UUID
+
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
 from src.app.context import RequestContext, set_request_context
-from src.shared.infrastructure.database.connection import async_session_factory
-
-from uuid import UUID
 
 
 @pytest.fixture
@@ -24,7 +23,7 @@ async def test_db_session() -> AsyncSession:
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
-    async_session = async_session_factory(bind=engine)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
 
     session: AsyncSession
     async with async_session() as session:
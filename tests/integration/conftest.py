@@ -0,0 +1,78 @@
+"""Fixtures for tests that run against the configured PostgreSQL database."""
+
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.app.dependencies.settings import get_settings
+from src.shared.infrastructure.database.connection import _connection_args
+
+
+class StatementCounter:
+    """Records the SQL statements sent to the database."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def clear(self) -> None:
+        self.statements.clear()
+
+    def of(self, verb: str) -> list[str]:
+        """Statements starting with the given verb (INSERT, UPDATE, SELECT...)."""
+        return [s for s in self.statements if s.lstrip().upper().startswith(verb)]
+
+    @property
+    def queries(self) -> list[str]:
+        """Statements other than savepoint management."""
+        return [
+            s
+            for s in self.statements
+            if not s.lstrip().upper().startswith(("SAVEPOINT", "RELEASE", "ROLLBACK"))
+        ]
+
+
+@pytest.fixture
+async def db_engine() -> AsyncIterator[AsyncEngine]:
+    """Engine for the configured database; skips when it is unreachable."""
+    settings = get_settings()
+    engine = create_async_engine(settings.database_url_async, **_connection_args(settings))
+    try:
+        async with engine.connect():
+            pass
+    except (OSError, SQLAlchemyError) as e:
+        await engine.dispose()
+        pytest.skip(f"Database unavailable: {e}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def statement_counter(db_engine: AsyncEngine) -> Iterator[StatementCounter]:
+    """Count statements with a before_cursor_execute listener."""
+    counter = StatementCounter()
+
+    def count(conn, cursor, statement, parameters, context, executemany) -> None:
+        counter.statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", count)
+    yield counter
+    event.remove(db_engine.sync_engine, "before_cursor_execute", count)
+
+
+@pytest.fixture
+async def db_session(db_engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """
+    Session inside an outer transaction that is rolled back.
+
+    Session commits become savepoints, so the database is left unchanged.
+    """
+    async with db_engine.connect() as conn:
+        await conn.begin()
+        async with AsyncSession(
+            bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False
+        ) as session:
+            yield session
+        await conn.rollback()
@@ -0,0 +1,129 @@
+"""
+Round trips of BaseRepository writes.
+
+Companies are used as the entity: a TimestampMixin table without
+required foreign keys.
+"""
+
+import random
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.professionals.infrastructure.repositories import CompanyRepository
+from src.shared.domain.models import Company
+from tests.integration.conftest import StatementCounter
+
+
+def _cnpj() -> str:
+    """Generate a random valid CNPJ."""
+    digits = [random.randint(0, 9) for _ in range(12)]
+    for weights in ([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]):
+        total = sum(w * d for w, d in zip(weights, digits, strict=True))
+        digits.append(0 if total % 11 < 2 else 11 - total % 11)
+    return "".join(map(str, digits))
+
+
+def _company(name: str = "Empresa Teste") -> Company:
+    return Company(cnpj=_cnpj(), legal_name=name)
+
+
+def _timestamps_loaded(entity: Company) -> bool:
+    unloaded = inspect(entity).unloaded
+    return "created_at" not in unloaded and "updated_at" not in unloaded
+
+
+async def test_create_returns_server_defaults_without_select(
+    db_session: AsyncSession,
+    statement_counter: StatementCounter,
+) -> None:
+    statement_counter.clear()
+
+    company = await CompanyRepository(db_session).create(_company())
+
+    assert len(statement_counter.of("INSERT")) == 1
+    assert statement_counter.of("SELECT") == []
+    assert _timestamps_loaded(company)
+    assert company.created_at is not None
+
+
+async def test_create_without_flush_defers_insert(
+    db_session: AsyncSession,
+    statement_counter: StatementCounter,
+) -> None:
+    repository = CompanyRepository(db_session)
+    statement_counter.clear()
+
+    companies = [await repository.create(_company(), flush=False) for _ in range(3)]
+
+    assert statement_counter.queries == []
+
+    await db_session.flush()
+
+    # Pending rows of the same table go in one INSERT ... RETURNING
+    assert len(statement_counter.queries) == 1
+    assert len(statement_counter.of("INSERT")) == 1
+    assert all(_timestamps_loaded(company) for company in companies)
+
+
+async def test_create_many_uses_one_insert(
+    db_session: AsyncSession,
+    statement_counter: StatementCounter,
+) -> None:
+    statement_counter.clear()
+
+    companies = await CompanyRepository(db_session).create_many(
+        [_company(f"Empresa {i}") for i in range(5)]
+    )
+
+    assert len(statement_counter.queries) == 1
+    assert len(statement_counter.of("INSERT")) == 1
+    assert all(_timestamps_loaded(company) for company in companies)
+
+
+async def test_create_many_without_entities_is_a_no_op(
+    db_session: AsyncSession,
+    statement_counter: StatementCounter,
+) -> None:
+    statement_counter.clear()
+
+    assert await CompanyRepository(db_session).create_many([]) == []
+    assert statement_counter.statements == []
+
+
+async def test_update_returns_onupdate_values_without_select(
+    db_session: AsyncSession,
+    statement_counter: StatementCounter,
+) -> None:
+    repository = CompanyRepository(db_session)
+    company = await repository.create(_company())
+    statement_counter.clear()
+
+    company.trade_name = "Nome Fantasia"
+    await repository.update(company)
+
+    assert len(statement_counter.of("UPDATE")) == 1
+    assert statement_counter.of("SELECT") == []
+    assert _timestamps_loaded(company)
+    assert company.updated_at is not None
+
+
+async def test_update_without_flush_defers_update(
+    db_session: AsyncSession,
+    statement_counter: StatementCounter,
+) -> None:
+    repository = CompanyRepository(db_session)
+    companies = await repository.create_many([_company(f"Empresa {i}") for i in range(2)])
+    statement_counter.clear()
+
+    for company in companies:
+        company.trade_name = "Nome Fantasia"
+        await repository.update(company, flush=False)
+
+    assert statement_counter.queries == []
+
+    await db_session.flush()
+
+    assert len(statement_counter.of("UPDATE")) == len(companies)
+    assert statement_counter.of("SELECT") == []
+    assert all(_timestamps_loaded(company) for company in companies)
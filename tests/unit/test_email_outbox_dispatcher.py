@@ -0,0 +1,236 @@
+"""
+Tests for EmailOutboxDispatcher.
+
+The outbox repository is replaced by an in-memory one following the
+semantics of EmailOutboxRepository (claim due rows, exponential backoff,
+FAILED once attempts are exhausted), and emails are sent with
+FakeEmailTransport.
+"""
+
+from dataclasses import dataclass, field
+from typing import Self
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.app.dependencies.settings import get_settings
+from src.shared.domain.models.enums import EmailOutboxStatus
+from src.shared.infrastructure.email import outbox_dispatcher
+from src.shared.infrastructure.email.outbox_dispatcher import (
+    EmailOutboxDispatcher,
+    RateLimiter,
+)
+from src.shared.infrastructure.email.transport import FakeEmailTransport, OutgoingEmail
+
+BATCH_SIZE = 3
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 10
+
+
+@dataclass
+class OutboxRow:
+    """Stand-in for an EmailOutbox row."""
+
+    recipients: list[str]
+    id: UUID = field(default_factory=uuid4)
+    kind: str = "invitation"
+    subject: str = "Convite"
+    html: str = "<p>Olá</p>"
+    tags: list[dict[str, str]] = field(default_factory=list)
+    status: EmailOutboxStatus = EmailOutboxStatus.PENDING
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    provider_message_id: str | None = None
+    error: str | None = None
+
+
+class Outbox:
+    """In-memory outbox table with a controllable clock."""
+
+    def __init__(self, size: int) -> None:
+        self.now = 0.0
+        self.rows = [OutboxRow(recipients=[f"user{i}@example.com"]) for i in range(size)]
+        self.commits = 0
+
+    def with_status(self, status: EmailOutboxStatus) -> list[OutboxRow]:
+        return [row for row in self.rows if row.status == status]
+
+
+class FakeSession:
+    def __init__(self, outbox: Outbox) -> None:
+        self.outbox = outbox
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self.outbox.commits += 1
+
+
+class FakeOutboxRepository:
+    """In-memory EmailOutboxRepository bound to an Outbox."""
+
+    def __init__(self, session: FakeSession) -> None:
+        self.outbox = session.outbox
+
+    async def claim_batch(self, limit: int, stale_before: object) -> list[OutboxRow]:
+        due = [
+            row
+            for row in self.outbox.rows
+            if row.status == EmailOutboxStatus.PENDING and row.next_attempt_at <= self.outbox.now
+        ][:limit]
+        for row in due:
+            row.status = EmailOutboxStatus.SENDING
+            row.attempts += 1
+        return due
+
+    async def mark_sent(self, sent: list[tuple[UUID, str | None]]) -> None:
+        rows = {row.id: row for row in self.outbox.rows}
+        for email_id, provider_message_id in sent:
+            rows[email_id].status = EmailOutboxStatus.SENT
+            rows[email_id].provider_message_id = provider_message_id
+
+    async def record_failure(
+        self,
+        ids: list[UUID],
+        error: str,
+        *,
+        max_attempts: int,
+        backoff_seconds: int,
+    ) -> int:
+        failed = 0
+        for row in self.outbox.rows:
+            if row.id not in ids:
+                continue
+            row.error = error
+            if row.attempts >= max_attempts:
+                row.status = EmailOutboxStatus.FAILED
+                failed += 1
+            else:
+                row.status = EmailOutboxStatus.PENDING
+                row.next_attempt_at = self.outbox.now + backoff_seconds * 2 ** (row.attempts - 1)
+        return failed
+
+
+class ShortIdsTransport(FakeEmailTransport):
+    """Transport returning one ID less than the emails it was given."""
+
+    async def send_batch(self, emails: list[OutgoingEmail]) -> list[str | None]:
+        ids = await super().send_batch(emails)
+        return ids[:-1]
+
+
+@pytest.fixture(autouse=True)
+def fake_repository(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(outbox_dispatcher, "EmailOutboxRepository", FakeOutboxRepository)
+
+
+def make_dispatcher(outbox: Outbox, transport: FakeEmailTransport) -> EmailOutboxDispatcher:
+    settings = get_settings().model_copy(
+        update={
+            "EMAIL_OUTBOX_BATCH_SIZE": BATCH_SIZE,
+            "EMAIL_OUTBOX_MAX_ATTEMPTS": MAX_ATTEMPTS,
+            "EMAIL_OUTBOX_RETRY_BACKOFF": RETRY_BACKOFF,
+        }
+    )
+    return EmailOutboxDispatcher(
+        lambda: FakeSession(outbox),  # type: ignore[arg-type]
+        transport,
+        settings,
+        rate_limiter=RateLimiter(1_000_000),
+    )
+
+
+async def test_drain_sends_due_emails_in_batches() -> None:
+    outbox = Outbox(size=7)
+    transport = FakeEmailTransport()
+
+    sent = await make_dispatcher(outbox, transport).drain()
+
+    assert sent == 7
+    # 3 + 3 + 1: one provider request per batch
+    assert transport.requests == 3
+    assert [email.to for email in transport.sent] == [row.recipients for row in outbox.rows]
+    assert len(outbox.with_status(EmailOutboxStatus.SENT)) == 7
+    assert all(row.provider_message_id for row in outbox.rows)
+
+
+async def test_dispatch_batch_without_due_emails_sends_nothing() -> None:
+    outbox = Outbox(size=0)
+    transport = FakeEmailTransport()
+
+    assert await make_dispatcher(outbox, transport).dispatch_batch() == (0, 0)
+    assert transport.requests == 0
+
+
+async def test_failed_request_schedules_retry_with_backoff() -> None:
+    outbox = Outbox(size=2)
+    transport = FakeEmailTransport(fail_times=2)
+    dispatcher = make_dispatcher(outbox, transport)
+
+    assert await dispatcher.drain() == 0
+    assert all(row.status == EmailOutboxStatus.PENDING for row in outbox.rows)
+    assert all(row.next_attempt_at == RETRY_BACKOFF for row in outbox.rows)
+    assert all(row.error == "Simulated provider failure" for row in outbox.rows)
+
+    # Not due yet
+    assert await dispatcher.dispatch_batch() == (0, 0)
+
+    outbox.now = RETRY_BACKOFF
+    assert await dispatcher.drain() == 0
+    # Backoff doubles on each attempt
+    assert all(row.next_attempt_at == RETRY_BACKOFF + 2 * RETRY_BACKOFF for row in outbox.rows)
+
+    outbox.now = 3 * RETRY_BACKOFF
+    assert await dispatcher.drain() == 2
+    assert all(row.status == EmailOutboxStatus.SENT for row in outbox.rows)
+    assert all(row.attempts == 3 for row in outbox.rows)
+
+
+async def test_emails_fail_permanently_after_max_attempts() -> None:
+    outbox = Outbox(size=2)
+    transport = FakeEmailTransport(fail_times=MAX_ATTEMPTS)
+    dispatcher = make_dispatcher(outbox, transport)
+
+    for _ in range(MAX_ATTEMPTS):
+        outbox.now += 1_000
+        await dispatcher.drain()
+
+    assert all(row.status == EmailOutboxStatus.FAILED for row in outbox.rows)
+    assert all(row.attempts == MAX_ATTEMPTS for row in outbox.rows)
+
+    # FAILED emails are not claimed again
+    outbox.now += 1_000
+    assert await dispatcher.drain() == 0
+    assert transport.requests == MAX_ATTEMPTS
+
+
+async def test_short_provider_id_list_is_recorded_as_failure() -> None:
+    outbox = Outbox(size=3)
+    transport = ShortIdsTransport()
+
+    claimed, delivered = await make_dispatcher(outbox, transport).dispatch_batch()
+
+    assert (claimed, delivered) == (3, 0)
+    assert outbox.with_status(EmailOutboxStatus.SENT) == []
+    assert all(row.status == EmailOutboxStatus.PENDING for row in outbox.rows)
+    assert all(row.error == "Transport returned 2 IDs for 3 emails" for row in outbox.rows)
+
+
+async def test_rate_limiter_spaces_acquires() -> None:
+    now = 0.0
+    sleeps: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        nonlocal now
+        sleeps.append(delay)
+        now += delay
+
+    limiter = RateLimiter(2, clock=lambda: now, sleep=sleep)
+    for _ in range(3):
+        await limiter.acquire()
+
+    assert sleeps == [0.5, 0.5]
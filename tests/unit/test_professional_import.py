@@ -0,0 +1,248 @@
+"""Tests for professional import row validation and job processing."""
+
+import io
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.app.dependencies.settings import get_settings
+from src.modules.professionals.domain.models import (
+    ProfessionalImportFileFormat,
+    ProfessionalImportStatus,
+)
+from src.modules.professionals.domain.services import (
+    ParsedProfessionalRow,
+    missing_columns,
+    parse_professional_row,
+)
+from src.modules.professionals.use_cases.professional_import import (
+    ProcessProfessionalImportJobUseCase,
+)
+
+VALID_ROW = {
+    "full_name": "Ana Souza",
+    "cpf": "52998224725",
+    "email": "ana@example.com",
+    "city": "São Paulo",
+    "state_code": "sp",
+    "postal_code": "01452000",
+    "professional_type": "doctor",
+    "council_type": "crm",
+    "council_number": "123456",
+    "council_state": "SP",
+    "specialty_codes": "card; ped",
+}
+
+
+def parse(line: int, **values: str) -> ParsedProfessionalRow:
+    row = parse_professional_row(line, {**VALID_ROW, **values})
+    assert isinstance(row, ParsedProfessionalRow), row
+    return row
+
+
+def test_parse_valid_row() -> None:
+    row = parse(2)
+
+    assert row.data.cpf == "52998224725"
+    assert row.data.state_code == "SP"
+    assert row.data.qualification.is_primary
+    assert row.specialty_codes == ["CARD", "PED"]
+    assert row.company_cnpj is None
+
+
+def test_parse_restores_leading_zeros_of_documents() -> None:
+    row = parse(2, cpf="3688289056", company_cnpj="6990590000123")
+
+    assert row.data.cpf == "03688289056"
+    assert row.company_cnpj == "06990590000123"
+
+
+@pytest.mark.parametrize(
+    ("values", "field"),
+    [
+        ({"cpf": "11111111111"}, "cpf"),
+        ({"cpf": "52998224724"}, "cpf"),
+        ({"council_type": "coren"}, "council_type"),
+        ({"specialty_codes": "CARD,card"}, "specialty_codes"),
+        ({"company_cnpj": "11222333000180"}, "company_cnpj"),
+        ({"state_code": "XX"}, "state_code"),
+    ],
+)
+def test_parse_invalid_row_reports_field(values: dict[str, str], field: str) -> None:
+    errors = parse_professional_row(7, {**VALID_ROW, **values})
+
+    assert isinstance(errors, list)
+    assert [(error["row"], error["field"]) for error in errors] == [(7, field)]
+    assert errors[0]["message"]
+
+
+def test_missing_columns() -> None:
+    assert missing_columns(list(VALID_ROW)) == []
+    assert missing_columns(["full_name", "cpf"]) == [
+        "city",
+        "state_code",
+        "postal_code",
+        "professional_type",
+        "council_type",
+        "council_number",
+        "council_state",
+    ]
+
+
+def test_drop_duplicates_rejects_rows_repeating_a_previous_row() -> None:
+    rows = [
+        parse(2),
+        parse(3, cpf="03688289056", email="bruno@example.com", council_number="1"),
+        # Same CPF as line 2
+        parse(4, email="carla@example.com", council_number="2"),
+        # Same email as line 3 and council as line 2
+        parse(5, cpf="11144477735", email="bruno@example.com"),
+        # Same council number in another state
+        parse(6, cpf="71428793860", email="davi@example.com", council_state="RJ"),
+    ]
+    errors = []
+
+    unique = ProcessProfessionalImportJobUseCase._drop_duplicates(rows, errors)
+
+    assert [row.line for row in unique] == [2, 3, 6]
+    assert [(error["row"], error["field"]) for error in errors] == [
+        (4, "cpf"),
+        (5, "email"),
+        (5, "council_number"),
+    ]
+    assert all(error["message"] for error in errors)
+
+
+@dataclass
+class FakeJob:
+    processed_rows: int = 0
+    attempts: int = 1
+    file_path: str = "imports/professionals.csv"
+    id: UUID = field(default_factory=uuid4)
+    organization_id: UUID = field(default_factory=uuid4)
+    file_format: ProfessionalImportFileFormat = ProfessionalImportFileFormat.CSV
+    errors: list = field(default_factory=list)
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        return None
+
+
+class FakeOrganizationRepository:
+    async def get_family_ids(self, organization_id: UUID) -> list[UUID]:
+        return [organization_id]
+
+
+class FakeJobRepository:
+    def __init__(self, job: FakeJob | None = None) -> None:
+        self.job = job
+        self.progress: list[int] = []
+        self.statuses: list[ProfessionalImportStatus] = []
+
+    async def claim(self, job_id: UUID, stale_before: object) -> FakeJob | None:
+        return self.job
+
+    async def set_status(self, job_id: UUID, status: ProfessionalImportStatus, **values: object) -> None:
+        self.statuses.append(status)
+
+    async def record_progress(self, job_id: UUID, *, processed_rows: int, **counts: object) -> None:
+        self.progress.append(processed_rows)
+
+
+def csv_file(rows: int) -> io.BytesIO:
+    lines = [";".join(VALID_ROW)]
+    # A blank line is skipped and not counted as a processed row
+    lines += [f"Professional {i};;;;;;;;;;" if i != 3 else "" for i in range(rows + 1)]
+    return io.BytesIO("\n".join(lines).encode())
+
+
+@pytest.mark.parametrize(
+    ("processed_rows", "chunks"),
+    [
+        (0, [[2, 3, 4, 6], [7, 8, 9, 10], [11, 12]]),
+        (4, [[7, 8, 9, 10], [11, 12]]),
+        (6, [[9, 10, 11, 12]]),
+        (10, []),
+    ],
+)
+async def test_import_resumes_after_processed_rows(
+    processed_rows: int,
+    chunks: list[list[int]],
+) -> None:
+    session = FakeSession()
+    settings = get_settings().model_copy(update={"PROFESSIONAL_IMPORT_CHUNK_SIZE": 4})
+    use_case = ProcessProfessionalImportJobUseCase(session, settings)  # type: ignore[arg-type]
+    use_case.organization_repository = FakeOrganizationRepository()  # type: ignore[assignment]
+    use_case.job_repository = job_repository = FakeJobRepository()  # type: ignore[assignment]
+
+    imported_lines: list[list[int]] = []
+
+    async def import_chunk(job, family_org_ids, parsed):
+        imported_lines.append([line for line, _ in parsed])
+        return len(parsed), []
+
+    use_case._import_chunk = import_chunk  # type: ignore[method-assign]
+
+    total_rows = await use_case._import(FakeJob(processed_rows), csv_file(10))  # type: ignore[arg-type]
+
+    assert imported_lines == chunks
+    assert job_repository.progress == [len(chunk) for chunk in chunks]
+    assert session.commits == len(chunks)
+    # Data rows in the spreadsheet, whatever was processed before
+    assert total_rows == 10
+
+
+class FailingStorage:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    async def download_to_file(self, path: str, file: io.BytesIO) -> None:
+        raise self.error
+
+
+def failing_use_case(error: Exception, attempts: int) -> tuple[ProcessProfessionalImportJobUseCase, FakeJobRepository]:
+    settings = get_settings().model_copy(
+        update={
+            "PROFESSIONAL_IMPORT_JOB_MAX_ATTEMPTS": 3,
+            "PROFESSIONAL_IMPORT_JOB_RETRY_BACKOFF": 30,
+        }
+    )
+    use_case = ProcessProfessionalImportJobUseCase(FakeSession(), settings)  # type: ignore[arg-type]
+    use_case.job_repository = job_repository = FakeJobRepository(FakeJob(attempts=attempts))  # type: ignore[assignment]
+    use_case.storage_service = FailingStorage(error)  # type: ignore[assignment]
+    return use_case, job_repository
+
+
+@pytest.mark.parametrize(
+    "error",
+    [OperationalError("SELECT 1", {}, Exception("connection lost")), ConnectionResetError()],
+)
+async def test_transient_error_schedules_retry_with_backoff(error: Exception) -> None:
+    use_case, job_repository = failing_use_case(error, attempts=2)
+
+    assert await use_case.execute(uuid4()) == 60
+    assert job_repository.statuses == [ProfessionalImportStatus.PENDING]
+
+
+async def test_transient_error_fails_job_after_max_attempts() -> None:
+    use_case, job_repository = failing_use_case(ConnectionResetError(), attempts=3)
+
+    assert await use_case.execute(uuid4()) is None
+    assert job_repository.statuses == [ProfessionalImportStatus.FAILED]
+
+
+async def test_unexpected_error_fails_job_and_propagates() -> None:
+    use_case, job_repository = failing_use_case(KeyError("bug"), attempts=1)
+
+    with pytest.raises(KeyError):
+        await use_case.execute(uuid4())
+    assert job_repository.statuses == [ProfessionalImportStatus.FAILED]
@@ -0,0 +1,129 @@
+"""Tests for the streaming CSV/XLSX readers."""
+
+import io
+from datetime import date, datetime
+from types import GeneratorType
+
+import pytest
+from openpyxl import Workbook
+
+from src.shared.infrastructure.spreadsheets import (
+    SpreadsheetError,
+    chunked,
+    normalize_column,
+    read_csv,
+    read_xlsx,
+)
+
+
+def xlsx_file(rows: list[list[object]]) -> io.BytesIO:
+    """Build an XLSX workbook in memory."""
+    workbook = Workbook()
+    sheet = workbook.active
+    for row in rows:
+        sheet.append(row)
+    file = io.BytesIO()
+    workbook.save(file)
+    file.seek(0)
+    return file
+
+
+@pytest.mark.parametrize(
+    ("content", "encoding"),
+    [
+        ("Full Name;City\nJosé;São Paulo\n", "utf-8"),
+        ("Full Name;City\nJosé;São Paulo\n", "utf-8-sig"),
+        ("Full Name;City\nJosé;São Paulo\n", "cp1252"),
+    ],
+)
+def test_read_csv_detects_encoding(content: str, encoding: str) -> None:
+    spreadsheet = read_csv(io.BytesIO(content.encode(encoding)))
+
+    assert spreadsheet.columns == ["full_name", "city"]
+    assert list(spreadsheet.rows) == [(2, {"full_name": "José", "city": "São Paulo"})]
+
+
+@pytest.mark.parametrize("delimiter", [";", ",", "\t"])
+def test_read_csv_detects_delimiter(delimiter: str) -> None:
+    content = delimiter.join(["full_name", "city"]) + "\n" + delimiter.join(["Ana", "Recife"])
+
+    spreadsheet = read_csv(io.BytesIO(content.encode()))
+
+    assert list(spreadsheet.rows) == [(2, {"full_name": "Ana", "city": "Recife"})]
+
+
+def test_read_csv_skips_blank_rows_and_cells_keeping_line_numbers() -> None:
+    content = "full_name;city\nAna;\n;\nBruno;Natal\n"
+
+    rows = list(read_csv(io.BytesIO(content.encode())).rows)
+
+    assert rows == [(2, {"full_name": "Ana"}), (4, {"full_name": "Bruno", "city": "Natal"})]
+
+
+def test_read_csv_without_header_fails() -> None:
+    with pytest.raises(SpreadsheetError):
+        read_csv(io.BytesIO(b""))
+
+
+def test_read_xlsx_converts_cells_to_text() -> None:
+    file = xlsx_file(
+        [
+            ["Full Name", "CPF", "Birth Date", "Graduation Year", "Notes"],
+            ["Ana", 52998224725, datetime(1990, 5, 17), 2015.0, None],
+            ["Bruno", "01234567890", date(1985, 1, 2), 2010, " x "],
+        ]
+    )
+
+    spreadsheet = read_xlsx(file)
+
+    assert spreadsheet.columns == ["full_name", "cpf", "birth_date", "graduation_year", "notes"]
+    assert list(spreadsheet.rows) == [
+        (2, {"full_name": "Ana", "cpf": "52998224725", "birth_date": "1990-05-17", "graduation_year": "2015"}),
+        (
+            3,
+            {
+                "full_name": "Bruno",
+                "cpf": "01234567890",
+                "birth_date": "1985-01-02",
+                "graduation_year": "2010",
+                "notes": "x",
+            },
+        ),
+    ]
+
+
+def test_read_xlsx_streams_rows() -> None:
+    file = xlsx_file([["full_name"], *[[f"Professional {i}"] for i in range(1_000)]])
+
+    spreadsheet = read_xlsx(file)
+
+    # Rows are produced lazily from the read-only worksheet
+    assert isinstance(spreadsheet.rows, GeneratorType)
+    assert next(spreadsheet.rows) == (2, {"full_name": "Professional 0"})
+    assert sum(1 for _ in spreadsheet.rows) == 999
+
+
+def test_read_xlsx_rejects_invalid_file() -> None:
+    with pytest.raises(SpreadsheetError):
+        read_xlsx(io.BytesIO(b"full_name;city\n"))
+
+
+def test_normalize_column() -> None:
+    assert normalize_column("  Full   Name ") == "full_name"
+    assert normalize_column(None) == ""
+
+
+@pytest.mark.parametrize(
+    ("items", "size", "sizes"),
+    [
+        (10, 4, [4, 4, 2]),
+        (8, 4, [4, 4]),
+        (3, 5, [3]),
+        (0, 3, []),
+    ],
+)
+def test_chunked_sizes(items: int, size: int, sizes: list[int]) -> None:
+    chunks = list(chunked(iter(range(items)), size))
+
+    assert [len(chunk) for chunk in chunks] == sizes
+    assert [item for chunk in chunks for item in chunk] == list(range(items))
@@ -0,0 +1,189 @@
+"""Tests for FirebaseStorageService with a fake bucket."""
+
+import io
+import threading
+from datetime import timedelta
+from typing import Any, BinaryIO
+from uuid import uuid4
+
+import pytest
+
+from src.app.dependencies.settings import get_settings
+from src.app.exceptions import ValidationError
+from src.shared.infrastructure.firebase.storage_service import (
+    CHUNK_SIZE_MULTIPLE,
+    FirebaseStorageService,
+)
+
+
+class FakeBlob:
+    """Blob keeping uploads in memory, read in chunk_size pieces like a resumable upload."""
+
+    def __init__(
+        self,
+        name: str,
+        uploads: dict[str, dict[str, Any]],
+        signed: list[tuple[str, str, timedelta, str]],
+    ) -> None:
+        self.name = name
+        self.uploads = uploads
+        self.signed = signed
+        self.chunk_size: int | None = None
+
+    def upload_from_file(
+        self,
+        file: BinaryIO,
+        *,
+        rewind: bool = False,
+        size: int | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        if rewind:
+            file.seek(0)
+        chunks = []
+        while chunk := file.read(self.chunk_size or -1):
+            chunks.append(chunk)
+        self.uploads[self.name] = {
+            "content": b"".join(chunks),
+            "chunks": [len(chunk) for chunk in chunks],
+            "chunk_size": self.chunk_size,
+            "size": size,
+            "content_type": content_type,
+            "thread": threading.current_thread().name,
+        }
+
+    def download_to_file(self, file: BinaryIO) -> None:
+        file.write(self.uploads[self.name]["content"])
+
+    def generate_signed_url(self, *, version: str, expiration: timedelta, method: str) -> str:
+        self.signed.append((self.name, version, expiration, method))
+        return f"https://storage.example.com/{self.name}?signature=fake"
+
+
+class FakeBucket:
+    def __init__(self) -> None:
+        self.uploads: dict[str, dict[str, Any]] = {}
+        self.signed: list[tuple[str, str, timedelta, str]] = []
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(name, self.uploads, self.signed)
+
+
+@pytest.fixture
+def bucket() -> FakeBucket:
+    return FakeBucket()
+
+
+@pytest.fixture
+def service(bucket: FakeBucket) -> FirebaseStorageService:
+    settings = get_settings().model_copy(
+        update={"FIREBASE_STORAGE_CHUNK_SIZE": CHUNK_SIZE_MULTIPLE}
+    )
+    return FirebaseStorageService(settings, bucket=bucket)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("configured", "chunk_size"),
+    [
+        (CHUNK_SIZE_MULTIPLE * 4, CHUNK_SIZE_MULTIPLE * 4),
+        (CHUNK_SIZE_MULTIPLE * 4 + 1000, CHUNK_SIZE_MULTIPLE * 4),
+        (1000, CHUNK_SIZE_MULTIPLE),
+    ],
+)
+def test_chunk_size_is_a_multiple_of_256_kb(configured: int, chunk_size: int) -> None:
+    settings = get_settings().model_copy(update={"FIREBASE_STORAGE_CHUNK_SIZE": configured})
+
+    assert FirebaseStorageService(settings, bucket=FakeBucket())._chunk_size == chunk_size  # type: ignore[arg-type]
+
+
+async def test_store_file_streams_in_chunks(
+    service: FirebaseStorageService,
+    bucket: FakeBucket,
+) -> None:
+    content = b"x" * (CHUNK_SIZE_MULTIPLE * 2 + 10)
+    file = io.BytesIO(content)
+    file.seek(100)
+
+    await service.store_file(file, "imports/file.csv", len(content), "text/csv")
+
+    upload = bucket.uploads["imports/file.csv"]
+    assert upload["content"] == content
+    assert upload["chunk_size"] == CHUNK_SIZE_MULTIPLE
+    assert upload["chunks"] == [CHUNK_SIZE_MULTIPLE, CHUNK_SIZE_MULTIPLE, 10]
+    assert upload["size"] == len(content)
+    assert upload["content_type"] == "text/csv"
+    # Blocking SDK calls run in the storage thread pool
+    assert upload["thread"].startswith("storage")
+    # Stored files are not signed
+    assert bucket.signed == []
+
+
+async def test_upload_bytes_uploads_and_signs_url(
+    service: FirebaseStorageService,
+    bucket: FakeBucket,
+) -> None:
+    content = b"%PDF-1.7 report"
+
+    url = await service.upload_bytes(content, "reports/report.pdf", "application/pdf")
+
+    upload = bucket.uploads["reports/report.pdf"]
+    assert upload["content"] == content
+    assert upload["size"] == len(content)
+    assert upload["content_type"] == "application/pdf"
+    assert url == "https://storage.example.com/reports/report.pdf?signature=fake"
+    assert bucket.signed == [("reports/report.pdf", "v4", timedelta(days=365), "GET")]
+
+
+async def test_upload_file_validates_and_signs_url(
+    service: FirebaseStorageService,
+    bucket: FakeBucket,
+) -> None:
+    organization_id = uuid4()
+    content = b"\x89PNG image"
+
+    uploaded = await service.upload_file(
+        io.BytesIO(content),
+        file_name="../my document.png",
+        file_size=len(content),
+        content_type="image/png",
+        organization_id=organization_id,
+        professional_id=uuid4(),
+        screening_id=uuid4(),
+        document_type_id=uuid4(),
+    )
+
+    assert uploaded.path.startswith(f"organizations/{organization_id}/")
+    assert uploaded.path.endswith("_my_document.png")
+    assert bucket.uploads[uploaded.path]["content"] == content
+    assert uploaded.url == f"https://storage.example.com/{uploaded.path}?signature=fake"
+    assert uploaded.size == len(content)
+
+
+async def test_upload_file_rejects_unsupported_type(
+    service: FirebaseStorageService,
+    bucket: FakeBucket,
+) -> None:
+    with pytest.raises(ValidationError):
+        await service.upload_file(
+            io.BytesIO(b"MZ"),
+            file_name="virus.exe",
+            file_size=2,
+            content_type="application/x-msdownload",
+            organization_id=uuid4(),
+            professional_id=uuid4(),
+            screening_id=uuid4(),
+            document_type_id=uuid4(),
+        )
+    assert bucket.uploads == {}
+
+
+async def test_download_to_file_rewinds(
+    service: FirebaseStorageService,
+    bucket: FakeBucket,
+) -> None:
+    await service.store_file(io.BytesIO(b"a;b\n1;2\n"), "imports/file.csv", 8, "text/csv")
+    file = io.BytesIO()
+
+    await service.download_to_file("imports/file.csv", file)
+
+    assert file.read() == b"a;b\n1;2\n"